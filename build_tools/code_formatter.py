@@ -171,46 +171,48 @@ class code_formatter(metaclass=code_formatter_meta):
         self._data = []
 
     def write(self, *args):
-        f = open(os.path.join(*args), "w")
-        name, extension = os.path.splitext(f.name)
+        path = os.path.join(*args)
+        name, extension = os.path.splitext(path)
 
         # Add a comment to inform which file generated the generated file
         # to make it easier to backtrack and modify generated code
         frame = inspect.currentframe().f_back
+        header = ""
         if re.match(r"^\.(cc|hh|c|h)$", extension) is not None:
-            f.write(
-                f"""/**
+            header = f"""/**
  * DO NOT EDIT THIS FILE!
  * File automatically generated by
  *   {os.path.relpath(frame.f_code.co_filename)}:{frame.f_lineno}
  */
 
 """
-            )
         elif re.match(r"^\.py$", extension) is not None:
-            f.write(
-                f"""#
+            header = f"""#
 # DO NOT EDIT THIS FILE!
 # File automatically generated by
 #   {os.path.relpath(frame.f_code.co_filename)}:{frame.f_lineno}
 #
 
 """
-            )
         elif re.match(r"^\.html$", extension) is not None:
-            f.write(
-                f"""<!--
+            header = f"""<!--
  DO NOT EDIT THIS FILE!
  File automatically generated by
    {frame.f_code.co_filename}:{frame.f_lineno}
 -->
 
 """
-            )
+        contents = header + "".join(self._data)
 
-        for data in self._data:
-            f.write(data)
-        f.close()
+        # Leave the file, and so its timestamp, alone if it is unchanged.
+        try:
+            with open(path) as f:
+                if f.read() == contents:
+                    return
+        except OSError:
+            pass
+        with open(path, "w") as f:
+            f.write(contents)
 
     def __str__(self):
         data = "".join(self._data)
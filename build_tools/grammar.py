@@ -24,11 +24,19 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import hashlib
+import importlib.util
 import os
+import tempfile
 
 import ply.lex
 import ply.yacc
 
+# The process umask, read once while the build is still single threaded, as
+# reading it means setting it.
+_umask = os.umask(0)
+os.umask(_umask)
+
 
 class ParseError(Exception):
     def __init__(self, message, token=None):
@@ -37,6 +45,12 @@ class ParseError(Exception):
 
 
 class Grammar:
+    # If set, the directory in which the lexer and parser tables are cached.
+    # The tables are named after a hash of the grammar (the token rules and
+    # the docstrings of the grammar methods), so they are only rebuilt when
+    # the grammar changes.
+    cache_dir = None
+
     def setupLexerFactory(self, **kwargs):
         if "module" in kwargs:
             raise AttributeError("module is an illegal attribute")
@@ -69,13 +83,17 @@ class Grammar:
             return self.yacc_kwargs
 
         if attr == "lex":
-            self.lex = ply.lex.lex(module=self, **self.lex_kwargs)
+            self.lex = self._build_lexer()
             return self.lex
 
         if attr == "yacc":
-            self.yacc = ply.yacc.yacc(module=self, **self.yacc_kwargs)
+            self.yacc = self._build_parser()
             return self.yacc
 
+        if attr == "grammar_hash":
+            self.grammar_hash = self._hash_grammar()
+            return self.grammar_hash
+
         if attr == "current_lexer":
             if not self.lexers:
                 return None
@@ -95,6 +113,104 @@ class Grammar:
             f"'{type(self)}' object has no attribute '{attr}'"
         )
 
+    def _hash_grammar(self):
+        """Returns a hash of everything the lexer and parser tables are built
+        from.
+        """
+        grammar = hashlib.sha256(ply.yacc.__version__.encode())
+        for name in sorted(dir(self)):
+            if name.startswith(("p_", "t_")):
+                rule = getattr(self, name)
+                if callable(rule):
+                    # Token functions may set their regex with @TOKEN.
+                    rule = getattr(rule, "regex", rule.__doc__)
+            elif name in (
+                "tokens",
+                "precedence",
+                "start",
+                "states",
+                "literals",
+            ):
+                rule = getattr(self, name)
+            else:
+                continue
+            grammar.update(f"{name}={rule!r}\n".encode())
+        grammar.update(repr(sorted(self.lex_kwargs.items())).encode())
+        return grammar.hexdigest()
+
+    def _cache_file(self, prefix, suffix):
+        if not self.cache_dir:
+            return None
+        return os.path.join(
+            self.cache_dir, f"{prefix}_{self.grammar_hash[:32]}{suffix}"
+        )
+
+    def _write_cache_file(self, path, write):
+        """Write a cache file atomically, by renaming it into place, as
+        several grammars may be built in parallel.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(
+            dir=self.cache_dir, prefix="tmp_", suffix=os.path.splitext(path)[1]
+        )
+        os.close(fd)
+        try:
+            write(tmp)
+            # mkstemp creates the file readable by its owner only, so give
+            # it the mode any other file written by the build would have.
+            os.chmod(tmp, 0o666 & ~_umask)
+            os.replace(tmp, path)
+        except OSError:
+            # The cache is only an optimization.
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    def _build_lexer(self):
+        lextab = self._cache_file("lextab", ".py")
+        if lextab and os.path.exists(lextab):
+            spec = importlib.util.spec_from_file_location(
+                os.path.basename(lextab)[:-3], lextab
+            )
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            return ply.lex.lex(
+                module=self, optimize=True, lextab=module, **self.lex_kwargs
+            )
+
+        lexer = ply.lex.lex(module=self, **self.lex_kwargs)
+        if lextab:
+            self._write_cache_file(
+                lextab,
+                lambda tmp: lexer.writetab(
+                    os.path.basename(tmp)[:-3], self.cache_dir
+                ),
+            )
+        return lexer
+
+    def _build_parser(self):
+        parsetab = self._cache_file("parsetab", ".pickle")
+        if not parsetab:
+            return ply.yacc.yacc(module=self, **self.yacc_kwargs)
+
+        kwargs = dict(self.yacc_kwargs, write_tables=False)
+        if os.path.exists(parsetab):
+            # ply checks the tables match the grammar before using them.
+            return ply.yacc.yacc(module=self, picklefile=parsetab, **kwargs)
+
+        parser = None
+
+        def write(tmp):
+            nonlocal parser
+            # The temporary file is empty, so ply builds the tables and
+            # writes them to it.
+            os.remove(tmp)
+            parser = ply.yacc.yacc(module=self, picklefile=tmp, **kwargs)
+
+        self._write_cache_file(parsetab, write)
+        if parser is None:
+            parser = ply.yacc.yacc(module=self, **self.yacc_kwargs)
+        return parser
+
     def parse_string(self, data, source="<string>", debug=None, tracking=0):
         if not isinstance(data, str):
             raise AttributeError(
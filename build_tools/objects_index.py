@@ -0,0 +1,162 @@
+# Copyright (c) 2024 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Generates the index used by ``m5.objects`` to import SimObject modules on
+demand. The index maps each public name defined at the top level of a
+SimObject module to the module defining it, and records which of those names
+are Enums. The modules are parsed, not imported, so the index can be built
+before any of them are embedded.
+"""
+
+import argparse
+import ast
+
+from code_formatter import code_formatter
+
+parser = argparse.ArgumentParser()
+parser.add_argument("index_py", help="index file to generate")
+parser.add_argument(
+    "modules",
+    help="SimObject modules, each given as <module path>=<source file>",
+    nargs="*",
+)
+
+args = parser.parse_args()
+
+
+def defined_names(statements):
+    """Yields the (name, is_enum) pairs for the names bound by a list of
+    top-level statements. Names bound inside top-level if/try/with blocks
+    are included as they are still bound at module scope."""
+    for stmt in statements:
+        if isinstance(stmt, ast.ClassDef):
+            bases = [
+                base.attr if isinstance(base, ast.Attribute) else base.id
+                for base in stmt.bases
+                if isinstance(base, (ast.Attribute, ast.Name))
+            ]
+            yield stmt.name, any(base.endswith("Enum") for base in bases)
+        elif isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            yield stmt.name, False
+        elif isinstance(stmt, (ast.Assign, ast.AnnAssign)):
+            targets = (
+                stmt.targets if isinstance(stmt, ast.Assign) else [stmt.target]
+            )
+            for target in targets:
+                for node in ast.walk(target):
+                    if isinstance(node, ast.Name):
+                        yield node.id, False
+        elif isinstance(stmt, (ast.If, ast.Try, ast.With)):
+            for block in ("body", "orelse", "finalbody"):
+                yield from defined_names(getattr(stmt, block, []))
+            for handler in getattr(stmt, "handlers", []):
+                yield from defined_names(handler.body)
+
+
+def imported_names(statements):
+    """Yields the names explicitly imported by a list of top-level
+    statements. Wildcard imports are skipped as their names are not known
+    without importing the module."""
+    for stmt in statements:
+        if isinstance(stmt, ast.ImportFrom):
+            for alias in stmt.names:
+                if alias.name != "*":
+                    yield alias.asname or alias.name
+
+
+def exported_names(tree):
+    """Returns the names ``from <module> import *`` would export that the
+    module itself defines or explicitly imports, mapped to whether the name
+    is an Enum defined by the module."""
+    names = {}
+    for name in imported_names(tree.body):
+        names[name] = None
+    for name, is_enum in defined_names(tree.body):
+        names[name] = is_enum
+
+    all_names = None
+    for stmt in tree.body:
+        if (
+            isinstance(stmt, ast.Assign)
+            and any(
+                isinstance(t, ast.Name) and t.id == "__all__"
+                for t in stmt.targets
+            )
+            and isinstance(stmt.value, (ast.List, ast.Tuple))
+        ):
+            all_names = [
+                elt.value
+                for elt in stmt.value.elts
+                if isinstance(elt, ast.Constant)
+            ]
+
+    if all_names is not None:
+        return {name: names[name] for name in all_names if name in names}
+    return {
+        name: is_enum
+        for name, is_enum in names.items()
+        if not name.startswith("_")
+    }
+
+
+index = {}
+imported = {}
+enums = set()
+for module in args.modules:
+    modpath, source = module.split("=", 1)
+    with open(source) as f:
+        tree = ast.parse(f.read(), source)
+    # As with `from <module> import *` run over every module in turn, a name
+    # defined by multiple modules resolves to the last of them. Names a
+    # module only imports are indexed if no module defines them.
+    for name, is_enum in exported_names(tree).items():
+        if is_enum is None:
+            imported[name] = modpath
+            continue
+        index[name] = modpath
+        if is_enum:
+            enums.add(name)
+        else:
+            enums.discard(name)
+for name, modpath in imported.items():
+    index.setdefault(name, modpath)
+
+code = code_formatter()
+code("names = {")
+code.indent()
+for name in sorted(index):
+    code("${{repr(name)}}: ${{repr(index[name])}},")
+code.dedent()
+code("}")
+code()
+code("enums = {")
+code.indent()
+for name in sorted(enums):
+    code("${{repr(name)}},")
+code.dedent()
+code("}")
+code.write(args.index_py)
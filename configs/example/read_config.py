@@ -55,6 +55,10 @@ import sys
 import m5
 import m5.ticks as ticks
 
+# SimObject modules are imported on demand. Import them all so every SimObject
+# class can be looked up by name.
+m5.objects._load_all()
+
 sim_object_classes_by_name = {
     cls.__name__: cls
     for cls in list(m5.objects.__dict__.values())
@@ -38,12 +38,14 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import contextlib
 import os
 import os.path
 import pickle
 import sys
 import tempfile
 import textwrap
+import time
 
 import SCons.Node.Python
 import SCons.Script
@@ -247,6 +249,40 @@ def warning(*args, **kwargs):
     all_warnings.append(printed)
 
 
+all_codegen_times = []
+
+
+@contextlib.contextmanager
+def codegen_timer(kind, name):
+    """Time a code generation step, like running the ISA parser or SLICC,
+    for the summary printed by summarize_codegen_times.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_codegen_time(kind, name, time.perf_counter() - start)
+
+
+def record_codegen_time(kind, name, seconds):
+    all_codegen_times.append((kind, name, seconds))
+
+
+def summarize_codegen_times():
+    if not all_codegen_times:
+        return
+    print(
+        termcap.Yellow
+        + termcap.Bold
+        + "*** Summary of Code Generation Times ***"
+        + termcap.Normal
+    )
+    for kind, name, seconds in sorted(
+        all_codegen_times, key=lambda t: t[2], reverse=True
+    ):
+        print(f"{kind:<16} {name:<48} {seconds:8.2f}s")
+
+
 def error(*args, **kwargs):
     message = " ".join(args)
     print_message("Error: ", termcap.Red, message, **kwargs)
@@ -539,6 +539,13 @@ class ISAParser(Grammar):
         self._operandsRE = None
         self._operandsWithExtRE = None
 
+        # Memoized results of operandUses() and mungeSnippet(), keyed by
+        # code snippet. Formats expand the same snippets for many
+        # instructions, and scanning them for operands is the bulk of the
+        # time spent parsing the larger ISAs.
+        self._operandUses = {}
+        self._mungedSnippets = {}
+
         # This dictionary maps format name strings to Format objects.
         self.formatMap = {}
 
@@ -719,6 +726,7 @@ class ISAParser(Grammar):
                 print("namespace %s {" % self.namespace, file=f)
                 if splits > 1:
                     print("#define __SPLIT %u" % i, file=f)
+                    fn = self.split_file_name(fn, i)
                 print(f'#include "{fn}"', file=f)
                 print("} // namespace %s" % self.namespace, file=f)
                 print("} // namespace gem5", file=f)
@@ -742,6 +750,7 @@ class ISAParser(Grammar):
                 print("namespace %s {" % self.namespace, file=f)
                 if splits > 1:
                     print("#define __SPLIT %u" % i, file=f)
+                    fn = self.split_file_name(fn, i)
                 # TODO: enable warning for all ISAs
                 if self.namespace == "ArmISAInst":
                     print(f"#ifdef __clang__", file=f)
@@ -761,6 +770,36 @@ class ISAParser(Grammar):
                 print("} // namespace %s" % self.namespace, file=f)
                 print("} // namespace gem5", file=f)
 
+    # The name of the file holding split number 'i' of a splittable file,
+    #   (e.g.) exec-ns.cc.inc -> exec-ns-2.cc.inc
+    def split_file_name(self, name, i):
+        return name.replace("-ns.", "-ns-%d." % i)
+
+    splitRE = re.compile(r"\n#endif\n#if __SPLIT == (\d+)\n")
+
+    # Also write each split of the splittable files to a file of its own,
+    # and have the top level files include those rather than the
+    # monolithic file. Each split then only depends on the instructions
+    # which end up in it, so a change to one instruction definition
+    # rebuilds one split rather than all of them.
+    def write_split_files(self):
+        for name, f in self.files.items():
+            splits = self.splits.get(f, 1)
+            if splits == 1:
+                continue
+            contents = f.getvalue()
+            first = "#if !defined(__SPLIT) || (__SPLIT == 1)\n"
+            contents = contents[contents.index(first) + len(first) :]
+            assert contents.endswith("\n#endif\n")
+            contents = contents[: -len("\n#endif\n")]
+            parts = self.splitRE.split(contents)
+            chunks = {1: parts[0]}
+            for i, chunk in zip(parts[1::2], parts[2::2]):
+                chunks[int(i)] = chunk
+            for i in range(1, splits + 1):
+                with self.open(self.split_file_name(name, i)) as chunk:
+                    chunk.write(chunks.get(i, "") + "\n")
+
     scaremonger_template = """// DO NOT EDIT
 // This file was automatically generated from an ISA description:
 //   %(filename)s
@@ -960,6 +999,8 @@ class ISAParser(Grammar):
         for f in self.splits.keys():
             f.write("\n#endif\n")
 
+        self.write_split_files()
+
         for f in self.files.values():  # close ALL the files;
             f.close()  # not doing so can cause compilation to fail
 
@@ -1611,31 +1652,116 @@ StaticInstPtr
             operandsWithExtREString, re.MULTILINE
         )
 
+        # operandsRE and operandsWithExtRE only ever match whole words,
+        # so rather than running them over every snippet, words are looked
+        # up in these maps of what they would have matched, which are
+        # filled in as words are seen.
+        self._operandNames = operands
+        self._operandExts = set(extensions)
+        self._operandWords = {}
+        self._mungedWords = {}
+
+    # Words operandsRE could match: not preceded by a word character or ':'.
+    operandWordRE = re.compile(r"(?<![\w:])\w+")
+
+    def _matchOperandWord(self, word):
+        """Returns the groups operandsRE would match for a whole word, the
+        operand full name, base and extension, or None."""
+        try:
+            return self._operandWords[word]
+        except KeyError:
+            pass
+        groups = None
+        for op in self._operandNames:
+            if word == op:
+                groups = (word, op, None)
+                break
+            ext = word[len(op) + 1 :]
+            if word.startswith(op + "_") and ext in self._operandExts:
+                groups = (word, op, ext)
+                break
+        self._operandWords[word] = groups
+        return groups
+
+    def operandUses(self, code):
+        """Find the operands used in a code snippet, ignoring those in
+        strings and comments.  Returns a tuple of (full name, base name,
+        extension, is_dest) tuples in the order they appear, with is_dest
+        set for operands on the LHS of an assignment."""
+        try:
+            return self._operandUses[code]
+        except KeyError:
+            pass
+        if not self._operandsRE:
+            self.buildOperandREs()
+
+        # delete strings and comments so we don't match on operands inside
+        stripped = code
+        for regEx in (stringRE, commentRE):
+            stripped = regEx.sub("", stripped)
+
+        uses = []
+        for match in self.operandWordRE.finditer(stripped):
+            groups = self._matchOperandWord(match.group())
+            if groups:
+                # if the token following the operand is an assignment, this
+                # is a destination (LHS), else it's a source (RHS)
+                is_dest = assignRE.match(stripped, match.end()) != None
+                uses.append(groups + (is_dest,))
+        uses = tuple(uses)
+        self._operandUses[code] = uses
+        return uses
+
+    # Words operandsWithExtRE could match: not preceded by a word character.
+    mungedWordRE = re.compile(r"(?<!\w)\w+")
+
+    def _mungeWord(self, match):
+        word = match.group()
+        try:
+            return self._mungedWords[word]
+        except KeyError:
+            pass
+        munged = word
+        for op in self._operandNames:
+            ext = word[len(op) + 1 :]
+            if word.startswith(op + "_") and ext in self._operandExts:
+                munged = op
+                break
+        self._mungedWords[word] = munged
+        return munged
+
     def substMungedOpNames(self, code):
         """Munge operand names in code string to make legal C++
         variable names.  This means getting rid of the type extension
         if any.  Will match base_name attribute of Operand object.)"""
-        return self.operandsWithExtRE().sub(r"\1", code)
+        if not self._operandsWithExtRE:
+            self.buildOperandREs()
+        return self.mungedWordRE.sub(self._mungeWord, code)
 
     def mungeSnippet(self, s):
         """Fix up code snippets for final substitution in templates."""
         if isinstance(s, str):
-            return self.substMungedOpNames(substBitOps(s))
+            try:
+                return self._mungedSnippets[s]
+            except KeyError:
+                munged = self.substMungedOpNames(substBitOps(s))
+                self._mungedSnippets[s] = munged
+                return munged
         else:
             return s
 
     def open(self, name, bare=False):
-        """Open the output file for writing and include scary warning."""
+        """Open the output file for writing and include scary warning.
+        The file is only written when it is closed, and only if its
+        contents changed."""
         filename = os.path.join(self.output_dir, name)
-        f = open(filename, "w")
-        if f:
-            if not bare:
-                f.write(ISAParser.scaremonger_template % self)
+        f = OutputFile(filename)
+        if not bare:
+            f.write(ISAParser.scaremonger_template % self)
         return f
 
     def update(self, file, contents):
-        """Update the output file only.  Scons should handle the case when
-        the new contents are unchanged using its built-in hash feature."""
+        """Update the output file, if its contents changed."""
         f = self.open(file)
         f.write(contents)
         f.close()
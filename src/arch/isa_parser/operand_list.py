@@ -37,12 +37,7 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from .util import (
-    assignRE,
-    commentRE,
-    error,
-    stringRE,
-)
+from .util import error
 
 
 class OperandList:
@@ -52,15 +47,9 @@ class OperandList:
     def __init__(self, parser, code):
         self.items = []
         self.bases = {}
-        # delete strings and comments so we don't match on operands inside
-        for regEx in (stringRE, commentRE):
-            code = regEx.sub("", code)
 
         # search for operands
-        for match in parser.operandsRE().finditer(code):
-            op = match.groups()
-            # regexp groups are operand full name, base, and extension
-            (op_full, op_base, op_ext) = op
+        for op_full, op_base, op_ext, is_dest in parser.operandUses(code):
             # If is a elem operand, define or update the corresponding
             # vector operand
             isElem = False
@@ -69,9 +58,6 @@ class OperandList:
                 elem_op = (op_base, op_ext)
                 op_base = parser.elemToVector[op_base]
                 op_ext = ""  # use the default one
-            # if the token following the operand is an assignment, this is
-            # a destination (LHS), else it's a source (RHS)
-            is_dest = assignRE.match(code, match.end()) != None
             is_src = not is_dest
 
             # see if we've already seen this one
@@ -191,15 +177,9 @@ class SubOperandList(OperandList):
     def __init__(self, parser, code, requestor_list):
         self.items = []
         self.bases = {}
-        # delete strings and comments so we don't match on operands inside
-        for regEx in (stringRE, commentRE):
-            code = regEx.sub("", code)
 
         # search for operands
-        for match in parser.operandsRE().finditer(code):
-            op = match.groups()
-            # regexp groups are operand full name, base, and extension
-            (op_full, op_base, op_ext) = op
+        for op_full, op_base, op_ext, is_dest in parser.operandUses(code):
             # If is a elem operand, define or update the corresponding
             # vector operand
             if op_base in parser.elemToVector:
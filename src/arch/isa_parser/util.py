@@ -37,6 +37,7 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import io
 import re
 
 ###################
@@ -56,14 +57,14 @@ def indent(s):
 stringRE = re.compile(r'"([^"\\]|\\.)*"')
 
 # Regular expression object to match C++ comments
-# (used in findOperands())
+# (used in ISAParser.operandUses())
 commentRE = re.compile(
     r"(^)?[^\S\n]*/(?:\*(.*?)\*/[^\S\n]*|/[^\n]*)($)?",
     re.DOTALL | re.MULTILINE,
 )
 
 # Regular expression object to match assignment statements (used in
-# findOperands()).  If the code immediately following the first
+# ISAParser.operandUses()).  If the code immediately following the first
 # appearance of the operand matches this regex, then the operand
 # appears to be on the LHS of an assignment, and is thus a
 # destination.  basically we're looking for an '=' that's not '=='.
@@ -125,6 +126,31 @@ def protectNonSubstPercents(s):
     return re.sub(r"%(?!\()", "%%", s)
 
 
+class OutputFile(io.StringIO):
+    """A generated file which is only written out when it is closed, and
+    then only if its contents changed.  Leaving unchanged outputs alone
+    keeps their timestamps, so tools which look at those don't rebuild
+    everything that includes them."""
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+
+    def close(self):
+        if self.closed:
+            return
+        contents = self.getvalue()
+        super().close()
+        try:
+            with open(self.path) as f:
+                if f.read() == contents:
+                    return
+        except OSError:
+            pass
+        with open(self.path, "w") as f:
+            f.write(contents)
+
+
 ##############
 # Stack: a simple stack object.  Used for both formats (formatStack)
 # and default cases (defaultStack).  Simply wraps a list to give more
@@ -29,6 +29,7 @@ import os
 import sys
 
 from slicc.parser import SLICC
+from slicc.symbols import StateMachine
 
 usage = "%prog [options] <slicc file> ... "
 version = "%prog v0.4"
@@ -56,6 +57,15 @@ def eprint(format, *args):
     print(format, file=sys.stderr)
 
 
+def print_timings(symtab):
+    machines = {str(m) for m in symtab.getAllType(StateMachine)}
+    times = symtab.codegen_times
+    for ident in sorted(machines, key=times.get, reverse=True):
+        print(f"    {ident:<40} {times[ident]:6.2f}s")
+    types = [times[ident] for ident in times if ident not in machines]
+    print(f"    {f'{len(types)} types':<40} {sum(types):6.2f}s")
+
+
 def main(args=None):
     import optparse
 
@@ -91,6 +101,19 @@ def main(args=None):
         action="store_true",
         help="print traceback on error",
     )
+    parser.add_option(
+        "-j",
+        "--jobs",
+        type="int",
+        default=1,
+        help="Number of processes to write the C++ files with",
+    )
+    parser.add_option(
+        "-T",
+        "--timings",
+        action="store_true",
+        help="Print how long writing each machine's C++ files took",
+    )
     parser.add_option("-q", "--quiet", help="don't print messages")
     opts, files = parser.parse_args(args=args)
 
@@ -132,7 +155,10 @@ def main(args=None):
                 slicc.writeHTMLFiles(opts.html_path)
 
             output("Writing C++ files...")
-            slicc.writeCodeFiles(opts.code_path, [])
+            slicc.writeCodeFiles(opts.code_path, [], opts.jobs)
+
+            if opts.timings:
+                print_timings(slicc.symtab)
 
     output("SLICC is Done.")
 
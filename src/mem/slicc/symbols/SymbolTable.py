@@ -25,7 +25,10 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import multiprocessing
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 
 from slicc.generate import html
 from slicc.symbols.StateMachine import StateMachine
@@ -43,6 +46,19 @@ def makeDir(path):
         os.makedirs(path, exist_ok=True)
 
 
+# The symbol table whose code the forked workers of writeCodeFiles() are
+# writing. Symbols reference most of the AST, so rather than pickling them,
+# workers are handed indices into this table's symbols.
+_writing = None
+
+
+def _write_symbol(index, path, includes):
+    symbol = _writing.sym_vec[index]
+    start = time.perf_counter()
+    symbol.writeCodeFiles(path, includes)
+    return time.perf_counter() - start
+
+
 class SymbolTable:
     def __init__(self, slicc):
         self.slicc = slicc
@@ -51,6 +67,9 @@ class SymbolTable:
         self.sym_map_vec = [{}]
         self.machine_components = {}
 
+        # How long writing each machine and type's code took, in seconds.
+        self.codegen_times = {}
+
         pairs = {}
         pairs["primitive"] = "yes"
         pairs["external"] = "yes"
@@ -133,7 +152,10 @@ class SymbolTable:
             if isinstance(symbol, type):
                 yield symbol
 
-    def writeCodeFiles(self, path, includes):
+    def writeCodeFiles(self, path, includes, jobs=1):
+        """Write the code for all the symbols. With more than one job the
+        machines and types, which are independent once the symbol table
+        is built, are written by that many forked worker processes."""
         makeDir(path)
 
         # Note: This will be None if generated only the shared code.
@@ -159,8 +181,41 @@ class SymbolTable:
 
             self.writeProtocolInfo(path)
 
+        # Machines take the longest to write, so start on them first.
+        indices = [
+            i
+            for cls in (StateMachine, Type)
+            for i, symbol in enumerate(self.sym_vec)
+            if isinstance(symbol, cls)
+        ]
+
+        global _writing
+        _writing = self
+        try:
+            if jobs > 1 and len(indices) > 1:
+                with ProcessPoolExecutor(
+                    jobs, mp_context=multiprocessing.get_context("fork")
+                ) as pool:
+                    times = list(
+                        pool.map(
+                            _write_symbol,
+                            indices,
+                            [path] * len(indices),
+                            [includes] * len(indices),
+                        )
+                    )
+            else:
+                times = [_write_symbol(i, path, includes) for i in indices]
+        finally:
+            _writing = None
+
+        for i, seconds in zip(indices, times):
+            self.codegen_times[self.sym_vec[i].ident] = seconds
+
+        # The remaining symbols don't generate any code of their own.
         for symbol in self.sym_vec:
-            symbol.writeCodeFiles(path, includes)
+            if not isinstance(symbol, (StateMachine, Type)):
+                symbol.writeCodeFiles(path, includes)
 
     def writeProtocolInfo(self, path):
         code = self.codeFormatter()
@@ -24,6 +24,7 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import copy
 import re
 import urllib.parse
 from abc import (
@@ -42,6 +43,14 @@ from .client_query import ClientQuery
 
 
 class AbstractClient(ABC):
+    def __init__(self):
+        # Results of previous queries, keyed by the query's resource ID,
+        # resource version and gem5 version. A value of ``None`` records that
+        # no resource matched the query.
+        self._query_results: Dict[
+            Tuple[str, Optional[str], Optional[str]], Optional[Dict[str, Any]]
+        ] = {}
+
     def _url_validator(self, url: str) -> bool:
         """
         Validates the provided URL.
@@ -186,8 +195,47 @@ class AbstractClient(ABC):
                             - gem5_version: The version of gem5.
 
         :return: A list of all the Resources with the given ID.
+
+        .. note::
+
+            The result of each query is remembered, so repeated queries for
+            the same resource are answered without querying the source again.
+            Only the queries which have not been seen before are passed, as a
+            single batch, to ``get_resources``.
         """
-        return self.get_resources(client_queries=client_queries)
+        ids = [query.get_resource_id() for query in client_queries]
+
+        def query_key(query: ClientQuery) -> Tuple:
+            return (
+                query.get_resource_id(),
+                query.get_resource_version(),
+                query.get_gem5_version(),
+            )
+
+        resources = {}
+        to_query = []
+        for query in client_queries:
+            key = query_key(query)
+            # If multiple queries share a resource ID the latest version
+            # across all of them is returned, so these are always sent to the
+            # source together.
+            if ids.count(key[0]) == 1 and key in self._query_results:
+                if self._query_results[key] is not None:
+                    resources[key[0]] = copy.deepcopy(self._query_results[key])
+            else:
+                to_query.append(query)
+
+        if to_query:
+            queried = self.get_resources(client_queries=to_query)
+            for query in to_query:
+                key = query_key(query)
+                if ids.count(key[0]) == 1:
+                    self._query_results[key] = copy.deepcopy(
+                        queried.get(key[0])
+                    )
+            resources.update(queried)
+
+        return resources
 
     @abstractmethod
     def get_all_resources(
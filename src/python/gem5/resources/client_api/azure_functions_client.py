@@ -47,6 +47,7 @@ from m5.util import warn
 from ...utils.socks_ssl_context import get_proxy_context
 from .abstract_client import AbstractClient
 from .client_query import ClientQuery
+from .metadata_cache import get_metadata_cache
 
 
 class AzureFunctionsAPIClientHttpJsonRequestError(Exception):
@@ -82,6 +83,7 @@ class AzureFunctionsAPIClient(AbstractClient):
 
         :param url: The base url for the azure functions API.
         """
+        super().__init__()
         self.url = config["url"]
 
     def _functions_http_json_req(
@@ -153,6 +155,12 @@ class AzureFunctionsAPIClient(AbstractClient):
 
         return json.loads(response.read().decode("utf-8"))
 
+    def _cache_key(self, condition: Dict[str, str]) -> str:
+        return (
+            f"azure-functions:{self.url}:{condition['id']}:"
+            f"{condition['resource_version']}"
+        )
+
     def get_resources(
         self,
         client_queries: List[ClientQuery],
@@ -175,11 +183,43 @@ class AzureFunctionsAPIClient(AbstractClient):
 
             search_conditions.append(condition)
 
-        resources = self._functions_http_json_req(
-            url,
-            data_json=search_conditions,
-            purpose_of_request="Get Resources",
-        )
+        # Conditions answered by the on-disk metadata cache, if enabled, are
+        # not sent to the API. The remaining conditions are sent in one
+        # request and the resources matching each are cached separately.
+        cache = get_metadata_cache()
+        resources = []
+        if cache:
+            uncached_conditions = []
+            for condition in search_conditions:
+                cached = cache.get(self._cache_key(condition))
+                if cached is not None:
+                    resources.extend(cached)
+                else:
+                    uncached_conditions.append(condition)
+        else:
+            uncached_conditions = search_conditions
+
+        if uncached_conditions:
+            retrieved = self._functions_http_json_req(
+                url,
+                data_json=uncached_conditions,
+                purpose_of_request="Get Resources",
+            )
+            resources.extend(retrieved)
+            if cache:
+                for condition in uncached_conditions:
+                    matching = [
+                        resource
+                        for resource in retrieved
+                        if resource["id"] == condition["id"]
+                        and condition["resource_version"]
+                        in ("None", resource["resource_version"])
+                    ]
+                    # Queries which matched nothing are not cached so newly
+                    # published resources are found immediately.
+                    if matching:
+                        cache.set(self._cache_key(condition), matching)
+
         resources_by_id = {}
         for resource in resources:
             if resource["id"] in resources_by_id.keys():
@@ -217,9 +257,15 @@ class AzureFunctionsAPIClient(AbstractClient):
                 "All resources are compatible with DEVELOP version. Please pass a specific gem5 version from gem5 releases."
             )
 
-        resources = self._functions_http_json_req(
-            url,
-            data_json=[{"gem5-version": gem5_version}],
-            purpose_of_request="Get All Resources",
-        )
+        cache = get_metadata_cache()
+        cache_key = f"azure-functions:{self.url}:all:{gem5_version}"
+        resources = cache.get(cache_key) if cache else None
+        if resources is None:
+            resources = self._functions_http_json_req(
+                url,
+                data_json=[{"gem5-version": gem5_version}],
+                purpose_of_request="Get All Resources",
+            )
+            if cache:
+                cache.set(cache_key, resources)
         return resources
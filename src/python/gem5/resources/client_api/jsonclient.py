@@ -44,6 +44,7 @@ from m5.util import warn
 
 from .abstract_client import AbstractClient
 from .client_query import ClientQuery
+from .metadata_cache import get_metadata_cache
 
 
 class JSONClient(AbstractClient):
@@ -53,8 +54,10 @@ class JSONClient(AbstractClient):
 
         :param path: The path to the Resource, either URL or local.
         """
+        super().__init__()
         self.path = path
         self.resources = []
+        self._indexed_resources = None
 
         # Try loading as local file if it exists
         if Path(path).is_file():
@@ -92,6 +95,13 @@ class JSONClient(AbstractClient):
                     return
 
                 # Handle HTTP/HTTPS URLs
+                cache = get_metadata_cache()
+                cache_key = f"json-client:{path}"
+                cached = cache.get(cache_key) if cache else None
+                if cached is not None:
+                    self.resources = cached
+                    return
+
                 req = request.Request(path)
                 with request.urlopen(req) as response:
                     self.resources = json.loads(
@@ -102,6 +112,8 @@ class JSONClient(AbstractClient):
                         f"Invalid JSON in file '{path}': "
                         "Top-level object must be a list"
                     )
+                if cache:
+                    cache.set(cache_key, self.resources)
                 return
 
             except URLError as e:
@@ -117,6 +129,31 @@ class JSONClient(AbstractClient):
         """Returns a JSON representation of the resources."""
         return self.resources
 
+    def _get_index(
+        self,
+    ) -> Tuple[
+        Dict[str, List[Tuple[int, Dict[str, Any]]]],
+        Dict[Tuple[str, str], List[Tuple[int, Dict[str, Any]]]],
+    ]:
+        """
+        Returns the resources indexed by ID and by ID and version. Each entry
+        is a list of the matching resources and their position in the
+        resources list. The index is built on first use and rebuilt if the
+        resources list is replaced.
+        """
+        if self._indexed_resources is not self.resources:
+            self._by_id = {}
+            self._by_id_and_version = {}
+            for position, resource in enumerate(self.resources):
+                self._by_id.setdefault(resource["id"], []).append(
+                    (position, resource)
+                )
+                self._by_id_and_version.setdefault(
+                    (resource["id"], resource.get("resource_version")), []
+                ).append((position, resource))
+            self._indexed_resources = self.resources
+        return self._by_id, self._by_id_and_version
+
     def get_resources(
         self,
         client_queries: List[ClientQuery],
@@ -162,9 +199,24 @@ class JSONClient(AbstractClient):
 
             return False
 
+        # Only the resources with a matching ID (and version, if specified)
+        # need to be checked against the queries.
+        by_id, by_id_and_version = self._get_index()
+        candidates = {}
+        for query in client_queries:
+            if query.get_resource_version() is not None:
+                matches = by_id_and_version.get(
+                    (query.get_resource_id(), query.get_resource_version()),
+                    [],
+                )
+            else:
+                matches = by_id.get(query.get_resource_id(), [])
+            for position, resource in matches:
+                candidates[position] = resource
+
         filtered_resources = filter(
             lambda resource: filter_resource(resource, client_queries),
-            self.resources,
+            (candidates[position] for position in sorted(candidates)),
         )
 
         resources_by_id = {}
@@ -0,0 +1,114 @@
+# Copyright (c) 2024 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+An on-disk cache of resource metadata retrieved from remote resource sources.
+
+Every gem5 process which obtains resources from a remote source (e.g., the
+gem5 resources API or a JSON file served over HTTP) otherwise makes a round
+trip per lookup. When many simulations are started at once this adds up to
+many identical requests. This cache stores the responses on disk, for a
+limited time, so they can be shared between processes.
+
+The cache is disabled by default. It is enabled by setting the
+``GEM5_RESOURCE_METADATA_CACHE_TTL`` environment variable to the number of
+seconds an entry may be used for. Entries are stored in
+``GEM5_RESOURCE_METADATA_CACHE_DIR`` if set, otherwise in
+``~/.cache/gem5/metadata``.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import (
+    Any,
+    Optional,
+)
+
+
+class MetadataCache:
+    def __init__(self, directory: Path, ttl: float):
+        """
+        :param directory: The directory in which cache entries are stored.
+        :param ttl: The time, in seconds, for which an entry is valid.
+        """
+        self.directory = Path(directory)
+        self.ttl = ttl
+
+    def _entry_path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Returns the value stored under ``key``, or ``None`` if there is no
+        such value or it has expired.
+        """
+        try:
+            with open(self._entry_path(key), encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get("key") != key:
+            return None
+        if time.time() - entry.get("time", 0) > self.ttl:
+            return None
+        return entry.get("value")
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Stores ``value``, which must be JSON serializable and not ``None``,
+        under ``key``. Failing to write the entry is not an error.
+        """
+        path = self._entry_path(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"key": key, "time": time.time(), "value": value}, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+def get_metadata_cache() -> Optional[MetadataCache]:
+    """
+    Returns the metadata cache configured through the environment, or
+    ``None`` if caching is disabled.
+    """
+    ttl = float(os.environ.get("GEM5_RESOURCE_METADATA_CACHE_TTL", "0"))
+    if ttl <= 0:
+        return None
+    directory = os.environ.get(
+        "GEM5_RESOURCE_METADATA_CACHE_DIR",
+        os.path.join(Path.home(), ".cache", "gem5", "metadata"),
+    )
+    return MetadataCache(Path(directory), ttl)
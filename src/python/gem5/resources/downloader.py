@@ -32,13 +32,20 @@ import tarfile
 import time
 import urllib.parse
 import urllib.request
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from http.client import IncompleteRead
 from pathlib import Path
 from typing import (
+    Callable,
     Dict,
     List,
     Optional,
 )
-from urllib.error import HTTPError
+from urllib.error import (
+    HTTPError,
+    URLError,
+)
 from urllib.parse import urlparse
 
 from m5.util import warn
@@ -46,10 +53,7 @@ from m5.util import warn
 from _m5 import core
 
 from ..utils.filelock import FileLock
-from ..utils.progress_bar import (
-    progress_hook,
-    tqdm,
-)
+from ..utils.progress_bar import tqdm
 from ..utils.socks_ssl_context import get_proxy_context
 from .client import get_resource_json_obj
 from .client import list_resources as client_list_resources
@@ -64,10 +68,230 @@ information about resources from resources.gem5.org.
 """
 
 
-def _download(url: str, download_to: str, max_attempts: int = 6) -> None:
+# The size of the blocks in which downloads are read from the network and
+# written to disk.
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Resources smaller than this are always downloaded over a single connection,
+# even when multiple connections are requested.
+_PARALLEL_DOWNLOAD_THRESHOLD = 64 * 1024 * 1024
+
+
+def _urlopen(request: urllib.request.Request):
+    proxy_context = get_proxy_context()
+    if proxy_context:
+        return urllib.request.urlopen(request, context=proxy_context)
+    return urllib.request.urlopen(request)
+
+
+class _GzipStreamInflater:
+    """
+    Decompresses a gzip stream as it is written, in blocks, to this object.
+    This allows a gzipped resource to be decompressed while it is still being
+    downloaded. As with ``gzip.open``, streams made up of multiple gzip members
+    are supported.
+    """
+
+    def __init__(self, inflate_to: str):
+        self._out = open(inflate_to, "wb")
+        self._new_member()
+
+    def _new_member(self) -> None:
+        self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        self._in_member = False
+
+    def write(self, data: bytes) -> None:
+        while data:
+            self._in_member = True
+            self._out.write(self._decompressor.decompress(data))
+            if not self._decompressor.eof:
+                return
+            data = self._decompressor.unused_data
+            self._new_member()
+
+    def close(self, complete: bool = True) -> None:
+        """
+        Closes the decompressed output file.
+
+        :param complete: If ``True``, an exception is raised if the stream
+                         written so far ends part-way through a gzip member.
+        """
+        self._out.close()
+        if complete and self._in_member:
+            raise EOFError(
+                "Compressed file ended before the end-of-stream marker was "
+                "reached."
+            )
+
+
+def _get_range_length(url: str) -> Optional[int]:
+    """
+    Returns the size of the file at ``url`` if the server supports HTTP range
+    requests for it, otherwise ``None``.
+    """
+    request = urllib.request.Request(url, method="HEAD")
+    try:
+        with _urlopen(request) as response:
+            if response.headers.get("Accept-Ranges", "").lower() != "bytes":
+                return None
+            length = response.headers.get("Content-Length")
+            return int(length) if length else None
+    except (URLError, ValueError):
+        return None
+
+
+def _fetch_range(
+    url: str,
+    part_file: str,
+    start: int = 0,
+    end: Optional[int] = None,
+    on_chunk: Optional[Callable[[bytes], None]] = None,
+) -> None:
+    """
+    Downloads the bytes ``start`` to ``end`` (inclusive) of the file at
+    ``url`` to ``part_file``. If ``end`` is ``None`` the remainder of the file
+    is downloaded.
+
+    If ``part_file`` already exists it is assumed to hold the first bytes of
+    the range from a previous, interrupted, attempt and only the remaining
+    bytes are requested. If the server does not honor the range request the
+    download restarts from the beginning of the range.
+
+    :param on_chunk: A function called with each block of data written to
+                     ``part_file``, including any data already present in it.
+    """
+    offset = os.path.getsize(part_file) if os.path.exists(part_file) else 0
+    if end is not None and start + offset > end:
+        return
+
+    request = urllib.request.Request(url)
+    if start + offset > 0 or end is not None:
+        end_str = "" if end is None else str(end)
+        request.add_header("Range", f"bytes={start + offset}-{end_str}")
+
+    with _urlopen(request) as response:
+        mode = "ab"
+        if response.status != 206:
+            # The server has ignored the range request and is sending the
+            # whole file.
+            if start != 0 or end is not None:
+                raise Exception(
+                    f"The server for '{url}' does not support range requests."
+                )
+            mode = "wb"
+            offset = 0
+
+        with open(part_file, mode) as f:
+            if on_chunk and offset:
+                with open(part_file, "rb") as existing:
+                    for chunk in iter(
+                        lambda: existing.read(_DOWNLOAD_CHUNK_SIZE), b""
+                    ):
+                        on_chunk(chunk)
+            expected = response.length
+            received = 0
+            for chunk in iter(
+                lambda: response.read(_DOWNLOAD_CHUNK_SIZE), b""
+            ):
+                f.write(chunk)
+                received += len(chunk)
+                if on_chunk:
+                    on_chunk(chunk)
+
+    # The connection may be closed before the whole response is received
+    # without an error being raised by the read.
+    if expected is not None and received < expected:
+        raise IncompleteRead(b"", expected - received)
+
+
+def _download_parallel(
+    url: str, part_file: str, length: int, connections: int
+) -> None:
+    """
+    Downloads the file at ``url`` to ``part_file`` over ``connections``
+    concurrent HTTP range requests. Each range is downloaded to its own
+    segment file, which is resumed if present, and the segments are then
+    concatenated.
+    """
+    segment_size = -(-length // connections)
+    segments = []
+    for i in range(connections):
+        start = i * segment_size
+        end = min(start + segment_size, length) - 1
+        if start <= end:
+            segments.append((f"{part_file}.{i}", start, end))
+
+    with tqdm(
+        unit="B",
+        unit_scale=True,
+        unit_divisor=1024,
+        miniters=1,
+        total=length,
+        desc=f"Downloading {part_file[: -len('.part')]}",
+    ) as t:
+        with ThreadPoolExecutor(max_workers=len(segments)) as executor:
+            futures = [
+                executor.submit(
+                    _fetch_range,
+                    url,
+                    segment_file,
+                    start,
+                    end,
+                    lambda chunk: t.update(len(chunk)),
+                )
+                for segment_file, start, end in segments
+            ]
+            for future in futures:
+                future.result()
+
+    with open(part_file, "wb") as f:
+        for segment_file, start, end in segments:
+            if os.path.getsize(segment_file) != end - start + 1:
+                raise Exception(
+                    f"Downloaded segment '{segment_file}' of '{url}' is "
+                    "incomplete."
+                )
+            with open(segment_file, "rb") as segment:
+                shutil.copyfileobj(segment, f, _DOWNLOAD_CHUNK_SIZE)
+    for segment_file, _, _ in segments:
+        os.remove(segment_file)
+
+
+def _inflate_file(gzip_file: str, inflate_to: str) -> None:
+    with gzip.open(gzip_file, "rb") as f:
+        with open(inflate_to, "wb") as o:
+            shutil.copyfileobj(f, o, _DOWNLOAD_CHUNK_SIZE)
+
+
+def _remove_partial_downloads(part_file: str) -> None:
+    """
+    Removes the ``.part`` file, and any parallel download segments of it,
+    left by an interrupted download.
+    """
+    directory = os.path.dirname(part_file) or "."
+    name = os.path.basename(part_file)
+    for entry in os.listdir(directory):
+        if entry == name or (
+            entry.startswith(f"{name}.") and entry[len(name) + 1 :].isdigit()
+        ):
+            os.remove(os.path.join(directory, entry))
+
+
+def _download(
+    url: str,
+    download_to: str,
+    max_attempts: int = 6,
+    inflate_to: Optional[str] = None,
+    connections: Optional[int] = None,
+) -> None:
     """
     Downloads a file.
 
+    The file is downloaded to ``download_to`` with a ``.part`` suffix and only
+    moved to ``download_to`` once complete. If the download is interrupted, a
+    subsequent attempt (including one made by a later call to this function)
+    resumes from the end of the ``.part`` file using an HTTP range request.
+
     The function will run a Truncated Exponential Backoff algorithm to retry
     the download if the HTTP Status Code returned is deemed retryable.
 
@@ -78,11 +302,27 @@ def _download(url: str, download_to: str, max_attempts: int = 6) -> None:
     :param max_attempts: The max number of download attempts before stopping.
                          The default is 6. This translates to roughly 1 minute
                          of retrying before stopping.
+
+    :param inflate_to: If set, the downloaded file is treated as gzipped and
+                       is decompressed to this location as it is downloaded.
+                       The compressed file is still stored at ``download_to``.
+
+    :param connections: The number of concurrent connections used to download
+                        large files from servers that support range requests.
+                        If ``None``, the value of the
+                        ``GEM5_RESOURCE_DOWNLOAD_CONNECTIONS`` environment
+                        variable is used, defaulting to 1.
     """
 
     # TODO: This whole setup will only work for single files we can get via
     # wget. We also need to support git clones going forward.
 
+    if connections is None:
+        connections = int(
+            os.environ.get("GEM5_RESOURCE_DOWNLOAD_CONNECTIONS", "1")
+        )
+
+    part_file = f"{download_to}.part"
     attempt = 0
     while True:
         # The loop will be broken on a successful download, via a `return`, or
@@ -90,23 +330,18 @@ def _download(url: str, download_to: str, max_attempts: int = 6) -> None:
         # number of download attempts has been reached or if a HTTP status code
         # other than 408, 429, or 5xx is received.
         try:
-            proxy_context = get_proxy_context()
-            if proxy_context:
-                # get the file as a bytes blob
-                request = urllib.request.Request(url)
-                with urllib.request.urlopen(
-                    request, context=proxy_context
-                ) as fr:
-                    with tqdm.wrapattr(
-                        open(download_to, "wb"),
-                        "write",
-                        miniters=1,
-                        desc="Downloading {download_to}",
-                        total=getattr(fr, "length", None),
-                    ) as fw:
-                        for chunk in fr:
-                            fw.write(chunk)
-            else:
+            length = None
+            if connections > 1:
+                length = _get_range_length(url)
+            if length and length >= _PARALLEL_DOWNLOAD_THRESHOLD:
+                _download_parallel(url, part_file, length, connections)
+                os.replace(part_file, download_to)
+                if inflate_to:
+                    _inflate_file(download_to, inflate_to)
+                return
+
+            inflater = _GzipStreamInflater(inflate_to) if inflate_to else None
+            try:
                 with tqdm(
                     unit="B",
                     unit_scale=True,
@@ -114,9 +349,20 @@ def _download(url: str, download_to: str, max_attempts: int = 6) -> None:
                     miniters=1,
                     desc=f"Downloading {download_to}",
                 ) as t:
-                    urllib.request.urlretrieve(
-                        url, download_to, reporthook=progress_hook(t)
-                    )
+
+                    def on_chunk(chunk: bytes) -> None:
+                        if inflater:
+                            inflater.write(chunk)
+                        t.update(len(chunk))
+
+                    _fetch_range(url, part_file, on_chunk=on_chunk)
+            except BaseException:
+                if inflater:
+                    inflater.close(complete=False)
+                raise
+            if inflater:
+                inflater.close()
+            os.replace(part_file, download_to)
             return
         except HTTPError as e:
             # If the error code retrieved is retryable, we retry using a
@@ -132,20 +378,29 @@ def _download(url: str, download_to: str, max_attempts: int = 6) -> None:
                         f"{e.code}"
                     )
                 time.sleep((2**attempt) + random.uniform(0, 1))
+            elif e.code == 416:
+                # The range requested is not satisfiable, most likely because
+                # the remote file has changed since the ".part" file was
+                # written. Restart the download from scratch.
+                attempt += 1
+                if attempt >= max_attempts:
+                    raise e
+                _remove_partial_downloads(part_file)
             else:
                 raise e
-        except ConnectionResetError as e:
+        except (ConnectionResetError, IncompleteRead) as e:
             # This catches the ConnectionResetError we see occassionally see
-            # when accessing resources on GitHub Actions.  It retries using a
-            # Truncated Exponential backoff algorithm, truncating after
-            # "max_attempts". If any other is retrieved we raise the error.
-            if e.errno == 104:
+            # when accessing resources on GitHub Actions, and connections that
+            # are closed before the whole file is received. It retries,
+            # resuming from the data already received, using a Truncated
+            # Exponential backoff algorithm, truncating after "max_attempts".
+            # If any other is retrieved we raise the error.
+            if isinstance(e, IncompleteRead) or e.errno == 104:
                 attempt += 1
                 if attempt >= max_attempts:
                     raise Exception(
                         f"After {attempt} attempts, the resource json could "
-                        "not be retrieved. OS Error Code retrieved: "
-                        f"{e.errno}"
+                        f"not be retrieved. Error retrieved: {e!r}"
                     )
                 time.sleep((2**attempt) + random.uniform(0, 1))
             else:
@@ -154,7 +409,7 @@ def _download(url: str, download_to: str, max_attempts: int = 6) -> None:
             raise Exception(
                 f"ValueError: {e}\n"
                 "Environment variable GEM5_USE_PROXY is set to "
-                f"'{use_proxy}'. The expected form is "
+                f"'{os.getenv('GEM5_USE_PROXY')}'. The expected form is "
                 "<host>:<port>'."
             )
         except ImportError as e:
@@ -370,9 +625,12 @@ def get_resource(
             download_dest += tar_extension
 
         zip_extension = ".gz"
+        unzip_to = download_dest
         if run_unzip:
             download_dest += zip_extension
 
+        inflated = False
+
         file_uri_path = _file_uri_to_path(resource_json["url"])
         if file_uri_path:
             if not file_uri_path.exists():
@@ -398,24 +656,31 @@ def get_resource(
             # Get the URL.
             url = resource_json["url"]
 
-            _download(url=url, download_to=download_dest)
+            # Gzipped resources are decompressed as they are downloaded.
+            _download(
+                url=url,
+                download_to=download_dest,
+                inflate_to=unzip_to if run_unzip else None,
+            )
+            inflated = run_unzip
             if not quiet:
                 print(f"Finished downloading resource '{resource_name}'.")
 
         if run_unzip:
-            if not quiet:
-                print(
-                    f"Decompressing resource '{resource_name}' "
-                    f"('{download_dest}')..."
-                )
-            unzip_to = download_dest[: -len(zip_extension)]
-            with gzip.open(download_dest, "rb") as f:
-                with open(unzip_to, "wb") as o:
-                    shutil.copyfileobj(f, o)
+            if not inflated:
+                if not quiet:
+                    print(
+                        f"Decompressing resource '{resource_name}' "
+                        f"('{download_dest}')..."
+                    )
+                _inflate_file(download_dest, unzip_to)
+                if not quiet:
+                    print(
+                        "Finished decompressing resource "
+                        f"'{resource_name}'."
+                    )
             os.remove(download_dest)
             download_dest = unzip_to
-            if not quiet:
-                print(f"Finished decompressing resource '{resource_name}'.")
 
         if run_tar_extract:
             if not quiet:
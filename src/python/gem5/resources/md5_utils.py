@@ -26,8 +26,115 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import hashlib
+import json
+import os
 from pathlib import Path
-from typing import Type
+from typing import (
+    Dict,
+    Optional,
+    Type,
+)
+
+# The size of the buffer used when reading files to hash. Resources such as
+# disk images can be many GiB in size, so a large buffer is used to keep the
+# number of read calls (and the Python overhead of each) low.
+_HASH_BUFFER_SIZE = 8 * 1024 * 1024
+
+# The name of the file, stored in the same directory as the hashed resources,
+# in which previously computed md5 values are recorded.
+_CACHE_FILE_NAME = ".gem5-md5-cache.json"
+
+# The version of the cache file format. Cache files of a different version are
+# ignored.
+_CACHE_VERSION = 1
+
+
+def _stat_key(path: Path) -> Dict[str, int]:
+    """
+    Returns the values used to determine whether a file has changed since its
+    md5 value was last computed.
+    """
+    stat = path.stat()
+    return {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "inode": stat.st_ino,
+    }
+
+
+def _dir_key(directory: Path) -> Dict[str, str]:
+    """
+    Returns a fingerprint of a directory's contents built from the path, size,
+    modification time and inode of every entry within it. If any file in the
+    directory is added, removed, renamed or modified, the fingerprint changes.
+    """
+    fingerprint = hashlib.md5()
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for name in sorted(files):
+            if name.startswith(_CACHE_FILE_NAME):
+                continue
+            path = Path(root) / name
+            key = _stat_key(path)
+            fingerprint.update(
+                "{}:{}:{}:{}\n".format(
+                    path.relative_to(directory),
+                    key["size"],
+                    key["mtime_ns"],
+                    key["inode"],
+                ).encode()
+            )
+        for name in dirs:
+            fingerprint.update(
+                f"{(Path(root) / name).relative_to(directory)}/\n".encode()
+            )
+    return {"fingerprint": fingerprint.hexdigest()}
+
+
+def _cache_path(path: Path) -> Path:
+    return path.absolute().parent / _CACHE_FILE_NAME
+
+
+def _load_cache(cache_file: Path) -> Dict[str, Dict]:
+    try:
+        with open(cache_file) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("version") != _CACHE_VERSION:
+        return {}
+    entries = cache.get("entries", {})
+    return entries if isinstance(entries, dict) else {}
+
+
+def _cache_lookup(path: Path, key: Dict) -> Optional[str]:
+    entry = _load_cache(_cache_path(path)).get(path.name)
+    if entry and entry.get("key") == key:
+        return entry.get("md5")
+    return None
+
+
+def _cache_store(path: Path, key: Dict, md5: str) -> None:
+    """
+    Records the md5 value of ``path`` in the cache file of its parent
+    directory. The cache is written to a temporary file and then moved into
+    place so concurrent readers never observe a partially written cache.
+    Failing to write the cache (e.g., in a read-only directory) is not an
+    error: the md5 value will simply be recomputed next time.
+    """
+    cache_file = _cache_path(path)
+    entries = _load_cache(cache_file)
+    entries[path.name] = {"key": key, "md5": md5}
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_file, "w") as f:
+            json.dump({"version": _CACHE_VERSION, "entries": entries}, f)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
 
 
 def _md5_update_from_file(
@@ -50,7 +157,7 @@ def _md5_update_from_file(
         desc=f"Computing md5sum on {filename}",
         total=filename.stat().st_size,
     ) as f:
-        for chunk in iter(lambda: f.read(4096), b""):
+        for chunk in iter(lambda: f.read(_HASH_BUFFER_SIZE), b""):
             hash.update(chunk)
     return hash
 
@@ -60,6 +167,8 @@ def _md5_update_from_dir(
 ) -> Type[hashlib.md5]:
     assert directory.is_dir()
     for path in sorted(directory.iterdir(), key=lambda p: str(p).lower()):
+        if path.name == _CACHE_FILE_NAME:
+            continue
         hash.update(path.name.encode())
         if path.is_file():
             hash = _md5_update_from_file(path, hash)
@@ -68,40 +177,76 @@ def _md5_update_from_dir(
     return hash
 
 
-def md5(path: Path) -> str:
+def md5(path: Path, use_cache: bool = True) -> str:
     """
     Gets the md5 value of a file or directory. ``md5_file`` is used if the path
     is a file and ``md5_dir`` is used if the path is a directory. An exception
     is returned if the path is not a valid file or directory.
 
     :param path: The path to get the md5 of.
+
+    :param use_cache: If ``True``, a previously computed md5 value is returned
+                      if the path has not changed since. ``True`` by default.
     """
     if path.is_file():
-        return md5_file(Path(path))
+        return md5_file(Path(path), use_cache=use_cache)
     elif path.is_dir():
-        return md5_dir(Path(path))
+        return md5_dir(Path(path), use_cache=use_cache)
     else:
         raise Exception(f"Path '{path}' is not a valid file or directory.")
 
 
-def md5_file(filename: Path) -> str:
+def md5_file(filename: Path, use_cache: bool = True) -> str:
     """
     Gives the md5 hash of a file.
 
+    Computed values are recorded in a cache file in the same directory as the
+    file, keyed by the file's size, modification time and inode. If the file
+    is unchanged when next hashed the cached value is returned without reading
+    the file.
+
     :filename: The file in which the md5 is to be calculated.
+
+    :param use_cache: If ``True``, the md5 cache is consulted and updated.
+                      ``True`` by default.
     """
-    return str(_md5_update_from_file(filename, hashlib.md5()).hexdigest())
+    filename = Path(filename)
+    if not use_cache:
+        return str(_md5_update_from_file(filename, hashlib.md5()).hexdigest())
+
+    key = _stat_key(filename)
+    md5 = _cache_lookup(filename, key)
+    if md5 is None:
+        md5 = str(_md5_update_from_file(filename, hashlib.md5()).hexdigest())
+        _cache_store(filename, key, md5)
+    return md5
 
 
-def md5_dir(directory: Path) -> str:
+def md5_dir(directory: Path, use_cache: bool = True) -> str:
     """
     Gives the md5 value of a directory.
 
     This is achieved by getting the md5 hash of all files in the directory.
 
+    As with ``md5_file``, computed values are cached. The cache entry for a
+    directory is invalidated if any file within it is added, removed or
+    modified.
+
     .. note::
 
         The path of files are also hashed so the md5 of the directory changes
         if empty files are included or filenames are changed.
+
+    :param use_cache: If ``True``, the md5 cache is consulted and updated.
+                      ``True`` by default.
     """
-    return str(_md5_update_from_dir(directory, hashlib.md5()).hexdigest())
+    directory = Path(directory)
+    if not use_cache:
+        return str(_md5_update_from_dir(directory, hashlib.md5()).hexdigest())
+
+    key = _dir_key(directory)
+    md5 = _cache_lookup(directory, key)
+    if md5 is None:
+        md5 = str(_md5_update_from_dir(directory, hashlib.md5()).hexdigest())
+        _cache_store(directory, key, md5)
+    return md5
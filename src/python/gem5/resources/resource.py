@@ -1042,6 +1042,68 @@ def obtain_resource(
     )
 
 
+def obtain_resources(
+    resource_ids: List[str],
+    resource_versions: Optional[Dict[str, str]] = None,
+    resource_directory: Optional[str] = None,
+    download_md5_mismatch: bool = True,
+    clients: Optional[List] = None,
+    gem5_version=core.gem5Version,
+    quiet: bool = False,
+) -> List[AbstractResource]:
+    """
+    Obtains multiple resources at once. This is equivalent to calling
+    ``obtain_resource`` for each resource ID but the metadata of all the
+    resources is retrieved from each client in a single request. E.g.:
+
+    .. code-block:: python
+
+        kernel, disk_image, bootloader = obtain_resources(
+            ["riscv-linux-6.6.33-kernel", "riscv-ubuntu-24.04-img",
+             "riscv-bootloader-opensbi-1.3.1"]
+        )
+
+    :param resource_ids: The IDs of the resources to obtain.
+    :param resource_versions: A dictionary mapping resource IDs to the version
+                              of that resource to obtain. Resources not in
+                              this dictionary are obtained at the latest
+                              compatible version. ``None`` by default.
+
+    The remaining parameters are passed to ``obtain_resource``.
+
+    :returns: The resources, in the same order as ``resource_ids``.
+    """
+    resource_versions = resource_versions or {}
+
+    # Retrieving the metadata of all the resources in one batch populates
+    # each client's record of previous queries, so the calls to
+    # `obtain_resource` below do not need to query the clients again.
+    get_multiple_resource_json_obj(
+        [
+            ClientQuery(
+                resource_id=resource_id,
+                resource_version=resource_versions.get(resource_id),
+                gem5_version=gem5_version,
+            )
+            for resource_id in resource_ids
+        ],
+        clients,
+    )
+
+    return [
+        obtain_resource(
+            resource_id,
+            resource_directory=resource_directory,
+            download_md5_mismatch=download_md5_mismatch,
+            resource_version=resource_versions.get(resource_id),
+            clients=clients,
+            gem5_version=gem5_version,
+            quiet=quiet,
+        )
+        for resource_id in resource_ids
+    ]
+
+
 def _resources_schema_validator(resource_json: Dict[str, Any]) -> None:
     """
     This function is used to validate the schema of the resource JSON object
@@ -24,8 +24,10 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import json
 import os
 import sys
+import time
 from pathlib import Path
 from typing import (
     Callable,
@@ -666,3 +668,118 @@ class Simulator:
 
     def get_checkpoint_dir(self) -> Optional[Path]:
         return self._board.get_checkpoint_dir()
+
+    def fan_out(
+        self,
+        variants: Dict[str, Callable[["Simulator"], None]],
+        processes: Optional[int] = None,
+    ) -> Dict[str, int]:
+        """
+        Runs several variants of the simulation from its current state, each
+        in a copy of this process, so the part of the simulation they share
+        (e.g., booting the OS up to the region of interest) is only simulated
+        once. This is to be called once ``run`` has returned at the point to
+        fan out from.
+
+        Each variant is a function passed the Simulator in the forked
+        process. It may change anything which can still be changed once the
+        simulation is instantiated (e.g., switch the processor, or set the
+        max ticks or the exit event handlers) before the simulation is run
+        to completion. The output of each variant is written to
+        ``<outdir>/<id>``, and its exit code, wall-clock time and maximum
+        resident set size to ``fan_out_summary.json`` in the output
+        directory.
+
+        Variants which need different parameters (e.g., cache sizes) cannot
+        be forked from an instantiated simulation. Instead, save a checkpoint
+        into ``multisim.shared_checkpoint_dir`` and add a simulator restoring
+        from it for each variant with ``multisim.add_simulator(..., after=)``.
+
+        Forking requires all the listeners (e.g., GDB) to be disabled, with
+        ``m5.disableAllListeners()``.
+
+        :param variants: The variants to run, keyed by their ID.
+        :param processes: The maximum number of variants run at the same
+                          time. If not set, the number of cores this process
+                          may use.
+
+        :returns: The exit code of each variant, keyed by its ID.
+        """
+
+        if not self._instantiated:
+            raise Exception(
+                "The simulation must be run up to the point to fan out from "
+                "before calling `fan_out`."
+            )
+        if not m5.listenersDisabled():
+            raise Exception(
+                "Cannot fan out a simulation with listeners enabled. Call "
+                "`m5.disableAllListeners()` before running it."
+            )
+        if processes is None:
+            processes = len(os.sched_getaffinity(0))
+
+        pending = list(variants.items())
+        running = {}
+        summary = {}
+        while pending or running:
+            while pending and len(running) < processes:
+                id, variant = pending.pop(0)
+                outdir = self._outdir / id
+                outdir.mkdir(parents=True, exist_ok=True)
+                # `m5.fork` formats the output directory with `%`.
+                pid = m5.fork(str(outdir).replace("%", "%%"))
+                if pid == 0:
+                    self._run_variant(outdir, variant)
+                running[pid] = (id, time.monotonic())
+
+            # Only wait for the variants, not for any other child of this
+            # process.
+            pid = 0
+            while pid == 0:
+                for child in running:
+                    pid, status, rusage = os.wait4(child, os.WNOHANG)
+                    if pid != 0:
+                        break
+                else:
+                    time.sleep(0.1)
+            id, start = running.pop(pid)
+            if os.WIFSIGNALED(status):
+                exit_code = -os.WTERMSIG(status)
+            else:
+                exit_code = os.WEXITSTATUS(status)
+            # ru_maxrss is in kilobytes, except on macOS where it is in bytes.
+            max_rss = rusage.ru_maxrss
+            if sys.platform != "darwin":
+                max_rss *= 1024
+            summary[id] = {
+                "exit_code": exit_code,
+                "wall_time": time.monotonic() - start,
+                "max_rss": max_rss,
+            }
+
+        with open(self._outdir / "fan_out_summary.json", "w") as f:
+            json.dump(summary, f, indent=4)
+        return {id: result["exit_code"] for id, result in summary.items()}
+
+    def _run_variant(
+        self, outdir: Path, variant: Callable[["Simulator"], None]
+    ) -> None:
+        """Runs a variant of the simulation in a process forked by
+        ``fan_out``. This never returns.
+        """
+
+        self._outdir = outdir
+        # `m5.fork` moves the output directory, but the stat outputs already
+        # created still write to the files of the parent.
+        m5.stats.reopenOutputs()
+        # Exit through `sys.exit`, so the final stats are dumped.
+        try:
+            variant(self)
+            self.run()
+        except Exception:
+            import traceback
+
+            traceback.print_exc()
+            sys.exit(1)
+        sys.exit(0)
@@ -50,6 +50,50 @@ class Spawn_gem5Process(process.BaseProcess):
 
         return Popen(process_obj)
 
+    @property
+    def rusage(self):
+        """The resources used by the process (as returned by `os.wait4`),
+        or None if it has not finished or they are not known.
+        """
+        return getattr(self._popen, "rusage", None)
+
+
+class Fork_gem5Process(process.BaseProcess):
+    """A process forked from the current gem5 process, rather than a new
+    gem5 process. As such, it can only be used before `m5.instantiate` is
+    called.
+    """
+
+    _start_method = None
+
+    @staticmethod
+    def _Popen(process_obj):
+        from .popen_fork_gem5 import Popen
+
+        return Popen(process_obj)
+
+    def run(self):
+        """Run the target, then gem5's exit handlers (see
+        `m5.simulate.registerExitHandler`).
+
+        A forked process exits with `os._exit`, without calling the atexit
+        handlers, so the final stats dump and the C++ exit callbacks would
+        otherwise never run.
+        """
+        try:
+            super().run()
+        finally:
+            from m5.simulate import runExitHandlers
+
+            runExitHandlers()
+
+    @property
+    def rusage(self):
+        """The resources used by the process (as returned by `os.wait4`),
+        or None if it has not finished or they are not known.
+        """
+        return getattr(self._popen, "rusage", None)
+
 
 class Process(process.BaseProcess):
     _start_method = None
@@ -58,6 +102,13 @@ class Process(process.BaseProcess):
     def _Popen(process_obj):
         return _default_context.get_context().Process._Popen(process_obj)
 
+    @property
+    def rusage(self):
+        """The resources used by the process (as returned by `os.wait4`),
+        or None if it has not finished or they are not known.
+        """
+        return getattr(self._popen, "rusage", None)
+
 
 class gem5Context(context.BaseContext):
     _name = "spawn_gem5"
@@ -43,12 +43,15 @@ from multiprocessing.context import (
     set_spawning_popen,
 )
 
+from . import popen_fork_gem5
 from ._command_line import get_command_line
 
 __all__ = ["Popen"]
 
 
-class Popen(popen_spawn_posix.Popen):
+# `popen_fork_gem5.Popen` provides the `poll` which records the resources used
+# by the process. `popen_spawn_posix.Popen` provides everything else.
+class Popen(popen_spawn_posix.Popen, popen_fork_gem5.Popen):
     method = "spawn_gem5"
 
     def __init__(self, process_obj):
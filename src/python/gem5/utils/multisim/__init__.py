@@ -30,4 +30,5 @@ from .multisim import (
     num_simulators,
     run,
     set_num_processes,
+    shared_checkpoint_dir,
 )
@@ -52,8 +52,30 @@ def main():
         help="The path to the config script specifying the simulations to run using multisim.",
     )
 
+    parser.add_argument(
+        "--fork-server",
+        action="store_true",
+        help="Load the config script once and fork a process to run each "
+        "simulation, instead of starting a new gem5 process for each. This "
+        "reduces the start-up time of each simulation.",
+    )
+
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=None,
+        help="The maximum number of simulations to run at once. This "
+        "overrides any number set by the config script with "
+        "`set_num_processes`. Simulations are also only started when the "
+        "host has the cores and memory they need.",
+    )
+
     args = parser.parse_args()
-    run(module_path=Path(args.config))
+    run(
+        module_path=Path(args.config),
+        processes=args.processes,
+        fork_server=args.fork_server,
+    )
 
 
 if __name__ == "__m5_main__":
@@ -47,21 +47,107 @@ config script is passed as a string referencing the config script as a module.
 This script is then passed to the child processes to load.
 
 2. The config script cannot accept parameters. It must be parameterless.
+
+Scheduling
+----------
+
+Simulations are started as soon as the resources they need are free, rather
+than only being limited to a number of processes. Each simulator can declare
+the memory and the number of host threads it needs, and an estimate of how
+long it will take, when it is added:
+
+.. code-block::
+
+    multisim.add_simulator(simulator, memory="8GiB", threads=1, cost=3600)
+
+A simulation is admitted when its declared needs fit in the host's memory and
+cores alongside the simulations already running (and the number of running
+simulations is below `set_num_processes`, if set). Simulations with a cost
+estimate are started first, longest first, then the others in the order they
+were added. When all the simulations have finished, the wall-clock time,
+maximum resident set size and exit status of each are written to
+`multisim_summary.json` in the output directory.
+
+Fork server
+-----------
+
+By default, each simulation is run in a new gem5 process which loads the
+config script again. For sweeps of many short simulations, the time taken to
+start gem5, import the SimObjects and obtain the resources can be a large
+part of each run. With `--fork-server`, a single gem5 process loads the config
+script once and forks a child to run each simulation:
+
+.. code-block::
+
+    <gem5-binary> -m gem5.utils.multisim --fork-server <config_script>
+
+The children are forked before `m5.instantiate` is called, so this requires
+the config script not to start threads (which are not copied by `fork`).
+
+Checkpoint fan-out
+------------------
+
+A sweep whose simulations share a prefix (e.g., booting the OS up to the
+region of interest) can simulate it once, save a checkpoint and restore it
+in each of the simulations:
+
+.. code-block::
+
+    def save_checkpoint():
+        boot.save_checkpoint(multisim.shared_checkpoint_dir("boot"))
+        return True
+
+    boot_board = make_board(l1d_size="32KiB")
+    boot_board.set_kernel_disk_workload(kernel=kernel, disk_image=disk)
+    boot = Simulator(
+        board=boot_board,
+        id="boot",
+        on_exit_event={ExitEvent.WORKBEGIN: save_checkpoint},
+    )
+    multisim.add_simulator(boot)
+
+    for size in ("16KiB", "32KiB", "64KiB"):
+        board = make_board(l1d_size=size)
+        board.set_kernel_disk_workload(
+            kernel=kernel,
+            disk_image=disk,
+            checkpoint=multisim.shared_checkpoint_dir("boot"),
+        )
+        multisim.add_simulator(Simulator(board=board, id=size), after="boot")
+
+The checkpoint is kept in shared memory (/dev/shm) if the host has it, and
+the simulations run after "boot" only start once it has finished. When the
+variants only differ in what can be changed after instantiation (e.g., the
+CPU switched to), `Simulator.fan_out` forks them from the simulation instead,
+which saves restoring the checkpoint.
 """
 
+import hashlib
 import importlib
+import json
 import multiprocessing
+import os
+import shutil
 import signal
+import sys
+import tempfile
 import time
 from multiprocessing import Lock
+from multiprocessing.connection import wait
+from multiprocessing.process import BaseProcess
 from pathlib import Path
 from typing import (
+    Callable,
+    Dict,
+    List,
     Optional,
-    Set,
+    Tuple,
+    Union,
 )
 
 from m5.core import override_re_outdir
 from m5.util import inform
+from m5.util.convert import toMemorySize
 
 # A global variable which __main__.py flips to `True` when multisim is run as
 # an executable module.
@@ -73,7 +159,45 @@ module_run = False
 # threads.
 _num_processes = None
 
-_multi_sim: Set["Simulator"] = set()
+# The simulators to run, in the order they were added, each mapped to the
+# resources it declared it needs (see `add_simulator`).
+_multi_sim: Dict["Simulator", Dict] = {}
+
+
+class _Job:
+    """A simulation to run, and what was recorded when running it."""
+
+    def __init__(
+        self,
+        id: str,
+        memory: Optional[int] = None,
+        threads: int = 1,
+        cost: Optional[float] = None,
+        after: Optional[str] = None,
+    ):
+        self.id = id
+        self.memory = memory
+        self.threads = threads
+        self.cost = cost
+        self.after = after
+
+        self.process = None
+        self.start_time = None
+        self.wall_time = None
+        self.max_rss = None
+        self.exit_code = None
+
+    def summary(self) -> Dict:
+        return {
+            "id": self.id,
+            "exit_code": self.exit_code,
+            "wall_time": self.wall_time,
+            "max_rss": self.max_rss,
+            "memory": self.memory,
+            "threads": self.threads,
+            "cost": self.cost,
+            "after": self.after,
+        }
 
 
 def _load_module(module_path: Path) -> None:
@@ -125,6 +249,141 @@ def _get_num_processes_child_process(
     num_processes_dict["num_processes"] = _num_processes
 
 
+def _get_jobs_child_process(info_dict, module_path: Path) -> None:
+    """Get the simulations to be run, with their declared resource needs,
+    and the maximum number of processes.
+
+    Like `_get_simulator_ids_child_process`, this is run in a child process
+    as the config script cannot be loaded in the main process.
+    """
+
+    _load_module(module_path)
+    global _multi_sim, _num_processes
+    info_dict["jobs"] = [
+        dict(id=sim.get_id(), **needs) for sim, needs in _multi_sim.items()
+    ]
+    info_dict["num_processes"] = _num_processes
+
+
+def _get_jobs(config_module_path: Path) -> Tuple[List[_Job], Optional[int]]:
+    """Returns the simulations to run and the maximum number of processes
+    set by the config script, loading it once in a child process.
+    """
+
+    manager = multiprocessing.Manager()
+    info_dict = manager.dict()
+    p = multiprocessing.Process(
+        target=_get_jobs_child_process,
+        args=(info_dict, config_module_path),
+    )
+    p.start()
+    p.join()
+    jobs = [_Job(**job) for job in info_dict["jobs"]]
+    return jobs, info_dict["num_processes"]
+
+
+def _host_resources() -> Tuple[int, Optional[int]]:
+    """Returns the number of cores this process may use and the host's
+    memory in bytes (None if unknown), taking into account any cgroup (v2)
+    memory limit.
+    """
+
+    try:
+        threads = len(os.sched_getaffinity(0))
+    except AttributeError:
+        threads = os.cpu_count() or 1
+
+    try:
+        memory = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, OSError, ValueError):
+        memory = None
+    try:
+        with open("/sys/fs/cgroup/memory.max") as f:
+            limit = f.read().strip()
+        if limit.isdigit():
+            memory = min(memory, int(limit)) if memory else int(limit)
+    except OSError:
+        pass
+
+    return threads, memory
+
+
+def _exit_status(exitcode: Optional[int]) -> int:
+    """The exit status of a process with the given `exitcode`, which is
+    negative if it was killed by a signal, as a shell reports it.
+    """
+    if exitcode is None:
+        return 1
+    if exitcode < 0:
+        return 128 - exitcode
+    return exitcode
+
+
+def _max_rss(process) -> Optional[int]:
+    """The maximum resident set size of a finished process, in bytes."""
+    rusage = process.rusage
+    if rusage is None:
+        return None
+    # ru_maxrss is in kilobytes, except on macOS where it is in bytes.
+    if sys.platform == "darwin":
+        return rusage.ru_maxrss
+    return rusage.ru_maxrss * 1024
+
+
+# The environment variable recording the directory returned by
+# `_shared_dir`, which the processes of a MultiSim run inherit.
+_SHARED_DIR_ENV = "GEM5_MULTISIM_SHARED_DIR"
+
+
+def _shared_dir() -> Path:
+    """The directory holding the checkpoints shared between the simulators
+    (see `shared_checkpoint_dir`). It is named after the top-level output
+    directory.
+
+    The first call, made before the output directory is changed to that of
+    a simulator, records the directory in the environment, so it is the
+    same in all the processes of a MultiSim run.
+    """
+    shared = os.environ.get(_SHARED_DIR_ENV)
+    if shared:
+        return Path(shared)
+
+    import m5
+
+    outdir = os.path.abspath(m5.options.outdir)
+    name = "gem5-multisim-" + hashlib.sha1(outdir.encode()).hexdigest()[:16]
+    shm = Path("/dev/shm")
+    if shm.is_dir() and os.access(shm, os.W_OK):
+        shared = shm / name
+    else:
+        shared = Path(tempfile.gettempdir()) / name
+    os.environ[_SHARED_DIR_ENV] = str(shared)
+    return shared
+
+
+def shared_checkpoint_dir(id: str) -> Path:
+    """Returns the directory in which the simulator `id` can save a
+    checkpoint for the simulators run after it (see `add_simulator`) to
+    restore from.
+
+    The directory is in shared memory (/dev/shm) if the host has it, so the
+    checkpoint is neither written to nor read from the disk, and it is
+    removed once all the simulators have finished.
+
+    :param id: The ID of the simulator saving the checkpoint.
+    """
+    return _shared_dir() / id
+
+
+def _write_summary(jobs: List[_Job]) -> None:
+    import m5
+
+    path = Path(m5.options.outdir) / "multisim_summary.json"
+    with open(path, "w") as f:
+        json.dump([job.summary() for job in jobs], f, indent=4)
+    inform(f"MultiSim summary written to '{path}'")
+
+
 def get_simulator_ids(config_module_path: Path) -> list[str]:
     """This is a  hack to determine the IDs of the simulations we are to run.
     The only way we can know is by importing the module, which we can only do
@@ -164,6 +423,17 @@ def _run(module_path: Path, id: str) -> None:
     """Run the simulator with the ID specified."""
 
     _load_module(module_path)
+    _run_simulator(id)
+
+
+def _run_simulator(id: str) -> None:
+    """Run the simulator with the ID specified, from the config script
+    already loaded in this process.
+    """
+
+    # A forked child inherits the signal handlers of the scheduler.
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
 
     global _multi_sim
     sim_list = [sim for sim in _multi_sim if sim.get_id() == id]
@@ -172,6 +442,8 @@ def _run(module_path: Path, id: str) -> None:
     assert len(sim_list) == 1, f"Multiple simulators with id '{id}' found."
     import m5
 
+    # Fix the shared directory before the output directory changes.
+    _shared_dir()
     subdir = Path(Path(m5.options.outdir) / Path(sim_list[0].get_id()))
     sim_list[0].override_outdir(subdir)
     # This doesn't do anything if none of the redirect options are passed
@@ -180,15 +452,65 @@ def _run(module_path: Path, id: str) -> None:
         sim_list[0].run()
     except Exception as e:
         inform(f"Error running simulator {id}: {e}")
+        # Exit with an error status, so it is recorded in the summary.
+        raise
+
 
+def _fork_server(module_path: Path, processes: Optional[int]) -> None:
+    """Load the config script once, then run each of its simulators in a
+    child forked from this process.
 
-def run(module_path: Path, processes: Optional[int] = None) -> None:
+    This is run in a single gem5 process started by `run`. As the children
+    are forked before `m5.instantiate` is called, they do not need to start
+    a new gem5 process, load the config script or obtain its resources.
+    """
+
+    _load_module(module_path)
+
+    global _multi_sim, _num_processes
+    jobs = [
+        _Job(id=sim.get_id(), **needs) for sim, needs in _multi_sim.items()
+    ]
+    if processes is None:
+        processes = _num_processes
+
+    from ..multiprocessing.context import Fork_gem5Process
+
+    # The exit status of the fork server is that of the simulations.
+    sys.exit(
+        _schedule(
+            jobs,
+            processes,
+            lambda job: Fork_gem5Process(
+                target=_run_simulator, args=(job.id,), name=job.id
+            ),
+        )
+    )
+
+
+def run(
+    module_path: Path,
+    processes: Optional[int] = None,
+    fork_server: bool = False,
+) -> None:
     """Run the simulators specified in the module in parallel.
 
+    Simulations are started as soon as the resources they declared they need
+    are free (see the module documentation), and the main process sleeps
+    until one of them finishes.
+
     :param module_path: The path to the module containing the simulators to
     run.
     :param processes: The number of processes to run in parallel. If not
-    specified, the number of available threads will be used.
+    specified, the number set by the module via `set_num_processes` is used.
+    If neither is set, the number of simulations is only limited by the
+    host's cores and memory.
+    :param fork_server: If True, the module is loaded once in a single gem5
+    process, which forks a child to run each simulator. Otherwise, each
+    simulator is run in a new gem5 process which loads the module itself.
+    Forking saves the time taken to start gem5 and run the module for each
+    simulation, which matters when there are many short simulations, but
+    the module must not start any threads.
     """
 
     assert len(_multi_sim) == 0, (
@@ -196,71 +518,200 @@ def run(module_path: Path, processes: Optional[int] = None) -> None:
         "(prior to determining number of jobs)."
     )
 
-    # Get the simulator IDs. This both provides us a list of targets
-    # and, by-proxy, the number of jobs.
-    ids = get_simulator_ids(module_path)
-    max_num_processes = get_num_processes(module_path)
+    from ..multiprocessing import Process
+
+    if fork_server:
+        server = Process(
+            target=_fork_server,
+            args=(module_path, processes),
+            name="fork_server",
+        )
+
+        def handle_exit(signum, frame):
+            """Signal handler to stop the server, which stops the
+            simulations.
+            """
+            if server.is_alive():
+                inform("Terminating the fork server")
+                server.terminate()
+            server.join()
+            sys.exit(_exit_status(server.exitcode))
+
+        signal.signal(signal.SIGINT, handle_exit)
+        signal.signal(signal.SIGTERM, handle_exit)
+
+        server.start()
+        server.join()
+        if server.exitcode != 0:
+            inform(f"The fork server exited with code {server.exitcode}")
+        sys.exit(_exit_status(server.exitcode))
+
+    # Get the simulators to run and what they need. This both provides us a
+    # list of targets and, by-proxy, the number of jobs.
+    jobs, max_num_processes = _get_jobs(module_path)
+    if processes is not None:
+        max_num_processes = processes
 
     assert len(_multi_sim) == 0, (
         "Simulators instantiated in main thread instead of child thread "
         "(after determining number of jobs)."
     )
-    assert max_num_processes is not None, (
-        "The maximum number of processes to use has not been set. Please "
-        "call `multisim.set_num_processes(num_processes)` in your "
-        "configuration script."
+
+    sys.exit(
+        _schedule(
+            jobs,
+            max_num_processes,
+            lambda job: Process(
+                target=_run, args=(module_path, job.id), name=job.id
+            ),
+        )
+    )
+
+
+def _schedule(
+    jobs: List[_Job],
+    max_num_processes: Optional[int],
+    make_process: Callable[[_Job], BaseProcess],
+) -> int:
+    """Run the jobs, each in the process returned by `make_process`,
+    starting each as soon as the resources it needs are free, then write
+    the summary of the runs.
+
+    Returns the exit status of the runs: 0 if every job ran and succeeded,
+    1 otherwise.
+    """
+
+    # Longest first, for those with a cost estimate, then the rest in the
+    # order they were added.
+    pending = sorted(
+        jobs, key=lambda job: (job.cost is None, -(job.cost or 0))
     )
+    host_threads, host_memory = _host_resources()
+    for job in pending:
+        if job.threads > host_threads or (
+            job.memory and host_memory and job.memory > host_memory
+        ):
+            inform(
+                f"Simulator '{job.id}' needs more resources than the host "
+                "has. It will be run on its own."
+            )
+
+    ids = {job.id for job in jobs}
+    for job in jobs:
+        if job.after is not None and job.after not in ids:
+            raise ValueError(
+                f"Simulator '{job.id}' is to be run after '{job.after}', "
+                "which does not exist."
+            )
+
+    # Fixed here, so the simulators save and restore their checkpoints in
+    # the directory removed at the end.
+    shared_dir = _shared_dir()
 
-    active_processes = []
-    remaining_ids = list(ids).copy()
+    # Maps each running process' sentinel to its job.
+    active: Dict[int, _Job] = {}
+    # Maps the ID of each job which is done to whether it succeeded.
+    done: Dict[str, bool] = {}
+    used = {"threads": 0, "memory": 0}
     process_lock = Lock()
-    from ..multiprocessing import Process
+
+    def terminate() -> None:
+        with process_lock:
+            for job in active.values():
+                if job.process.is_alive():
+                    inform(f"Terminating process {job.process.name}")
+                    job.process.terminate()
 
     def handle_exit(signum, frame):
         """Signal handler to clean up processes on termination."""
-        import sys
-
         inform("Cleaning up processes")
+        terminate()
+        sys.exit(128 + signum)
+
+    def fits(job: _Job) -> bool:
+        if not active:
+            # Always run something, even if it needs more than the host has.
+            return True
+        if max_num_processes is not None and len(active) >= max_num_processes:
+            return False
+        if used["threads"] + job.threads > host_threads:
+            return False
+        if host_memory is not None and job.memory is not None:
+            return used["memory"] + job.memory <= host_memory
+        return True
+
+    def start(job: _Job) -> None:
+        try:
+            process = make_process(job)
+            job.start_time = time.monotonic()
+            process.start()
+        except Exception as e:
+            inform(f"Error starting process for {job.id}: {e}")
+            done[job.id] = False
+            return
+        job.process = process
+        used["threads"] += job.threads
+        used["memory"] += job.memory or 0
+        with process_lock:
+            active[process.sentinel] = job
+
+    def finish(sentinel: int) -> None:
         with process_lock:
-            for process in active_processes:
-                if process.is_alive():
-                    inform(f"Terminating process {process.name}")
-                    process.terminate()
-        sys.exit(0)
+            job = active.pop(sentinel)
+        job.process.join()
+        job.wall_time = time.monotonic() - job.start_time
+        job.exit_code = job.process.exitcode
+        job.max_rss = _max_rss(job.process)
+        used["threads"] -= job.threads
+        used["memory"] -= job.memory or 0
+        done[job.id] = job.exit_code == 0
+        inform(
+            f"Simulator '{job.id}' finished with exit code {job.exit_code} "
+            f"after {job.wall_time:.1f}s"
+        )
 
     # Register signal handler
     signal.signal(signal.SIGINT, handle_exit)
     signal.signal(signal.SIGTERM, handle_exit)
 
     try:
-        while remaining_ids or active_processes:
-            # Start new processes if available
-            while remaining_ids and len(active_processes) < max_num_processes:
-                id_to_run = remaining_ids.pop()
-                try:
-                    process = Process(
-                        target=_run,
-                        args=(module_path, id_to_run),
-                        name=id_to_run,
+        while pending or active:
+            # Start every pending job which fits, in order.
+            for job in list(pending):
+                if job.after is not None:
+                    if job.after not in done:
+                        continue
+                    if not done[job.after]:
+                        inform(
+                            f"Not running simulator '{job.id}' as "
+                            f"'{job.after}' failed."
+                        )
+                        pending.remove(job)
+                        done[job.id] = False
+                        continue
+                if fits(job):
+                    pending.remove(job)
+                    start(job)
+            if not active:
+                if pending and all(job.after not in done for job in pending):
+                    ids = ", ".join(job.id for job in pending)
+                    inform(
+                        "Not running simulators which are each to run "
+                        f"after another: {ids}"
                     )
-                    process.start()
-                    with process_lock:
-                        active_processes.append(process)
-                except Exception as e:
-                    inform(f"Error starting process for {id_to_run}: {e}")
-            # Wait for active processes to finish
-            time.sleep(1)  # Avoid busy-waiting
-            with process_lock:
-                # Using list comprehension to remove finished processes
-                # as using `remove` in a loop over the list will cause
-                # the list to be modified during iteration.
-                active_processes = [
-                    process
-                    for process in active_processes
-                    if process.is_alive()
-                ]
+                    break
+                continue
+            # Sleep until at least one of the running jobs finishes.
+            for sentinel in wait(list(active)):
+                finish(sentinel)
+        _write_summary(jobs)
     finally:
-        handle_exit(None, None)
+        terminate()
+        shutil.rmtree(shared_dir, ignore_errors=True)
+
+    if pending or not all(done.values()):
+        return 1
+    return 0
 
 
 def set_num_processes(num_processes: int) -> None:
@@ -282,7 +733,13 @@ def num_simulators() -> int:
     return len(_multi_sim)
 
 
-def add_simulator(simulator: "Simulator") -> None:
+def add_simulator(
+    simulator: "Simulator",
+    memory: Optional[Union[int, str]] = None,
+    threads: int = 1,
+    cost: Optional[float] = None,
+    after: Optional[str] = None,
+) -> None:
     """Add a single simulator to the Multisim. Doing so informs the simulators
     to run this simulator via multiprocessing.
 
@@ -294,9 +751,17 @@ def add_simulator(simulator: "Simulator") -> None:
     simulations having been run).
 
     :param simulator: The simulator to add to the multisim.
-    :param id: The id of the simulator. This is used to reference the
-    simulation. This is particularly important when referencing the correct
-    m5out subdirectory.
+    :param memory: The memory the simulation needs, in bytes or as a string
+    (e.g., "4GiB"). If not set, memory is not taken into account when
+    deciding whether to start the simulation.
+    :param threads: The number of host threads the simulation uses.
+    :param cost: An estimate of how long the simulation will take, in any
+    unit as long as it is the same for all the simulators. Simulations with
+    a higher cost are started first.
+    :param after: The ID of a simulator which must have finished
+    successfully before this one is started, e.g., because this one restores
+    the checkpoint it saves in `shared_checkpoint_dir`. If it fails, this one
+    is not run.
     """
     global _multi_sim
     if not simulator.get_id():
@@ -304,7 +769,16 @@ def add_simulator(simulator: "Simulator") -> None:
         # simulators. This is used to ensure that the simulator has a unique
         # id.
         simulator.set_id(f"sim_{len(_multi_sim)}")
-    _multi_sim.add(simulator)
+    if isinstance(memory, str):
+        memory = toMemorySize(memory)
+    if threads < 1:
+        raise ValueError("A simulator must use at least one thread.")
+    _multi_sim[simulator] = {
+        "memory": memory,
+        "threads": threads,
+        "cost": cost,
+        "after": after,
+    }
 
     # The following code is used to enable a user to run a single simulation
     # from the config script, based on an ID, in the case the config script is
@@ -348,6 +822,7 @@ def add_simulator(simulator: "Simulator") -> None:
         elif args.id == simulator.get_id():
             import m5
 
+            _shared_dir()
             subdir = Path(Path(m5.options.outdir) / Path(simulator.get_id()))
             simulator.override_outdir(subdir)
             simulator.run()
@@ -40,9 +40,12 @@ class FakeTQDM:
             return args[0]
         return kwargs.get("iterable", None)
 
-    def __enter__(self):
+    def update(self, n=1):
         pass
 
+    def __enter__(self):
+        return self
+
     def __exit__(self, exc_type, exc_val, exc_tb):
         pass
 
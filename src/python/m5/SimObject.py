@@ -40,6 +40,7 @@
 
 import importlib
 import inspect
+from bisect import bisect_left
 from functools import wraps
 from types import (
     FunctionType,
@@ -625,6 +626,81 @@ class SimObjectCliWrapper:
 # The SimObject class is the root of the special hierarchy.  Most of
 # the code in this class deals with the configuration hierarchy itself
 # (parent/child node relationships).
+# The frozen traversal order of a sealed SimObject hierarchy (see
+# SimObject.seal_hierarchy()), along with type indexes built from it
+# on demand. The indexes let Parent.any and Self.all proxies be
+# resolved without walking the hierarchy for every parameter. Only
+# the structure of the hierarchy and the declared parameter types are
+# indexed; parameter values are always read from the objects.
+class _SealedHierarchy:
+    def __init__(self, order):
+        self.order = order
+        # ptype -> positions in order of the instances of ptype
+        self._instances = {}
+        # ptype -> positions in order of the objects that have
+        # parameters declared with a subclass of ptype
+        self._param_owners = {}
+        # (class, ptype) -> names of the parameters of class declared
+        # with a subclass of ptype
+        self._param_names = {}
+        # (id(obj), ptype) -> direct children of obj that are ptype
+        self._children = {}
+
+    def instances(self, ptype, start, end):
+        positions = self._instances.get(ptype)
+        if positions is None:
+            positions = [
+                pos
+                for pos, obj in enumerate(self.order)
+                if isinstance(obj, ptype)
+            ]
+            self._instances[ptype] = positions
+        return self._slice(positions, start, end)
+
+    def param_owners(self, ptype, start, end):
+        positions = self._param_owners.get(ptype)
+        if positions is None:
+            positions = [
+                pos
+                for pos, obj in enumerate(self.order)
+                if self.param_names(type(obj), ptype)
+            ]
+            self._param_owners[ptype] = positions
+        return self._slice(positions, start, end)
+
+    def param_names(self, cls, ptype):
+        key = (cls, ptype)
+        names = self._param_names.get(key)
+        if names is None:
+            names = tuple(
+                pname
+                for pname, pdesc in cls._params.items()
+                # DictParams are not supported
+                if not isinstance(pdesc, DictParamDesc)
+                and issubclass(pdesc.ptype, ptype)
+            )
+            self._param_names[key] = names
+        return names
+
+    def children(self, obj, ptype):
+        key = (id(obj), ptype)
+        children = self._children.get(key)
+        if children is None:
+            children = tuple(
+                child
+                for child in obj._children.values()
+                if isinstance(child, ptype)
+            )
+            self._children[key] = children
+        return children
+
+    def _slice(self, positions, start, end):
+        order = self.order
+        first = bisect_left(positions, start)
+        last = bisect_left(positions, end, first)
+        return [order[pos] for pos in positions[first:last]]
+
+
 class SimObject(metaclass=MetaSimObject):
     # Specify metaclass.  Any class inheriting from SimObject will
     # get this metaclass.
@@ -755,6 +831,8 @@ class SimObject(metaclass=MetaSimObject):
         self._ccObject = None  # pointer to C++ object
         self._ccParams = None
         self._instantiated = False  # really "cloned"
+        self._hierarchy_span = None  # set by seal_hierarchy()
+        self._path_cache = None
         self._init_called = True  # Checked so subclasses don't forget __init__
 
         # Clone children specified at class level.  No need for a
@@ -952,10 +1030,14 @@ class SimObject(metaclass=MetaSimObject):
     # Also implemented by SimObjectVector
     def clear_parent(self, old_parent):
         assert self._parent is old_parent
+        if self._hierarchy_span is not None:
+            self._unseal_hierarchy()
         self._parent = None
 
     # Also implemented by SimObjectVector
     def set_parent(self, parent, name):
+        if self._hierarchy_span is not None:
+            self._unseal_hierarchy()
         self._parent = parent
         self._name = name
 
@@ -976,6 +1058,8 @@ class SimObject(metaclass=MetaSimObject):
     # clear out child with given name. This code is not likely to be exercised.
     # See comment in add_child.
     def clear_child(self, name):
+        if self._hierarchy_span is not None:
+            self._unseal_hierarchy()
         child = self._children[name]
         child.clear_parent(self)
         del self._children[name]
@@ -997,6 +1081,8 @@ class SimObject(metaclass=MetaSimObject):
             # exercised without specialized testing.
             self.clear_child(name)
         if not isNullPointer(child):
+            if self._hierarchy_span is not None:
+                self._unseal_hierarchy()
             child.set_parent(self, name)
             self._children[name] = child
 
@@ -1017,6 +1103,9 @@ class SimObject(metaclass=MetaSimObject):
                 self.add_child(key, val)
 
     def path(self):
+        if self._path_cache is not None:
+            return self._path_cache
+
         if not self._parent:
             return f"<orphan {self.__class__}>"
         elif isinstance(self._parent, MetaSimObject):
@@ -1024,8 +1113,14 @@ class SimObject(metaclass=MetaSimObject):
 
         ppath = self._parent.path()
         if ppath == "root":
-            return self._name
-        return ppath + "." + self._name
+            path = self._name
+        else:
+            path = ppath + "." + self._name
+        # The path can only change if the hierarchy does, so it is safe
+        # to remember it until the hierarchy is unsealed.
+        if self._hierarchy_span is not None:
+            self._path_cache = path
+        return path
 
     def path_list(self):
         if self._parent:
@@ -1047,8 +1142,22 @@ class SimObject(metaclass=MetaSimObject):
         if isinstance(self, ptype):
             return self, True
 
+        sealed = self._hierarchy_span
+        if sealed is not None:
+            children = sealed[0].children(self, ptype)
+            pnames = sealed[0].param_names(type(self), ptype)
+        else:
+            children = self._children.values()
+            pnames = [
+                pname
+                for pname, pdesc in self._params.items()
+                # DictParams are not supported
+                if not isinstance(pdesc, DictParamDesc)
+                and issubclass(pdesc.ptype, ptype)
+            ]
+
         found_obj = None
-        for child in self._children.values():
+        for child in children:
             visited = False
             if hasattr(child, "_visited"):
                 visited = getattr(child, "_visited")
@@ -1061,22 +1170,20 @@ class SimObject(metaclass=MetaSimObject):
                     )
                 found_obj = child
         # search param space
-        for pname, pdesc in self._params.items():
-            if isinstance(pdesc, DictParamDesc):
-                # DictParams are not supported
-                continue
-
-            if issubclass(pdesc.ptype, ptype):
-                match_obj = self._values[pname]
-                if found_obj != None and found_obj != match_obj:
-                    raise AttributeError(
-                        "parent.any matched more than one: %s and %s"
-                        % (found_obj.path, match_obj.path)
-                    )
-                found_obj = match_obj
+        for pname in pnames:
+            match_obj = self._values[pname]
+            if found_obj != None and found_obj != match_obj:
+                raise AttributeError(
+                    "parent.any matched more than one: %s and %s"
+                    % (found_obj.path, match_obj.path)
+                )
+            found_obj = match_obj
         return found_obj, found_obj != None
 
     def find_all(self, ptype):
+        if self._hierarchy_span is not None:
+            return self._find_all_sealed(ptype)
+
         all = {}
         # search children
         for child in self._children.values():
@@ -1111,6 +1218,19 @@ class SimObject(metaclass=MetaSimObject):
         # ensure that the order is the same on all hosts
         return sorted(all.keys(), key=lambda o: o.path()), True
 
+    # Same as find_all(), but uses the type index of the sealed
+    # hierarchy instead of recursing through the children.
+    def _find_all_sealed(self, ptype):
+        sealed, start, end = self._hierarchy_span
+        # Every descendant except this object itself
+        all = dict.fromkeys(sealed.instances(ptype, start + 1, end), True)
+        for obj in sealed.param_owners(ptype, start, end):
+            for pname in sealed.param_names(type(obj), ptype):
+                match_obj = obj._values[pname]
+                if not isproxy(match_obj) and not isNullPointer(match_obj):
+                    all[match_obj] = True
+        return sorted(all.keys(), key=lambda o: o.path()), True
+
     def unproxy(self, base):
         return self
 
@@ -1310,6 +1430,12 @@ class SimObject(metaclass=MetaSimObject):
         return self._ccObject
 
     def descendants(self):
+        if self._hierarchy_span is not None:
+            sealed, start, end = self._hierarchy_span
+            return iter(sealed.order[start:end])
+        return self._walk_descendants()
+
+    def _walk_descendants(self):
         yield self
         # The order of the dict is implementation dependent, so sort
         # it based on the key (name) to ensure the order is the same
@@ -1317,6 +1443,52 @@ class SimObject(metaclass=MetaSimObject):
         for name, child in sorted(self._children.items()):
             yield from child.descendants()
 
+    # Freeze the traversal order of the hierarchy below this object.
+    # The order is computed in a single walk and shared by every
+    # object in the hierarchy, so descendants() no longer re-sorts the
+    # children of each node and path() can cache its result.
+    # m5.instantiate() seals the hierarchy once orphan parameters have
+    # been adopted. Returns the sealed order. Changing the hierarchy
+    # through add_child(), clear_child(), set_parent() or
+    # clear_parent() unseals it again.
+    def seal_hierarchy(self):
+        span = self._hierarchy_span
+        if span is not None and span[1] == 0:
+            # Already sealed from this object
+            return span[0].order
+
+        order = []
+        spans = []
+
+        def visit(obj):
+            start = len(order)
+            order.append(obj)
+            for name, child in sorted(obj._children.items()):
+                if not isSimObjectVector(child):
+                    child = [child]
+                for member in child:
+                    if isSimObject(member):
+                        visit(member)
+            spans.append((obj, start, len(order)))
+
+        visit(self)
+        sealed = _SealedHierarchy(tuple(order))
+        for obj, start, end in spans:
+            obj._hierarchy_span = (sealed, start, end)
+            obj._path_cache = None
+        return sealed.order
+
+    def _unseal_hierarchy(self):
+        # Drop the cached order of every sealed hierarchy this object
+        # is part of, including the ones sealed from an ancestor.
+        obj = self
+        while obj is not None and not isinstance(obj, MetaSimObject):
+            if obj._hierarchy_span is not None:
+                for member in obj._hierarchy_span[0].order:
+                    member._hierarchy_span = None
+                    member._path_cache = None
+            obj = obj._parent
+
     # Call C++ to create C++ object corresponding to this object
     def createCCObject(self):
         if self.abstract:
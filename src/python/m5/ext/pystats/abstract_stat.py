@@ -37,6 +37,8 @@ from typing import (
 
 from .serializable_stat import SerializableStat
 
+_VECTOR_INDEX = re.compile("[0-9]+$")
+
 
 class AbstractStat(SerializableStat):
     """
@@ -101,8 +103,7 @@ class AbstractStat(SerializableStat):
         split into a SimObject name and index, or if the SimObject does not
         exit at `Simobject[index]`, the function returns None.
         """
-        regex = re.compile("[0-9]+$")
-        match = regex.search(item)
+        match = _VECTOR_INDEX.search(item)
         if not match:
             return None
 
@@ -112,12 +113,13 @@ class AbstractStat(SerializableStat):
         vector_index = int(match_str)
         vector_name = item[: (-1 * len(match_str))]
 
-        if hasattr(self, vector_name):
-            vector = getattr(self, vector_name)
+        # Missing attributes are None (see __getattr__) rather than raising.
+        vector = getattr(self, vector_name, None)
+        if vector is not None:
             try:
                 vector_value = vector[vector_index]
                 return vector_name, vector_index, vector_value
-            except KeyError:
+            except (KeyError, IndexError):
                 pass
         return None
 
@@ -25,21 +25,73 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import json
+import re
+from itertools import repeat
 from json.decoder import JSONDecodeError
 from typing import (
     IO,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
     Union,
 )
 
-from .group import Group
+from .abstract_stat import AbstractStat
+from .group import (
+    Group,
+    SimObjectGroup,
+    SimObjectVectorGroup,
+)
 from .simstat import SimStat
 from .statistic import (
     Distribution,
     Scalar,
     Statistic,
+    Vector,
 )
 
 
+def _json_to_simstat(d: dict) -> Union[SimStat, Statistic, Group]:
+    """
+    Converts a JSON object, whose members have already been converted, into
+    the matching pystats object.
+    """
+
+    if "type" in d:
+        if d["type"] == "Scalar":
+            d.pop("type", None)
+            return Scalar(**d)
+
+        elif d["type"] == "Distribution":
+            d.pop("type", None)
+            return Distribution(**d)
+
+        elif d["type"] == "Group":
+            return Group(**d)
+
+        elif d["type"] == "SimObject":
+            d.pop("type", None)
+            return SimObjectGroup(**d)
+
+        elif d["type"] == "SimObjectVector":
+            d.pop("type", None)
+            return SimObjectVectorGroup(**d)
+
+        elif d["type"] == "Vector":
+            d.pop("type", None)
+            d.pop("time_conversion", None)
+            return Vector(d)
+
+        else:
+            raise ValueError(f"SimStat object has invalid type {d['type']}")
+    else:
+        return SimStat(**d)
+
+
 class JsonLoader(json.JSONDecoder):
     """
     Subclass of JSONDecoder that overrides ``object_hook``. Converts JSON object
@@ -58,39 +110,253 @@ class JsonLoader(json.JSONDecoder):
     """
 
     def __init__(self):
-        super().__init__(self, object_hook=self.__json_to_simstat)
-
-    def __json_to_simstat(self, d: dict) -> Union[SimStat, Statistic, Group]:
-        if "type" in d:
-            if d["type"] == "Scalar":
-                d.pop("type", None)
-                return Scalar(**d)
-
-            elif d["type"] == "Distribution":
-                d.pop("type", None)
-                return Distribution(**d)
-
-            elif d["type"] == "Group":
-                return Group(**d)
-
-            elif d["type"] == "Vector":
-                d.pop("type", None)
-                d.pop("time_conversion", None)
-                return Vector(d)
-
-            else:
-                raise ValueError(
-                    f"SimStat object has invalid type {d['type']}"
-                )
+        super().__init__(object_hook=_json_to_simstat)
+
+
+def _convert(value: Any) -> Any:
+    # What json.load with JsonLoader would return for a decoded value.
+    if isinstance(value, dict):
+        return _json_to_simstat(
+            {
+                k: _convert(v) if isinstance(v, (dict, list)) else v
+                for k, v in value.items()
+            }
+        )
+    if isinstance(value, list):
+        return [_convert(v) for v in value]
+    return value
+
+
+def _convert_lazy(value: Any) -> Any:
+    # As _convert, but groups are only converted when they are accessed.
+    if isinstance(value, dict):
+        group_type = _LAZY_GROUPS.get(value.get("type"))
+        if group_type is not None:
+            return group_type(value)
+        if value.get("type") == "SimObjectVector":
+            members = {
+                k: _convert_lazy(v) for k, v in value.items() if k != "type"
+            }
+            return SimObjectVectorGroup(**members)
+        return _convert(value)
+    if isinstance(value, list):
+        return [_convert_lazy(v) for v in value]
+    return value
+
+
+class _Lazy:
+    """
+    A group which keeps its decoded JSON object, and only converts its
+    members (one level deep) when it is first accessed. Once converted, the
+    group is the same as one built by JsonLoader.
+
+    ``find()`` indexes the names of all the stats below the group on its
+    first call, without converting them, and later calls reuse the index.
+    Only the stats which are found are converted. The index assumes the
+    stats are not modified after they are loaded.
+    """
+
+    __slots__ = ("_json", "_find_index")
+
+    # The members which the group's __init__ sets before the others, which
+    # is the order children() visits them in.
+    _leading: Tuple[str, ...] = ()
+    _keeps_type = True
+
+    def __init__(self, json_object: Dict):
+        self._json = json_object
+        self._find_index = None
+
+    def _materialize(self) -> None:
+        json_object = self._json
+        if json_object is None:
+            return
+        self._json = None
+        kwargs = {
+            key: _convert_lazy(value)
+            for key, value in json_object.items()
+            if key != "type" or self._keeps_type
+        }
+        self._base.__init__(self, **kwargs)
+
+    def __getattr__(self, item: str) -> Any:
+        if item in _Lazy.__slots__:
+            raise AttributeError(item)
+        if self._json is not None:
+            self._materialize()
+            return getattr(self, item)
+        return super().__getattr__(item)
+
+    def __iter__(self):
+        self._materialize()
+        return super().__iter__()
+
+    def children(
+        self,
+        predicate: Optional[Callable[[str], bool]] = None,
+        recursive: bool = False,
+    ) -> List[AbstractStat]:
+        self._materialize()
+        return super().children(predicate=predicate, recursive=recursive)
+
+    def to_json(self) -> Dict:
+        self._materialize()
+        return super().to_json()
+
+    def find(self, regex: Union[str, Pattern]) -> List[AbstractStat]:
+        if isinstance(regex, str):
+            pattern = re.compile(regex)
         else:
-            return SimStat(**d)
+            pattern = regex
+
+        if self._find_index is None:
+            self._find_index = _StatIndex(self)
+        return self._find_index.find(pattern)
+
+
+class _StatIndex:
+    """
+    The names of all the stats below a group, in the order
+    ``children(recursive=True)`` returns them. Each stat is stored as the
+    group (or vector) containing it and its key in that container, so it
+    can be looked up without converting anything else.
+    """
+
+    def __init__(self, root: AbstractStat):
+        # Containers are (parent container, key) pairs. Container 0 is
+        # the root.
+        self._containers: List[Tuple[int, Union[str, int]]] = [(-1, "")]
+        self._resolved: Dict[int, AbstractStat] = {0: root}
+        # Entries are (name, container, key). Stats which are only found by
+        # converting a parent stat are stored as (name, -1, stat).
+        self._entries: List[Tuple[str, int, Any]] = []
+        self._visit(root, 0)
+        self._names = dict.fromkeys(entry[0] for entry in self._entries)
+
+    def _container(self, parent: int, key: Union[str, int]) -> int:
+        self._containers.append((parent, key))
+        return len(self._containers) - 1
+
+    def _resolve(self, container: int) -> AbstractStat:
+        node = self._resolved.get(container)
+        if node is None:
+            parent, key = self._containers[container]
+            node = self._member(self._resolve(parent), key)
+            self._resolved[container] = node
+        return node
+
+    @staticmethod
+    def _member(node: AbstractStat, key: Union[str, int]) -> AbstractStat:
+        if isinstance(key, int):
+            return node.value[key]
+        if isinstance(node, _Lazy):
+            node._materialize()
+        return node.__dict__[key]
+
+    def _visit(self, node: AbstractStat, container: int) -> None:
+        # Indexes the children of a (possibly converted) stat.
+        if isinstance(node, _Lazy) and node._json is not None:
+            self._visit_json_group(type(node), node._json, container)
+        elif isinstance(node, SimObjectVectorGroup):
+            for i, element in enumerate(node.value):
+                self._visit(element, self._container(container, i))
+        elif isinstance(node, Group):
+            for key, value in node.__dict__.items():
+                if isinstance(value, AbstractStat):
+                    self._entries.append((key, container, key))
+                    self._visit(value, self._container(container, key))
+        elif not isinstance(node, Scalar):
+            self._splice(node)
+
+    def _visit_json_group(
+        self, group_type: type, json_object: Dict, container: int
+    ) -> None:
+        keys = [key for key in group_type._leading if key in json_object]
+        keys.extend(key for key in json_object if key not in keys)
+        for key in keys:
+            value = json_object[key]
+            if isinstance(value, dict):
+                self._entries.append((key, container, key))
+                self._visit_json(value, self._container(container, key))
+
+    def _visit_json(self, json_object: Dict, container: int) -> None:
+        # Indexes the children of a stat which has not been converted.
+        stat_type = json_object.get("type")
+        if stat_type in _LAZY_GROUPS:
+            self._visit_json_group(
+                _LAZY_GROUPS[stat_type], json_object, container
+            )
+        elif stat_type == "SimObjectVector":
+            for i, element in enumerate(json_object.get("value", [])):
+                self._visit_json(element, self._container(container, i))
+        elif stat_type != "Scalar":
+            self._splice(self._resolve(container))
 
+    def _splice(self, stat: AbstractStat) -> None:
+        # Indexes the children of a stat by converting it. children() only
+        # calls the predicate on the names of the stats it returns, so the
+        # names line up with the stats.
+        names = []
 
-def load(json_file: IO) -> SimStat:
+        def record(name: str) -> bool:
+            names.append(name)
+            return True
+
+        stats = stat.children(record, recursive=True)
+        assert len(names) == len(stats)
+        self._entries.extend(zip(names, repeat(-1), stats))
+
+    def find(self, pattern: Pattern) -> List[AbstractStat]:
+        matched = {name for name in self._names if re.match(pattern, name)}
+        found = []
+        for name, container, key in self._entries:
+            if name in matched:
+                if container < 0:
+                    found.append(key)
+                else:
+                    found.append(self._member(self._resolve(container), key))
+        return found
+
+
+class _LazySimStat(_Lazy, SimStat):
+    _base = SimStat
+    _leading = (
+        "time_conversion",
+        "creation_time",
+        "simulated_begin_time",
+        "simulated_end_time",
+    )
+
+
+class _LazyGroup(_Lazy, Group):
+    _base = Group
+    _leading = ("type", "time_conversion")
+
+
+class _LazySimObjectGroup(_Lazy, SimObjectGroup):
+    _base = SimObjectGroup
+    _leading = ("type", "time_conversion")
+    _keeps_type = False
+
+
+_LAZY_GROUPS = {
+    None: _LazySimStat,
+    "Group": _LazyGroup,
+    "SimObject": _LazySimObjectGroup,
+}
+
+
+def load(json_file: IO, lazy: bool = False) -> SimStat:
     """
     Wrapper function that provides a cleaner interface for using the
     JsonLoader class.
 
+    :param json_file: The JSON stats file to load.
+    :param lazy: Only convert each group into pystats objects when it is
+                 first accessed. This is much faster, and uses much less
+                 memory, when only some of the stats in a large file are
+                 used.
+
     Usage
     -----
 
@@ -103,5 +369,8 @@ def load(json_file: IO) -> SimStat:
 
     """
 
+    if lazy:
+        return _convert_lazy(json.load(json_file))
+
     simstat_object = json.load(json_file, cls=JsonLoader)
     return simstat_object
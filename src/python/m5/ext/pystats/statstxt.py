@@ -0,0 +1,271 @@
+# Copyright (c) 2024 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+A streaming reader for gem5's text stats output (``stats.txt``).
+
+The reader yields one dump at a time, so files holding many periodic dumps
+can be processed in constant memory. Stats can be filtered by name before
+their values are parsed, and any dump can be read directly, using an index
+of the offset at which each dump begins.
+
+Usage
+-----
+
+.. code-block::
+
+         from m5.ext.pystats.statstxt import StatsTxtReader
+
+         reader = StatsTxtReader("m5out/stats.txt", pattern=r".*numCycles$")
+         for dump in reader:
+             print(dump["simTicks"] if "simTicks" in dump else None, dump)
+
+         last = reader[-1]
+"""
+
+import gzip
+import re
+from typing import (
+    IO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Union,
+)
+
+_BEGIN = b"---------- Begin Simulation Statistics"
+_END = b"---------- End Simulation Statistics"
+_MARKER = b"----------"
+_CHUNK_SIZE = 1 << 20
+
+StatValue = Union[int, float, str]
+
+
+def _parse_value(token: bytes) -> StatValue:
+    try:
+        return int(token)
+    except ValueError:
+        pass
+    try:
+        return float(token)
+    except ValueError:
+        return token.decode()
+
+
+class StatsDump(dict):
+    """
+    The stats of one dump, mapping each stat name (e.g.,
+    ``board.processor.cores.core.numCycles`` or
+    ``system.cpu.op_class::IntAlu``) to its value, in file order. Values are
+    ints or floats, or strings if they are neither.
+    """
+
+    def __init__(self, index: int, offset: int, message: str = ""):
+        super().__init__()
+        # The position of the dump in the file, counting from 0.
+        self.index = index
+        # The offset of the dump's "Begin" line in the file.
+        self.offset = offset
+        # The message passed to m5.stats.dump(), if any.
+        self.message = message
+        # The description of each stat, if the reader was asked for them
+        # and the file has them.
+        self.descs: Dict[str, str] = {}
+        # False if the file ended before the dump's "End" line.
+        self.complete = True
+
+
+class StatsTxtReader:
+    """
+    Reads the dumps in a ``stats.txt`` file, or a gzipped one.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        names: Optional[Iterable[str]] = None,
+        pattern: Optional[Union[str, Pattern]] = None,
+        descs: bool = False,
+    ):
+        """
+        :param path: The stats file. Files ending in ``.gz`` are read
+                     through gzip.
+        :param names: If given, only the stats with these names are read.
+        :param pattern: If given, only the stats whose names match this
+                        regular expression (with ``re.match``) are read. If
+                        both ``names`` and ``pattern`` are given, stats
+                        which satisfy either are read.
+        :param descs: Also read the description of each stat.
+        """
+
+        self.path = path
+        self.descs = descs
+        self._names = (
+            None if names is None else {name.encode() for name in names}
+        )
+        self._pattern = re.compile(pattern) if pattern is not None else None
+        # Whether each stat name seen so far is read. The same names
+        # appear in every dump, so each name is only checked once.
+        self._wanted: Dict[bytes, bool] = {}
+        self._offsets: Optional[List[int]] = None
+
+    def _open(self) -> IO[bytes]:
+        if self.path.endswith(".gz"):
+            return gzip.open(self.path, "rb")
+        return open(self.path, "rb")
+
+    def _is_wanted(self, name: bytes) -> bool:
+        wanted = self._wanted.get(name)
+        if wanted is None:
+            if self._names is None and self._pattern is None:
+                wanted = True
+            else:
+                wanted = (self._names is not None and name in self._names) or (
+                    self._pattern is not None
+                    and self._pattern.match(name.decode()) is not None
+                )
+            self._wanted[name] = wanted
+        return wanted
+
+    def offsets(self) -> List[int]:
+        """
+        The offset of each dump in the file. The file is scanned for them
+        the first time this is called.
+        """
+
+        if self._offsets is None:
+            offsets = []
+            with self._open() as fp:
+                base = 0
+                data = b""
+                while True:
+                    chunk = fp.read(_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    # Keep the end of the previous chunk, so markers which
+                    # span two chunks are found, along with the byte before
+                    # them to check they start a line. Markers starting at
+                    # its first byte were found in the previous chunk.
+                    keep = data[-len(_BEGIN) :]
+                    data = keep + chunk
+                    start = 1 if keep else 0
+                    index = data.find(_BEGIN, start)
+                    while index >= 0:
+                        if index == 0 or data[index - 1] == ord("\n"):
+                            offsets.append(base - len(keep) + index)
+                        index = data.find(_BEGIN, index + 1)
+                    base += len(chunk)
+            self._offsets = offsets
+        return self._offsets
+
+    def __len__(self) -> int:
+        """The number of dumps in the file."""
+        return len(self.offsets())
+
+    def __iter__(self) -> Iterator[StatsDump]:
+        return self.dumps()
+
+    def __getitem__(self, index: int) -> StatsDump:
+        """Reads the dump at ``index`` (negative indexes count back)."""
+        offset = self.offsets()[index]
+        if index < 0:
+            index += len(self.offsets())
+        with self._open() as fp:
+            fp.seek(offset)
+            return next(self._read(fp, index, offset))
+
+    def dumps(self, start: int = 0) -> Iterator[StatsDump]:
+        """Reads the dumps in order, starting with dump ``start``."""
+
+        offset = 0
+        if start:
+            offsets = self.offsets()
+            if start >= len(offsets):
+                return
+            offset = offsets[start]
+        with self._open() as fp:
+            if offset:
+                fp.seek(offset)
+            yield from self._read(fp, start, offset)
+
+    @staticmethod
+    def _begin(line: bytes, index: int, offset: int) -> StatsDump:
+        message = line[len(_BEGIN) :].strip(b" -\r\n").lstrip(b": ")
+        return StatsDump(index, offset, message.decode())
+
+    def _read(
+        self, fp: IO[bytes], index: int, offset: int
+    ) -> Iterator[StatsDump]:
+        descs = self.descs
+        is_wanted = self._is_wanted
+        wanted = self._wanted
+        dump = None
+        for line in fp:
+            line_offset = offset
+            offset += len(line)
+            if dump is None:
+                if line.startswith(_BEGIN):
+                    dump = self._begin(line, index, line_offset)
+                continue
+
+            space = line.find(b" ")
+            if space <= 0:
+                continue
+            name = line[:space]
+            keep = wanted.get(name)
+            if keep is None:
+                if name == _MARKER:
+                    if line.startswith(_END):
+                        yield dump
+                        dump = None
+                        index += 1
+                    elif line.startswith(_BEGIN):
+                        # The previous dump was cut short.
+                        dump.complete = False
+                        yield dump
+                        index += 1
+                        dump = self._begin(line, index, line_offset)
+                    continue
+                keep = is_wanted(name)
+            if not keep:
+                continue
+
+            fields = line[space:].split(None, 1)
+            if not fields:
+                continue
+            key = name.decode()
+            dump[key] = _parse_value(fields[0])
+            if descs and len(fields) > 1:
+                desc = fields[1].partition(b"#")[2]
+                if desc:
+                    dump.descs[key] = desc.strip().decode()
+
+        if dump is not None:
+            dump.complete = False
+            yield dump
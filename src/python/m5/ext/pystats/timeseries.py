@@ -0,0 +1,275 @@
+# Copyright (c) 2024 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+A columnar store for stats which are dumped repeatedly over a simulation.
+
+A time series is a directory holding two files:
+
+* ``columns.json``: the format version, the element type and one entry per
+  column (its name, and optionally its description and unit). It is
+  written once, when the first row is added.
+* ``data.bin``: the rows, back to back, with no framing. Each row holds one
+  little-endian 64-bit float per column. Rows are only ever appended.
+
+The first column is always ``tick``, the tick at which the row was dumped.
+As the data file is a plain row-major array, it can be memory-mapped
+without being parsed, and a row which is only partially written (e.g., if
+the simulation was killed) is ignored by the reader.
+
+Usage
+-----
+
+.. code-block::
+
+         from m5.ext.pystats.timeseries import TimeSeriesReader
+
+         series = TimeSeriesReader("m5out/stats.ts")
+         ticks = series["tick"]
+         cycles = series["board.processor.cores.core.numCycles"]
+"""
+
+import json
+import os
+import sys
+from array import array
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+FORMAT_VERSION = 1
+COLUMNS_FILE = "columns.json"
+DATA_FILE = "data.bin"
+DTYPE = "<f8"
+TICK_COLUMN = "tick"
+
+_ITEM_SIZE = 8
+_SWAP = sys.byteorder != "little"
+
+
+class TimeSeriesWriter:
+    """
+    Appends rows to a time series. Rows are buffered and written out in
+    chunks of ``chunk_rows`` rows.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        columns: Iterable[str],
+        descs: Optional[Dict[str, str]] = None,
+        units: Optional[Dict[str, str]] = None,
+        chunk_rows: int = 64,
+    ):
+        """
+        :param path: The directory to write the time series to. It is
+                     created if it does not exist. An existing time series
+                     in it is replaced.
+        :param columns: The name of each column, not including the tick
+                        column, which is always added first.
+        :param descs: Optional descriptions, keyed by column name.
+        :param units: Optional units, keyed by column name.
+        :param chunk_rows: The number of rows to buffer before writing
+                           them out.
+        """
+
+        if chunk_rows < 1:
+            raise ValueError("chunk_rows must be at least 1")
+
+        self.path = path
+        self.columns = [TICK_COLUMN] + list(columns)
+        self.chunk_rows = chunk_rows
+        self._index = {name: i for i, name in enumerate(self.columns)}
+        if len(self._index) != len(self.columns):
+            raise ValueError("Column names must be unique")
+
+        os.makedirs(path, exist_ok=True)
+        header = []
+        for name in self.columns:
+            entry = {"name": name}
+            if descs and name in descs:
+                entry["desc"] = descs[name]
+            if units and name in units:
+                entry["unit"] = units[name]
+            header.append(entry)
+        with open(os.path.join(path, COLUMNS_FILE), "w") as fp:
+            json.dump(
+                {"version": FORMAT_VERSION, "dtype": DTYPE, "columns": header},
+                fp,
+                indent=1,
+            )
+
+        self._fp = open(os.path.join(path, DATA_FILE), "wb")
+        self._buffer = array("d")
+        self._pending = 0
+
+    def index(self, name: str) -> Optional[int]:
+        """Returns the position of the named column, or None."""
+        return self._index.get(name)
+
+    def append(self, row: Iterable[float]) -> None:
+        """
+        Appends a row. The row must hold one value per column, in column
+        order, starting with the tick.
+        """
+
+        start = len(self._buffer)
+        self._buffer.extend(row)
+        if len(self._buffer) - start != len(self.columns):
+            del self._buffer[start:]
+            raise ValueError(
+                f"Expected {len(self.columns)} values in a row, "
+                f"got {len(self._buffer) - start}"
+            )
+        self._pending += 1
+        if self._pending >= self.chunk_rows:
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes out all buffered rows."""
+
+        if self._fp is None or not self._pending:
+            return
+        if _SWAP:
+            self._buffer.byteswap()
+        self._buffer.tofile(self._fp)
+        self._fp.flush()
+        self._buffer = array("d")
+        self._pending = 0
+
+    def close(self) -> None:
+        """Writes out all buffered rows and closes the data file."""
+
+        if self._fp is None:
+            return
+        self.flush()
+        self._fp.close()
+        self._fp = None
+
+
+class TimeSeriesReader:
+    """
+    Reads a time series written by ``TimeSeriesWriter``.
+
+    ``reader[name]`` and ``reader.data`` return NumPy arrays backed by a
+    memory map of the data file, so only the parts which are used are read.
+    ``rows()`` can be used when NumPy is not available.
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: The time series directory.
+        """
+
+        self.path = path
+        with open(os.path.join(path, COLUMNS_FILE)) as fp:
+            header = json.load(fp)
+        if header.get("version") != FORMAT_VERSION:
+            raise ValueError(
+                f"{path}: Unsupported time series version "
+                f"'{header.get('version')}'"
+            )
+        if header.get("dtype") != DTYPE:
+            raise ValueError(
+                f"{path}: Unsupported element type '{header.get('dtype')}'"
+            )
+
+        entries = header["columns"]
+        self.columns: List[str] = [entry["name"] for entry in entries]
+        self.descs: Dict[str, str] = {
+            e["name"]: e["desc"] for e in entries if "desc" in e
+        }
+        self.units: Dict[str, str] = {
+            e["name"]: e["unit"] for e in entries if "unit" in e
+        }
+        self._index = {name: i for i, name in enumerate(self.columns)}
+        self._data = None
+
+    @property
+    def _data_path(self) -> str:
+        return os.path.join(self.path, DATA_FILE)
+
+    def __len__(self) -> int:
+        """The number of complete rows in the data file."""
+        size = os.path.getsize(self._data_path)
+        return size // (_ITEM_SIZE * len(self.columns))
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._index
+
+    @property
+    def data(self):
+        """
+        The whole time series as a read-only, memory-mapped NumPy array with
+        one row per dump and one column per stat.
+        """
+
+        import numpy
+
+        rows = len(self)
+        if self._data is None or self._data.shape[0] != rows:
+            if rows == 0:
+                self._data = numpy.empty(
+                    (0, len(self.columns)), dtype=numpy.dtype(DTYPE)
+                )
+            else:
+                self._data = numpy.memmap(
+                    self._data_path,
+                    dtype=numpy.dtype(DTYPE),
+                    mode="r",
+                    shape=(rows, len(self.columns)),
+                )
+        return self._data
+
+    def __getitem__(self, name: str):
+        """The named column as a (strided, memory-mapped) NumPy array."""
+
+        try:
+            index = self._index[name]
+        except KeyError:
+            raise KeyError(f"No column named '{name}'")
+        return self.data[:, index]
+
+    def rows(self) -> Iterator[Tuple[float, ...]]:
+        """Iterates over the rows without NumPy."""
+
+        width = len(self.columns)
+        chunk = 1024 * width
+        remaining = len(self) * width
+        with open(self._data_path, "rb") as fp:
+            while remaining:
+                values = array("d")
+                values.fromfile(fp, min(chunk, remaining))
+                remaining -= len(values)
+                if _SWAP:
+                    values.byteswap()
+                for start in range(0, len(values), width):
+                    yield tuple(values[start : start + width])
@@ -262,6 +262,12 @@ def parse_options():
         help="Create DOT & pdf outputs of the DVFS configuration"
         + " [Default: %default]",
     )
+    option(
+        "--instantiate-times",
+        action="store_true",
+        default=False,
+        help="Print the time spent in each phase of m5.instantiate()",
+    )
 
     # Debugging options
     group("Debugging Options")
@@ -482,7 +488,14 @@ def main():
         debug.help()
 
     if options.list_sim_objects:
-        from . import SimObject
+        from . import (
+            SimObject,
+            objects,
+        )
+
+        # SimObject modules are imported on demand. Import them all so every
+        # SimObject class is listed.
+        objects._load_all()
 
         done = True
         print("SimObjects:")
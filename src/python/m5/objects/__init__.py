@@ -24,6 +24,133 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-for module in __spec__.loader_state:
-    if module.startswith("m5.objects."):
-        exec(f"from {module} import *")
+"""
+The m5.objects package exposes every SimObject, and every other public name,
+defined by the SimObject modules built into gem5, as if each module had been
+imported with ``from <module> import *``.
+
+Importing every module at startup executes hundreds of SimObject class
+bodies, most of which a given configuration never uses. Instead, a module is
+imported the first time one of the names it defines is accessed. The
+``_index`` module, generated at build time, maps each name to its module.
+Accessing a name which is not in the index (e.g., a name a module imports
+through a wildcard import) imports every module, as does
+``from m5.objects import *``.
+
+Setting the ``M5_EAGER_OBJECTS`` environment variable to "true" imports every
+module at startup instead.
+"""
+
+import importlib as _importlib
+import os as _os
+import sys as _sys
+import types as _types
+
+_modules = [
+    module
+    for module in __spec__.loader_state
+    if module.startswith(f"{__name__}.") and module != f"{__name__}._index"
+]
+
+try:
+    from ._index import enums as _index_enums
+    from ._index import names as _index_names
+except ImportError:
+    _index_names = {}
+    _index_enums = set()
+
+# Only the modules built into this binary can be imported.
+_available = set(_modules)
+_index_names = {
+    name: module
+    for name, module in _index_names.items()
+    if module in _available
+}
+
+# The modules whose names have been added to this package's namespace.
+_exported = set()
+
+
+def _export_loaded():
+    """
+    Adds the names of every fully imported SimObject module to this package's
+    namespace, in the order the modules were registered.
+    """
+    for module in _modules:
+        if module in _exported or module not in _sys.modules:
+            continue
+        spec = getattr(_sys.modules[module], "__spec__", None)
+        if getattr(spec, "_initializing", False):
+            # The module is still being executed; its names are exported
+            # once it completes.
+            continue
+        _exported.add(module)
+        exec(f"from {module} import *", globals())
+
+
+def _load_all():
+    """Imports every SimObject module, e.g., to populate
+    ``m5.SimObject.allClasses`` with every SimObject class."""
+    for module in _modules:
+        _importlib.import_module(module)
+    _export_loaded()
+
+
+def _load_enum(name):
+    """
+    Imports the module defining the Enum ``name``, unless the module is
+    already imported or being imported. This is used to resolve Enum
+    parameter types declared before the module defining the Enum has been
+    imported.
+    """
+    module = _index_names.get(name)
+    if name in _index_enums and module not in _sys.modules:
+        _importlib.import_module(module)
+        _export_loaded()
+
+
+def __getattr__(name):
+    if name == "__all__":
+        # `from m5.objects import *`
+        _load_all()
+        return [key for key in globals() if not key.startswith("_")]
+
+    module = _index_names.get(name)
+    if module is not None:
+        _importlib.import_module(module)
+        _export_loaded()
+    elif not name.startswith("__"):
+        _load_all()
+
+    try:
+        return globals()[name]
+    except KeyError:
+        raise AttributeError(
+            f"module '{__name__}' has no attribute '{name}'"
+        ) from None
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_index_names))
+
+
+class _ObjectsModule(_types.ModuleType):
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        # Importing a submodule binds it to its name in this package. As in
+        # `from m5.objects.<module> import *`, a name defined by the module
+        # takes precedence over the module itself.
+        if (
+            isinstance(value, _types.ModuleType)
+            and value.__name__ == f"{__name__}.{name}"
+        ):
+            _export_loaded()
+
+
+if _os.environ.get("M5_EAGER_OBJECTS", "false").lower() in ("true", "yes"):
+    _load_all()
+else:
+    _sys.modules[__name__].__class__ = _ObjectsModule
+    # The base SimObject module is always needed and is cheap to import.
+    _importlib.import_module(f"{__name__}.SimObject")
+    _export_loaded()
@@ -198,6 +198,12 @@ class SingleTypeParamDesc(ParamDesc):
         if attr == "ptype":
             from .. import SimObject
 
+            if self.ptype_str not in SimObject.allClasses:
+                # SimObject modules are imported on demand, so the module
+                # defining this type may not have been imported yet.
+                from .. import objects
+
+                getattr(objects, self.ptype_str, None)
             ptype = SimObject.allClasses[self.ptype_str]
             assert isSimObjectClass(ptype)
             self.ptype = ptype
@@ -593,6 +599,12 @@ class ParamFactory:
     # E.g., Param.Int(5, "number of widgets")
     def __call__(self, *args, **kwargs):
         ptype = None
+        if self.ptype_str not in allParams:
+            # Enums are defined in SimObject modules, which are imported on
+            # demand, so import the module defining this type if it is one.
+            from .. import objects
+
+            objects._load_enum(self.ptype_str)
         try:
             ptype = allParams[self.ptype_str]
         except KeyError:
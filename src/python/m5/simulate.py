@@ -40,7 +40,13 @@
 import atexit
 import os
 import sys
-from typing import Optional
+import time
+from contextlib import contextmanager
+from typing import (
+    List,
+    Optional,
+    Tuple,
+)
 
 from m5.objects import Root
 from m5.util.dot_writer import (
@@ -73,6 +79,64 @@ _drain_manager = _m5_drain.DrainManager.instance()
 
 _instantiated = False  # Has m5.instantiate() been called?
 
+# The functions registered with registerExitHandler() which have not run.
+_exit_handlers = []
+
+# (phase, seconds) for each phase of m5.instantiate(), in the order
+# the phases ran.
+_instantiate_times = []
+
+
+def registerExitHandler(handler) -> None:
+    """Registers a function to be called when gem5 exits, like
+    ``atexit.register``. The handlers are called in the reverse order of
+    their registration, either by atexit or by ``runExitHandlers``.
+    """
+    if not _exit_handlers:
+        atexit.register(runExitHandlers)
+    _exit_handlers.append(handler)
+
+
+def runExitHandlers() -> None:
+    """Calls the handlers registered with ``registerExitHandler`` which
+    have not been called yet, most recently registered first.
+
+    This is called on exit. A process which exits without calling the atexit
+    handlers, e.g., a forked process, calls it itself so the handlers (such
+    as the final stats dump) still run.
+    """
+    while _exit_handlers:
+        _exit_handlers.pop()()
+
+
+@contextmanager
+def _timed_phase(name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _instantiate_times.append((name, time.perf_counter() - start))
+
+
+def getInstantiateTimes() -> List[Tuple[str, float]]:
+    """Returns the time spent in each phase of ``m5.instantiate()``.
+
+    :returns: A list of ``(phase, seconds)`` tuples in the order the phases
+              ran. The list is empty before ``m5.instantiate()`` is called.
+    """
+    return list(_instantiate_times)
+
+
+def _report_instantiate_times(num_objects: int) -> None:
+    total = sum(seconds for _, seconds in _instantiate_times)
+    width = max(len(name) for name, _ in _instantiate_times)
+    print(f"Instantiate phase times ({num_objects} SimObjects):")
+    for name, seconds in _instantiate_times:
+        share = 100.0 * seconds / total if total else 0.0
+        print(f"    {name:<{width}}  {seconds:9.4f}s  {share:5.1f}%")
+    print(f"    {'total':<{width}}  {total:9.4f}s")
+    sys.stdout.flush()
+
 
 def _fix_all_objects(root):
     """Makes all parameters concrete of all objects that are childred of root."""
@@ -80,16 +144,36 @@ def _fix_all_objects(root):
     ticks.fixGlobalFrequency()
 
     # Make sure SimObject-valued params are in the configuration
-    # hierarchy so we catch them with future descendants() walks
-    for obj in root.descendants():
-        obj.adoptOrphanParams()
-
-    # Unproxy in sorted order for determinism
-    for obj in root.descendants():
-        obj.unproxyParams()
+    # hierarchy so we catch them with future descendants() walks.
+    # Adopting a child extends the walk, so it can't use a sealed order.
+    with _timed_phase("adoptOrphanParams"):
+        for obj in root.descendants():
+            obj.adoptOrphanParams()
+
+    # The hierarchy is complete, so compute the traversal order once
+    # and reuse it for every following pass.
+    with _timed_phase("seal_hierarchy"):
+        root.seal_hierarchy()
+
+    # Unproxy in sorted order for determinism. Unproxying may parent an
+    # object that was not in the hierarchy yet, which unseals it, so
+    # keep going until every object has been unproxied.
+    with _timed_phase("unproxyParams"):
+        order = root.seal_hierarchy()
+        unproxied = set()
+        while True:
+            for obj in order:
+                if id(obj) not in unproxied:
+                    unproxied.add(id(obj))
+                    obj.unproxyParams()
+            sealed = root.seal_hierarchy()
+            if sealed is order:
+                break
+            order = sealed
 
     # Initialize the global statistics
-    stats.initSimStats()
+    with _timed_phase("initSimStats"):
+        stats.initSimStats()
 
 
 def _dump_configs(
@@ -159,39 +243,47 @@ def _create_cpp_objects(root, ckpt_dir):
     """
 
     # Create the C++ sim objects and connect ports
-    for obj in root.descendants():
-        obj.createCCObject()
-    for obj in root.descendants():
-        obj.connectPorts()
+    with _timed_phase("createCCObject"):
+        for obj in root.descendants():
+            obj.createCCObject()
+    with _timed_phase("connectPorts"):
+        for obj in root.descendants():
+            obj.connectPorts()
 
     # Do a second pass to finish initializing the sim objects
-    for obj in root.descendants():
-        obj.init()
+    with _timed_phase("init"):
+        for obj in root.descendants():
+            obj.init()
 
     # Do a third pass to initialize statistics
-    stats._bindStatHierarchy(root)
-    root.regStats()
+    with _timed_phase("regStats"):
+        stats._bindStatHierarchy(root)
+        root.regStats()
 
     # Do a fourth pass to initialize probe points
-    for obj in root.descendants():
-        obj.regProbePoints()
+    with _timed_phase("regProbePoints"):
+        for obj in root.descendants():
+            obj.regProbePoints()
 
     # Do a fifth pass to connect probe listeners
-    for obj in root.descendants():
-        obj.regProbeListeners()
+    with _timed_phase("regProbeListeners"):
+        for obj in root.descendants():
+            obj.regProbeListeners()
 
     # We're done registering statistics.  Enable the stats package now.
     stats.enable()
 
     # Restore checkpoint (if any)
     if ckpt_dir:
-        _drain_manager.preCheckpointRestore()
-        ckpt = _m5_core.getCheckpoint(ckpt_dir)
-        for obj in root.descendants():
-            obj.loadState(ckpt)
+        with _timed_phase("loadState"):
+            _drain_manager.preCheckpointRestore()
+            ckpt = _m5_core.getCheckpoint(ckpt_dir)
+            for obj in root.descendants():
+                obj.loadState(ckpt)
     else:
-        for obj in root.descendants():
-            obj.initState()
+        with _timed_phase("initState"):
+            for obj in root.descendants():
+                obj.initState()
 
     # Check to see if any of the stat events are in the past after resuming from
     # a checkpoint, If so, this call will shift them to be at a valid time.
@@ -232,13 +324,22 @@ def instantiate(ckpt_dir=None):
     if not root:
         fatal("Need to instantiate Root() before calling instantiate()")
 
+    del _instantiate_times[:]
+
     _fix_all_objects(root)
 
-    _dump_configs(root)
+    with _timed_phase("dump configs"):
+        _dump_configs(root)
 
     _create_cpp_objects(root, ckpt_dir)
 
-    _dump_configs_post_cpp(root)
+    with _timed_phase("dump post-C++ configs"):
+        _dump_configs_post_cpp(root)
+
+    from m5 import options
+
+    if options.instantiate_times:
+        _report_instantiate_times(len(root.seal_hierarchy()))
 
 
 need_startup = True
@@ -259,10 +360,10 @@ def simulate(*args, **kwargs):
 
         # Python exit handlers happen in reverse order.
         # We want to dump stats last.
-        atexit.register(stats.dump)
+        registerExitHandler(stats.dump)
 
         # register our C++ exit callback function with Python
-        atexit.register(_m5_core.doExitCleanup)
+        registerExitHandler(_m5_core.doExitCleanup)
 
         # Reset to put the stats in a consistent state.
         stats.reset()
@@ -521,11 +622,11 @@ def fork(simout="%(parent)s.f%(fork_seq)i"):
     """Fork the simulator.
 
     This function forks the simulator. After forking the simulator,
-    the child process gets its output files redirected to a new output
-    directory. The default name of the output directory is the same as
-    the parent with the suffix ".fN" added where N is the fork
-    sequence number. The name of the output directory can be
-    overridden using the simout keyword argument.
+    the child process gets its output files, including its stat outputs,
+    redirected to a new output directory. The default name of the
+    output directory is the same as the parent with the suffix ".fN"
+    added where N is the fork sequence number. The name of the output
+    directory can be overridden using the simout keyword argument.
 
     Output file formatting dictionary:
       parent -- Path to the parent process's output directory.
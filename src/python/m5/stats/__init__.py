@@ -53,8 +53,11 @@ from _m5.stats import periodicStatDump
 from _m5.stats import schedStatEvent as schedEvent
 
 from .gem5stats import JsonOutputVistor
+from .timeseries import TimeSeriesOutput
 
 outputList = []
+# The URLs the outputs in outputList were created from.
+_outputUrls = []
 
 # Dictionary of stat visitor factories populated by the _url_factory
 # visitor.
@@ -203,6 +206,31 @@ def _jsonFactory(fn):
     return JsonOutputVistor(fn)
 
 
+@_url_factory(["timeseries", "ts"])
+def _timeSeriesFactory(fn, chunking=64, desc=True):
+    """Output stats as a columnar time series.
+
+    Every stat dump is appended as one row, with one column per stat
+    value. The column names are written once, to columns.json, and the
+    rows are appended to data.bin as raw 64-bit floats. This makes
+    periodic dumps cheap to write and lets the series be memory-mapped
+    into NumPy arrays (see m5.ext.pystats.timeseries.TimeSeriesReader).
+
+    The columns are fixed by the first dump. Sparse histograms are not
+    supported.
+
+    Parameters:
+      * chunking (unsigned): Number of dumps to buffer (default: 64)
+      * desc (bool): Output stat descriptions (default: True)
+
+    Example:
+      timeseries://stats.ts?chunking=16;desc=False
+
+    """
+
+    return TimeSeriesOutput(fn, chunking, desc)
+
+
 def addStatVisitor(url):
     """Add a stat visitor specified using a URL string
 
@@ -233,6 +261,29 @@ def addStatVisitor(url):
         fatal(f"Stat type '{parsed.scheme}' disabled at compile time")
 
     outputList.append(factory(parsed))
+    _outputUrls.append(url)
+
+
+def reopenOutputs():
+    """Create the stat outputs again, relative to the current output
+    directory.
+
+    This is used in a forked simulator, which would otherwise write its
+    stats to the files of its parent. Outputs with absolute paths still
+    write to the same files.
+    """
+
+    global outputList
+    for output in outputList:
+        if isinstance(output, TimeSeriesOutput):
+            # The parent writes out the dumps it buffered.
+            output.discard()
+
+    urls = list(_outputUrls)
+    outputList = []
+    _outputUrls.clear()
+    for url in urls:
+        addStatVisitor(url)
 
 
 def printStatVisitorTypes():
@@ -424,7 +475,7 @@ def dump(roots=None, message=""):
         prepare()
 
     for output in outputList:
-        if isinstance(output, JsonOutputVistor):
+        if isinstance(output, (JsonOutputVistor, TimeSeriesOutput)):
             if not all_roots:
                 output.dump(Root.getInstance())
             else:
@@ -41,10 +41,13 @@ This serves as the bridge between the gem5 statistics exposed via PyBind11 and
 the Python Stats model.
 """
 
+import re
 from datetime import datetime
 from typing import (
     IO,
+    Dict,
     List,
+    Optional,
     Union,
 )
 
@@ -52,11 +55,16 @@ from m5.ext.pystats.group import *
 from m5.ext.pystats.simstat import *
 from m5.ext.pystats.statistic import *
 from m5.ext.pystats.storagetype import *
-from m5.objects import *
+from m5.objects import (
+    Root,
+    SimObject,
+)
 from m5.params import SimObjectVector
 
 from _m5 import stats as _m5_stats
 
+from .json_writer import JsonStreamWriter
+
 
 class JsonOutputVistor:
     """
@@ -92,8 +100,13 @@ class JsonOutputVistor:
         """
 
         with open(self.file, "w") as fp:
-            simstat = get_simstat(root=roots, prepare_stats=False)
-            simstat.dump(fp=fp, **self.json_args)
+            if set(self.json_args) <= {"indent"}:
+                dump_simstat_json(
+                    root=roots, fp=fp, prepare_stats=False, **self.json_args
+                )
+            else:
+                simstat = get_simstat(root=roots, prepare_stats=False)
+                simstat.dump(fp=fp, **self.json_args)
 
 
 def __get_statistic(statistic: _m5_stats.Info) -> Optional[Statistic]:
@@ -288,6 +301,10 @@ def _prepare_stats(group: _m5_stats.Group):
         _prepare_stats(child)
 
 
+def _group_pattern(to_match: str) -> re.Pattern:
+    return re.compile(f"{to_match}" + r"\d*")
+
+
 def _process_simobject_object(simobject: SimObject) -> SimObjectGroup:
     """
     Processes the stats of a SimObject, and returns a dictionary of the stats
@@ -320,18 +337,17 @@ def _process_simobject_object(simobject: SimObject) -> SimObjectGroup:
         if to_add:
             stats[name] = to_add
 
+    patterns = [_group_pattern(to_match) for to_match in stats.keys()]
     for name, child in sorted(simobject.getStatGroups().items()):
         # Note: We are using the name of the group to determine if we have
         # already processed the group as a child simobject or a statistic.
         # This is to avoid SimObjectVector's being processed twice. It is far
         # from an ideal solution, but it works for now.
-        if not any(
-            re.compile(f"{to_match}" + r"\d*").search(name)
-            for to_match in stats.keys()
-        ):
+        if not any(pattern.search(name) for pattern in patterns):
             stats[name] = Group(
                 type="Group", **_process_simobject_stats(child)
             )
+            patterns.append(_group_pattern(name))
 
     return SimObjectGroup(**stats)
 
@@ -437,3 +453,363 @@ def get_simstat(
         simulated_end_time=simulated_end_time,
         **stats_map,
     )
+
+
+# The functions below stream the same JSON as ``get_simstat(...).dump(...)``
+# straight to a file. Rather than building the PyStats object tree, each
+# statistic is translated into the dictionary its PyStats object would
+# serialize to and written out immediately.
+
+
+def _scalar_json(
+    value: Union[float, int], unit: str, description: Optional[str] = None
+) -> Dict:
+    return {
+        "value": value,
+        "type": "Scalar",
+        "description": description,
+        "unit": unit,
+        "datatype": "f64",
+    }
+
+
+def _statistic_json(statistic: _m5_stats.Info) -> Optional[Dict]:
+    """
+    The JSON equivalent of ``__get_statistic``.
+    """
+
+    statistic.prepare()
+
+    if isinstance(statistic, _m5_stats.ScalarInfo):
+        if statistic.is_nozero and statistic.value == 0.0:
+            return None
+        return _scalar_json(statistic.value, statistic.unit, statistic.desc)
+    elif isinstance(statistic, _m5_stats.DistInfo):
+        unit = statistic.unit
+        values = statistic.values
+        return {
+            "value": {
+                index: _scalar_json(value, unit)
+                for index, value in enumerate(values)
+            },
+            "type": "Distribution",
+            "description": statistic.desc,
+            "min": statistic.min_val,
+            "max": statistic.max_val,
+            "num_bins": len(values),
+            "bin_size": statistic.bucket_size,
+            "sum": statistic.sum,
+            "underflow": statistic.underflow,
+            "overflow": statistic.overflow,
+            "logs": statistic.logs,
+            "sum_squared": statistic.squares,
+        }
+    elif isinstance(statistic, _m5_stats.FormulaInfo):
+        pass
+    elif isinstance(statistic, _m5_stats.VectorInfo):
+        return _vector_json(statistic)
+    elif isinstance(statistic, _m5_stats.Vector2dInfo):
+        return _vector2d_json(statistic)
+    elif isinstance(statistic, _m5_stats.SparseHistInfo):
+        unit = statistic.unit
+        return {
+            "value": {
+                val: _scalar_json(count, unit)
+                for val, count in statistic.values.items()
+            },
+            "type": "SparseHist",
+            "description": statistic.desc,
+        }
+
+    return None
+
+
+def _vector_json(statistic: _m5_stats.VectorInfo) -> Dict:
+    # Fetch each list from C++ once, rather than once per element.
+    values = statistic.value
+    subnames = statistic.subnames
+    subdescs = statistic.subdescs
+    unit = statistic.unit
+    desc = statistic.desc
+
+    vec = {}
+    for index in range(statistic.size):
+        if len(subnames) > index and subnames[index]:
+            index_subname = str(subnames[index])
+            if index_subname.isdigit():
+                index_subname = int(index_subname)
+            elif index_subname.isnumeric():
+                index_subname = float(index_subname)
+        else:
+            index_subname = index
+
+        if len(subdescs) > index and subdescs[index]:
+            index_subdesc = str(subdescs[index])
+        else:
+            index_subdesc = desc
+
+        vec[index_subname] = _scalar_json(values[index], unit, index_subdesc)
+
+    return {"value": vec, "type": "Vector", "description": desc}
+
+
+def _vector2d_json(statistic: _m5_stats.Vector2dInfo) -> Dict:
+    # Mirrors __get_vector2d, including how it looks up the subnames.
+    description = statistic.desc
+    x_size = statistic.x_size
+    y_size = statistic.y_size
+    values = statistic.value
+    subnames = statistic.subnames
+    subdescs = statistic.subdescs
+    ysubnames = statistic.ysubnames
+    unit = statistic.unit
+
+    vector_rep = {}
+    for x_index in range(x_size):
+        x_index_string = x_index
+        if x_index in subnames:
+            x_index_string = str(subnames[x_index])
+
+        x_desc = description
+        if x_index in subdescs:
+            x_desc = str(subdescs[x_index])
+
+        x_vec = {}
+        for y_index in range(y_size):
+            y_index_val = y_index
+            if y_index in ysubnames:
+                y_index_val = str(subnames[y_index])
+            x_vec[y_index_val] = _scalar_json(
+                values[x_index * y_size + y_index], unit
+            )
+
+        vector_rep[x_index_string] = {
+            "value": x_vec,
+            "type": "Vector",
+            "description": x_desc,
+        }
+
+    return {
+        "value": vector_rep,
+        "type": "Vector2d",
+        "description": description,
+    }
+
+
+def _write_entries(writer: JsonStreamWriter, entries: Dict) -> None:
+    # Entries are either JSON values, or (function, argument) tuples which
+    # write the value of the entry when called with the writer.
+    for key, entry in entries.items():
+        writer.key(key)
+        if isinstance(entry, tuple):
+            entry[0](writer, entry[1])
+        else:
+            writer.value(entry)
+
+
+def _group_entries(group: _m5_stats.Group) -> Dict:
+    """
+    The entries of a group, as returned by ``_process_group``.
+    """
+
+    entries = {}
+    for stat in group.getStats():
+        val = _statistic_json(stat)
+        if val is not None:
+            entries[stat.name] = val
+    for name, sub in group.getStatGroups().items():
+        entries[name] = (_write_group, sub)
+    return entries
+
+
+def _write_group(writer: JsonStreamWriter, group: _m5_stats.Group) -> None:
+    writer.begin_object()
+    writer.key("type")
+    writer.value("Group")
+    writer.key("time_conversion")
+    writer.value(None)
+    if isinstance(group, _m5_stats.Group):
+        _write_entries(writer, _group_entries(group))
+    writer.end_object()
+
+
+def _is_true(val: Optional[Dict]) -> bool:
+    # Whether the PyStats object whose JSON is ``val`` is true, which
+    # _process_simobject_object requires to keep a statistic. Scalars always
+    # are, the other statistics only if they have values (see __len__).
+    if val is None:
+        return False
+    return val["type"] == "Scalar" or bool(val["value"])
+
+
+def _has_stats(child) -> bool:
+    # Whether _process_simobject_stats(child) would be added to the stats of
+    # its parent, for children other than groups (see _simobject_entries).
+    if isinstance(child, SimObject):
+        return True
+    if isinstance(child, (list, SimObjectVector)):
+        return len(child) > 0
+    return False
+
+
+def _simobject_entries(simobject: SimObject) -> Dict:
+    """
+    The entries of a SimObject, as returned by
+    ``_process_simobject_object``.
+    """
+
+    entries = {"name": simobject.get_name()} if simobject.get_name() else {}
+
+    for stat in simobject.getStats():
+        val = _statistic_json(stat)
+        if _is_true(val):
+            entries[stat.name] = val
+
+    for name, child in simobject._children.items():
+        if _has_stats(child):
+            entries[name] = (_write_simobject_stats, child)
+        elif isinstance(child, _m5_stats.Group):
+            # A group is kept if it has any entries, so serialize its stats
+            # once, here, rather than again when it is written.
+            group_entries = _group_entries(child)
+            if group_entries:
+                entries[name] = (_write_object, group_entries)
+
+    patterns = [_group_pattern(to_match) for to_match in entries.keys()]
+    for name, child in sorted(simobject.getStatGroups().items()):
+        if not any(pattern.search(name) for pattern in patterns):
+            entries[name] = (_write_group, child)
+            patterns.append(_group_pattern(name))
+
+    return entries
+
+
+def _stats_entries(simobject) -> Dict:
+    """
+    The members of the PyStats object ``_process_simobject_stats`` returns
+    for a SimObject or SimObjectVector, in order.
+    """
+
+    if isinstance(simobject, SimObject):
+        return {
+            "type": "SimObject",
+            "time_conversion": None,
+            **_simobject_entries(simobject),
+        }
+
+    if isinstance(simobject, (list, SimObjectVector)):
+        return {
+            "type": "SimObjectVector",
+            "time_conversion": None,
+            "value": (_write_simobject_vector, simobject),
+        }
+
+    if isinstance(simobject, _m5_stats.Group):
+        return _group_entries(simobject)
+
+    return {}
+
+
+def _write_object(writer: JsonStreamWriter, entries: Dict) -> None:
+    writer.begin_object()
+    _write_entries(writer, entries)
+    writer.end_object()
+
+
+def _write_simobject_stats(writer: JsonStreamWriter, simobject) -> None:
+    _write_object(writer, _stats_entries(simobject))
+
+
+def _write_simobject_vector(
+    writer: JsonStreamWriter, simobjects: List[SimObject]
+) -> None:
+    writer.begin_array()
+    for obj in simobjects:
+        _write_simobject_stats(writer, obj)
+    writer.end_array()
+
+
+def dump_simstat_json(
+    root: Union[
+        Union[SimObject, SimObjectVector],
+        List[Union[SimObject, SimObjectVector]],
+    ],
+    fp: IO[str],
+    prepare_stats: bool = True,
+    indent: Optional[Union[int, str]] = 4,
+) -> None:
+    """
+    Writes the same JSON as ``get_simstat(root, prepare_stats).dump(fp,
+    indent=indent)``, but streams it to ``fp`` as the statistics are read
+    rather than building the SimStat object first. This is considerably
+    faster and uses far less memory for large systems.
+
+    :param root: A SimObject, or list of SimObjects, whose statistics are to
+                 be written. Typically this is the simulation's Root.
+
+    :param fp: The text stream to write the JSON to.
+
+    :param prepare_stats: Dictates whether the stats are to be prepared prior
+                          to being written. By default this is ``True``.
+
+    :param indent: The indentation of the JSON output, as accepted by
+                   ``json.dump``.
+    """
+
+    if prepare_stats:
+        _m5_stats.processDumpQueue()
+
+    # As in get_simstat, roots with the same name replace each other.
+    roots = {}
+    for r in root:
+        roots[r.get_name() if r.get_name() else "root"] = r
+
+    def prepare(r):
+        if prepare_stats:
+            if isinstance(r, list):
+                for obj in r:
+                    _prepare_stats(obj)
+            else:
+                _prepare_stats(r)
+
+    final_tick = Root.getInstance().resolveStat("finalTick").value
+    sim_ticks = Root.getInstance().resolveStat("simTicks").value
+    header = {
+        "time_conversion": None,
+        "creation_time": datetime.now(),
+        "simulated_begin_time": int(final_tick - sim_ticks),
+        "simulated_end_time": int(final_tick),
+    }
+
+    writer = JsonStreamWriter(fp, indent=indent)
+    writer.begin_object()
+    if len(roots) == 1:
+        # The members of the only root are merged into the SimStat object.
+        name, r = next(iter(roots.items()))
+        prepare(r)
+        entries = _stats_entries(r)
+        entries["name"] = name
+        if entries.get("type"):
+            writer.key("type")
+            writer.value(entries["type"])
+        header["time_conversion"] = entries.get("time_conversion")
+        _write_entries(writer, header)
+        _write_entries(
+            writer,
+            {
+                key: entry
+                for key, entry in entries.items()
+                if key not in ("type", "time_conversion")
+            },
+        )
+    else:
+        _write_entries(writer, header)
+        for name, r in roots.items():
+            writer.key(name)
+            prepare(r)
+            entries = _stats_entries(r)
+            entries["name"] = name
+            writer.begin_object()
+            _write_entries(writer, entries)
+            writer.end_object()
+    writer.end_object()
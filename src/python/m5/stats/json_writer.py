@@ -0,0 +1,202 @@
+# Copyright (c) 2024 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+A JSON writer which streams its output to a file as it is produced, rather
+than serializing an object tree which has been built in memory first. The
+output is the same as that of ``json.dump`` with the default encoder
+settings and the same ``indent``.
+"""
+
+from datetime import datetime
+from enum import Enum
+from json.encoder import encode_basestring_ascii
+from typing import (
+    IO,
+    Any,
+    Optional,
+    Union,
+)
+
+_INFINITY = float("inf")
+
+
+def _float_str(value: float) -> str:
+    # The same representation json.dump uses, including for non-finite
+    # values.
+    if value != value:
+        return "NaN"
+    if value == _INFINITY:
+        return "Infinity"
+    if value == -_INFINITY:
+        return "-Infinity"
+    return float.__repr__(value)
+
+
+def _key_str(key: Any) -> str:
+    # JSON object keys are strings, converted the same way json.dump does.
+    if isinstance(key, str):
+        return key
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, float):
+        return _float_str(key)
+    if isinstance(key, int):
+        return int.__repr__(key)
+    raise TypeError(
+        f"keys must be str, int, float, bool or None, not "
+        f"{key.__class__.__name__}"
+    )
+
+
+class JsonStreamWriter:
+    """
+    Writes a JSON document to a text stream, one element at a time.
+
+    Objects and arrays are opened and closed explicitly, and each member of
+    an object is introduced with ``key()``. Values are either written whole
+    with ``value()`` or built from nested ``begin_object()``/
+    ``begin_array()`` calls.
+
+    .. code-block::
+
+        writer = JsonStreamWriter(fp, indent=4)
+        writer.begin_object()
+        writer.key("cores")
+        writer.value(64)
+        writer.key("cpu")
+        writer.begin_array()
+        writer.value({"ipc": 1.5})
+        writer.end_array()
+        writer.end_object()
+    """
+
+    def __init__(self, fp: IO[str], indent: Optional[Union[int, str]] = None):
+        """
+        :param fp: The text stream to write the JSON to.
+        :param indent: The indentation, as accepted by ``json.dump``.
+        """
+        self._write = fp.write
+        if isinstance(indent, int):
+            indent = " " * indent
+        self._indent = indent
+        if indent is None:
+            self._item_separator = ", "
+        else:
+            self._item_separator = ","
+        # For each open object or array: whether it has any members yet.
+        self._has_members = []
+        self._after_key = False
+
+    def _newline(self, depth: int) -> None:
+        if self._indent is not None:
+            self._write("\n" + self._indent * depth)
+
+    def _begin_value(self) -> None:
+        # Separates a value from the previous member of an array. Values in
+        # objects have been separated by key() already.
+        if self._after_key:
+            self._after_key = False
+            return
+        if self._has_members:
+            if self._has_members[-1]:
+                self._write(self._item_separator)
+            self._has_members[-1] = True
+            self._newline(len(self._has_members))
+
+    def _begin(self, bracket: str) -> None:
+        self._begin_value()
+        self._write(bracket)
+        self._has_members.append(False)
+
+    def _end(self, bracket: str) -> None:
+        if self._has_members.pop():
+            self._newline(len(self._has_members))
+        self._write(bracket)
+
+    def begin_object(self) -> None:
+        self._begin("{")
+
+    def end_object(self) -> None:
+        self._end("}")
+
+    def begin_array(self) -> None:
+        self._begin("[")
+
+    def end_array(self) -> None:
+        self._end("]")
+
+    def key(self, key: Any) -> None:
+        """Starts a member of the current object."""
+        self._begin_value()
+        self._write(encode_basestring_ascii(_key_str(key)) + ": ")
+        self._after_key = True
+
+    def value(self, value: Any) -> None:
+        """
+        Writes a complete value. Dicts, lists and tuples are written
+        recursively. A ``datetime`` is written in ISO format (to the second)
+        and an ``Enum`` by its name. Any other type which JSON can't
+        represent is written as ``null``, as ``SerializableStat.to_json``
+        does.
+        """
+        if isinstance(value, dict):
+            self.begin_object()
+            for key, member in value.items():
+                self.key(key)
+                self.value(member)
+            self.end_object()
+        elif isinstance(value, (list, tuple)):
+            self.begin_array()
+            for member in value:
+                self.value(member)
+            self.end_array()
+        else:
+            self._begin_value()
+            self._write(self._scalar(value))
+
+    def _scalar(self, value: Any) -> str:
+        if isinstance(value, str):
+            return encode_basestring_ascii(value)
+        if value is True:
+            return "true"
+        if value is False:
+            return "false"
+        if isinstance(value, int):
+            return int.__repr__(value)
+        if isinstance(value, float):
+            return _float_str(value)
+        if isinstance(value, datetime):
+            return encode_basestring_ascii(
+                value.replace(microsecond=0).isoformat()
+            )
+        if isinstance(value, Enum):
+            return encode_basestring_ascii(str(value.name))
+        return "null"
@@ -0,0 +1,230 @@
+# Copyright (c) 2024 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+A stat output which appends every dump as one row of a columnar time series
+(see ``m5.ext.pystats.timeseries``).
+"""
+
+import os
+from typing import (
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import m5
+from m5.ext.pystats.timeseries import TimeSeriesWriter
+from m5.objects import (
+    Root,
+    SimObject,
+)
+from m5.util import warn
+
+from _m5 import stats as _m5_stats
+
+_DIST_FIELDS = (
+    ("min_value", "min_val"),
+    ("max_value", "max_val"),
+    ("underflows", "underflow"),
+    ("overflows", "overflow"),
+    ("sum", "sum"),
+    ("squares", "squares"),
+    ("logs", "logs"),
+)
+
+
+def _subname(subnames: List[str], index: int) -> Union[str, int]:
+    if index < len(subnames) and subnames[index]:
+        return subnames[index]
+    return index
+
+
+def _vector_names(statistic: _m5_stats.VectorInfo) -> List[str]:
+    size = statistic.size
+    subnames = statistic.subnames
+    if size == 1 and not (subnames and subnames[0]):
+        return [statistic.name]
+    return [f"{statistic.name}::{_subname(subnames, i)}" for i in range(size)]
+
+
+def _flatten_stat(
+    prefix: str, statistic: _m5_stats.Info
+) -> Iterator[Tuple[str, float]]:
+    """
+    Yields a (column name, value) pair for every value of a stat. Sparse
+    histograms are skipped as they do not have a fixed set of values.
+    """
+
+    if isinstance(statistic, _m5_stats.ScalarInfo):
+        yield prefix + statistic.name, statistic.value
+    elif isinstance(statistic, _m5_stats.VectorInfo):
+        yield from zip(
+            (prefix + name for name in _vector_names(statistic)),
+            statistic.value,
+        )
+    elif isinstance(statistic, _m5_stats.Vector2dInfo):
+        values = statistic.value
+        x_names = statistic.subnames
+        y_names = statistic.ysubnames
+        base = prefix + statistic.name
+        for x in range(statistic.x_size):
+            x_name = _subname(x_names, x)
+            for y in range(statistic.y_size):
+                yield (
+                    f"{base}::{x_name}::{_subname(y_names, y)}",
+                    values[x * statistic.y_size + y],
+                )
+    elif isinstance(statistic, _m5_stats.DistInfo):
+        base = prefix + statistic.name
+        for field, attr in _DIST_FIELDS:
+            yield f"{base}::{field}", getattr(statistic, attr)
+        for i, value in enumerate(statistic.values):
+            yield f"{base}::{i}", value
+
+
+def _flatten_group(
+    prefix: str, group: _m5_stats.Group
+) -> Iterator[Tuple[str, _m5_stats.Info]]:
+    for statistic in group.getStats():
+        yield prefix, statistic
+    for name, child in group.getStatGroups().items():
+        yield from _flatten_group(f"{prefix}{name}.", child)
+
+
+def _flatten(
+    roots: Union[List[SimObject], Root],
+) -> Iterator[Tuple[str, _m5_stats.Info]]:
+    # The same traversal as m5.stats._dump_to_visitor, yielding each stat
+    # with the prefix the text output would give it.
+    if isinstance(roots, list) and roots:
+        for root in roots:
+            prefix = "".join(f"{p}." for p in root.path_list())
+            yield from _flatten_group(prefix, root)
+    else:
+        from m5 import stats
+
+        yield from _flatten_group("", Root.getInstance())
+        for statistic in stats.stats_list:
+            yield "", statistic
+
+
+class TimeSeriesOutput:
+    """
+    A stat output which adds one row to a columnar time series every time
+    the stats are dumped. The columns are fixed by the first dump: stats
+    which are missing from a later dump (e.g., when only some roots are
+    dumped) are stored as NaN, and stats which did not exist in the first
+    dump are ignored.
+    """
+
+    def __init__(self, path: str, chunking: int = 64, desc: bool = True):
+        """
+        :param path: The time series directory. Relative paths are relative
+                     to the output directory.
+        :param chunking: The number of dumps to buffer before they are
+                         written out.
+        :param desc: Store the stat descriptions in the column dictionary.
+        """
+
+        self.path = path
+        self.chunking = chunking
+        self.desc = desc
+        self._writer: Optional[TimeSeriesWriter] = None
+        self._warned = False
+        # Exit handlers run in reverse order of registration, so this runs
+        # after the final stat dump registered by m5.simulate.
+        from m5.simulate import registerExitHandler
+
+        registerExitHandler(self.close)
+
+    def _open(self, values: Dict[str, float], infos: Dict) -> None:
+        from m5 import options
+
+        descs = {}
+        units = {}
+        for name, statistic in infos.items():
+            if self.desc and statistic.desc:
+                descs[name] = statistic.desc
+            if statistic.unit:
+                units[name] = statistic.unit
+        self._writer = TimeSeriesWriter(
+            os.path.join(options.outdir, self.path),
+            values.keys(),
+            descs=descs,
+            units=units,
+            chunk_rows=self.chunking,
+        )
+
+    def dump(self, roots: Union[List[SimObject], Root]) -> None:
+        """
+        Adds a row holding the current value of every stat under ``roots``.
+
+        .. warning::
+
+            This dump assumes the statistics have already been prepared
+            for the target root.
+        """
+
+        values = {}
+        infos = {}
+        for prefix, statistic in _flatten(roots):
+            for name, value in _flatten_stat(prefix, statistic):
+                values[name] = value
+                if self._writer is None:
+                    infos[name] = statistic
+
+        if self._writer is None:
+            self._open(values, infos)
+
+        writer = self._writer
+        row = [float("nan")] * len(writer.columns)
+        row[0] = m5.curTick()
+        for name, value in values.items():
+            index = writer.index(name)
+            if index is not None:
+                row[index] = value
+            elif not self._warned:
+                warn(
+                    f"{self.path}: Ignoring stat '{name}' (and any others) "
+                    "which did not exist in the first dump."
+                )
+                self._warned = True
+        writer.append(row)
+
+    def discard(self) -> None:
+        """Forgets the time series without writing out any buffered dumps,
+        e.g., in a forked simulator whose parent writes them.
+        """
+        self._writer = None
+
+    def close(self) -> None:
+        """Writes out any buffered dumps and closes the time series."""
+        if self._writer is not None:
+            self._writer.close()
@@ -24,14 +24,69 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+from itertools import count
+
 __all__ = ["multidict"]
 
+# Every change to a multidict takes a new version from this counter, so
+# a flattened table is stale if any multidict in its chain has a newer
+# version than the table.
+_versions = count(1)
+
 
 class multidict:
     def __init__(self, parent={}, **kwargs):
         self.local = dict(**kwargs)
-        self.parent = parent
         self.deleted = {}
+        # Flattened table of this multidict and all of its parents. It is
+        # only kept for multidicts that are the parent of another one
+        # (i.e., the class-level tables of SimObjects), since those are
+        # read far more often than they are changed.
+        self._shared = False
+        self._flat = None
+        self._flat_version = 0
+        self.parent = parent
+
+    @property
+    def parent(self):
+        return self._parent
+
+    @parent.setter
+    def parent(self, parent):
+        if isinstance(parent, multidict):
+            parent._shared = True
+        self._parent = parent
+        self._changed()
+
+    def _changed(self):
+        self._version = next(_versions)
+
+    # Return a dict of all the keys visible through this multidict, in
+    # the same order as items(). The dict must not be modified.
+    def _flattened(self):
+        newest = 0
+        node = self
+        while isinstance(node, multidict):
+            if node._version > newest:
+                newest = node._version
+            node = node._parent
+
+        if self._flat is not None and self._flat_version >= newest:
+            return self._flat
+
+        flat = dict(self.local)
+        parent = self._parent
+        if isinstance(parent, multidict):
+            parent = parent._flattened()
+        deleted = self.deleted
+        for key, value in parent.items():
+            if key not in flat and key not in deleted:
+                flat[key] = value
+
+        if self._shared:
+            self._flat = flat
+            self._flat_version = newest
+        return flat
 
     def __str__(self):
         return str(dict(self.items()))
@@ -50,31 +105,43 @@ class multidict:
                 self.deleted[key] = True
             else:
                 raise KeyError(e)
+        self._changed()
 
     def __setitem__(self, key, value):
         self.deleted.pop(key, False)
         self.local[key] = value
+        self._changed()
 
     def __getitem__(self, key):
-        try:
-            return self.local[key]
-        except KeyError as e:
-            if not self.deleted.get(key, False) and key in self.parent:
-                return self.parent[key]
-            else:
-                raise KeyError(e)
+        local = self.local
+        if key in local:
+            return local[key]
+        if key not in self.deleted:
+            parent = self._parent
+            if isinstance(parent, multidict):
+                parent = parent._flattened()
+            if key in parent:
+                return parent[key]
+        raise KeyError(key)
 
     def __len__(self):
         return len(self.local) + len(self.parent)
 
     def next(self):
-        for key, value in self.local.items():
-            yield key, value
+        if self._shared:
+            yield from self._flattened().items()
+            return
+
+        local = self.local
+        yield from local.items()
 
-        if self.parent:
-            for key, value in self.parent.next():
-                if key not in self.local and key not in self.deleted:
-                    yield key, value
+        parent = self._parent
+        if isinstance(parent, multidict):
+            parent = parent._flattened()
+        deleted = self.deleted
+        for key, value in parent.items():
+            if key not in local and key not in deleted:
+                yield key, value
 
     def has_key(self, key):
         return key in self
@@ -102,6 +169,7 @@ class multidict:
         except KeyError:
             self.deleted.pop(key, False)
             self.local[key] = default
+            self._changed()
             return default
 
     def _dump(self):
@@ -0,0 +1,78 @@
+# Copyright (c) 2024 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Simulates the start of "riscv-hello" once, saving a checkpoint in the
+directory shared by the MultiSim simulators, then restores it in two
+simulators run after it.
+"""
+
+import gem5.utils.multisim as multisim
+from gem5.components.boards.simple_board import SimpleBoard
+from gem5.components.cachehierarchies.classic.no_cache import NoCache
+from gem5.components.memory import SingleChannelDDR3_1600
+from gem5.components.processors.cpu_types import CPUTypes
+from gem5.components.processors.simple_processor import SimpleProcessor
+from gem5.isas import ISA
+from gem5.resources.resource import obtain_resource
+from gem5.simulate.exit_event import ExitEvent
+from gem5.simulate.simulator import Simulator
+from gem5.utils.requires import requires
+
+requires(isa_required=ISA.RISCV)
+
+
+def make_board(checkpoint=None):
+    board = SimpleBoard(
+        clk_freq="3GHz",
+        processor=SimpleProcessor(
+            cpu_type=CPUTypes.TIMING, isa=ISA.RISCV, num_cores=1
+        ),
+        memory=SingleChannelDDR3_1600(size="32MiB"),
+        cache_hierarchy=NoCache(),
+    )
+    board.set_se_binary_workload(
+        obtain_resource("riscv-hello"), checkpoint=checkpoint
+    )
+    return board
+
+
+def save_checkpoint():
+    save.save_checkpoint(multisim.shared_checkpoint_dir("save"))
+    return True
+
+
+save = Simulator(
+    board=make_board(),
+    id="save",
+    max_ticks=1000000,
+    on_exit_event={ExitEvent.MAX_TICK: save_checkpoint},
+)
+multisim.add_simulator(save)
+
+for id in ("restore-0", "restore-1"):
+    board = make_board(checkpoint=multisim.shared_checkpoint_dir("save"))
+    multisim.add_simulator(Simulator(board=board, id=id), after="save")
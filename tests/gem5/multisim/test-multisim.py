@@ -54,6 +54,43 @@ gem5_verify_config(
     uses_kvm=False,
 )
 
+# The "restore" simulators only succeed if the checkpoint "save" wrote to
+# `shared_checkpoint_dir` is where they look for it. Their stats are only
+# dumped when they exit, which a forked simulator must do explicitly.
+for name, gem5_args in (
+    ("", []),
+    ("-fork-server", ["--fork-server"]),
+):
+    gem5_verify_config(
+        name=f"test-multisim-shared-checkpoint{name}",
+        fixtures=(),
+        verifiers=(
+            verifier.MatchRegex(
+                re.compile(r".*'restore-0' finished with exit code 0")
+            ),
+            verifier.MatchRegex(
+                re.compile(r".*'restore-1' finished with exit code 0")
+            ),
+            verifier.MatchFileRegex(
+                re.compile(r"simSeconds"), ["restore-0/stats.txt"]
+            ),
+        ),
+        gem5_args=["-m", "gem5.utils.multisim"] + gem5_args,
+        config=joinpath(
+            config.base_dir,
+            "tests",
+            "gem5",
+            "multisim",
+            "configs",
+            "hello-shared-checkpoint.py",
+        ),
+        config_args=[],
+        valid_isas=(constants.all_compiled_tag,),
+        valid_hosts=constants.supported_hosts,
+        length=constants.quick_tag,
+        uses_kvm=False,
+    )
+
 # For now, skip this test because there are issues with obtaining one of the
 # checkpoints with obtain_resource
 # gem5_verify_config(
@@ -54,7 +54,16 @@ def run_hello_world_binary_test(isa: str):
     gem5_verify_config(
         name=f"test-regression-tests-{isa}-hello-world",
         fixtures=(),
-        verifiers=(),
+        verifiers=(
+            # The core's IPC, as printed in stats.txt, within 2% of the
+            # reference IPC. The reference IPCs were obtained by running the
+            # tests on gem5 v25.0.0.1, commit
+            # ddd4ae35adb0a3df1f1ba11e9a973a5c2f8c2944.
+            verifier.MatchStatsTolerance(
+                joinpath(getcwd(), "ref", f"hello-world-{isa}-stats.txt"),
+                rel_tol=0.02,
+            ),
+        ),
         gem5_args=[],
         config=joinpath(
             config.base_dir,
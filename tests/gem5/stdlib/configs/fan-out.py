@@ -0,0 +1,129 @@
+# Copyright (c) 2024 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Runs the start of "riscv-hello", then fans out three variants of the rest of
+the simulation with `Simulator.fan_out`: one which runs to the end, one which
+stops after a further million ticks and one which fails. It checks the exit
+code of each variant and that each wrote its own stats.
+"""
+
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+
+import m5
+
+from gem5.components.boards.simple_board import SimpleBoard
+from gem5.components.cachehierarchies.classic.no_cache import NoCache
+from gem5.components.memory import SingleChannelDDR3_1600
+from gem5.components.processors.cpu_types import CPUTypes
+from gem5.components.processors.simple_processor import SimpleProcessor
+from gem5.isas import ISA
+from gem5.resources.resource import obtain_resource
+from gem5.simulate.exit_event import ExitEvent
+from gem5.simulate.simulator import Simulator
+from gem5.utils.requires import requires
+
+parser = argparse.ArgumentParser()
+
+parser.add_argument(
+    "-r",
+    "--resource-directory",
+    type=str,
+    required=False,
+    help="The directory in which resources will be downloaded or exist.",
+)
+
+args = parser.parse_args()
+
+requires(isa_required=ISA.RISCV)
+
+board = SimpleBoard(
+    clk_freq="3GHz",
+    processor=SimpleProcessor(
+        cpu_type=CPUTypes.TIMING, isa=ISA.RISCV, num_cores=1
+    ),
+    memory=SingleChannelDDR3_1600(size="32MiB"),
+    cache_hierarchy=NoCache(),
+)
+board.set_se_binary_workload(
+    obtain_resource("riscv-hello", resource_directory=args.resource_directory)
+)
+
+simulator = Simulator(
+    board=board,
+    max_ticks=1000000,
+    on_exit_event={ExitEvent.MAX_TICK: (lambda: True)},
+)
+simulator.run()
+
+
+def to_end(simulator: Simulator) -> None:
+    simulator.set_max_ticks(m5.MaxTick)
+
+
+def more_ticks(simulator: Simulator) -> None:
+    pass
+
+
+def fail(simulator: Simulator) -> None:
+    raise Exception("This variant fails.")
+
+
+m5.disableAllListeners()
+exit_codes = simulator.fan_out(
+    {"to-end": to_end, "more-ticks": more_ticks, "fail": fail}
+)
+print(f"Exit codes: {json.dumps(exit_codes, sort_keys=True)}")
+
+outdir = Path(m5.options.outdir)
+with open(outdir / "fan_out_summary.json") as f:
+    summary = json.load(f)
+if {id: result["exit_code"] for id, result in summary.items()} != exit_codes:
+    print("The summary does not match the exit codes.")
+    sys.exit(1)
+
+# Each variant dumps its stats in its own directory, rather than in that of
+# this process, when it exits.
+ticks = {}
+for id in ("to-end", "more-ticks"):
+    with open(outdir / id / "stats.txt") as f:
+        match = re.search(r"^simTicks\s+(\d+)", f.read(), re.MULTILINE)
+    if not match:
+        print(f"No stats were dumped for '{id}'.")
+        sys.exit(1)
+    ticks[id] = int(match.group(1))
+if ticks["more-ticks"] >= ticks["to-end"]:
+    print("The variants did not run separately.")
+    sys.exit(1)
+parent_stats = outdir / "stats.txt"
+if parent_stats.exists() and "simTicks" in parent_stats.read_text():
+    print("A variant dumped its stats in the parent's directory.")
+    sys.exit(1)
+print("Each variant wrote its own stats.")
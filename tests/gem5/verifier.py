@@ -40,7 +40,10 @@
 """
 Built in test cases that verify particular details about a gem5 run.
 """
+import heapq
+import itertools
 import json
+import math
 import os
 import re
 
@@ -191,12 +194,217 @@ class MatchStderr(DerivedGoldStandard):
 
 
 class MatchStats(DerivedGoldStandard):
-    # TODO: Likely will want to change this verifier since we have the weird
-    # perl script right now. A simple diff probably isn't going to work.
+    # A simple diff rarely works for stats, since any change to the model
+    # changes some of them. See MatchStatsTolerance for a verifier which
+    # compares them value by value.
     _file = constants.gem5_simulation_stats
     _default_ignore_regex = []
 
 
+def _parse_stats(filename):
+    """
+    Yields ((dump, name), value) for every stat in a stats.txt file, in the
+    order they appear, reading the file a line at a time. Dumps are counted
+    from 1, and for vectors and distributions each element is a stat of its
+    own (e.g. "system.cpu.op_class::IntAlu").
+    """
+    dump = 0
+    with open(filename) as stats:
+        for line in stats:
+            if line.startswith("---------- Begin Simulation Statistics"):
+                dump += 1
+                continue
+            fields = line.split(maxsplit=2)
+            if len(fields) < 2:
+                continue
+            try:
+                value = float(fields[1])
+            except ValueError:
+                continue
+            yield (dump, fields[0]), value
+
+
+class MatchStatsTolerance(Verifier):
+    """
+    Compares the stats of the test with a reference stats file value by
+    value, and passes if every stat is within its tolerance of the
+    reference. Stats missing from the test output fail, while stats only
+    in the test output are ignored.
+
+    On failure, the stats which deviate most from the reference are
+    reported.
+    """
+
+    def __init__(
+        self,
+        standard_filename,
+        rel_tol=0.0,
+        abs_tol=0.0,
+        tolerances=None,
+        include=None,
+        exclude=None,
+        test_filename=constants.gem5_simulation_stats,
+        max_reported=10,
+    ):
+        """
+        :param standard_filename: The path of the reference stats file.
+
+        :param rel_tol: The default tolerance relative to the reference
+        value, e.g. 0.01 for 1%.
+
+        :param abs_tol: The default absolute tolerance. A stat passes if it
+        is within either tolerance.
+
+        :param tolerances: A dict mapping a string or compiled regex to the
+        (rel_tol, abs_tol) of the stats whose names it matches, overriding
+        the defaults. The first regex which matches is used.
+
+        :param include: A string, compiled regex, or iterable containing
+        either. If given, only stats whose names match are compared.
+
+        :param exclude: Like include, but for stats which are not compared.
+
+        :param test_filename: The name of the test's stats file, relative to
+        its output directory.
+
+        :param max_reported: How many of the largest deviations to report.
+        """
+        super().__init__()
+        self.standard_filename = standard_filename
+        self.test_filename = test_filename
+        self.default_tolerance = (rel_tol, abs_tol)
+        self.tolerances = [
+            (re.compile(regex), tolerance)
+            for regex, tolerance in (tolerances or {}).items()
+        ]
+        self.include = [re.compile(r) for r in _iterable_regex(include)]
+        self.exclude = [re.compile(r) for r in _iterable_regex(exclude)]
+        self.max_reported = max_reported
+
+    def _tolerance(self, name):
+        """
+        Returns the (rel_tol, abs_tol) of a stat, or None if it isn't
+        compared.
+        """
+        if self.include and not any(r.search(name) for r in self.include):
+            return None
+        if any(r.search(name) for r in self.exclude):
+            return None
+        for regex, tolerance in self.tolerances:
+            if regex.search(name):
+                return tolerance
+        return self.default_tolerance
+
+    @staticmethod
+    def _deviation(expected, actual, tolerance):
+        """
+        Returns how far actual is from expected, relative to expected, if
+        it is outside the tolerance, or None if it is within it.
+        """
+        if math.isnan(expected) or math.isnan(actual):
+            if math.isnan(expected) and math.isnan(actual):
+                return None
+            return math.inf
+        if expected == actual:
+            return None
+        rel_tol, abs_tol = tolerance
+        if math.isclose(expected, actual, rel_tol=rel_tol, abs_tol=abs_tol):
+            return None
+        if expected == 0:
+            return math.inf
+        return abs(actual - expected) / abs(expected)
+
+    def compare(self, standard_filename, test_filename):
+        """
+        Compares two stats files. Returns the number of stats compared, and
+        a list of (deviation, (dump, name), expected, actual) for those
+        outside their tolerance, where actual is None for missing stats.
+        """
+        compared = 0
+        failures = []
+
+        def check(stat, expected, actual, tolerance):
+            nonlocal compared
+            compared += 1
+            deviation = self._deviation(expected, actual, tolerance)
+            if deviation is not None:
+                failures.append((deviation, stat, expected, actual))
+
+        # Both files usually list the same stats in the same order, so walk
+        # them together and only hold on to the stats which are out of step.
+        standard_pending = {}
+        test_pending = {}
+        for standard, test in itertools.zip_longest(
+            _parse_stats(standard_filename), _parse_stats(test_filename)
+        ):
+            if standard is not None and test is not None:
+                if standard[0] == test[0]:
+                    tolerance = self._tolerance(standard[0][1])
+                    if tolerance is not None:
+                        check(standard[0], standard[1], test[1], tolerance)
+                    continue
+            if standard is not None:
+                stat, value = standard
+                tolerance = self._tolerance(stat[1])
+                if tolerance is None:
+                    pass
+                elif stat in test_pending:
+                    check(stat, value, test_pending.pop(stat), tolerance)
+                else:
+                    standard_pending[stat] = value
+            if test is not None:
+                stat, value = test
+                tolerance = self._tolerance(stat[1])
+                if tolerance is None:
+                    pass
+                elif stat in standard_pending:
+                    check(stat, standard_pending.pop(stat), value, tolerance)
+                else:
+                    test_pending[stat] = value
+
+        for stat, expected in standard_pending.items():
+            compared += 1
+            failures.append((math.inf, stat, expected, None))
+
+        return compared, failures
+
+    def _format_failure(self, failure):
+        deviation, (dump, name), expected, actual = failure
+        if dump > 1:
+            name = f"{name} (dump {dump})"
+        if actual is None:
+            return f"  {name}: missing, expected {expected:g}"
+        if math.isinf(deviation):
+            change = ""
+        else:
+            sign = "+" if actual > expected else "-"
+            change = f" ({sign}{deviation:.2%})"
+        return f"  {name}: expected {expected:g}, got {actual:g}{change}"
+
+    def test(self, params):
+        # We need a tempdir fixture from our parent verifier suite.
+        fixtures = params.fixtures
+        # Get the file from the tempdir of the test.
+        tempdir = fixtures[constants.tempdir_fixture_name].path
+        test_filename = joinpath(tempdir, self.test_filename)
+
+        compared, failures = self.compare(
+            self.standard_filename, test_filename
+        )
+        if not failures:
+            return
+
+        worst = heapq.nlargest(self.max_reported, failures, key=lambda f: f[0])
+        lines = [self._format_failure(f) for f in worst]
+        if len(failures) > len(worst):
+            lines.append(f"  ... and {len(failures) - len(worst)} more")
+        test_util.fail(
+            f"{len(failures)} of {compared} stats differ from "
+            f"{self.standard_filename}:\n" + "\n".join(lines) + "\n"
+            f"See {tempdir} for full results"
+        )
+
+
 class MatchConfigINI(DerivedGoldStandard):
     _file = constants.gem5_simulation_config_ini
     _default_ignore_regex = (
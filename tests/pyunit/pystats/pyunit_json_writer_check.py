@@ -0,0 +1,283 @@
+# Copyright (c) 2024 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import io
+import json
+import os
+import re
+import tempfile
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+from unittest import mock
+
+from m5.ext.pystats.storagetype import StorageType
+from m5.stats import gem5stats
+from m5.stats.json_writer import JsonStreamWriter
+
+
+class JsonStreamWriterTestSuite(unittest.TestCase):
+    """Tests that JsonStreamWriter writes the same JSON as json.dump"""
+
+    document = {
+        "type": "SimObject",
+        "time_conversion": None,
+        "name": 'café "quoted"\n',
+        "cpu": [
+            {"value": 1.5, "flags": [True, False], "empty": {}},
+            {"value": float("nan"), "max": float("inf"), "none": []},
+        ],
+        "vector": {0: 3, 1.5: -2, "x": 10**20},
+        "nested": {"a": {"b": {"c": [[], [{}], [1, [2, [3]]]]}}},
+    }
+
+    def _stream(self, indent):
+        fp = io.StringIO()
+        JsonStreamWriter(fp, indent=indent).value(self.document)
+        return fp.getvalue()
+
+    def test_matches_json_dump(self):
+        for indent in (None, 0, 2, 4, "\t"):
+            with self.subTest(indent=indent):
+                self.assertEqual(
+                    self._stream(indent),
+                    json.dumps(self.document, indent=indent),
+                )
+
+    def test_incremental(self):
+        fp = io.StringIO()
+        writer = JsonStreamWriter(fp, indent=4)
+        writer.begin_object()
+        for key, value in self.document.items():
+            writer.key(key)
+            if isinstance(value, list):
+                writer.begin_array()
+                for item in value:
+                    writer.value(item)
+                writer.end_array()
+            else:
+                writer.value(value)
+        writer.end_object()
+        self.assertEqual(fp.getvalue(), json.dumps(self.document, indent=4))
+
+    def test_serializable_stat_types(self):
+        fp = io.StringIO()
+        JsonStreamWriter(fp).value(
+            [datetime(2024, 5, 6, 7, 8, 9, 123456), StorageType["f64"], set()]
+        )
+        self.assertEqual(fp.getvalue(), '["2024-05-06T07:08:09", "f64", null]')
+
+
+# Stand-ins for the _m5.stats classes and the SimObjects, so the two JSON
+# writers can be run on a hierarchy chosen by the test.
+class _Info:
+    def __init__(self, name, **attrs):
+        self.name = name
+        self.desc = f"The {name}"
+        self.unit = "(Count)"
+        self.__dict__.update(attrs)
+
+    def prepare(self):
+        pass
+
+
+class _ScalarInfo(_Info):
+    is_nozero = False
+
+
+class _VectorInfo(_Info):
+    subnames = []
+    subdescs = []
+
+    @property
+    def size(self):
+        return len(self.value)
+
+
+class _FormulaInfo(_VectorInfo):
+    pass
+
+
+class _Vector2dInfo(_Info):
+    subnames = {}
+    subdescs = {}
+    ysubnames = {}
+
+
+class _DistInfo(_Info):
+    pass
+
+
+class _SparseHistInfo(_Info):
+    pass
+
+
+class _Group:
+    def __init__(self, stats=(), groups=None):
+        self._stats = list(stats)
+        self._groups = groups or {}
+
+    def getStats(self):
+        return self._stats
+
+    def getStatGroups(self):
+        return self._groups
+
+    def preDumpStats(self):
+        pass
+
+
+class _SimObject(_Group):
+    def __init__(self, name, stats=(), children=None, groups=None):
+        super().__init__(stats, groups)
+        self._name = name
+        self._children = children or {}
+
+    def get_name(self):
+        return self._name
+
+
+class _SimObjectVector(list):
+    pass
+
+
+class _Root:
+    stats = {"finalTick": 2000, "simTicks": 1500}
+
+    @classmethod
+    def getInstance(cls):
+        return cls
+
+    @classmethod
+    def resolveStat(cls, name):
+        return SimpleNamespace(value=cls.stats[name])
+
+
+def _dist(name, values):
+    return _DistInfo(
+        name,
+        values=values,
+        min_val=0,
+        max_val=len(values),
+        bucket_size=1,
+        sum=sum(values),
+        squares=sum(v * v for v in values),
+        underflow=0,
+        overflow=0,
+        logs=0.0,
+    )
+
+
+def _stats():
+    """One of each kind of statistic, including empty ones."""
+    return [
+        _ScalarInfo("zero", value=0.0),
+        _ScalarInfo("nozero", value=0.0, is_nozero=True),
+        _ScalarInfo("ipc", value=1.25),
+        _VectorInfo("vector", value=[1.0, 2.0], subnames=["a", "7"]),
+        _VectorInfo("emptyVector", value=[]),
+        _FormulaInfo("formula", value=[1.0]),
+        _Vector2dInfo("vector2d", x_size=2, y_size=2, value=[1, 2, 3, 4]),
+        _dist("dist", [1, 0, 3]),
+        _SparseHistInfo("sparseHist", values={1.0: 2, 4.0: 1}),
+        _SparseHistInfo("emptySparseHist", values={}),
+    ]
+
+
+class JsonOutputVistorTestSuite(unittest.TestCase):
+    """Tests that JsonOutputVistor writes the same JSON as the SimStat
+    returned by get_simstat"""
+
+    def setUp(self):
+        patcher = mock.patch.multiple(
+            gem5stats,
+            _m5_stats=SimpleNamespace(
+                Info=_Info,
+                ScalarInfo=_ScalarInfo,
+                VectorInfo=_VectorInfo,
+                FormulaInfo=_FormulaInfo,
+                Vector2dInfo=_Vector2dInfo,
+                DistInfo=_DistInfo,
+                SparseHistInfo=_SparseHistInfo,
+                Group=_Group,
+                processDumpQueue=lambda: None,
+            ),
+            SimObject=_SimObject,
+            SimObjectVector=_SimObjectVector,
+            Root=_Root,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _root(self):
+        cpus = _SimObjectVector(
+            _SimObject(f"cpu{i}", _stats()) for i in range(2)
+        )
+        system = _SimObject(
+            "system",
+            _stats(),
+            children={
+                "cpu": cpus,
+                "no_cpus": _SimObjectVector(),
+                "formulas": _Group([_FormulaInfo("formula", value=[])]),
+                "group": _Group([_VectorInfo("emptyVector", value=[])]),
+            },
+            groups={
+                "cpu0": cpus[0],
+                "cpu1": cpus[1],
+                "bus": _Group(_stats(), {"queue": _Group(_stats())}),
+            },
+        )
+        return _SimObject(
+            None,
+            _stats(),
+            children={"system": system},
+            groups={"system": system},
+        )
+
+    def _without_creation_time(self, text):
+        return re.sub(r'"creation_time": "[^"]*"', "", text)
+
+    def test_matches_simstat(self):
+        root = self._root()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "stats.json")
+            gem5stats.JsonOutputVistor(path, indent=4).dump([root])
+            with open(path) as f:
+                streamed = f.read()
+
+        fp = io.StringIO()
+        gem5stats.get_simstat([root], prepare_stats=False).dump(fp, indent=4)
+
+        self.assertEqual(
+            self._without_creation_time(streamed),
+            self._without_creation_time(fp.getvalue()),
+        )
+        system = json.loads(streamed)["system"]
+        self.assertIn("vector", system)
+        self.assertNotIn("emptyVector", system)
+        self.assertNotIn("emptySparseHist", system)
+        self.assertIn("emptyVector", system["bus"])
@@ -0,0 +1,108 @@
+# Copyright (c) 2024 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import io
+import unittest
+
+from m5.ext.pystats import (
+    Group,
+    Scalar,
+    SimObjectGroup,
+    SimObjectVectorGroup,
+    SimStat,
+)
+from m5.ext.pystats.jsonloader import load
+
+
+def _core(index: int) -> SimObjectGroup:
+    return SimObjectGroup(
+        numCycles=Scalar(value=100 * index, unit="Cycle"),
+        ipc=Scalar(value=1.0 / (index + 1), description="IPC"),
+        fetch=Group(
+            type="Group", numInsts=Scalar(value=10 * index, unit="Count")
+        ),
+    )
+
+
+def _simstat_json() -> str:
+    return SimStat(
+        creation_time="2024-01-01T00:00:00",
+        simulated_begin_time=0,
+        simulated_end_time=1000,
+        board=SimObjectGroup(
+            processor=SimObjectGroup(
+                cores=SimObjectVectorGroup(value=[_core(i) for i in range(3)])
+            ),
+            memory=SimObjectGroup(readBursts=Scalar(value=42)),
+        ),
+        simSeconds=Scalar(value=0.5, unit="Second"),
+    ).dumps()
+
+
+class JsonLoaderTestSuite(unittest.TestCase):
+    """Tests loading stats JSON, both eagerly and lazily"""
+
+    def setUp(self):
+        text = _simstat_json()
+        self.eager = load(io.StringIO(text))
+        self.lazy = load(io.StringIO(text), lazy=True)
+
+    def test_same_stats(self):
+        self.assertEqual(self.eager.to_json(), self.lazy.to_json())
+
+    def test_lookup(self):
+        for simstat in (self.eager, self.lazy):
+            with self.subTest(lazy=simstat is self.lazy):
+                self.assertIsInstance(simstat, SimStat)
+                core = simstat.board.processor.cores1
+                self.assertIsInstance(core, SimObjectGroup)
+                self.assertEqual(core.numCycles.value, 100)
+                self.assertEqual(core.fetch.numInsts.value, 10)
+                self.assertEqual(simstat.board.memory.readBursts.value, 42)
+                self.assertIsNone(simstat.board.processor.cores3)
+                self.assertIsNone(simstat.board.missing)
+
+    def test_find(self):
+        for regex in ("numCycles", "cores", "num.*", "fetch", "missing"):
+            with self.subTest(regex=regex):
+                self.assertEqual(
+                    [stat.to_json() for stat in self.eager.find(regex)],
+                    [stat.to_json() for stat in self.lazy.find(regex)],
+                )
+        self.assertEqual(len(self.lazy.find("ipc")), 3)
+
+    def test_find_converts_only_matches(self):
+        found = self.lazy.find("readBursts")
+        self.assertEqual([stat.value for stat in found], [42])
+        self.assertIsNotNone(self.lazy.board.processor._json)
+        # Stats found through the index are the ones attributes return.
+        self.assertIs(found[0], self.lazy.board.memory.readBursts)
+
+    def test_find_after_lookup(self):
+        self.lazy.board.processor.cores0.fetch
+        self.assertEqual(
+            [stat.value for stat in self.lazy.find("numInsts")], [0, 10, 20]
+        )
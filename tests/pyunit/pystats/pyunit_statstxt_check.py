@@ -0,0 +1,148 @@
+# Copyright (c) 2024 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import gzip
+import math
+import os
+import tempfile
+import unittest
+
+from m5.ext.pystats import statstxt
+from m5.ext.pystats.statstxt import StatsTxtReader
+
+_DUMP = """
+---------- Begin Simulation Statistics{message}----------
+simSeconds                       {seconds:<12} # Seconds simulated (Second)
+simTicks                         {ticks:<12} # Ticks simulated (Tick)
+system.cpu.ipc                   nan          # IPC ((Count/Cycle))
+system.cpu.op_class::IntAlu      {ops:<4}  75.00%  75.00% # Ops (Count)
+system.cpu.op_class::total       {total:<12} # Ops (Count)
+system.mem_ctrl.readLatencyHist::mean  {latency:<6} # Latency (Tick)
+
+---------- End Simulation Statistics   ----------
+"""
+
+
+def _stats_text(count: int) -> str:
+    return "".join(
+        _DUMP.format(
+            message=f" : dump {i} " if i % 2 else " ",
+            seconds=0.5 * (i + 1),
+            ticks=1000 * (i + 1),
+            ops=3 * i,
+            total=4 * i,
+            latency=12.5 + i,
+        )
+        for i in range(count)
+    )
+
+
+class StatsTxtReaderTestSuite(unittest.TestCase):
+    """Tests reading stats.txt files dump by dump"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, "stats.txt")
+        with open(self.path, "w") as fp:
+            fp.write(_stats_text(5))
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_dumps(self):
+        dumps = list(StatsTxtReader(self.path))
+        self.assertEqual(len(dumps), 5)
+        dump = dumps[2]
+        self.assertEqual(dump.index, 2)
+        self.assertEqual(dump.message, "")
+        self.assertEqual(dumps[3].message, "dump 3")
+        self.assertTrue(dump.complete)
+        self.assertEqual(
+            list(dump),
+            [
+                "simSeconds",
+                "simTicks",
+                "system.cpu.ipc",
+                "system.cpu.op_class::IntAlu",
+                "system.cpu.op_class::total",
+                "system.mem_ctrl.readLatencyHist::mean",
+            ],
+        )
+        self.assertEqual(dump["simSeconds"], 1.5)
+        self.assertEqual(dump["simTicks"], 3000)
+        self.assertIsInstance(dump["simTicks"], int)
+        self.assertTrue(math.isnan(dump["system.cpu.ipc"]))
+        self.assertEqual(dump["system.cpu.op_class::IntAlu"], 6)
+        self.assertEqual(dump.descs, {})
+
+    def test_filters(self):
+        reader = StatsTxtReader(
+            self.path, names=["simTicks"], pattern=r".*::mean$", descs=True
+        )
+        dump = next(iter(reader))
+        self.assertEqual(
+            dump,
+            {"simTicks": 1000, "system.mem_ctrl.readLatencyHist::mean": 12.5},
+        )
+        self.assertEqual(dump.descs["simTicks"], "Ticks simulated (Tick)")
+
+    def test_index(self):
+        with open(self.path, "rb") as fp:
+            data = fp.read()
+        reader = StatsTxtReader(self.path, names=["simTicks"])
+        # Small chunks, to find markers which span them.
+        chunk_size = statstxt._CHUNK_SIZE
+        statstxt._CHUNK_SIZE = 7
+        try:
+            offsets = reader.offsets()
+        finally:
+            statstxt._CHUNK_SIZE = chunk_size
+        self.assertEqual(len(offsets), 5)
+        for offset in offsets:
+            self.assertTrue(data[offset:].startswith(b"---------- Begin"))
+        self.assertEqual(reader[3], {"simTicks": 4000})
+        self.assertEqual(reader[3].offset, offsets[3])
+        self.assertEqual(reader[-1].index, 4)
+        self.assertEqual(
+            [dump.index for dump in reader.dumps(start=3)], [3, 4]
+        )
+        self.assertEqual(list(reader.dumps(start=5)), [])
+
+    def test_gzip_and_truncated(self):
+        text = _stats_text(3)
+        text = text[: text.rindex("system.cpu.ipc")]
+        path = self.path + ".gz"
+        with gzip.open(path, "wt") as fp:
+            fp.write(text)
+        reader = StatsTxtReader(path, names=["simTicks"])
+        dumps = list(reader)
+        self.assertEqual(
+            [dump["simTicks"] for dump in dumps], [1000, 2000, 3000]
+        )
+        self.assertEqual(
+            [dump.complete for dump in dumps], [True, True, False]
+        )
+        self.assertEqual(reader[1], {"simTicks": 2000})
@@ -0,0 +1,128 @@
+# Copyright (c) 2024 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import math
+import os
+import tempfile
+import unittest
+
+from m5.ext.pystats.timeseries import (
+    DATA_FILE,
+    TimeSeriesReader,
+    TimeSeriesWriter,
+)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class TimeSeriesTestSuite(unittest.TestCase):
+    """Tests writing and reading back a columnar time series"""
+
+    columns = ["system.cpu.numCycles", "system.cpu.ipc", "simSeconds"]
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, "stats.ts")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _rows(self, count):
+        return [
+            (tick * 1000, tick * 2, 1.0 / (tick + 1), float("nan"))
+            for tick in range(count)
+        ]
+
+    def _write(self, rows, chunk_rows=4):
+        writer = TimeSeriesWriter(
+            self.path,
+            self.columns,
+            descs={"system.cpu.ipc": "IPC"},
+            units={"simSeconds": "Second"},
+            chunk_rows=chunk_rows,
+        )
+        for row in rows:
+            writer.append(row)
+        return writer
+
+    def _assert_rows_equal(self, actual, expected):
+        self.assertEqual(len(actual), len(expected))
+        for got, want in zip(actual, expected):
+            for a, b in zip(got, want):
+                if math.isnan(b):
+                    self.assertTrue(math.isnan(a))
+                else:
+                    self.assertEqual(a, b)
+
+    def test_header(self):
+        self._write([]).close()
+        reader = TimeSeriesReader(self.path)
+        self.assertEqual(reader.columns, ["tick"] + self.columns)
+        self.assertEqual(reader.descs, {"system.cpu.ipc": "IPC"})
+        self.assertEqual(reader.units, {"simSeconds": "Second"})
+        self.assertEqual(len(reader), 0)
+        self.assertEqual(list(reader.rows()), [])
+
+    def test_chunked_appends(self):
+        rows = self._rows(10)
+        writer = self._write(rows, chunk_rows=4)
+        # Only whole chunks are written before the writer is closed.
+        self.assertEqual(len(TimeSeriesReader(self.path)), 8)
+        writer.close()
+        reader = TimeSeriesReader(self.path)
+        self._assert_rows_equal(list(reader.rows()), rows)
+
+    def test_partial_row_ignored(self):
+        rows = self._rows(3)
+        self._write(rows).close()
+        with open(os.path.join(self.path, DATA_FILE), "ab") as fp:
+            fp.write(b"\0" * 12)
+        reader = TimeSeriesReader(self.path)
+        self._assert_rows_equal(list(reader.rows()), rows)
+
+    def test_bad_row(self):
+        writer = self._write([])
+        with self.assertRaises(ValueError):
+            writer.append((0, 1, 2))
+        writer.append((0, 1, 2, 3))
+        writer.close()
+        self.assertEqual(len(TimeSeriesReader(self.path)), 1)
+
+    @unittest.skipIf(numpy is None, "NumPy is not available")
+    def test_numpy_columns(self):
+        rows = self._rows(5)
+        self._write(rows).close()
+        reader = TimeSeriesReader(self.path)
+        self.assertEqual(reader.data.shape, (5, 4))
+        self.assertEqual(list(reader["tick"]), [row[0] for row in rows])
+        self.assertEqual(
+            list(reader["system.cpu.ipc"]), [row[2] for row in rows]
+        )
+        with self.assertRaises(KeyError):
+            reader["system.cpu.missing"]
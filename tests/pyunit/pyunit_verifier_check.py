@@ -0,0 +1,189 @@
+# Copyright (c) 2024 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Unit tests of the testlib verifiers (tests/gem5/verifier.py) which do not
+need gem5 to be run.
+"""
+
+import importlib.util
+import math
+import os
+import re
+import sys
+import tempfile
+import unittest
+
+_tests_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(_tests_dir, os.pardir, "ext"))
+
+# The verifiers are loaded from their file, as the tests' `gem5` package is
+# hidden by the gem5 standard library.
+_spec = importlib.util.spec_from_file_location(
+    "verifier", os.path.join(_tests_dir, "gem5", "verifier.py")
+)
+verifier = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(verifier)
+MatchStatsTolerance = verifier.MatchStatsTolerance
+
+_begin = "\n---------- Begin Simulation Statistics ----------\n"
+_end = "\n---------- End Simulation Statistics   ----------\n"
+
+
+def _stats_txt(*dumps):
+    """The text of a stats.txt file with the given dumps, each a list of
+    (name, value) pairs."""
+    text = ""
+    for dump in dumps:
+        text += _begin
+        for name, value in dump:
+            text += f"{name:<40} {value:>12} # A stat (Unitless)\n"
+        text += _end
+    return text
+
+
+class MatchStatsToleranceTestSuite(unittest.TestCase):
+    """Tests MatchStatsTolerance.compare"""
+
+    reference = [
+        ("simSeconds", 0.001),
+        ("system.cpu.ipc", 1.5),
+        ("system.cpu.numCycles", 1000),
+        ("system.cpu.cpi", "nan"),
+        ("system.mem.bytesRead::total", 4096),
+    ]
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+
+    def _write(self, name, *dumps):
+        path = os.path.join(self.dir.name, name)
+        with open(path, "w") as f:
+            f.write(_stats_txt(*dumps))
+        return path
+
+    def _compare(self, verifier, *dumps):
+        standard = self._write("standard.txt", *([self.reference] * 2))
+        test = self._write("test.txt", *dumps)
+        return verifier.compare(standard, test)
+
+    def _changed(self, **changes):
+        return [
+            (name, changes.get(name.split(".")[-1], value))
+            for name, value in self.reference
+        ]
+
+    def test_identical(self):
+        verifier = MatchStatsTolerance("standard.txt")
+        compared, failures = self._compare(
+            verifier, self.reference, self.reference
+        )
+        self.assertEqual(compared, 10)
+        self.assertEqual(failures, [])
+
+    def test_within_tolerance(self):
+        verifier = MatchStatsTolerance("standard.txt", rel_tol=0.05)
+        stats = self._changed(ipc=1.55, numCycles=1040)
+        _, failures = self._compare(verifier, stats, stats)
+        self.assertEqual(failures, [])
+
+    def test_out_of_tolerance(self):
+        verifier = MatchStatsTolerance(
+            "standard.txt",
+            rel_tol=0.05,
+            tolerances={r"\.ipc$": (0.01, 0)},
+        )
+        _, failures = self._compare(
+            verifier, self.reference, self._changed(ipc=1.55)
+        )
+        self.assertEqual(len(failures), 1)
+        deviation, stat, expected, actual = failures[0]
+        self.assertEqual(stat, (2, "system.cpu.ipc"))
+        self.assertEqual((expected, actual), (1.5, 1.55))
+        self.assertAlmostEqual(deviation, 0.05 / 1.5)
+
+    def test_missing(self):
+        verifier = MatchStatsTolerance("standard.txt")
+        stats = [s for s in self.reference if s[0] != "system.cpu.ipc"]
+        compared, failures = self._compare(verifier, self.reference, stats)
+        self.assertEqual(compared, 10)
+        self.assertEqual(
+            failures, [(math.inf, (2, "system.cpu.ipc"), 1.5, None)]
+        )
+
+    def test_extra_stats_ignored(self):
+        verifier = MatchStatsTolerance("standard.txt")
+        stats = self.reference + [("system.cpu.extra", 1)]
+        compared, failures = self._compare(verifier, stats, stats)
+        self.assertEqual(compared, 10)
+        self.assertEqual(failures, [])
+
+    def test_nan(self):
+        verifier = MatchStatsTolerance("standard.txt")
+        _, failures = self._compare(
+            verifier, self.reference, self._changed(cpi=2.0)
+        )
+        self.assertEqual(len(failures), 1)
+        self.assertEqual(failures[0][1], (2, "system.cpu.cpi"))
+        self.assertEqual(failures[0][0], math.inf)
+
+    def test_include_exclude(self):
+        stats = self._changed(ipc=3.0, numCycles=2000)
+
+        verifier = MatchStatsTolerance("standard.txt", include=r"\.ipc$")
+        compared, failures = self._compare(verifier, stats, stats)
+        self.assertEqual(compared, 2)
+        self.assertEqual(
+            [f[1] for f in failures],
+            [(1, "system.cpu.ipc"), (2, "system.cpu.ipc")],
+        )
+
+        verifier = MatchStatsTolerance(
+            "standard.txt",
+            include=re.compile(r"^system\.cpu\."),
+            exclude=[r"\.ipc$", r"\.numCycles$"],
+        )
+        compared, failures = self._compare(verifier, stats, stats)
+        self.assertEqual(compared, 2)
+        self.assertEqual(failures, [])
+
+    def test_out_of_order(self):
+        # Stats listed in another order, in both dumps, are matched by name
+        # within their own dump.
+        verifier = MatchStatsTolerance("standard.txt")
+        reordered = list(reversed(self.reference))
+        compared, failures = self._compare(verifier, reordered, reordered)
+        self.assertEqual(compared, 10)
+        self.assertEqual(failures, [])
+
+        stats = list(reversed(self._changed(numCycles=1001)))
+        _, failures = self._compare(verifier, reordered, stats)
+        self.assertEqual(
+            failures,
+            [(0.001, (2, "system.cpu.numCycles"), 1000, 1001)],
+        )
+
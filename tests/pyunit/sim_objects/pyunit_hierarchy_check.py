@@ -0,0 +1,145 @@
+# Copyright (c) 2024 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import unittest
+
+from m5.objects import (
+    ClockDomain,
+    DerivedClockDomain,
+    SrcClockDomain,
+    SubSystem,
+    VoltageDomain,
+)
+from m5.proxy import Parent
+
+
+def _build_tree():
+    top = SubSystem()
+    top.b = SubSystem()
+    top.a = SubSystem()
+    top.b.vec = [SubSystem() for _ in range(12)]
+    top.b.z = SubSystem()
+    return top
+
+
+class SealedHierarchyTestSuite(unittest.TestCase):
+    """Tests the frozen traversal order used by SimObject.descendants()"""
+
+    def test_sealed_order_matches_walk(self):
+        top = _build_tree()
+        walk = list(top.descendants())
+        self.assertEqual(list(top.seal_hierarchy()), walk)
+        self.assertEqual(list(top.descendants()), walk)
+        self.assertEqual(
+            list(top.b.descendants()), list(top.b._walk_descendants())
+        )
+        self.assertIs(top.seal_hierarchy(), top.seal_hierarchy())
+
+    def test_sealed_paths(self):
+        top = _build_tree()
+        paths = [obj.path() for obj in top.descendants()]
+        top.seal_hierarchy()
+        self.assertEqual([obj.path() for obj in top.descendants()], paths)
+        self.assertEqual(top.b.vec[3]._path_cache, top.b.vec[3].path())
+
+    def test_add_child_unseals(self):
+        top = _build_tree()
+        top.seal_hierarchy()
+        top.b.seal_hierarchy()
+        top.b.vec[0].c = SubSystem()
+        self.assertIsNone(top._hierarchy_span)
+        self.assertIsNone(top.b.vec[3]._path_cache)
+        self.assertIn(top.b.vec[0].c, list(top.descendants()))
+        self.assertEqual(
+            list(top.descendants()), list(top._walk_descendants())
+        )
+
+
+def _build_clocked_tree():
+    top = SubSystem(eventq_index=0)
+    top.voltage_domain = VoltageDomain()
+    top.clk_domain = SrcClockDomain(
+        clock="1GHz", voltage_domain=top.voltage_domain
+    )
+    top.sub = [SubSystem() for _ in range(4)]
+    for sub in top.sub:
+        sub.clk_domain = DerivedClockDomain(clk_domain=top.clk_domain)
+        sub.fast_domain = DerivedClockDomain(clk_domain=Parent.clk_domain)
+    top.sub[2].local = [
+        SrcClockDomain(clock="2GHz", voltage_domain=Parent.voltage_domain)
+        for _ in range(3)
+    ]
+    return top
+
+
+def _find(find, ptype):
+    try:
+        return find(ptype)
+    except (AttributeError, KeyError) as e:
+        return type(e)
+
+
+class ProxyIndexTestSuite(unittest.TestCase):
+    """Tests that the sealed hierarchy resolves Parent.any and Self.all
+    proxies exactly like a walk of the live hierarchy"""
+
+    ptypes = (
+        SubSystem,
+        VoltageDomain,
+        ClockDomain,
+        SrcClockDomain,
+        DerivedClockDomain,
+    )
+
+    def _results(self, top):
+        return [
+            (_find(obj.find_any, ptype), _find(obj.find_all, ptype))
+            for obj in top.descendants()
+            for ptype in self.ptypes
+        ]
+
+    def test_find_matches_walk(self):
+        top = _build_clocked_tree()
+        expected = self._results(top)
+        top.seal_hierarchy()
+        self.assertEqual(self._results(top), expected)
+
+    def test_unproxy_matches_walk(self):
+        expected = _build_clocked_tree()
+        for obj in expected.descendants():
+            obj.unproxyParams()
+
+        top = _build_clocked_tree()
+        for obj in top.seal_hierarchy():
+            obj.unproxyParams()
+
+        for obj, ref in zip(top.descendants(), expected.descendants()):
+            self.assertEqual(obj.path(), ref.path())
+            for pname in ("clk_domain", "voltage_domain"):
+                if pname in obj._params:
+                    self.assertEqual(
+                        getattr(obj, pname).path(), getattr(ref, pname).path()
+                    )
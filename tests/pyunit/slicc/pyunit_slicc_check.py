@@ -0,0 +1,140 @@
+# Copyright (c) 2024 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import filecmp
+import os
+import sys
+import tempfile
+import unittest
+
+_root = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, os.pardir
+)
+for _path in (
+    os.path.join("src", "mem"),
+    "build_tools",
+    "site_scons",
+    os.path.join("ext", "ply"),
+):
+    sys.path.insert(0, os.path.join(_root, _path))
+
+from code_formatter import code_formatter
+
+from slicc.parser import SLICC
+
+_protocol_base = os.path.join(_root, "src", "mem", "ruby", "protocol")
+
+
+class CodeFormatterWriteTestSuite(unittest.TestCase):
+    """Tests that code_formatter.write only writes a file when its contents
+    change, so that what is built from an unchanged file isn't rebuilt."""
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+        self.path = os.path.join(self.dir.name, "test.txt")
+
+    def write(self, text):
+        code = code_formatter()
+        code(text)
+        code.write(self.path)
+
+    def age(self):
+        # Make the file older than anything written by the test, so that
+        # rewriting it is seen even on a filesystem with coarse timestamps.
+        os.utime(self.path, (0, 0))
+
+    def test_new(self):
+        self.write("new")
+        with open(self.path) as f:
+            self.assertEqual("new\n", f.read())
+
+    def test_unchanged(self):
+        self.write("unchanged")
+        self.age()
+        self.write("unchanged")
+        self.assertEqual(0, os.stat(self.path).st_mtime)
+
+    def test_changed(self):
+        self.write("old")
+        self.age()
+        self.write("changed")
+        self.assertNotEqual(0, os.stat(self.path).st_mtime)
+        with open(self.path) as f:
+            self.assertEqual("changed\n", f.read())
+
+
+class SliccJobsTestSuite(unittest.TestCase):
+    """Tests that the C++ code SLICC generates for a protocol is the same
+    whether its machines and types are written serially or in parallel."""
+
+    protocol = "MI_example"
+
+    def generate(self, jobs):
+        path = os.path.join(self.dir.name, f"jobs{jobs}")
+        slicc = SLICC(
+            os.path.join(_protocol_base, f"{self.protocol}.slicc"),
+            [os.path.join(_protocol_base, "RubySlicc_interfaces.slicc")],
+            _protocol_base,
+            verbose=False,
+        )
+        slicc.process()
+        slicc.writeCodeFiles(path, [], jobs)
+        return path, slicc
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+
+    def assertSameTree(self, left, right):
+        compare = filecmp.dircmp(left, right)
+        self.assertEqual([], compare.left_only)
+        self.assertEqual([], compare.right_only)
+        self.assertEqual([], compare.funny_files)
+        _, mismatch, errors = filecmp.cmpfiles(
+            left, right, compare.common_files, shallow=False
+        )
+        self.assertEqual([], mismatch)
+        self.assertEqual([], errors)
+        for subdir in compare.common_dirs:
+            self.assertSameTree(
+                os.path.join(left, subdir), os.path.join(right, subdir)
+            )
+
+    def test_jobs(self):
+        serial, serial_slicc = self.generate(1)
+        parallel, parallel_slicc = self.generate(4)
+        self.assertTrue(
+            os.listdir(os.path.join(serial, self.protocol)),
+            "no code was generated",
+        )
+        self.assertSameTree(serial, parallel)
+        # Each machine and type writing its files is timed, wherever that
+        # happened.
+        self.assertEqual(
+            set(serial_slicc.symtab.codegen_times),
+            set(parallel_slicc.symtab.codegen_times),
+        )
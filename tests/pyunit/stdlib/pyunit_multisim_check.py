@@ -0,0 +1,221 @@
+# Copyright (c) 2024 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import os
+import signal
+import tempfile
+import unittest
+from pathlib import Path
+from typing import (
+    List,
+    Optional,
+    Tuple,
+)
+from unittest.mock import patch
+
+from gem5.utils.multisim import multisim
+from gem5.utils.multisim.multisim import (
+    _Job,
+    _schedule,
+)
+
+GiB = 1024**3
+
+
+class _FakeProcess:
+    """Stands in for a simulation process. It finishes as soon as it is
+    started, but the scheduler only notices when it next waits, so the jobs
+    it starts together are running at the same time.
+    """
+
+    def __init__(self, job: _Job, log: List, running: List[str]):
+        self.name = job.id
+        self.exitcode = None
+        self.rusage = None
+        self._log = log
+        self._running = running
+        self._exit_code = 1 if job.id.startswith("fail") else 0
+        self._read, self._write = os.pipe()
+
+    @property
+    def sentinel(self) -> int:
+        return self._read
+
+    def start(self) -> None:
+        self._log.append((self.name, sorted(self._running)))
+        self._running.append(self.name)
+        os.write(self._write, b"x")
+
+    def join(self) -> None:
+        self._running.remove(self.name)
+        self.exitcode = self._exit_code
+        os.close(self._read)
+        os.close(self._write)
+
+    def is_alive(self) -> bool:
+        return self.exitcode is None
+
+    def terminate(self) -> None:
+        pass
+
+
+class MultisimScheduleTestSuite(unittest.TestCase):
+    """Tests the order in which multisim starts simulations, and which it
+    runs at the same time, given the resources they need and the host has.
+    """
+
+    def setUp(self) -> None:
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            self.addCleanup(signal.signal, signum, signal.getsignal(signum))
+        shared_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(shared_dir.cleanup)
+        for name, value in (
+            ("_shared_dir", Path(shared_dir.name)),
+            ("_write_summary", None),
+        ):
+            patcher = patch.object(multisim, name, return_value=value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def schedule(
+        self,
+        jobs: List[_Job],
+        host: Tuple[int, Optional[int]],
+        max_num_processes: Optional[int] = None,
+    ) -> Tuple[int, List]:
+        """Schedules the jobs on a host with the given number of threads
+        and memory. Returns the exit status and the ID of each job started,
+        in order, with the IDs of the jobs running when it was started.
+        """
+        log = []
+        running = []
+        with patch.object(multisim, "_host_resources", return_value=host):
+            status = _schedule(
+                jobs,
+                max_num_processes,
+                lambda job: _FakeProcess(job, log, running),
+            )
+        self.assertEqual([], running)
+        return status, log
+
+    def test_cost_order(self) -> None:
+        jobs = [
+            _Job("a"),
+            _Job("b", cost=10),
+            _Job("c", cost=30),
+            _Job("d"),
+            _Job("e", cost=20),
+        ]
+        status, log = self.schedule(jobs, (8, 8 * GiB), max_num_processes=1)
+
+        self.assertEqual(0, status)
+        self.assertEqual(["c", "e", "b", "a", "d"], [id for id, _ in log])
+        for job in jobs:
+            self.assertEqual(0, job.exit_code)
+
+    def test_all_fit(self) -> None:
+        jobs = [_Job("a"), _Job("b"), _Job("c")]
+        status, log = self.schedule(jobs, (8, 8 * GiB))
+
+        self.assertEqual(0, status)
+        self.assertEqual([("a", []), ("b", ["a"]), ("c", ["a", "b"])], log)
+
+    def test_max_num_processes(self) -> None:
+        jobs = [_Job("a"), _Job("b"), _Job("c")]
+        status, log = self.schedule(jobs, (8, 8 * GiB), max_num_processes=2)
+
+        self.assertEqual(0, status)
+        self.assertEqual([("a", []), ("b", ["a"]), ("c", [])], log)
+
+    def test_memory_short(self) -> None:
+        jobs = [
+            _Job("a", memory=3 * GiB),
+            _Job("b", memory=3 * GiB),
+            _Job("c", memory=1 * GiB),
+        ]
+        status, log = self.schedule(jobs, (8, 4 * GiB))
+
+        self.assertEqual(0, status)
+        # "b" does not fit alongside "a", but "c", after it, does.
+        self.assertEqual([("a", []), ("c", ["a"]), ("b", [])], log)
+
+    def test_threads_short(self) -> None:
+        jobs = [
+            _Job("a", threads=3),
+            _Job("b", threads=2),
+            _Job("c", threads=1),
+        ]
+        status, log = self.schedule(jobs, (4, 8 * GiB))
+
+        self.assertEqual(0, status)
+        self.assertEqual([("a", []), ("c", ["a"]), ("b", [])], log)
+
+    def test_larger_than_host(self) -> None:
+        jobs = [
+            _Job("small"),
+            _Job("threads", threads=4),
+            _Job("memory", memory=2 * GiB),
+            _Job("other"),
+        ]
+        status, log = self.schedule(jobs, (2, 1 * GiB))
+
+        # The jobs which need more than the host has are still run, each on
+        # its own.
+        self.assertEqual(0, status)
+        self.assertEqual(
+            [
+                ("small", []),
+                ("other", ["small"]),
+                ("threads", []),
+                ("memory", []),
+            ],
+            log,
+        )
+
+    def test_failure(self) -> None:
+        jobs = [
+            _Job("fail"),
+            _Job("restore", after="fail"),
+            _Job("other"),
+        ]
+        status, log = self.schedule(jobs, (8, 8 * GiB))
+
+        # The job to run after the failed one is not run.
+        self.assertEqual(1, status)
+        self.assertEqual([("fail", []), ("other", ["fail"])], log)
+        self.assertEqual(1, jobs[0].exit_code)
+        self.assertIsNone(jobs[1].exit_code)
+        self.assertEqual(0, jobs[2].exit_code)
+
+    def test_after(self) -> None:
+        jobs = [
+            _Job("restore", after="save"),
+            _Job("save"),
+        ]
+        status, log = self.schedule(jobs, (8, 8 * GiB))
+
+        self.assertEqual(0, status)
+        self.assertEqual([("save", []), ("restore", [])], log)
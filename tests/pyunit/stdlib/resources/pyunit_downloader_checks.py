@@ -0,0 +1,151 @@
+# Copyright (c) 2024 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import gzip
+import http.server
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from gem5.resources.downloader import _download
+
+
+class _RangeRequestHandler(http.server.BaseHTTPRequestHandler):
+    """
+    A minimal HTTP handler serving ``server.content`` with support for single
+    byte-range requests. If ``server.fail_after`` is set, the first response
+    is cut short after that many bytes to simulate a connection reset.
+    """
+
+    def log_message(self, format, *args):
+        pass
+
+    def _range(self):
+        length = len(self.server.content)
+        header = self.headers.get("Range")
+        if not header:
+            return 0, length - 1, False
+        start, end = header[len("bytes=") :].split("-")
+        end = int(end) if end else length - 1
+        return int(start), min(end, length - 1), True
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Length", str(len(self.server.content)))
+        self.end_headers()
+
+    def do_GET(self):
+        start, end, partial = self._range()
+        self.server.requests.append(self.headers.get("Range"))
+        if start >= len(self.server.content):
+            self.send_response(416)
+            self.end_headers()
+            return
+        body = self.server.content[start : end + 1]
+        self.send_response(206 if partial else 200)
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.server.fail_after is not None:
+            body = body[: self.server.fail_after]
+            self.server.fail_after = None
+        self.wfile.write(body)
+
+
+class DownloaderTestSuite(unittest.TestCase):
+    """Test cases for gem5.resources.downloader._download()"""
+
+    def setUp(self) -> None:
+        self.server = http.server.ThreadingHTTPServer(
+            ("localhost", 0), _RangeRequestHandler
+        )
+        self.server.content = os.urandom(3 * 1024 * 1024 + 17)
+        self.server.fail_after = None
+        self.server.requests = []
+        self.url = f"http://localhost:{self.server.server_address[1]}/file"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.dir)
+
+    def test_download(self) -> None:
+        dest = self.dir / "file"
+        _download(self.url, str(dest), connections=1)
+        self.assertEqual(self.server.content, dest.read_bytes())
+        self.assertFalse((self.dir / "file.part").exists())
+
+    @patch("gem5.resources.downloader.time.sleep", new=lambda _: None)
+    def test_interruptedDownloadResumes(self) -> None:
+        # A connection dropped part way through the download should be
+        # resumed from the data already received rather than restarted.
+        self.server.fail_after = 1024 * 1024
+        dest = self.dir / "file"
+        _download(self.url, str(dest), connections=1)
+        self.assertEqual(self.server.content, dest.read_bytes())
+        self.assertEqual([None, f"bytes={1024 * 1024}-"], self.server.requests)
+
+    def test_existingPartFileResumes(self) -> None:
+        # A ".part" file left by an earlier call is resumed.
+        dest = self.dir / "file"
+        (self.dir / "file.part").write_bytes(self.server.content[:1000])
+        _download(self.url, str(dest), connections=1)
+        self.assertEqual(self.server.content, dest.read_bytes())
+        self.assertEqual(["bytes=1000-"], self.server.requests)
+
+    @patch("gem5.resources.downloader._PARALLEL_DOWNLOAD_THRESHOLD", new=0)
+    def test_parallelDownload(self) -> None:
+        dest = self.dir / "file"
+        _download(self.url, str(dest), connections=4)
+        self.assertEqual(self.server.content, dest.read_bytes())
+        self.assertEqual(4, len(self.server.requests))
+        self.assertEqual([], [p.name for p in self.dir.glob("file.part*")])
+
+    @patch("gem5.resources.downloader.time.sleep", new=lambda _: None)
+    def test_streamingInflate(self) -> None:
+        # A gzipped download is decompressed while it is received, including
+        # across a resumed connection and multiple gzip members.
+        raw = self.server.content
+        self.server.content = gzip.compress(raw[:1000]) + gzip.compress(
+            raw[1000:], compresslevel=1
+        )
+        self.server.fail_after = len(self.server.content) // 2
+        dest = self.dir / "file.gz"
+        _download(
+            self.url,
+            str(dest),
+            inflate_to=str(self.dir / "file"),
+            connections=1,
+        )
+        self.assertEqual(raw, (self.dir / "file").read_bytes())
+        self.assertEqual(self.server.content, dest.read_bytes())
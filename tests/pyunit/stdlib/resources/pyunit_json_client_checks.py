@@ -28,9 +28,13 @@ import json
 import os
 import tempfile
 import unittest
+from pathlib import Path
 from typing import Dict
+from unittest.mock import patch
 
+from gem5.resources.client_api.client_query import ClientQuery
 from gem5.resources.client_api.jsonclient import JSONClient
+from gem5.resources.client_api.metadata_cache import MetadataCache
 
 
 class JSONClientTestSuite(unittest.TestCase):
@@ -179,3 +183,55 @@ class JSONClientTestSuite(unittest.TestCase):
             f"'{path}' is not a valid file path or URL"
             in str(context.exception)
         )
+
+    def test_get_resources_by_id_and_version(self) -> None:
+        # Tests JSONClient.get_resources() returns the latest compatible
+        # version of each queried resource in a single batch.
+
+        client = JSONClient(path=self.file_path)
+        resources = client.get_resources(
+            [
+                ClientQuery("this-is-a-test-resource", gem5_version="23.0"),
+                ClientQuery("test-version", "0.2.0", gem5_version="23.0"),
+                ClientQuery("not-a-resource", gem5_version="23.0"),
+            ]
+        )
+        self.assertEqual(
+            {"this-is-a-test-resource", "test-version"}, set(resources)
+        )
+        self.assertEqual(
+            "1.0.0", resources["this-is-a-test-resource"]["resource_version"]
+        )
+        self.assertEqual("file", resources["test-version"]["category"])
+
+    def test_get_resources_by_id_remembers_queries(self) -> None:
+        # Tests repeated queries are answered without searching the
+        # resources again, and callers cannot modify the remembered result.
+
+        client = JSONClient(path=self.file_path)
+        query = ClientQuery("this-is-a-test-resource", gem5_version="23.1")
+        first = client.get_resources_by_id([query])
+        first["this-is-a-test-resource"]["resource_version"] = "0.0.0"
+        with patch.object(client, "get_resources", side_effect=AssertionError):
+            second = client.get_resources_by_id([query])
+        self.assertEqual(
+            "2.0.0", second["this-is-a-test-resource"]["resource_version"]
+        )
+
+
+class MetadataCacheTestSuite(unittest.TestCase):
+    """Test cases for gem5.resources.client_api.metadata_cache"""
+
+    def test_set_and_get(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            cache = MetadataCache(Path(directory), ttl=60)
+            self.assertIsNone(cache.get("key"))
+            cache.set("key", [{"id": "resource"}])
+            self.assertEqual([{"id": "resource"}], cache.get("key"))
+            self.assertIsNone(cache.get("other-key"))
+
+    def test_expired_entry(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            MetadataCache(Path(directory), ttl=60).set("key", [1])
+            expired_cache = MetadataCache(Path(directory), ttl=-1)
+            self.assertIsNone(expired_cache.get("key"))
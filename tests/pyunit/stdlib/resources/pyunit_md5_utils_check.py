@@ -116,3 +116,62 @@ class MD5DirTestSuite(unittest.TestCase):
         shutil.rmtree(dir2)
 
         self.assertEqual(first_md5, second_md5)
+
+
+class MD5CacheTestSuite(unittest.TestCase):
+    """Test cases for the md5 cache used by md5_file() and md5_dir()"""
+
+    def setUp(self) -> None:
+        self.dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.dir)
+
+    def test_cachedMd5FileIsReused(self) -> None:
+        # This test ensures a cached md5 value is returned, without re-reading
+        # the file, when the file has not changed.
+
+        path = self.dir / "file"
+        path.write_text("This is a test string, to be put in a temp file")
+        self.assertEqual("b113b29fce251f2023066c3fda2ec9dd", md5_file(path))
+        self.assertTrue((self.dir / ".gem5-md5-cache.json").is_file())
+
+        stat = path.stat()
+        with open(path, "r+") as f:
+            f.write("T")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        # The size, mtime and inode are unchanged so the cache is trusted.
+        self.assertEqual("b113b29fce251f2023066c3fda2ec9dd", md5_file(path))
+
+    def test_modifiedFileInvalidatesCache(self) -> None:
+        # This test ensures a file's cached md5 value is not used once the
+        # file has been modified.
+
+        path = self.dir / "file"
+        path.write_text("This is a test")
+        first_md5 = md5_file(path)
+        path.write_text("This is a different test")
+        self.assertNotEqual(first_md5, md5_file(path))
+        self.assertEqual(md5_file(path, use_cache=False), md5_file(path))
+
+    def test_modifiedDirInvalidatesCache(self) -> None:
+        # This test ensures a directory's cached md5 value is not used once a
+        # file within it is added.
+
+        dir = self.dir / "dir"
+        dir.mkdir()
+        (dir / "file1").write_text("Some test data here")
+        first_md5 = md5_dir(dir)
+        self.assertEqual(first_md5, md5_dir(dir))
+        (dir / "file2").write_text("Some more test data")
+        self.assertNotEqual(first_md5, md5_dir(dir))
+        self.assertEqual(md5_dir(dir, use_cache=False), md5_dir(dir))
+
+    def test_corruptCacheIsIgnored(self) -> None:
+        # This test ensures an unreadable cache file does not cause an error.
+
+        path = self.dir / "file"
+        path.write_text("This is a test string, to be put in a temp file")
+        (self.dir / ".gem5-md5-cache.json").write_text("{not json")
+        self.assertEqual("b113b29fce251f2023066c3fda2ec9dd", md5_file(path))
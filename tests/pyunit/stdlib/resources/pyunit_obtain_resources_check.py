@@ -38,6 +38,7 @@ from gem5.resources.client import _create_clients
 from gem5.resources.resource import (
     BinaryResource,
     obtain_resource,
+    obtain_resources,
 )
 
 mock_json_path = Path(__file__).parent / "refs/obtain-resource.json"
@@ -132,6 +133,26 @@ class TestObtainResourcesCheck(unittest.TestCase):
         self.assertEqual("src/test-source", resource.get_source())
         self.assertEqual(ISA.ARM, resource.get_architecture())
 
+    def test_obtain_multiple_resources(self, mock_create_client):
+        """Test that obtain_resources returns each resource, in order, at the
+        requested version or the latest compatible version."""
+        resources = obtain_resources(
+            resource_ids=["test-binary-resource", "test-binary-resource"],
+            resource_directory=self.get_resource_dir(),
+            gem5_version="develop",
+        )
+        self.assertEqual(2, len(resources))
+        self.assertEqual("1.7.0", resources[0].get_resource_version())
+
+        resources = obtain_resources(
+            resource_ids=["test-binary-resource"],
+            resource_versions={"test-binary-resource": "1.5.0"},
+            resource_directory=self.get_resource_dir(),
+            gem5_version="develop",
+        )
+        self.assertEqual("1.5.0", resources[0].get_resource_version())
+        self.assertIsInstance(resources[0], BinaryResource)
+
     def test_obtain_resources_no_version_invalid_id(self, mock_create_client):
         with self.assertRaises(Exception) as context:
             obtain_resource(
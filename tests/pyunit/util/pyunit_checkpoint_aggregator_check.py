@@ -0,0 +1,177 @@
+# Copyright (c) 2024 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import configparser
+import contextlib
+import gc
+import gzip
+import io
+import os
+import sys
+import tempfile
+import unittest
+import warnings
+
+sys.path.insert(
+    0,
+    os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        os.pardir,
+        os.pardir,
+        os.pardir,
+        "util",
+    ),
+)
+
+import checkpoint_aggregator
+
+PAGE_SIZE = checkpoint_aggregator.PAGE_SIZE
+
+
+def _checkpoint(pages, tick, paddr):
+    return f"""[Globals]
+curTick={tick}
+
+[system]
+pagePtr={pages}
+
+[system.cpu]
+instCnt=0
+
+[system.cpu.workload]
+paddr={paddr}
+
+[system.cpu.workload.FdMap256]
+M5_pid=100
+
+[system.physmem.store0]
+range_size={pages * PAGE_SIZE}
+"""
+
+
+class CheckpointAggregatorTestSuite(unittest.TestCase):
+    """Tests util/checkpoint_aggregator.py on two small checkpoints, one
+    with a compressed memory image, as gem5 writes them, and one with an
+    uncompressed image."""
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+
+        # The first image is two pages. The second is three pages, of
+        # which only the first two are in the image, the rest being zero.
+        self.images = [
+            bytes(range(256)) * (2 * PAGE_SIZE // 256),
+            b"\xab" * (2 * PAGE_SIZE),
+        ]
+        self.cpts = []
+        for i, (pages, tick, paddr, compress) in enumerate(
+            ((2, 5000, 0x1000, True), (3, 7000, 0x2000, False))
+        ):
+            cpt = os.path.join(self.dir.name, f"cpt{i}")
+            os.makedirs(cpt)
+            with open(os.path.join(cpt, "m5.cpt"), "w") as f:
+                f.write(_checkpoint(pages, tick, paddr))
+            path = os.path.join(cpt, checkpoint_aggregator.PMEM_FILE)
+            with (gzip.open if compress else open)(path, "wb") as f:
+                f.write(self.images[i])
+            self.cpts.append(cpt)
+
+    def aggregate(self, no_compress, memory_size=None):
+        output = os.path.join(self.dir.name, "out")
+        with contextlib.redirect_stdout(io.StringIO()):
+            checkpoint_aggregator.aggregate(
+                output, self.cpts, no_compress, memory_size, jobs=2
+            )
+        config = configparser.ConfigParser()
+        config.optionxform = str
+        config.read(os.path.join(output, "m5.cpt"))
+        path = os.path.join(output, checkpoint_aggregator.PMEM_FILE)
+        with open(path, "rb") as f:
+            compressed = f.read(2) == b"\x1f\x8b"
+        self.assertEqual(not no_compress, compressed)
+        with (gzip.open if compressed else open)(path, "rb") as f:
+            return config, f.read()
+
+    def check_config(self, config, pages):
+        self.assertEqual("7000", config["Globals"]["curTick"])
+        self.assertEqual(str(pages), config["system"]["pagePtr"])
+        self.assertEqual("2", config["system"]["nextPID"])
+        self.assertEqual(
+            str(pages * PAGE_SIZE),
+            config["system.physmem.store0"]["range_size"],
+        )
+        # The CPUs of each checkpoint are renamed, and their physical
+        # addresses moved to where their memory is in the image.
+        self.assertEqual("0", config["system.cpu0"]["instCnt"])
+        self.assertEqual(str(0x1000), config["system.cpu0.workload"]["paddr"])
+        self.assertEqual(
+            str(0x2000 + 2 * PAGE_SIZE),
+            config["system.cpu1.workload"]["paddr"],
+        )
+        self.assertEqual(
+            "0", config["system.cpu0.workload.FdMap256"]["M5_pid"]
+        )
+        self.assertEqual(
+            "1", config["system.cpu1.workload.FdMap256"]["M5_pid"]
+        )
+
+    def test_compressed(self):
+        config, memory = self.aggregate(no_compress=False)
+        self.check_config(config, 5)
+        self.assertEqual(
+            self.images[0] + self.images[1] + bytes(PAGE_SIZE), memory
+        )
+
+    def test_uncompressed(self):
+        config, memory = self.aggregate(no_compress=True)
+        self.check_config(config, 5)
+        self.assertEqual(
+            self.images[0] + self.images[1] + bytes(PAGE_SIZE), memory
+        )
+
+    def test_memory_size(self):
+        for no_compress in (False, True):
+            with self.subTest(no_compress=no_compress):
+                config, memory = self.aggregate(no_compress, 8 * PAGE_SIZE)
+                self.check_config(config, 8)
+                self.assertEqual(
+                    self.images[0] + self.images[1] + bytes(4 * PAGE_SIZE),
+                    memory,
+                )
+
+    def test_open_pmem(self):
+        for cpt, image in zip(self.cpts, self.images):
+            path = os.path.join(cpt, checkpoint_aggregator.PMEM_FILE)
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always", ResourceWarning)
+                with checkpoint_aggregator.open_pmem(path) as f:
+                    self.assertEqual(image, f.read())
+                gc.collect()
+            # Closing the image closes the file it is read from.
+            self.assertEqual(
+                [], [w for w in caught if w.category is ResourceWarning]
+            )
@@ -0,0 +1,175 @@
+# Copyright (c) 2024 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import configparser
+import contextlib
+import importlib.util
+import io
+import os
+import tempfile
+import unittest
+
+_util_dir = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    os.pardir,
+    os.pardir,
+    os.pardir,
+    "util",
+)
+_spec = importlib.util.spec_from_file_location(
+    "cpt_upgrader", os.path.join(_util_dir, "cpt_upgrader.py")
+)
+cpt_upgrader = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(cpt_upgrader)
+
+_misc_regs = " ".join(["0"] * 1024)
+
+_checkpoint = f"""## checkpoint generated: Thu Jan  1 00:00:00 2024
+
+[root]
+isa={{isa}}
+full_system=true
+
+[root.globals]
+curTick=1000
+version_tags=
+
+[system]
+pagePtr=0
+
+[system.cpu]
+instCnt=1234
+_pid=100
+
+[system.cpu.xc.0]
+intRegs=1 2 3 4 5 6 7 8
+floatRegs.i=9 10 11 12
+vecRegs=13 14
+vecPredRegs=15
+ccRegs=1 0 1 0 1
+miscRegs={_misc_regs}
+_pc=4096
+_npc=4100
+_upc=0
+_nupc=1
+
+[system.cpu.isa]
+miscRegs={_misc_regs}
+
+[system.cpu.interrupts]
+interrupts=0 0 0 0
+
+[system.physmem.store0]
+store_id=0
+filename=system.physmem.store0.pmem
+range_size=536870912
+"""
+
+
+def _options(cpt):
+    return {sec: dict(cpt.items(sec)) for sec in cpt.sections()}
+
+
+class CheckpointFileTestSuite(unittest.TestCase):
+    """Checks that CheckpointFile upgrades checkpoints the same way as the
+    ConfigParser it replaced."""
+
+    @classmethod
+    def setUpClass(cls):
+        if not cpt_upgrader.Upgrader.by_tag:
+            cpt_upgrader.Upgrader.load_all()
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "m5.cpt")
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def _update(self, upg, cpt):
+        """Apply upg to cpt, returning the options of cpt afterwards, or the
+        error the upgrader raised."""
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                upg.update(cpt, set(cpt_upgrader.Upgrader.by_tag))
+        except Exception as e:
+            return type(e), str(e)
+        return _options(cpt)
+
+    def test_section_proxy(self):
+        with open(self.path, "w") as f:
+            f.write(_checkpoint.format(isa="x86"))
+        cpt = cpt_upgrader.CheckpointFile(self.path)
+
+        self.assertIn("system.cpu", cpt)
+        self.assertNotIn("system.cpu.xc.1", cpt)
+        with self.assertRaises(KeyError):
+            cpt["system.cpu.xc.1"]
+
+        items = cpt["system.cpu"]
+        self.assertIn("instCnt", items)
+        self.assertEqual(items["instCnt"], "1234")
+        self.assertIsNone(items.get("numCycles"))
+        self.assertEqual(items.setdefault("numCycles", "10"), "10")
+        items["instCnt"] = "4321"
+        del items["_pid"]
+        with self.assertRaises(KeyError):
+            del items["_pid"]
+
+        self.assertEqual(
+            cpt.items("system.cpu"), [("instCnt", "4321"), ("numCycles", "10")]
+        )
+
+        # The changed section is written out, the others as they were read.
+        out = io.StringIO()
+        cpt.write(out)
+        parser = configparser.ConfigParser()
+        parser.optionxform = str
+        parser.read_string(out.getvalue())
+        self.assertEqual(_options(parser), _options(cpt))
+
+    def test_upgraders(self):
+        for isa in ("arm", "riscv", "sparc", "x86"):
+            with open(self.path, "w") as f:
+                f.write(_checkpoint.format(isa=isa))
+            for tag, upg in sorted(cpt_upgrader.Upgrader.by_tag.items()):
+                with self.subTest(isa=isa, tag=tag):
+                    parser = configparser.ConfigParser()
+                    parser.optionxform = str
+                    parser.read(self.path)
+                    expected = self._update(upg, parser)
+
+                    cpt = cpt_upgrader.CheckpointFile(self.path)
+                    self.assertEqual(self._update(upg, cpt), expected)
+
+                    if isinstance(expected, dict):
+                        # Check the result survives being written out.
+                        out = io.StringIO()
+                        cpt.write(out)
+                        parser = configparser.ConfigParser()
+                        parser.optionxform = str
+                        parser.read_string(out.getvalue())
+                        self.assertEqual(_options(parser), expected)
@@ -0,0 +1,95 @@
+# Copyright (c) 2024 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import unittest
+
+from m5.util.multidict import multidict
+
+
+class MultidictTestSuite(unittest.TestCase):
+    """Test cases for m5.util.multidict"""
+
+    def setUp(self):
+        self.base = multidict()
+        self.base["a"] = "base_a"
+        self.base["b"] = "base_b"
+        self.base["c"] = "base_c"
+        self.middle = multidict(self.base)
+        self.middle["c"] = "middle_c"
+        self.middle["d"] = "middle_d"
+        self.leaf = multidict(self.middle)
+        self.leaf["e"] = "leaf_e"
+
+    def test_items(self):
+        self.assertEqual(
+            list(self.leaf.items()),
+            [
+                ("e", "leaf_e"),
+                ("c", "middle_c"),
+                ("d", "middle_d"),
+                ("a", "base_a"),
+                ("b", "base_b"),
+            ],
+        )
+        self.assertEqual(list(self.middle.keys()), ["c", "d", "a", "b"])
+
+    def test_lookup(self):
+        self.assertEqual(self.leaf["a"], "base_a")
+        self.assertEqual(self.leaf["c"], "middle_c")
+        self.assertEqual(self.leaf.get("f", "default"), "default")
+        with self.assertRaises(KeyError):
+            self.leaf["f"]
+
+    def test_late_parent_change(self):
+        # Read through the chain so that the parents are flattened
+        self.assertEqual(self.leaf["b"], "base_b")
+        self.base["b"] = "new_b"
+        self.base["f"] = "base_f"
+        self.assertEqual(self.leaf["b"], "new_b")
+        self.assertEqual(self.leaf["f"], "base_f")
+        self.assertIn(("f", "base_f"), list(self.middle.items()))
+
+    def test_delete(self):
+        list(self.leaf.items())
+        del self.middle["a"]
+        with self.assertRaises(KeyError):
+            self.leaf["a"]
+        self.assertNotIn("a", list(self.leaf.keys()))
+        self.middle["a"] = "middle_a"
+        self.assertEqual(self.leaf["a"], "middle_a")
+
+    def test_reparent(self):
+        list(self.leaf.items())
+        other = multidict(x="other_x")
+        self.middle.parent = other
+        self.assertEqual(list(self.leaf.keys()), ["e", "c", "d", "x"])
+        with self.assertRaises(KeyError):
+            self.leaf["a"]
+
+    def test_iterate_while_changing(self):
+        for key, value in self.middle.items():
+            self.middle[key + "_copy"] = value
+        self.assertEqual(self.leaf["a_copy"], "base_a")
@@ -0,0 +1,323 @@
+# Copyright (c) 2024 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import importlib.util
+import io
+import os
+import random
+import sys
+import tempfile
+import unittest
+from collections import OrderedDict
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_util_dir = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    os.pardir,
+    os.pardir,
+    os.pardir,
+    "util",
+)
+sys.path.insert(0, _util_dir)
+
+import protolib
+
+if np is not None:
+    _spec = importlib.util.spec_from_file_location(
+        "packet_trace_analysis",
+        os.path.join(_util_dir, "packet_trace_analysis.py"),
+    )
+    packet_trace_analysis = importlib.util.module_from_spec(_spec)
+    _spec.loader.exec_module(packet_trace_analysis)
+
+# The fields of each TrafficGen state, in the order they are read in
+# TrafficGen::parseConfig (src/cpu/testers/traffic_gen/traffic_gen.cc).
+_TRAFFIC_GEN_FIELDS = {
+    "LINEAR": (
+        "read_percent",
+        "start_addr",
+        "end_addr",
+        "blocksize",
+        "min_period",
+        "max_period",
+        "data_limit",
+    ),
+    "STRIDED": (
+        "read_percent",
+        "start_addr",
+        "end_addr",
+        "offset",
+        "blocksize",
+        "superblock_size",
+        "stride_size",
+        "min_period",
+        "max_period",
+        "data_limit",
+    ),
+}
+_TRAFFIC_GEN_FIELDS["RANDOM"] = _TRAFFIC_GEN_FIELDS["LINEAR"]
+
+_READ_REQ = 1
+_WRITE_REQ = 4
+
+
+class _Message:
+    """A serialized message, for protolib.encodeMessage."""
+
+    def __init__(self, *fields):
+        out = io.BytesIO()
+        for number, value in fields:
+            if isinstance(value, bytes):
+                protolib._EncodeVarint32(out, number << 3 | 2)
+                protolib._EncodeVarint32(out, len(value))
+                out.write(value)
+            else:
+                protolib._EncodeVarint32(out, number << 3)
+                protolib._EncodeVarint32(out, value)
+        self.data = out.getvalue()
+
+    def SerializeToString(self):
+        return self.data
+
+
+def _write_trace(path, packets, tick_freq=10**12):
+    """Writes a packet trace of the (tick, cmd, addr, size) packets."""
+    with open(path, "wb") as f:
+        f.write(b"gem5")
+        protolib.encodeMessage(f, _Message((1, b"test"), (3, tick_freq)))
+        for tick, cmd, addr, size in packets:
+            protolib.encodeMessage(
+                f, _Message((1, tick), (2, cmd), (3, addr), (4, size))
+            )
+
+
+def _stack_distances(lines):
+    """The LRU stack distance of each access to lines (the number of
+    other lines accessed since the last access to the line), or None for
+    the first access to a line, found by brute force."""
+    distances = []
+    for i, line in enumerate(lines):
+        previous = [j for j in range(i) if lines[j] == line]
+        if previous:
+            distances.append(len(set(lines[previous[-1] + 1 : i])))
+        else:
+            distances.append(None)
+    return distances
+
+
+def _lru_miss_ratio(lines, size):
+    """The miss ratio of a fully associative LRU cache of size lines."""
+    cache = OrderedDict()
+    misses = 0
+    for line in lines:
+        if line in cache:
+            cache.move_to_end(line)
+        else:
+            misses += 1
+            cache[line] = None
+            if len(cache) > size:
+                cache.popitem(last=False)
+    return misses / len(lines)
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class ReuseDistanceTestSuite(unittest.TestCase):
+    """Tests the SHARDS estimate of the reuse distances against those found
+    by brute force."""
+
+    def setUp(self):
+        rng = random.Random(1)
+        # Enough accesses for the Fenwick tree to be compacted, with a mix
+        # of short and long reuse distances.
+        self.lines = [
+            rng.randrange(16) if rng.random() < 0.5 else rng.randrange(400)
+            for _ in range(3000)
+        ]
+        self.addrs = np.array(self.lines, np.uint64) * np.uint64(64)
+
+    def test_all_sampled(self):
+        reuse = packet_trace_analysis.ReuseDistance(64, 1.0)
+        # In several blocks, as the trace is read.
+        for start in range(0, len(self.addrs), 700):
+            reuse.add(self.addrs[start : start + 700])
+
+        distances = _stack_distances(self.lines)
+        self.assertEqual(len(self.lines), reuse.sampled)
+        self.assertEqual(distances.count(None), reuse.cold)
+        expected = {}
+        for distance in distances:
+            if distance is not None:
+                bits = distance.bit_length()
+                expected[bits] = expected.get(bits, 0) + 1
+        self.assertEqual(expected, dict(reuse.histogram))
+
+        # The buckets are powers of two, so the miss ratios of caches of a
+        # power of two lines are exact.
+        for size in (1, 4, 16, 64, 256, 1024):
+            self.assertAlmostEqual(
+                _lru_miss_ratio(self.lines, size), reuse.miss_ratio(size)
+            )
+
+    def test_sampled(self):
+        lines = np.arange(8192, dtype=np.uint64)
+        reuse = packet_trace_analysis.ReuseDistance(64, 0.25)
+        reuse.add(np.concatenate((lines, lines)) * np.uint64(64))
+
+        # Every line is accessed twice, the second time after all the other
+        # lines.
+        distances, cold = reuse.distances()
+        self.assertAlmostEqual(8192, cold, delta=8192 * 0.1)
+        self.assertEqual(1, len(distances))
+        (low, high), count = distances[0]
+        self.assertAlmostEqual(8192, count, delta=8192 * 0.1)
+        self.assertLessEqual(low, 8191 * 1.1)
+        self.assertGreater(high, 8191 * 0.9)
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TraceAnalysisTestSuite(unittest.TestCase):
+    """Tests the summaries of a synthetic packet trace, and the TrafficGen
+    configurations made from them."""
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+        self.path = os.path.join(self.dir.name, "trace.gz")
+
+    def analyse(self, packets, **kwargs):
+        _write_trace(self.path, packets, tick_freq=10**9)
+        return packet_trace_analysis.analyse(
+            self.path, block_size=256, window=1000, **kwargs
+        )
+
+    def parse_traffic_gen(self, config):
+        """Returns the fields of the states of a TrafficGen configuration,
+        by their names in traffic_gen.cc, and its other lines."""
+        states = []
+        others = []
+        for line in config.splitlines():
+            words = line.split()
+            if words[0] != "STATE" or words[3] not in _TRAFFIC_GEN_FIELDS:
+                others.append(line)
+                continue
+            fields = _TRAFFIC_GEN_FIELDS[words[3]]
+            self.assertEqual(len(fields), len(words) - 4, line)
+            state = dict(zip(fields, map(int, words[4:])))
+            state.update(id=int(words[1]), duration=int(words[2]))
+            state["mode"] = words[3]
+            states.append(state)
+        return states, others
+
+    def test_linear(self):
+        # 64 B reads, 3 in 4, every 10 ticks, in 4000 ticks.
+        packets = [
+            (10 * i, _READ_REQ if i % 4 else _WRITE_REQ, 0x1000 + 64 * i, 64)
+            for i in range(400)
+        ]
+        analysis = self.analyse(packets)
+
+        self.assertEqual(10**9, analysis.tick_freq)
+        self.assertEqual(400, analysis.packets)
+        self.assertEqual(("linear", 64), analysis.pattern())
+        totals = analysis.totals()
+        self.assertEqual(300, totals["reads"])
+        self.assertEqual(100, totals["writes"])
+        self.assertEqual(300 * 64, totals["read_bytes"])
+        windows = analysis.windows.sums
+        self.assertEqual(4, len(windows))
+        self.assertEqual([100 * 64] * 4, windows[:, :2].sum(1).tolist())
+
+        states, others = self.parse_traffic_gen(
+            analysis.traffic_gen_config(phases=2)
+        )
+        self.assertEqual(2, len(states))
+        for id, state in enumerate(states):
+            self.assertEqual(id, state["id"])
+            self.assertEqual(2000, state["duration"])
+            self.assertEqual("LINEAR", state["mode"])
+            self.assertEqual(75, state["read_percent"])
+            self.assertEqual(0x1000, state["start_addr"])
+            self.assertEqual(0x1000 + 64 * 400, state["end_addr"])
+            self.assertEqual(64, state["blocksize"])
+            self.assertEqual(10, state["min_period"])
+            self.assertEqual(10, state["max_period"])
+            self.assertEqual(0, state["data_limit"])
+        self.assertEqual(
+            [
+                "STATE 2 0 EXIT",
+                "INIT 0",
+                "TRANSITION 0 1 1",
+                "TRANSITION 1 2 1",
+                "TRANSITION 2 2 1",
+            ],
+            others,
+        )
+
+    def test_strided(self):
+        packets = [(10 * i, _READ_REQ, 256 * i, 64) for i in range(100)]
+        analysis = self.analyse(packets)
+
+        self.assertEqual(("strided", 256), analysis.pattern())
+        states, _ = self.parse_traffic_gen(analysis.traffic_gen_config())
+        self.assertEqual(1, len(states))
+        state = states[0]
+        self.assertEqual("STRIDED", state["mode"])
+        self.assertEqual(100, state["read_percent"])
+        self.assertEqual(0, state["start_addr"])
+        self.assertEqual(256 * 99 + 64, state["end_addr"])
+        self.assertEqual(0, state["offset"])
+        self.assertEqual(64, state["blocksize"])
+        self.assertEqual(64, state["superblock_size"])
+        self.assertEqual(256, state["stride_size"])
+        self.assertEqual(10, state["min_period"])
+        self.assertEqual(10, state["max_period"])
+        self.assertEqual(0, state["data_limit"])
+
+    def test_random(self):
+        rng = random.Random(1)
+        packets = [
+            (10 * i, _WRITE_REQ, 64 * rng.randrange(1 << 20), 64)
+            for i in range(100)
+        ]
+        analysis = self.analyse(packets)
+
+        self.assertEqual("random", analysis.pattern()[0])
+        states, _ = self.parse_traffic_gen(analysis.traffic_gen_config())
+        self.assertEqual(1, len(states))
+        state = states[0]
+        self.assertEqual("RANDOM", state["mode"])
+        self.assertEqual(0, state["read_percent"])
+        self.assertEqual(
+            min(addr for _, _, addr, _ in packets), state["start_addr"]
+        )
+        self.assertEqual(
+            max(addr for _, _, addr, _ in packets) + 64, state["end_addr"]
+        )
+        self.assertEqual(64, state["blocksize"])
@@ -0,0 +1,273 @@
+# Copyright (c) 2024 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import gzip
+import io
+import os
+import random
+import struct
+import sys
+import tempfile
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+sys.path.insert(
+    0,
+    os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        os.pardir,
+        os.pardir,
+        os.pardir,
+        "util",
+    ),
+)
+
+import protolib
+
+
+class _Message:
+    """A message of (field number, value) pairs, serialized by hand as
+    protobuf would. Values are varints, except bytes, which are
+    length-delimited, and floats, which are fixed64."""
+
+    def __init__(self, *fields):
+        out = io.BytesIO()
+        for number, value in fields:
+            if isinstance(value, bytes):
+                protolib._EncodeVarint32(out, number << 3 | 2)
+                protolib._EncodeVarint32(out, len(value))
+                out.write(value)
+            elif isinstance(value, float):
+                protolib._EncodeVarint32(out, number << 3 | 1)
+                out.write(struct.pack("<d", value))
+            else:
+                protolib._EncodeVarint32(out, number << 3)
+                protolib._EncodeVarint32(out, value)
+        self.data = out.getvalue()
+
+    def SerializeToString(self):
+        return self.data
+
+    def ParseFromString(self, data):
+        self.data = data
+
+
+def _encode(messages, magic=b""):
+    out = io.BytesIO()
+    out.write(magic)
+    for message in messages:
+        protolib.encodeMessage(out, message)
+    return out.getvalue()
+
+
+# Block sizes to read with: a byte at a time, so every message and length
+# is split, sizes which split some of them, and one larger than the trace.
+_BLOCK_SIZES = (1, 7, 64, 1000, protolib.BLOCK_SIZE)
+
+
+class ReadMessagesTestSuite(unittest.TestCase):
+    """Tests protolib.readMessages and decodeMessage on messages written
+    with protolib.encodeMessage."""
+
+    def setUp(self):
+        rng = random.Random(1)
+        # Lengths of one, two and three bytes.
+        self.messages = [
+            _Message((1, bytes(rng.randrange(256) for _ in range(size))))
+            for size in (0, 1, 100, 126, 127, 200, 5000, 20000, 3)
+        ]
+        self.data = _encode(self.messages)
+
+    def test_read_messages(self):
+        expected = [message.data for message in self.messages]
+        for block_size in _BLOCK_SIZES:
+            with self.subTest(block_size=block_size):
+                self.assertEqual(
+                    expected,
+                    list(
+                        protolib.readMessages(
+                            io.BytesIO(self.data), block_size
+                        )
+                    ),
+                )
+
+    def test_decode_message(self):
+        in_file = io.BytesIO(self.data)
+        for message in self.messages:
+            decoded = _Message()
+            self.assertTrue(protolib.decodeMessage(in_file, decoded))
+            self.assertEqual(message.data, decoded.data)
+        self.assertFalse(protolib.decodeMessage(in_file, _Message()))
+
+    def test_truncated(self):
+        # An incomplete message at the end of the file is not returned.
+        data = self.data + _encode([_Message((1, b"x" * 300))])[:-1]
+        for block_size in _BLOCK_SIZES:
+            with self.subTest(block_size=block_size):
+                self.assertEqual(
+                    len(self.messages),
+                    len(
+                        list(
+                            protolib.readMessages(io.BytesIO(data), block_size)
+                        )
+                    ),
+                )
+
+
+class VarintFieldsTestSuite(unittest.TestCase):
+    def test_varint_fields(self):
+        header = _Message(
+            (1, b"system.monitor"),
+            (2, 1),
+            (3, 10**12),
+            (4, _Message((1, 0), (2, b"cpu")).data),
+            (5, 1.5),
+            (6, 1 << 63),
+        )
+        self.assertEqual(
+            {2: 1, 3: 10**12, 6: 1 << 63},
+            protolib.varintFields(header.data),
+        )
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TraceArraysTestSuite(unittest.TestCase):
+    """Tests the decoding of whole traces into NumPy arrays, in blocks of
+    various sizes, against the messages written."""
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+
+    def write(self, messages, compress=False):
+        path = os.path.join(self.dir.name, "trace")
+        with (gzip.open if compress else open)(path, "wb") as f:
+            f.write(_encode(messages, b"gem5"))
+        return path
+
+    def test_packet_arrays(self):
+        rng = random.Random(1)
+        header = _Message((1, b"system.monitor"), (3, 10**12))
+        packets = []
+        for i in range(300):
+            fields = {
+                "tick": 1000 * i + (1 << 40),
+                "cmd": rng.choice((1, 4)),
+                "addr": rng.randrange(1 << 48),
+                "size": 64,
+                "pc": rng.randrange(1 << 64),
+            }
+            if i % 3:
+                fields["pkt_id"] = i
+            if i % 5 == 0:
+                # Missing fields are 0.
+                del fields["pc"]
+            packets.append(fields)
+        numbers = {name: number for number, name, _ in protolib.PACKET_FIELDS}
+        messages = [header] + [
+            _Message(*((numbers[name], value) for name, value in p.items()))
+            for p in packets
+        ]
+
+        for compress in (False, True):
+            path = self.write(messages, compress)
+            for block_size in _BLOCK_SIZES:
+                with self.subTest(compress=compress, block_size=block_size):
+                    read, records = protolib.packetArrays(path, block_size)
+                    self.assertEqual(header.data, read)
+                    self.assertEqual(len(packets), len(records))
+                    for _, name, _ in protolib.PACKET_FIELDS:
+                        self.assertEqual(
+                            [p.get(name, 0) for p in packets],
+                            records[name].tolist(),
+                            name,
+                        )
+
+    def test_inst_dep_arrays(self):
+        rng = random.Random(1)
+        header = _Message((1, b"system.cpu"), (3, 10**12), (4, 0))
+        records = []
+        messages = [header]
+        for i in range(200):
+            rob_deps = [
+                rng.randrange(1 << 40) for _ in range(rng.randrange(4))
+            ]
+            reg_deps = [rng.randrange(1000) for _ in range(i % 3)]
+            fields = [(1, i + 1), (2, rng.randrange(8))]
+            # The repeated fields are interleaved with the others.
+            fields += [(6, dep) for dep in rob_deps]
+            fields += [(7, 10 * i), (11, rng.randrange(1 << 64))]
+            fields += [(8, dep) for dep in reg_deps]
+            messages.append(_Message(*fields))
+            records.append((fields, rob_deps, reg_deps))
+
+        path = self.write(messages)
+        for block_size in _BLOCK_SIZES:
+            with self.subTest(block_size=block_size):
+                read, arrays, deps = protolib.instDepArrays(path, block_size)
+                self.assertEqual(header.data, read)
+                self.assertEqual(len(records), len(arrays))
+                names = {
+                    number: name
+                    for number, name, _ in protolib.INST_DEP_FIELDS
+                }
+                for i, (fields, rob_deps, reg_deps) in enumerate(records):
+                    expected = {name: 0 for name in names.values()}
+                    for number, value in fields:
+                        if number in names:
+                            expected[names[number]] = value
+                    self.assertEqual(
+                        expected,
+                        {name: arrays[name][i].item() for name in expected},
+                    )
+                    for name, values in (
+                        ("rob_dep", rob_deps),
+                        ("reg_dep", reg_deps),
+                    ):
+                        offsets, all_values = deps[name]
+                        self.assertEqual(
+                            values,
+                            all_values[offsets[i] : offsets[i + 1]].tolist(),
+                        )
+
+    def test_empty(self):
+        header, records = protolib.packetArrays(self.write([]))
+        self.assertIsNone(header)
+        self.assertEqual(0, len(records))
+
+        header = _Message((3, 10**12))
+        read, records = protolib.packetArrays(self.write([header]))
+        self.assertEqual(header.data, read)
+        self.assertEqual(0, len(records))
+
+    def test_not_varint(self):
+        path = self.write([_Message((3, 10**12)), _Message((1, b"tick"))])
+        with self.assertRaises(ValueError):
+            protolib.packetArrays(path)
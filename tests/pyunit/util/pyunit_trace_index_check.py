@@ -0,0 +1,238 @@
+# Copyright (c) 2024 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import contextlib
+import gzip
+import importlib.util
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+_util_dir = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    os.pardir,
+    os.pardir,
+    os.pardir,
+    "util",
+)
+sys.path.insert(0, _util_dir)
+
+import trace_index
+
+# The size of the chunks of the test traces, so they have many.
+_CHUNK_SIZE = 2048
+
+
+def _o3_trace(insts=2000):
+    """An O3PipeView trace of insts instructions, fetched 1000 ticks
+    apart. Every tenth one is squashed and, as in a real trace, written
+    after some of the instructions fetched after it, so the fetch ticks
+    are not quite in order."""
+    records = []
+    squashed = []
+    for sn in range(1, insts + 1):
+        tick = 1000 * sn
+        retire = 0 if sn % 10 == 0 else tick + 7000
+        record = (
+            f"O3PipeView:fetch:{tick}:0x{0x400000 + 4 * sn:08x}:0:{sn}:"
+            f"  add r{sn % 8}, r1, r2\n"
+            f"O3PipeView:decode:{tick + 1000}\n"
+            f"O3PipeView:rename:{tick + 2000}\n"
+            f"O3PipeView:dispatch:{tick + 3000}\n"
+            f"O3PipeView:issue:{tick + 4000}\n"
+            f"O3PipeView:complete:{tick + 5000}\n"
+            f"O3PipeView:retire:{retire}:store:0\n"
+        )
+        if retire:
+            records.append(record)
+        else:
+            squashed.append(record)
+        if len(squashed) > 0 and sn % 10 == 5:
+            records += squashed
+            squashed = []
+    return "".join(records + squashed)
+
+
+def _minor_trace(lines=5000):
+    """A MinorTrace trace with a few lines in each tick."""
+    return "".join(
+        f"{500 * (i // 3):>10}: system.cpu.fetch1: MinorTrace: "
+        f"state=fetch line={i}\n"
+        for i in range(lines)
+    )
+
+
+def _load_o3_pipeview():
+    """Loads o3-pipeview.py afresh, as it keeps its state in globals."""
+    spec = importlib.util.spec_from_file_location(
+        "o3_pipeview", os.path.join(_util_dir, "o3-pipeview.py")
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TraceIndexTestSuite(unittest.TestCase):
+    """Tests that reading the part of a trace found with its index gives
+    the same results as reading all of it."""
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+
+    def write(self, name, text, compress=False):
+        path = os.path.join(self.dir.name, name)
+        with (gzip.open if compress else open)(path, "wt") as f:
+            f.write(text)
+        return path
+
+    def pipeview(self, trace, *args):
+        """Returns the output of o3-pipeview.py on trace with args."""
+        out = os.path.join(self.dir.name, "o3-pipeview.out")
+        argv = ["o3-pipeview.py", "-o", out] + list(args) + [trace]
+        with patch.object(sys, "argv", argv), contextlib.redirect_stdout(
+            io.StringIO()
+        ):
+            _load_o3_pipeview().main()
+        with open(out) as f:
+            return f.read()
+
+    def check_pipeview(self, trace, index, option, low, high):
+        """Checks o3-pipeview.py gives the same output for the range of
+        option from low to high with the index as it does without."""
+        args = [option, f"{low}:{high}"]
+        expected = self.pipeview(trace, *args)
+        self.assertEqual(expected, self.pipeview(trace, "--index", *args))
+        start, end = index.span(
+            "tick" if option == "-t" else "sn",
+            low,
+            high if high > 0 else None,
+        )
+        self.assertLess(end - start, index.length)
+        return expected
+
+    def test_o3_pipeview(self):
+        for compress in (False, True):
+            with self.subTest(compress=compress):
+                trace = self.write("trace.out", _o3_trace(), compress)
+                index = trace_index.TraceIndex(
+                    trace, trace_index.O3_PIPE_VIEW, _CHUNK_SIZE
+                )
+                self.assertGreater(len(index.chunks), 10)
+
+                for option, column in (("-t", 1), ("-i", 3)):
+                    # A range within the trace, one from the smallest to
+                    # the largest key of some chunks, one up to the end of
+                    # the trace, and one after it.
+                    chunk = index.chunks[len(index.chunks) // 2]
+                    later = index.chunks[len(index.chunks) // 2 + 2]
+                    ranges = (
+                        (chunk[column] + 3, later[column] - 5),
+                        (chunk[column], later[column + 1]),
+                        (chunk[column + 1], later[column]),
+                        (later[column], -1),
+                        (later[column + 1], -1),
+                    )
+                    for low, high in ranges:
+                        with self.subTest(option=option, low=low, high=high):
+                            output = self.check_pipeview(
+                                trace, index, option, low, high
+                            )
+                            # Some instructions are printed after the
+                            # header.
+                            self.assertGreater(output.count("\n"), 3)
+
+                    # After the end of the trace, nothing is printed.
+                    after = max(chunk[column + 1] for chunk in index.chunks)
+                    after += 1
+                    self.assertEqual(
+                        "", self.pipeview(trace, option, f"{after}:-1")
+                    )
+                    self.assertEqual(
+                        "",
+                        self.pipeview(trace, "--index", option, f"{after}:-1"),
+                    )
+                os.remove(trace)
+                os.remove(index.index_path)
+
+    def test_minor_trace(self):
+        trace = self.write("minor.out", _minor_trace())
+        index = trace_index.TraceIndex(
+            trace, trace_index.MINOR_TRACE, _CHUNK_SIZE
+        )
+        self.assertGreater(len(index.chunks), 10)
+        with open(trace) as f:
+            lines = f.readlines()
+
+        def in_range(lines, low, high):
+            return [
+                line
+                for line in lines
+                if low <= int(line.split(":")[0])
+                and (high is None or int(line.split(":")[0]) <= high)
+            ]
+
+        chunk = index.chunks[len(index.chunks) // 2]
+        later = index.chunks[len(index.chunks) // 2 + 2]
+        for low, high in (
+            (chunk[1] + 100, later[1] + 100),
+            (chunk[1], later[2]),
+            (chunk[2], later[1]),
+            (later[1], None),
+            (0, chunk[1]),
+        ):
+            with self.subTest(low=low, high=high):
+                with trace_index.openTrace(
+                    trace, trace_index.MINOR_TRACE, "tick", low, high
+                ) as f:
+                    window = f.readlines()
+                self.assertLess(len(window), len(lines))
+                self.assertEqual(
+                    in_range(lines, low, high), in_range(window, low, high)
+                )
+
+    def test_stale_index(self):
+        trace = self.write("minor.out", _minor_trace(100))
+        index = trace_index.TraceIndex(trace, trace_index.MINOR_TRACE, 256)
+        chunks = index.chunks
+
+        # The saved index is used as it is.
+        self.assertEqual(
+            chunks,
+            trace_index.TraceIndex(trace, trace_index.MINOR_TRACE).chunks,
+        )
+
+        # Until the trace changes.
+        with open(trace, "a") as f:
+            f.write(_minor_trace(200)[len(_minor_trace(100)) :])
+        with contextlib.redirect_stdout(io.StringIO()):
+            index = trace_index.TraceIndex(trace, trace_index.MINOR_TRACE, 256)
+        self.assertGreater(len(index.chunks), len(chunks))
+        self.assertEqual(chunks[:-1], index.chunks[: len(chunks) - 1])
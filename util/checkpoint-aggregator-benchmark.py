@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# Copyright (c) 2024 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Measures the throughput of util/checkpoint_aggregator.py, aggregating
+synthetic checkpoints into a compressed and an uncompressed memory image,
+with one worker and with one worker per CPU. The memory images of the
+synthetic checkpoints are half random and half zero pages, which compress
+about as well as those of real checkpoints.
+
+Usage:
+    util/checkpoint-aggregator-benchmark.py -n 16 --size 64
+"""
+
+import argparse
+import gzip
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from checkpoint_aggregator import (
+    PAGE_SIZE,
+    PMEM_FILE,
+    aggregate,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "-n",
+        "--checkpoints",
+        type=int,
+        default=16,
+        help="The number of checkpoints to aggregate.",
+    )
+    parser.add_argument(
+        "--size",
+        type=int,
+        default=64,
+        help="The size of the memory of each checkpoint, in MiB.",
+    )
+    args = parser.parse_args()
+
+    pages = (args.size << 20) // PAGE_SIZE
+    total = pages * PAGE_SIZE * args.checkpoints
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cpts = []
+        for i in range(args.checkpoints):
+            cpt = os.path.join(tmpdir, f"cpt{i}")
+            os.makedirs(cpt)
+            with gzip.open(os.path.join(cpt, PMEM_FILE), "wb", 6) as f:
+                for _ in range(pages // 2):
+                    f.write(os.urandom(PAGE_SIZE))
+                    f.write(bytes(PAGE_SIZE))
+            with open(os.path.join(cpt, "m5.cpt"), "w") as f:
+                f.write(
+                    f"[Globals]\ncurTick={i}\n\n"
+                    f"[system]\npagePtr={pages}\n\n"
+                    f"[system.cpu.workload.FdMap256]\npaddr=0\n\n"
+                    f"[system.physmem.store0]\n"
+                    f"range_size={pages * PAGE_SIZE}\n"
+                )
+            cpts.append(cpt)
+
+        print(f"{'format':<14}{'jobs':>6}{'time (s)':>10}{'MiB/s':>10}")
+        for no_compress in (False, True):
+            for jobs in sorted({1, os.cpu_count()}):
+                output = os.path.join(tmpdir, "out")
+                start = time.perf_counter()
+                # Silence the aggregator's progress messages.
+                with open(os.devnull, "w") as devnull:
+                    stdout, sys.stdout = sys.stdout, devnull
+                    try:
+                        aggregate(output, cpts, no_compress, None, jobs)
+                    finally:
+                        sys.stdout = stdout
+                elapsed = time.perf_counter() - start
+                print(
+                    f"{'uncompressed' if no_compress else 'compressed':<14}"
+                    f"{jobs:>6}{elapsed:>10.2f}"
+                    f"{(total >> 20) / elapsed:>10.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -29,9 +29,21 @@
 import gzip
 import os
 import re
+import shutil
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from configparser import ConfigParser
 
+PAGE_SIZE = 1 << 12
+
+# The size of the buffers the memory images are copied through.
+BUFFER_SIZE = 16 << 20
+
+# The compression level used by gem5 when writing checkpoints.
+COMPRESS_LEVEL = 6
+
+PMEM_FILE = "system.physmem.store0.pmem"
+
 
 class myCP(ConfigParser):
     def __init__(self):
@@ -41,28 +53,77 @@ class myCP(ConfigParser):
         return optionstr
 
 
-def aggregate(output_dir, cpts, no_compress, memory_size):
+def open_pmem(path):
+    """Open a memory image for reading, whether it is gzip compressed (as
+    written by gem5) or not (as read by gem5, and written by this script with
+    --no-compress).
+    """
+    with open(path, "rb") as f:
+        compressed = f.read(2) == b"\x1f\x8b"
+    if compressed:
+        return gzip.open(path, "rb")
+    return open(path, "rb")
+
+
+def copy_pages(src, dst, size):
+    """Copy size bytes of a memory image from src to dst."""
+    while size > 0:
+        data = src.read(min(size, BUFFER_SIZE))
+        if not data:
+            # Like gem5, treat the rest of a short image as zeroes.
+            dst.seek(size, os.SEEK_CUR)
+            break
+        dst.write(data)
+        size -= len(data)
+
+
+def copy_image(src_path, dst_path, offset, size, compress):
+    """Copy size bytes of the memory image at src_path into the aggregated
+    image. If compress is false, the bytes are written at offset in the image
+    at dst_path, otherwise they are written to a new gzip file at dst_path.
+    Run in a worker process, so the images are decompressed in parallel.
+    """
+    with open_pmem(src_path) as src:
+        if compress:
+            with gzip.open(
+                dst_path, "wb", compresslevel=COMPRESS_LEVEL
+            ) as dst:
+                copy_pages(src, dst, size)
+        else:
+            with open(dst_path, "r+b", buffering=0) as dst:
+                dst.seek(offset)
+                copy_pages(src, dst, size)
+
+
+def write_zeroes(dst, size):
+    """Write size zero bytes to a (compressed) image."""
+    zeroes = bytes(min(size, BUFFER_SIZE))
+    while size > 0:
+        dst.write(zeroes[:size])
+        size -= len(zeroes)
+
+
+def aggregate(output_dir, cpts, no_compress, memory_size, jobs=None):
     merged_config = None
     page_ptr = 0
 
     output_path = output_dir
-    if not os.path.isdir(output_path):
-        os.system("mkdir -p " + output_path)
+    os.makedirs(output_path, exist_ok=True)
 
-    agg_mem_file = open(output_path + "/system.physmem.store0.pmem", "wb+")
-    agg_config_file = open(output_path + "/m5.cpt", "wb+")
-
-    if not no_compress:
-        merged_mem = gzip.GzipFile(fileobj=agg_mem_file, mode="wb")
+    agg_mem_path = os.path.join(output_path, PMEM_FILE)
+    agg_config_file = open(output_path + "/m5.cpt", "w")
 
     max_curtick = 0
     num_digits = len(str(len(cpts) - 1))
 
+    # The (offset, size) of each checkpoint's memory in the aggregated image.
+    images = []
+
     for i, arg in enumerate(cpts):
         print(arg)
         merged_config = myCP()
         config = myCP()
-        config.readfp(open(cpts[i] + "/m5.cpt"))
+        config.read(cpts[i] + "/m5.cpt")
 
         for sec in config.sections():
             if re.compile("cpu").search(sec):
@@ -73,13 +134,15 @@ def aggregate(output_dir, cpts, no_compress, memory_size):
                 for item in items:
                     if item[0] == "paddr":
                         merged_config.set(
-                            newsec, item[0], int(item[1]) + (page_ptr << 12)
+                            newsec,
+                            item[0],
+                            str(int(item[1]) + (page_ptr << 12)),
                         )
                         continue
                     merged_config.set(newsec, item[0], item[1])
 
                 if re.compile("workload.FdMap256$").search(sec):
-                    merged_config.set(newsec, "M5_pid", i)
+                    merged_config.set(newsec, "M5_pid", str(i))
 
             elif sec == "system":
                 pass
@@ -98,37 +161,59 @@ def aggregate(output_dir, cpts, no_compress, memory_size):
 
         ### memory stuff
         pages = int(config.get("system", "pagePtr"))
+        images.append((page_ptr * PAGE_SIZE, pages * PAGE_SIZE))
         page_ptr = page_ptr + pages
         print("pages to be read: ", pages)
 
-        f = open(cpts[i] + "/system.physmem.store0.pmem", "rb")
-        gf = gzip.GzipFile(fileobj=f, mode="rb")
+    # Pad the memory to memory_size.
+    image_size = page_ptr * PAGE_SIZE
+    if memory_size and image_size < memory_size:
+        page_ptr = (memory_size + PAGE_SIZE - 1) // PAGE_SIZE
+    padding = page_ptr * PAGE_SIZE - image_size
 
-        x = 0
-        while x < pages:
-            bytesRead = gf.read(1 << 12)
-            if not no_compress:
-                merged_mem.write(bytesRead)
-            else:
-                agg_mem_file.write(bytesRead)
-            x += 1
+    if no_compress:
+        # The padding is left as a hole in the (sparse) file, which reads
+        # as zeroes, and the workers write their pages in place.
+        with open(agg_mem_path, "wb") as agg_mem_file:
+            agg_mem_file.truncate(page_ptr * PAGE_SIZE)
+        parts = [agg_mem_path] * len(cpts)
+    else:
+        # gzip files can be concatenated, so each worker compresses its
+        # pages to a separate file, and they are then joined in order.
+        parts = [f"{agg_mem_path}.{i}" for i in range(len(cpts))]
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [
+            executor.submit(
+                copy_image,
+                os.path.join(cpt, PMEM_FILE),
+                part,
+                offset,
+                size,
+                not no_compress,
+            )
+            for cpt, part, (offset, size) in zip(cpts, parts, images)
+        ]
+        for future in futures:
+            future.result()
 
-        gf.close()
-        f.close()
+    if not no_compress:
+        with open(agg_mem_path, "wb") as agg_mem_file:
+            for part in parts:
+                with open(part, "rb") as f:
+                    shutil.copyfileobj(f, agg_mem_file, BUFFER_SIZE)
+                os.remove(part)
+            if padding:
+                with gzip.GzipFile(
+                    fileobj=agg_mem_file,
+                    mode="wb",
+                    compresslevel=COMPRESS_LEVEL,
+                ) as merged_mem:
+                    write_zeroes(merged_mem, padding)
 
     merged_config.add_section("system")
-    merged_config.set("system", "pagePtr", page_ptr)
-    merged_config.set("system", "nextPID", len(cpts))
-
-    file_size = page_ptr * 4 * 1024
-    dummy_data = "".zfill(4096)
-    while file_size < memory_size:
-        if not no_compress:
-            merged_mem.write(dummy_data)
-        else:
-            agg_mem_file.write(dummy_data)
-        file_size += 4 * 1024
-        page_ptr += 1
+    merged_config.set("system", "pagePtr", str(page_ptr))
+    merged_config.set("system", "nextPID", str(len(cpts)))
 
     print("WARNING: ")
     print(
@@ -136,19 +221,14 @@ def aggregate(output_dir, cpts, no_compress, memory_size):
     )
     print(page_ptr, "x 4K of memory")
     merged_config.set(
-        "system.physmem.store0", "range_size", page_ptr * 4 * 1024
+        "system.physmem.store0", "range_size", str(page_ptr * PAGE_SIZE)
     )
 
     merged_config.add_section("Globals")
-    merged_config.set("Globals", "curTick", max_curtick)
+    merged_config.set("Globals", "curTick", str(max_curtick))
 
     merged_config.write(agg_config_file)
-
-    if not no_compress:
-        merged_mem.close()
-        agg_mem_file.close()
-    else:
-        agg_mem_file.close()
+    agg_config_file.close()
 
 
 if __name__ == "__main__":
@@ -164,6 +244,14 @@ if __name__ == "__main__":
     parser.add_argument("-c", "--no-compress", action="store_true")
     parser.add_argument("--cpts", nargs="+")
     parser.add_argument("--memory-size", action="store", type=int)
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="The number of checkpoints to decompress in parallel "
+        "(default: the number of CPUs).",
+    )
 
     # Assume x86 ISA.  Any other ISAs would need extra stuff in this script
     # to appropriately parse their page tables and understand page sizes.
@@ -180,4 +268,5 @@ if __name__ == "__main__":
         options.cpts,
         options.no_compress,
         options.memory_size,
+        options.jobs,
     )
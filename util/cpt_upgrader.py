@@ -49,9 +49,10 @@
 # upgrade() method should be implemented in its own .py file and placed in
 # src/util/cpt_upgraders/.  For each upgrader whose tag is not present in
 # the checkpoint tag list, the upgrade() method will be run, passing in a
-# ConfigParser object which contains the open file. As these operations can
-# be isa specific the method can verify the isa and use regexes to find the
-# correct sections that need to be updated.
+# CheckpointFile object which contains the open file. It has the same
+# interface as a ConfigParser, but only parses the sections which are used.
+# As these operations can be isa specific the method can verify the isa and
+# use regexes to find the correct sections that need to be updated.
 
 # It is also possible to use this mechanism to revert prior tags.  In this
 # case, implement a downgrade() method instead.  Dependencies should still
@@ -73,11 +74,16 @@ import configparser
 import glob
 import os
 import os.path as osp
+import re
 import sys
 import types
+from collections.abc import MutableMapping
 
 verbose_print = False
 
+# The default of the fallback arguments of CheckpointFile.
+_UNSET = object()
+
 
 def verboseprint(*args):
     if not verbose_print:
@@ -87,6 +93,172 @@ def verboseprint(*args):
     print("\n")
 
 
+class CheckpointFile:
+    """An m5.cpt file, indexed by section. The options of a section are only
+    parsed when they are used, and the sections which are not changed are
+    written back as they were read, so upgrading a checkpoint with many
+    sections only costs as much as the sections the upgraders change.
+
+    This implements the part of the ConfigParser interface the upgraders
+    use, without interpolation and with case-sensitive options.
+    """
+
+    _header = re.compile(r"^\[([^\]\n]+)\][ \t]*$", re.MULTILINE)
+    _option = re.compile(r"\s*(.*?)\s*[=:]\s*(.*?)\s*$")
+
+    class _Section:
+        def __init__(self, raw=None):
+            # The text of the section as read, including its header, or
+            # None if the section was added or changed.
+            self.raw = raw
+            self._options = None if raw is not None else {}
+
+        @property
+        def options(self):
+            if self._options is None:
+                self._options = {}
+                # Skip the header.
+                for line in self.raw.splitlines()[1:]:
+                    if not line.strip() or line.lstrip()[0] in "#;":
+                        continue
+                    match = CheckpointFile._option.match(line)
+                    if match:
+                        self._options[match.group(1)] = match.group(2)
+            return self._options
+
+    class _SectionProxy(MutableMapping):
+        """The options of a section, as returned by cpt[section]. Changes
+        are written through to the checkpoint.
+        """
+
+        def __init__(self, cpt, name):
+            self._cpt = cpt
+            self._name = name
+
+        @property
+        def name(self):
+            return self._name
+
+        def __getitem__(self, option):
+            return self._cpt._section(self._name).options[option]
+
+        def __setitem__(self, option, value):
+            self._cpt._changed(self._name).options[option] = value
+
+        def __delitem__(self, option):
+            if option not in self:
+                raise KeyError(option)
+            del self._cpt._changed(self._name).options[option]
+
+        def __contains__(self, option):
+            return option in self._cpt._section(self._name).options
+
+        def __iter__(self):
+            return iter(self._cpt._section(self._name).options)
+
+        def __len__(self):
+            return len(self._cpt._section(self._name).options)
+
+    def __init__(self, path):
+        with open(path) as f:
+            text = f.read()
+
+        self._sections = {}
+        headers = list(self._header.finditer(text))
+        # Any text before the first section (e.g., comments).
+        self._preamble = text[: headers[0].start()] if headers else text
+        for header, next_header in zip(headers, headers[1:] + [None]):
+            name = header.group(1)
+            if name in self._sections:
+                raise configparser.DuplicateSectionError(name, path)
+            end = next_header.start() if next_header else len(text)
+            self._sections[name] = self._Section(text[header.start() : end])
+
+    def _section(self, section):
+        try:
+            return self._sections[section]
+        except KeyError:
+            raise configparser.NoSectionError(section) from None
+
+    def _changed(self, section):
+        sec = self._section(section)
+        # Parse the options before dropping the text they come from.
+        sec.options
+        sec.raw = None
+        return sec
+
+    def __getitem__(self, section):
+        if section not in self._sections:
+            raise KeyError(section)
+        return self._SectionProxy(self, section)
+
+    def __contains__(self, section):
+        return section in self._sections
+
+    def sections(self):
+        return list(self._sections)
+
+    def has_section(self, section):
+        return section in self._sections
+
+    def add_section(self, section):
+        if section in self._sections:
+            raise configparser.DuplicateSectionError(section)
+        self._sections[section] = self._Section()
+
+    def remove_section(self, section):
+        return self._sections.pop(section, None) is not None
+
+    def has_option(self, section, option):
+        sec = self._sections.get(section)
+        return sec is not None and option in sec.options
+
+    def get(self, section, option, *, raw=False, fallback=_UNSET):
+        sec = self._sections.get(section)
+        if sec is not None and option in sec.options:
+            return sec.options[option]
+        if fallback is not _UNSET:
+            return fallback
+        if sec is None:
+            raise configparser.NoSectionError(section)
+        raise configparser.NoOptionError(option, section)
+
+    def getint(self, section, option, *, raw=False, fallback=_UNSET):
+        value = self.get(section, option, fallback=None)
+        if value is None:
+            if fallback is not _UNSET:
+                return fallback
+            # Raise the appropriate error.
+            self.get(section, option)
+        return int(value)
+
+    def items(self, section, raw=False):
+        return list(self._section(section).options.items())
+
+    def set(self, section, option, value=None):
+        self._changed(section).options[option] = value
+
+    def remove_option(self, section, option):
+        options = self._section(section).options
+        if option not in options:
+            return False
+        del self._changed(section).options[option]
+        return True
+
+    def write(self, f):
+        f.write(self._preamble)
+        for name, sec in self._sections.items():
+            if sec.raw is not None:
+                f.write(sec.raw)
+                if not sec.raw.endswith("\n"):
+                    f.write("\n")
+                continue
+            f.write(f"[{name}]\n")
+            for option, value in sec.options.items():
+                f.write(f"{option}={value}\n")
+            f.write("\n")
+
+
 class Upgrader:
     tag_set = set()
     untag_set = set()  # tags to remove by downgrading
@@ -161,6 +333,47 @@ class Upgrader:
     def get(tag):
         return Upgrader.by_tag[tag]
 
+    # The plans computed by `plan`, by the tags they start from.
+    plans = {}
+
+    @staticmethod
+    def plan(tags):
+        """Returns the upgraders (and downgraders) to apply, in order, to a
+        checkpoint with the given tags. Upgraders are applied in rounds, each
+        applying those whose dependences are met by the previous rounds.
+
+        Checkpoints in a tree usually have the same tags, so the plans are
+        only computed once for each set of tags.
+        """
+        key = frozenset(tags)
+        if key in Upgrader.plans:
+            return Upgrader.plans[key]
+
+        tags = set(tags)
+        plan = []
+        # Apply migrations for tags not in checkpoint and tags present for
+        # which downgraders are present, respecting dependences
+        to_apply = (Upgrader.tag_set - tags) | (Upgrader.untag_set & tags)
+        while to_apply:
+            ready = sorted(t for t in to_apply if Upgrader.get(t).ready(tags))
+            if not ready:
+                print("could not apply these upgrades:", " ".join(to_apply))
+                print("update dependences impossible to resolve; aborting")
+                exit(1)
+
+            for tag in ready:
+                upg = Upgrader.get(tag)
+                if hasattr(upg, "upgrader"):
+                    tags.add(tag)
+                else:
+                    tags.remove(tag)
+                plan.append(upg)
+
+            to_apply -= set(ready)
+
+        Upgrader.plans[key] = plan
+        return plan
+
     @staticmethod
     def load_all():
         util_dir = osp.dirname(osp.abspath(__file__))
@@ -193,6 +406,9 @@ class Upgrader:
 
 
 def process_file(path, **kwargs):
+    """Upgrade the checkpoint file at path. Returns the tags of the upgraders
+    (and downgraders) applied, or which would be applied with dry_run.
+    """
     if not osp.isfile(path):
         import errno
 
@@ -200,20 +416,8 @@ def process_file(path, **kwargs):
 
     verboseprint(f"Processing file {path}....")
 
-    if kwargs.get("backup", True):
-        import shutil
-
-        shutil.copyfile(path, path + ".bak")
-
-    cpt = configparser.ConfigParser()
-
-    # gem5 is case sensitive with paramaters
-    cpt.optionxform = str
-
     # Read the current data
-    cpt_file = open(path)
-    cpt.read_file(cpt_file)
-    cpt_file.close()
+    cpt = CheckpointFile(path)
 
     change = False
 
@@ -252,31 +456,68 @@ def process_file(path, **kwargs):
             " ".join(unknown_tags),
         )
 
-    # Apply migrations for tags not in checkpoint and tags present for which
-    # downgraders are present, respecting dependences
-    to_apply = (Upgrader.tag_set - tags) | (Upgrader.untag_set & tags)
-    while to_apply:
-        ready = {t for t in to_apply if Upgrader.get(t).ready(tags)}
-        if not ready:
-            print("could not apply these upgrades:", " ".join(to_apply))
-            print("update dependences impossible to resolve; aborting")
-            exit(1)
-
-        for tag in ready:
-            Upgrader.get(tag).update(cpt, tags)
-            change = True
+    plan = Upgrader.plan(tags)
+    applied = [upg.tag for upg in plan]
+    if kwargs.get("dry_run", False):
+        return applied
 
-        to_apply -= ready
+    for upg in plan:
+        upg.update(cpt, tags)
+        change = True
 
     if not change:
         verboseprint("...nothing to do")
-        return
+        return applied
 
     cpt.set("root.globals", "version_tags", " ".join(tags))
 
-    # Write the old data back
+    # Write the new data next to the old, then replace it, keeping the old
+    # data as the backup.
     verboseprint("...completed")
-    cpt.write(open(path, "w"))
+    with open(path + ".tmp", "w") as f:
+        cpt.write(f)
+    if kwargs.get("backup", True):
+        os.replace(path, path + ".bak")
+    os.replace(path + ".tmp", path)
+    return applied
+
+
+def _init_worker(verbose):
+    """Set up a worker process processing a checkpoint tree."""
+    global verbose_print
+    verbose_print = verbose
+    # Forked workers already have the upgraders.
+    if not Upgrader.by_tag:
+        Upgrader.load_all()
+
+
+def process_files(paths, jobs=None, **kwargs):
+    """Upgrade the checkpoint files at paths in parallel, printing the tags
+    each needs (or needed).
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from functools import partial
+
+    def report(path, applied):
+        if kwargs.get("dry_run", False):
+            print(f"{path}: needs {' '.join(applied) or 'nothing'}")
+        elif applied:
+            print(f"{path}: applied {' '.join(applied)}")
+
+    if len(paths) == 1 or jobs == 1:
+        for path in paths:
+            report(path, process_file(path, **kwargs))
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_worker,
+        initargs=(verbose_print,),
+    ) as executor:
+        for path, applied in zip(
+            paths, executor.map(partial(process_file, **kwargs), paths)
+        ):
+            report(path, applied)
 
 
 if __name__ == "__main__":
@@ -307,6 +548,20 @@ if __name__ == "__main__":
         action="store_true",
         help="Print out debugging information as",
     )
+    parser.add_argument(
+        "-n",
+        "--dry-run",
+        action="store_true",
+        help="Print the tags each checkpoint needs, without modifying it",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="The number of checkpoints to upgrade in parallel with "
+        "--recurse (default: the number of CPUs)",
+    )
     parser.add_argument(
         "--get-cc-file",
         action="store_true",
@@ -346,21 +601,22 @@ if __name__ == "__main__":
 
     # Process a single file if we have it
     if osp.isfile(path):
-        process_file(path, **vars(args))
+        process_files([path], **vars(args))
     # Process an entire directory
     elif osp.isdir(path):
         cpt_file = osp.join(path, "m5.cpt")
         if args.recurse:
             # Visit very file and see if it matches
-            for root, dirs, files in os.walk(path):
-                for name in files:
-                    if name == "m5.cpt":
-                        process_file(osp.join(root, name), **vars(args))
-                for dir in dirs:
-                    pass
+            paths = sorted(
+                osp.join(root, name)
+                for root, dirs, files in os.walk(path)
+                for name in files
+                if name == "m5.cpt"
+            )
+            process_files(paths, **vars(args))
         # Maybe someone passed a cpt.XXXXXXX directory and not m5.cpt
         elif osp.isfile(cpt_file):
-            process_file(cpt_file, **vars(args))
+            process_files([cpt_file], **vars(args))
         else:
             print(f"Error: checkpoint file not found in {path} ")
             print("and recurse not specified")
@@ -85,6 +85,11 @@
 # 7,35666,1,COMP,3000::,4
 # 8,35670,1,STORE,1748748,4,74,0:,6,3:,7
 # 9,35670,1,COMP,500::,7
+#
+# If the output file ends in .npz, the trace is instead saved as a NumPy
+# structured array of the fields in protolib.INST_DEP_FIELDS, "records",
+# along with each repeated dependency field and its "<name>_offsets", with
+# the dependencies of record i in <name>[offsets[i]:offsets[i + 1]].
 
 import sys
 
@@ -118,9 +123,28 @@ except:
 
 def main():
     if len(sys.argv) != 3:
-        print("Usage: ", sys.argv[0], " <protobuf input> <ASCII output>")
+        print(
+            "Usage: ", sys.argv[0], " <protobuf input> <ASCII or .npz output>"
+        )
         exit(-1)
 
+    if sys.argv[2].endswith(".npz"):
+        import numpy
+
+        header, records, deps = protolib.instDepArrays(sys.argv[1])
+        # The header is printed, as in the ASCII output, rather than saved.
+        if header is not None:
+            header = inst_dep_record_pb2.InstDepRecordHeader.FromString(header)
+            print("Object id:", header.obj_id)
+            print("Tick frequency:", header.tick_freq)
+        arrays = {"records": records}
+        for name, (offsets, values) in deps.items():
+            arrays[f"{name}_offsets"] = offsets
+            arrays[name] = values
+        numpy.savez(sys.argv[2], **arrays)
+        print("Parsed packets:", len(records))
+        exit(0)
+
     # Open the file on read mode
     proto_in = protolib.openFileRd(sys.argv[1])
 
@@ -161,7 +185,8 @@ def main():
     packet = inst_dep_record_pb2.InstDepRecord()
 
     # Decode the packet messages until we hit the end of the file
-    while protolib.decodeMessage(proto_in, packet):
+    for message in protolib.readMessages(proto_in):
+        packet.ParseFromString(message)
         num_packets += 1
 
         # Write to file the seq num
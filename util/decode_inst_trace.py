@@ -125,7 +125,8 @@ def main():
         "size",
         "mem_flags",
     )
-    while protolib.decodeMessage(proto_in, inst):
+    for message in protolib.readMessages(proto_in):
+        inst.ParseFromString(message)
         # If we have a tick use it, otherwise count instructions
         if inst.HasField("tick"):
             tick = inst.tick
@@ -36,7 +36,9 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 # This script is used to dump protobuf packet traces to ASCII
-# format.
+# format, or, if the output file ends in .npy, to a NumPy structured array
+# with the fields in protolib.PACKET_FIELDS. In both cases, the header of
+# the trace is printed rather than written to the output.
 
 import os
 import subprocess
@@ -50,11 +52,31 @@ subprocess.check_call(["make", "--quiet", "-C", util_dir, "packet_pb2.py"])
 import packet_pb2
 
 
+def print_header(header):
+    print("Object id:", header.obj_id)
+    print("Tick frequency:", header.tick_freq)
+
+    for id_string in header.id_strings:
+        print("Master id %d: %s" % (id_string.key, id_string.value))
+
+
 def main():
     if len(sys.argv) != 3:
-        print("Usage: ", sys.argv[0], " <protobuf input> <ASCII output>")
+        print(
+            "Usage: ", sys.argv[0], " <protobuf input> <ASCII or .npy output>"
+        )
         exit(-1)
 
+    if sys.argv[2].endswith(".npy"):
+        import numpy
+
+        header, packets = protolib.packetArrays(sys.argv[1])
+        if header is not None:
+            print_header(packet_pb2.PacketHeader.FromString(header))
+        numpy.save(sys.argv[2], packets)
+        print("Parsed packets:", len(packets))
+        exit(0)
+
     # Open the file in read mode
     proto_in = protolib.openFileRd(sys.argv[1])
 
@@ -76,12 +98,7 @@ def main():
     # Add the packet header
     header = packet_pb2.PacketHeader()
     protolib.decodeMessage(proto_in, header)
-
-    print("Object id:", header.obj_id)
-    print("Tick frequency:", header.tick_freq)
-
-    for id_string in header.id_strings:
-        print("Master id %d: %s" % (id_string.key, id_string.value))
+    print_header(header)
 
     print("Parsing packets")
 
@@ -89,7 +106,8 @@ def main():
     packet = packet_pb2.Packet()
 
     # Decode the packet messages until we hit the end of the file
-    while protolib.decodeMessage(proto_in, packet):
+    for message in protolib.readMessages(proto_in):
+        packet.ParseFromString(message)
         num_packets += 1
         # ReadReq is 1 and WriteReq is 4 in src/mem/packet.hh Command enum
         cmd = "r" if packet.cmd == 1 else ("w" if packet.cmd == 4 else "u")
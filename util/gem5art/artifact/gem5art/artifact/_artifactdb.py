@@ -37,7 +37,10 @@ Some common queries can be found in common_queries.py
 import copy
 import json
 import os
+import re
 import shutil
+import sqlite3
+import threading
 from abc import (
     ABC,
     abstractmethod,
@@ -48,6 +51,7 @@ from typing import (
     Dict,
     Iterable,
     List,
+    Optional,
     Tuple,
     Type,
     Union,
@@ -223,13 +227,69 @@ class ArtifactMongoDB(ArtifactDB):
         yield from data
 
 
-class ArtifactFileDB(ArtifactDB):
+class _StorageDirectoryMixin:
+    """
+    Stores the files of artifacts in the directory given by the environment
+    variable GEM5ART_STORAGE, if any, named with their UUIDs.
+    """
+
+    _storage_enabled: bool
+    _storage_path: Path
+
+    def _init_storage(self) -> None:
+        storage_path = os.environ.get("GEM5ART_STORAGE", "")
+        self._storage_enabled = True if storage_path else False
+        self._storage_path = Path(storage_path)
+        if (
+            self._storage_enabled
+            and self._storage_path.exists()
+            and not self._storage_path.is_dir()
+        ):
+            raise Exception(
+                f"GEM5ART_STORAGE={storage_path} exists and is not a directory"
+            )
+        if self._storage_enabled:
+            os.makedirs(self._storage_path, exist_ok=True)
+
+    def upload(self, key: UUID, path: Path) -> None:
+        """Copy the artifact to the folder specified by GEM5ART_STORAGE."""
+        if not self._storage_enabled:
+            return
+        src_path = path
+        dst_path = self._storage_path / str(key)
+        if not dst_path.exists():
+            shutil.copy2(src_path, dst_path)
+
+    def downloadFile(self, key: UUID, path: Path) -> None:
+        """Copy the file from the storage to specified path."""
+        assert path.exists()
+        if not self._storage_enabled:
+            return
+        src_path = self._storage_path / str(key)
+        dst_path = path
+        shutil.copy2(src_path, dst_path)
+
+
+def _path_from_uri(uri: str) -> Path:
+    """Returns the path of a file://... or sqlite://... URI."""
+    parsed_uri = urlparse(uri)
+    # using urlparse to parse relative/absolute file path
+    # abs path: urlparse("file:///path/to/file") ->
+    #           (netloc='', path='/path/to/file')
+    # rel path: urlparse("file://path/to/file") ->
+    #           (netloc='path', path='/to/file')
+    # so, the filepath would be netloc+path for both cases
+    return Path(parsed_uri.netloc) / Path(parsed_uri.path)
+
+
+class ArtifactFileDB(_StorageDirectoryMixin, ArtifactDB):
     """
     This is a file-based database where Artifacts (as defined in artifacts.py)
     are stored in a JSON file.
 
     This database stores a list of serialized artifacts in a JSON file.
-    This database is not thread-safe.
+    This database is not thread-safe; see ArtifactSQLiteDB for a database
+    which is.
 
     If the user specifies a valid path in the environment variable
     GEM5ART_STORAGE then this database will copy all artifacts to that
@@ -245,34 +305,13 @@ class ArtifactFileDB(ArtifactDB):
     _json_file: Path
     _uuid_artifact_map: Dict[str, Dict[str, str]]
     _hash_uuid_map: Dict[str, List[str]]
-    _storage_enabled: bool
-    _storage_path: Path
 
     def __init__(self, uri: str) -> None:
         """Initialize the file-driven database from a JSON file.
         If the file doesn't exist, a new file will be created.
         """
-        parsed_uri = urlparse(uri)
-        # using urlparse to parse relative/absolute file path
-        # abs path: urlparse("file:///path/to/file") ->
-        #           (netloc='', path='/path/to/file')
-        # rel path: urlparse("file://path/to/file") ->
-        #           (netloc='path', path='/to/file')
-        # so, the filepath would be netloc+path for both cases
-        self._json_file = Path(parsed_uri.netloc) / Path(parsed_uri.path)
-        storage_path = os.environ.get("GEM5ART_STORAGE", "")
-        self._storage_enabled = True if storage_path else False
-        self._storage_path = Path(storage_path)
-        if (
-            self._storage_enabled
-            and self._storage_path.exists()
-            and not self._storage_path.is_dir()
-        ):
-            raise Exception(
-                f"GEM5ART_STORAGE={storage_path} exists and is not a directory"
-            )
-        if self._storage_enabled:
-            os.makedirs(self._storage_path, exist_ok=True)
+        self._json_file = _path_from_uri(uri)
+        self._init_storage()
 
         self._uuid_artifact_map, self._hash_uuid_map = self._load_from_file(
             self._json_file
@@ -284,15 +323,6 @@ class ArtifactFileDB(ArtifactDB):
         assert isinstance(artifact["hash"], str)
         self.insert_artifact(key, artifact["hash"], artifact)
 
-    def upload(self, key: UUID, path: Path) -> None:
-        """Copy the artifact to the folder specified by GEM5ART_STORAGE."""
-        if not self._storage_enabled:
-            return
-        src_path = path
-        dst_path = self._storage_path / str(key)
-        if not dst_path.exists():
-            shutil.copy2(src_path, dst_path)
-
     def __contains__(self, key: Union[UUID, str]) -> bool:
         """Key can be a UUID or a string. Returns true if item in DB"""
         if isinstance(key, UUID):
@@ -311,15 +341,6 @@ class ArtifactFileDB(ArtifactDB):
             artifact = list(self.get_artifact_by_hash(key))
         return artifact[0]
 
-    def downloadFile(self, key: UUID, path: Path) -> None:
-        """Copy the file from the storage to specified path."""
-        assert path.exists()
-        if not self._storage_enabled:
-            return
-        src_path = self._storage_path / str(key)
-        dst_path = path
-        shutil.copy2(src_path, dst_path)
-
     def _load_from_file(
         self, json_file: Path
     ) -> Tuple[Dict[str, Dict[str, str]], Dict[str, List[str]]]:
@@ -401,6 +422,194 @@ class ArtifactFileDB(ArtifactDB):
                 yield artifact
 
 
+class ArtifactSQLiteDB(_StorageDirectoryMixin, ArtifactDB):
+    """
+    This is a database where Artifacts (as defined in artifact.py) are
+    stored in an SQLite database file.
+
+    Each artifact is stored as a JSON document, along with its UUID, hash,
+    name and type in indexed columns, so looking artifacts up by any of
+    those doesn't scan the database and adding one doesn't rewrite it. The
+    database uses write-ahead logging, so it can be read and written by
+    several processes (e.g., the jobs of run_job_pool) at once.
+
+    As with ArtifactFileDB, if the user specifies a valid path in the
+    environment variable GEM5ART_STORAGE then this database will copy all
+    artifacts to that directory named with their UUIDs.
+    """
+
+    # The attributes of artifacts which have their own columns.
+    _columns = {"_id": "id", "hash": "hash", "name": "name", "type": "type"}
+
+    _schema = """
+        CREATE TABLE IF NOT EXISTS artifacts (
+            id TEXT PRIMARY KEY,
+            hash TEXT NOT NULL,
+            name TEXT,
+            type TEXT,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS artifacts_hash ON artifacts (hash);
+        CREATE INDEX IF NOT EXISTS artifacts_name ON artifacts (name);
+        CREATE INDEX IF NOT EXISTS artifacts_type_name
+            ON artifacts (type, name);
+    """
+
+    def __init__(self, uri: str) -> None:
+        """Initialize the database from an SQLite file, given as
+        sqlite:///path/to/file or sqlite://relative/path. If the file doesn't
+        exist, a new database will be created.
+        """
+        self._db_file = _path_from_uri(uri)
+        self._init_storage()
+        # SQLite connections can't be shared between threads, or used
+        # after a fork, so each thread of each process has its own.
+        self._local = threading.local()
+        with self._connection() as connection:
+            connection.executescript(self._schema)
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != os.getpid():
+            # Wait for other writers for up to a minute.
+            connection = sqlite3.connect(self._db_file, timeout=60)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.create_function("regexp", 2, _regexp)
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    @staticmethod
+    def _row(artifact: Dict[str, Any]) -> Tuple[str, str, Any, Any, str]:
+        return (
+            str(artifact["_id"]),
+            artifact["hash"],
+            artifact.get("name"),
+            artifact.get("type"),
+            json.dumps(artifact, cls=ArtifactFileDB.ArtifactEncoder),
+        )
+
+    def _query(
+        self, where: str, params: Iterable[Any], limit: int = 0
+    ) -> Iterable[Dict[str, Any]]:
+        query = f"SELECT data FROM artifacts WHERE {where} ORDER BY rowid"
+        if limit:
+            query += f" LIMIT {int(limit)}"
+        for (data,) in self._connection().execute(query, tuple(params)):
+            yield json.loads(data)
+
+    def put(self, key: UUID, artifact: Dict[str, Union[str, UUID]]) -> None:
+        """Insert the artifact into the database with the key."""
+        assert artifact["_id"] == key
+        assert isinstance(artifact["hash"], str)
+        self.insert_artifacts([artifact])
+
+    def insert_artifacts(self, artifacts: Iterable[Dict[str, Any]]) -> int:
+        """
+        Put the artifacts to the database in one transaction, skipping any
+        whose UUID is already in it. Returns the number of artifacts added.
+        """
+        with self._connection() as connection:
+            return connection.executemany(
+                "INSERT OR IGNORE INTO artifacts VALUES (?, ?, ?, ?, ?)",
+                (self._row(artifact) for artifact in artifacts),
+            ).rowcount
+
+    def __contains__(self, key: Union[UUID, str]) -> bool:
+        """Key can be a UUID or a string. Returns true if item in DB"""
+        return self._get(key) is not None
+
+    def _get(self, key: Union[UUID, str]) -> Optional[Dict[str, Any]]:
+        if isinstance(key, UUID):
+            where, value = "id = ?", str(key)
+        else:
+            # This is a hash.
+            where, value = "hash = ?", key
+        return next(iter(self._query(where, [value], limit=1)), None)
+
+    def get(self, key: Union[UUID, str]) -> Dict[str, str]:
+        """Key can be a UUID or a string. Returns a dictionary to construct
+        an artifact.
+        """
+        return self._get(key)  # type: ignore
+
+    def searchByName(self, name: str, limit: int) -> Iterable[Dict[str, Any]]:
+        """Returns an iterable of all artifacts in the database that match
+        some name."""
+        yield from self._query("name = ?", [name], limit)
+
+    def searchByType(self, typ: str, limit: int) -> Iterable[Dict[str, Any]]:
+        """Returns an iterable of all artifacts in the database that match
+        some type."""
+        yield from self._query("type = ?", [typ], limit)
+
+    def searchByNameType(
+        self, name: str, typ: str, limit: int
+    ) -> Iterable[Dict[str, Any]]:
+        """Returns an iterable of all artifacts in the database that match
+        some name and type."""
+        yield from self._query("type = ? AND name = ?", [typ, name], limit)
+
+    def searchByLikeNameType(
+        self, name: str, typ: str, limit: int
+    ) -> Iterable[Dict[str, Any]]:
+        """Returns an iterable of all artifacts in the database that match
+        some type and a regex name."""
+        yield from self._query(
+            "type = ? AND name REGEXP ?", [typ, name], limit
+        )
+
+    def find_exact(
+        self, attr: Dict[str, Any], limit: int
+    ) -> Iterable[Dict[str, Any]]:
+        """
+        Return all artifacts such that, for every yielded artifact,
+        and for every (k,v) in attr, the attribute `k` of the artifact has
+        the value of `v`.
+        """
+        conditions = []
+        params = []
+        filtered = False
+        for key, value in attr.items():
+            if key in self._columns and isinstance(value, (str, UUID)):
+                conditions.append(f"{self._columns[key]} = ?")
+                params.append(str(value))
+            elif isinstance(value, (str, int, float)) and re.fullmatch(
+                r"[A-Za-z_]\w*", key
+            ):
+                conditions.append(f"json_extract(data, '$.{key}') = ?")
+                params.append(value)
+            else:
+                filtered = True
+        where = " AND ".join(conditions) or "1"
+        count = 0
+        for artifact in self._query(where, params, 0 if filtered else limit):
+            # Values which aren't strings or numbers (and the types of
+            # those which are) are checked here.
+            if attr.items() <= artifact.items():
+                yield artifact
+                count += 1
+                if count == limit:
+                    return
+
+
+def _regexp(pattern: str, value: Optional[str]) -> bool:
+    """The REGEXP function of SQLite, as an unanchored search."""
+    return value is not None and re.search(pattern, value) is not None
+
+
+def migrateFileDB(json_file: Path, sqlite_uri: str) -> int:
+    """
+    Copies the artifacts in the JSON file of an ArtifactFileDB to the
+    ArtifactSQLiteDB at sqlite_uri, skipping those already in it. Returns the
+    number of artifacts copied. The files of the artifacts stay where they
+    are, in GEM5ART_STORAGE.
+    """
+    with open(json_file) as f:
+        artifacts = json.load(f)
+    return ArtifactSQLiteDB(sqlite_uri).insert_artifacts(artifacts)
+
+
 _db = None
 
 if MONGO_SUPPORT:
@@ -408,7 +617,10 @@ if MONGO_SUPPORT:
 else:
     _default_uri = "file://db.json"
 
-_db_schemes: Dict[str, Type[ArtifactDB]] = {"file": ArtifactFileDB}
+_db_schemes: Dict[str, Type[ArtifactDB]] = {
+    "file": ArtifactFileDB,
+    "sqlite": ArtifactSQLiteDB,
+}
 if MONGO_SUPPORT:
     _db_schemes["mongodb"] = ArtifactMongoDB
 
@@ -425,6 +637,10 @@ def _getDBType(uri: str) -> Type[ArtifactDB]:
             A simple flat file database with optional storage for the binary
             artifacts. The filepath is where the json file is stored and the
             data storage can be specified with GEM5ART_STORAGE
+        **ArtifactSQLiteDB**: sqlite://...
+            An indexed SQLite database which can be shared by concurrent
+            jobs. The filepath is where the database is stored and the data
+            storage can be specified with GEM5ART_STORAGE
     """
     result = urlparse(uri)
     if result.scheme in _db_schemes:
@@ -28,7 +28,10 @@
 
 import hashlib
 import json
+import os
+import sqlite3
 import subprocess
+import threading
 import time
 from inspect import cleandoc
 from pathlib import Path
@@ -37,6 +40,7 @@ from typing import (
     Dict,
     List,
     Optional,
+    Tuple,
     Union,
 )
 from uuid import (
@@ -47,10 +51,7 @@ from uuid import (
 from ._artifactdb import getDBConnection
 
 
-def getHash(path: Path) -> str:
-    """
-    Returns an md5 hash for the file in self.path.
-    """
+def _md5File(path: Path) -> str:
     BUF_SIZE = 65536
     md5 = hashlib.md5()
     with open(path, "rb") as f:
@@ -63,6 +64,98 @@ def getHash(path: Path) -> str:
     return md5.hexdigest()
 
 
+class _HashCache:
+    """
+    A persistent cache of the md5 hashes of files, keyed by their absolute
+    path, size and modification time, so the same disk image or binary
+    isn't re-read every time it is registered.
+
+    The cache is an SQLite database, so it can be shared by concurrent
+    processes. It is stored in the file given by the environment variable
+    GEM5ART_HASH_CACHE, or ~/.cache/gem5art/hashes.sqlite by default; set
+    GEM5ART_HASH_CACHE to an empty string to disable it.
+    """
+
+    # Files modified less than this many seconds before they are hashed
+    # aren't cached, as they could be modified again without their size or
+    # modification time changing.
+    SETTLE_TIME = 2
+
+    def __init__(self) -> None:
+        self._memo: Dict[Tuple[str, int, int], str] = {}
+        self._local = threading.local()
+
+    def _path(self) -> Optional[Path]:
+        default = Path.home() / ".cache" / "gem5art" / "hashes.sqlite"
+        path = os.environ.get("GEM5ART_HASH_CACHE", str(default))
+        return Path(path) if path else None
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        path = self._path()
+        if path is None:
+            return None
+        key = (path, os.getpid())
+        if getattr(self._local, "key", None) != key:
+            self._local.key = key
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                connection = sqlite3.connect(path, timeout=60)
+                connection.execute("PRAGMA journal_mode=WAL")
+                with connection:
+                    connection.execute(
+                        "CREATE TABLE IF NOT EXISTS hashes (path TEXT "
+                        "PRIMARY KEY, size INTEGER, mtime INTEGER, hash TEXT)"
+                    )
+                self._local.connection = connection
+            except (OSError, sqlite3.Error):
+                # Hash without the cache if it can't be used.
+                self._local.connection = None
+        return self._local.connection
+
+    def getHash(self, path: Path) -> str:
+        stat = path.stat()
+        key = (str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+        if key in self._memo:
+            return self._memo[key]
+
+        connection = self._connection()
+        if connection is not None:
+            row = connection.execute(
+                "SELECT hash FROM hashes WHERE path = ? AND size = ? "
+                "AND mtime = ?",
+                key,
+            ).fetchone()
+            if row is not None:
+                self._memo[key] = row[0]
+                return row[0]
+
+        md5 = _md5File(path)
+        if time.time() - stat.st_mtime < self.SETTLE_TIME:
+            return md5
+        self._memo[key] = md5
+        if connection is not None:
+            try:
+                with connection:
+                    connection.execute(
+                        "INSERT OR REPLACE INTO hashes VALUES (?, ?, ?, ?)",
+                        key + (md5,),
+                    )
+            except sqlite3.Error:
+                pass
+        return md5
+
+
+_hash_cache = _HashCache()
+
+
+def getHash(path: Path) -> str:
+    """
+    Returns an md5 hash for the file in self.path. The hash is cached, and
+    the file is only read again if its size or modification time changes.
+    """
+    return _hash_cache.getHash(Path(path))
+
+
 def getGit(path: Path) -> Dict[str, str]:
     """
     Returns dictionary with origin, current commit, and repo name for the
@@ -23,3 +23,13 @@
 # THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import os
+import tempfile
+
+# Keep the hashes of the files the tests register out of the user's cache
+# (see gem5art.artifact.artifact._HashCache).
+_hash_cache_dir = tempfile.TemporaryDirectory()
+os.environ["GEM5ART_HASH_CACHE"] = os.path.join(
+    _hash_cache_dir.name, "hashes.sqlite"
+)
@@ -28,9 +28,12 @@
 
 import hashlib
 import io
+import os
 import sys
+import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 from uuid import (
     UUID,
     uuid4,
@@ -101,6 +104,40 @@ class TestGit(unittest.TestCase):
         )
 
 
+class TestHash(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.dir.name) / "file"
+        self.path.write_bytes(b"original")
+        os.utime(self.path, (1000000000, 1000000000))
+        environ = patch.dict(
+            os.environ,
+            {"GEM5ART_HASH_CACHE": str(Path(self.dir.name) / "hashes.sqlite")},
+        )
+        environ.start()
+        self.addCleanup(environ.stop)
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_cached(self):
+        original = hashlib.md5(b"original").hexdigest()
+        self.assertEqual(artifact.artifact.getHash(self.path), original)
+
+        # A change which keeps the size and time isn't seen, even by a new
+        # process, as the hash comes from the cache.
+        self.path.write_bytes(b"modified")
+        os.utime(self.path, (1000000000, 1000000000))
+        artifact.artifact._hash_cache._memo.clear()
+        self.assertEqual(artifact.artifact.getHash(self.path), original)
+
+        os.utime(self.path, (1000000001, 1000000001))
+        self.assertEqual(
+            artifact.artifact.getHash(self.path),
+            hashlib.md5(b"modified").hexdigest(),
+        )
+
+
 class TestArtifact(unittest.TestCase):
     def setUp(self):
         self.artifact = artifact.Artifact(
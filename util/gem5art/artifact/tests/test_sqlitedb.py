@@ -0,0 +1,128 @@
+# Copyright (c) 2024 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Tests for ArtifactSQLiteDB"""
+
+
+import json
+import os
+import unittest
+from uuid import (
+    UUID,
+    uuid4,
+)
+
+from gem5art.artifact import Artifact
+from gem5art.artifact._artifactdb import (
+    getDBConnection,
+    migrateFileDB,
+)
+
+
+class TestArtifactSQLiteDB(unittest.TestCase):
+    def setUp(self):
+        self.db = getDBConnection("sqlite://test.sqlite")
+
+        with open("test-file.txt", "w") as f:
+            f.write("This is a test file.")
+
+        self.artifact = Artifact.registerArtifact(
+            name=f"test-artifact",
+            typ="text",
+            path=f"test-file.txt",
+            cwd="./",
+            command='echo "This is a test file" > test-file.txt',
+            inputs=[],
+            documentation=f"This artifact is made for testing.",
+        )
+
+    def tearDown(self):
+        os.remove("test-file.txt")
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(f"test.sqlite{suffix}"):
+                os.remove(f"test.sqlite{suffix}")
+
+    def test_get(self):
+        self.assertIn(self.artifact._id, self.db)
+        self.assertIn(self.artifact.hash, self.db)
+        self.assertNotIn(uuid4(), self.db)
+        artifact = self.db.get(self.artifact.hash)
+        self.assertEqual(UUID(artifact["_id"]), self.artifact._id)
+        self.assertEqual(Artifact(artifact).name, "test-artifact")
+
+    def test_register_again(self):
+        artifact = Artifact.registerArtifact(
+            name=f"test-artifact",
+            typ="text",
+            path=f"test-file.txt",
+            cwd="./",
+            command='echo "This is a test file" > test-file.txt',
+            inputs=[],
+            documentation=f"This artifact is made for testing.",
+        )
+        self.assertEqual(artifact._id, self.artifact._id)
+        self.assertEqual(len(list(self.db.searchByType("text", 0))), 1)
+
+    def test_search(self):
+        self.assertEqual(
+            len(list(self.db.searchByName("test-artifact", 0))), 1
+        )
+        self.assertEqual(
+            len(list(self.db.searchByNameType("test-artifact", "text", 0))), 1
+        )
+        self.assertEqual(
+            len(list(self.db.searchByLikeNameType("artifact$", "text", 0))), 1
+        )
+        self.assertEqual(
+            len(list(self.db.searchByLikeNameType("^artifact", "text", 0))), 0
+        )
+        self.assertEqual(
+            len(list(self.db.find_exact({"cwd": ".", "type": "text"}, 1))), 1
+        )
+        self.assertEqual(
+            len(list(self.db.find_exact({"inputs": [], "type": "text"}, 1))),
+            1,
+        )
+        self.assertEqual(
+            len(list(self.db.find_exact({"cwd": "/", "type": "text"}, 1))), 0
+        )
+
+    def test_migrate(self):
+        artifacts = [
+            {"_id": str(uuid4()), "hash": str(i), "name": "a", "type": "b"}
+            for i in range(10)
+        ]
+        with open("test.json", "w") as f:
+            json.dump(artifacts, f)
+        try:
+            copied = migrateFileDB("test.json", "sqlite://test.sqlite")
+            self.assertEqual(copied, 10)
+            copied = migrateFileDB("test.json", "sqlite://test.sqlite")
+            self.assertEqual(copied, 0)
+        finally:
+            os.remove("test.json")
+        self.assertEqual(len(list(self.db.searchByNameType("a", "b", 5))), 5)
+        self.assertIn("9", self.db)
@@ -33,12 +33,14 @@ experiment is reproducible and the output is saved to the database.
 """
 
 import hashlib
+import itertools
 import json
 import os
 import signal
 import subprocess
 import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import (
     Any,
@@ -59,6 +61,98 @@ from gem5art import artifact
 from gem5art.artifact import Artifact
 from gem5art.artifact._artifactdb import ArtifactDB
 
+# Files which are already compressed, e.g. the memory images of
+# checkpoints, are stored in the results archive rather than compressed
+# again. They are recognized by their first bytes (gzip, bzip2, xz, zstd
+# and zip) or their suffix.
+_COMPRESSED_MAGIC = (
+    b"\x1f\x8b",
+    b"BZh",
+    b"\xfd7zXZ\x00",
+    b"\x28\xb5\x2f\xfd",
+    b"PK\x03\x04",
+)
+_COMPRESSED_SUFFIXES = {
+    ".gz",
+    ".bz2",
+    ".xz",
+    ".zst",
+    ".zip",
+    ".7z",
+    ".png",
+    ".jpg",
+    ".jpeg",
+}
+
+
+def _isCompressed(path: Path) -> bool:
+    if path.suffix.lower() in _COMPRESSED_SUFFIXES:
+        return True
+    with open(path, "rb") as f:
+        start = f.read(6)
+    return start.startswith(_COMPRESSED_MAGIC)
+
+
+def _prepareFile(path: Path) -> int:
+    """Returns the compression type for path in the results archive, and
+    asks the OS to start reading the file into its cache, so it is read
+    while the files before it are compressed."""
+    if _isCompressed(path):
+        compress_type = zipfile.ZIP_STORED
+    else:
+        compress_type = zipfile.ZIP_DEFLATED
+    if hasattr(os, "posix_fadvise"):
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+    return compress_type
+
+
+def zipDirectory(
+    directory: Path,
+    zip_path: Path,
+    compression_level: int = 6,
+    jobs: Optional[int] = None,
+) -> None:
+    """Zips up directory, including its name, into zip_path (which is
+    skipped if it is in directory).
+
+    Files which are already compressed are stored as they are. While a
+    file is compressed, the next jobs files (by default, one per CPU) are
+    read ahead by a pool of threads.
+    """
+    directory = Path(directory)
+    zip_path = Path(zip_path)
+    paths = [
+        path
+        for path in sorted(directory.glob("**/*"))
+        if path.resolve() != zip_path.resolve()
+    ]
+    files = iter([path for path in paths if path.is_file()])
+    jobs = jobs or os.cpu_count() or 1
+    with ThreadPoolExecutor(jobs) as pool, zipfile.ZipFile(
+        zip_path,
+        "w",
+        zipfile.ZIP_DEFLATED,
+        compresslevel=compression_level,
+    ) as zipf:
+        # At most jobs files are prepared ahead of the one written.
+        prepared = {
+            path: pool.submit(_prepareFile, path)
+            for path in itertools.islice(files, jobs)
+        }
+        for path in paths:
+            arcname = path.relative_to(directory.parent)
+            if path not in prepared:
+                zipf.write(path, arcname)
+                continue
+            compress_type = prepared.pop(path).result()
+            for next_path in itertools.islice(files, 1):
+                prepared[next_path] = pool.submit(_prepareFile, next_path)
+            zipf.write(path, arcname, compress_type)
+
 
 class gem5Run:
     """
@@ -106,6 +200,13 @@ class gem5Run:
     results: Optional[Artifact]
     artifacts: List[Artifact]
 
+    # The zlib compression level of the results archive, and the number of
+    # files read ahead while it is compressed (by default, one per CPU).
+    # When many runs are in parallel, e.g. in run_job_pool, fewer may be
+    # better.
+    results_compression_level: int = 6
+    results_jobs: Optional[int] = None
+
     rerunnable: bool
 
     @classmethod
@@ -592,17 +693,26 @@ class gem5Run:
         # TODO: remove the old runs?
         self._run(task, cwd)
 
-    def saveResults(self) -> None:
+    def saveResults(
+        self,
+        compression_level: Optional[int] = None,
+        jobs: Optional[int] = None,
+    ) -> None:
         """Zip up the output directory and store the results in the
-        database."""
-
-        with zipfile.ZipFile(
-            self.outdir / "results.zip", "w", zipfile.ZIP_DEFLATED
-        ) as zipf:
-            for path in self.outdir.glob("**/*"):
-                if path.name == "results.zip":
-                    continue
-                zipf.write(path, path.relative_to(self.outdir.parent))
+        database.
+
+        compression_level (0-9) and jobs, the number of files read ahead
+        while the archive is compressed, default to
+        results_compression_level and results_jobs.
+        """
+        if compression_level is None:
+            compression_level = self.results_compression_level
+        zipDirectory(
+            self.outdir,
+            self.outdir / "results.zip",
+            compression_level,
+            jobs or self.results_jobs,
+        )
 
         self.results = Artifact.registerArtifact(
             command=f"zip results.zip -r {self.outdir}",
@@ -26,14 +26,20 @@
 
 """Tests for gem5Run object"""
 
+import gzip
 import hashlib
 import os
+import tempfile
 import unittest
+import zipfile
 from pathlib import Path
 from uuid import uuid4
 
 from gem5art.artifact import artifact
-from gem5art.run import gem5Run
+from gem5art.run import (
+    gem5Run,
+    zipDirectory,
+)
 
 
 class TestSERun(unittest.TestCase):
@@ -120,5 +126,38 @@ class TestSERun(unittest.TestCase):
         )
 
 
+class TestZipDirectory(unittest.TestCase):
+    def test_zip(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            outdir = Path(tmpdir) / "out"
+            (outdir / "cpt").mkdir(parents=True)
+            stats = "\n".join(str(i) for i in range(10000)).encode()
+            (outdir / "stats.txt").write_bytes(stats)
+            pmem = gzip.compress(os.urandom(10000))
+            (outdir / "cpt" / "system.physmem.store0.pmem").write_bytes(pmem)
+            zip_path = outdir / "results.zip"
+            zipDirectory(outdir, zip_path, compression_level=1, jobs=1)
+
+            with zipfile.ZipFile(zip_path) as zipf:
+                self.assertIsNone(zipf.testzip())
+                self.assertEqual(
+                    sorted(zipf.namelist()),
+                    [
+                        "out/cpt/",
+                        "out/cpt/system.physmem.store0.pmem",
+                        "out/stats.txt",
+                    ],
+                )
+                self.assertEqual(zipf.read("out/stats.txt"), stats)
+                info = zipf.getinfo("out/stats.txt")
+                self.assertEqual(info.compress_type, zipfile.ZIP_DEFLATED)
+                # The checkpoint is already compressed.
+                info = zipf.getinfo("out/cpt/system.physmem.store0.pmem")
+                self.assertEqual(info.compress_type, zipfile.ZIP_STORED)
+                self.assertEqual(
+                    zipf.read("out/cpt/system.physmem.store0.pmem"), pmem
+                )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,142 @@
+#! /usr/bin/env python3
+# Copyright (c) 2024 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Compares the time and memory taken to write the JSON statistics of a 64-core
+system via the PyStats object tree (``get_simstat(...).dump(...)``) and via
+the streaming writer (``dump_simstat_json``), and checks that both produce
+the same output.
+
+It must be run by an X86 build of gem5, e.g.:
+    build/X86/gem5.opt util/json-stats-benchmark.py --cores 64
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+import tracemalloc
+
+if __name__ == "__main__":
+    print("ERROR: This file must be run from gem5.", file=sys.stderr)
+    sys.exit(1)
+
+import m5
+from m5.objects import *
+from m5.stats.gem5stats import (
+    dump_simstat_json,
+    get_simstat,
+)
+
+parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+parser.add_argument(
+    "--cores", type=int, default=64, help="The number of CPU cores."
+)
+parser.add_argument(
+    "--ticks",
+    type=int,
+    default=10**9,
+    help="The number of ticks to simulate before dumping the stats.",
+)
+parser.add_argument(
+    "-r",
+    "--repeats",
+    type=int,
+    default=3,
+    help="The number of times each dump is repeated.",
+)
+args = parser.parse_args()
+
+binary = os.path.join(
+    os.path.dirname(os.path.realpath(__file__)),
+    "..",
+    "tests/test-progs/hello/bin/x86/linux/hello",
+)
+
+system = System()
+system.clk_domain = SrcClockDomain(
+    clock="1GHz", voltage_domain=VoltageDomain()
+)
+system.mem_mode = "timing"
+system.mem_ranges = [AddrRange("512MiB")]
+system.membus = SystemXBar()
+system.cpu = [X86TimingSimpleCPU(cpu_id=i) for i in range(args.cores)]
+for i, cpu in enumerate(system.cpu):
+    cpu.icache_port = system.membus.cpu_side_ports
+    cpu.dcache_port = system.membus.cpu_side_ports
+    cpu.createInterruptController()
+    cpu.interrupts[0].pio = system.membus.mem_side_ports
+    cpu.interrupts[0].int_requestor = system.membus.cpu_side_ports
+    cpu.interrupts[0].int_responder = system.membus.mem_side_ports
+    cpu.workload = Process(pid=100 + i, cmd=[binary])
+    cpu.createThreads()
+system.mem_ctrl = MemCtrl(dram=DDR3_1600_8x8(range=system.mem_ranges[0]))
+system.mem_ctrl.port = system.membus.mem_side_ports
+system.system_port = system.membus.cpu_side_ports
+system.workload = SEWorkload.init_compatible(binary)
+
+root = Root(full_system=False, system=system)
+m5.instantiate()
+m5.simulate(args.ticks)
+m5.stats.prepare()
+
+
+def pystats_dump(fp):
+    get_simstat(root, prepare_stats=False).dump(fp=fp)
+
+
+def streaming_dump(fp):
+    dump_simstat_json(root, fp, prepare_stats=False)
+
+
+outputs = {}
+print(f"{'writer':<12}{'time (s)':>10}{'peak memory (MiB)':>20}")
+for name, dump in (("pystats", pystats_dump), ("streaming", streaming_dump)):
+    path = os.path.join(m5.options.outdir, f"stats-{name}.json")
+    times = []
+    for _ in range(args.repeats):
+        with open(path, "w") as fp:
+            start = time.perf_counter()
+            dump(fp)
+            times.append(time.perf_counter() - start)
+
+    # Measure the memory separately, as tracing slows the dump down.
+    tracemalloc.start()
+    with open(path, "w") as fp:
+        dump(fp)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    with open(path) as fp:
+        # The creation time is the only part of the output allowed to differ.
+        outputs[name] = re.sub(r'"creation_time": "[^"]*"', "", fp.read())
+    print(f"{name:<12}{min(times):>10.3f}{peak / 2**20:>20.1f}")
+
+if outputs["pystats"] != outputs["streaming"]:
+    print("ERROR: The JSON outputs differ.", file=sys.stderr)
+    sys.exit(1)
@@ -87,6 +87,13 @@ if __name__ == "__main__":
         default=None,
         help="time of last event to load from file",
     )
+    parser.add_argument(
+        "--index",
+        action="store_true",
+        default=False,
+        help="index the event file (in <event-file>.idx, the first time) "
+        + "and only read the part of it from the start to the end time",
+    )
     parser.add_argument(
         "--mini-views",
         action="store_true",
@@ -125,8 +132,12 @@ if __name__ == "__main__":
     if args.eventFile and os.access(args.eventFile, os.O_RDONLY):
         controller.startTime = args.start_time
         controller.endTime = args.end_time
+        controller.useIndex = args.index
         model.load_events(
-            args.eventFile, startTime=args.start_time, endTime=args.end_time
+            args.eventFile,
+            startTime=args.start_time,
+            endTime=args.end_time,
+            index=args.index,
         )
         controller.set_time_index(0)
     else:
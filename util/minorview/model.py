@@ -37,6 +37,8 @@ import os
 import re
 from time import time as wall_time
 
+import trace_index
+
 from . import (
     blobs,
     colours,
@@ -810,8 +812,10 @@ class BlobModel:
 
             self.add_line(LineFault(id, pairs["fault"], vaddr, other_pairs))
 
-    def load_events(self, file, startTime=0, endTime=None):
-        """Load an event file and add everything to this model"""
+    def load_events(self, file, startTime=0, endTime=None, index=False):
+        """Load an event file and add everything to this model. If index
+        is set, the file is indexed (if it hasn't been already) and only
+        the part of it from startTime to endTime is read"""
 
         def update_comments(comments, time):
             # Add a list of comments to an existing event, if there is one at
@@ -851,7 +855,12 @@ class BlobModel:
         else:
             print("Opening file", file)
 
-        f = open(file)
+        if index:
+            f = trace_index.openTrace(
+                file, trace_index.MINOR_TRACE, "tick", startTime, endTime
+            )
+        else:
+            f = trace_index.openTrace(file)
 
         start_wall_time = wall_time()
 
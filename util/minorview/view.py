@@ -214,6 +214,7 @@ class BlobController:
         self.defaultEventFile = defaultEventFile
         self.startTime = None
         self.endTime = None
+        self.useIndex = False
 
         self.otherViews = []
 
@@ -362,6 +363,7 @@ class BlobController:
             self.filenameEntry.get_text(),
             startTime=self.startTime,
             endTime=self.endTime,
+            index=self.useIndex,
         )
         self.set_time_index(
             min(len(self.model.times) - 1, self.view.timeIndex)
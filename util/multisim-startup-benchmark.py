@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# Copyright (c) 2024 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Measures the time taken by gem5's MultiSim to run a sweep of many short
+simulations, with each simulation started in a new gem5 process (the
+default) and with the simulations forked from a single gem5 process which
+loaded the config script once (`--fork-server`). The per-simulation times
+are read from the `multisim_summary.json` MultiSim writes, so the
+difference between the modes is the start-up time saved for each
+simulation.
+
+Usage:
+    util/multisim-startup-benchmark.py build/X86/gem5.opt -n 200
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import tempfile
+import time
+
+# The config script of the sweep. As MultiSim config scripts cannot take
+# parameters, the number of simulations is passed in the environment.
+config = """
+import os
+
+import gem5.utils.multisim as multisim
+from gem5.components.boards.simple_board import SimpleBoard
+from gem5.components.cachehierarchies.classic.no_cache import NoCache
+from gem5.components.memory import SingleChannelDDR3_1600
+from gem5.components.processors.cpu_types import CPUTypes
+from gem5.components.processors.simple_processor import SimpleProcessor
+from gem5.isas import ISA
+from gem5.resources.resource import obtain_resource
+from gem5.simulate.simulator import Simulator
+
+multisim.set_num_processes(int(os.environ["BENCHMARK_PROCESSES"]))
+
+binary = obtain_resource("x86-print-this")
+for i in range(int(os.environ["BENCHMARK_SIMULATIONS"])):
+    board = SimpleBoard(
+        clk_freq="1GHz",
+        processor=SimpleProcessor(
+            cpu_type=CPUTypes.ATOMIC, isa=ISA.X86, num_cores=1
+        ),
+        memory=SingleChannelDDR3_1600(size="32MiB"),
+        cache_hierarchy=NoCache(),
+    )
+    board.set_se_binary_workload(binary=binary, arguments=[f"sim {i}", 1])
+    multisim.add_simulator(Simulator(board=board, id=f"sim_{i}"))
+"""
+
+parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+parser.add_argument("gem5", help="The gem5 binary to benchmark.")
+parser.add_argument(
+    "-n",
+    "--simulations",
+    type=int,
+    default=200,
+    help="The number of simulations in the sweep.",
+)
+parser.add_argument(
+    "-j",
+    "--processes",
+    type=int,
+    default=os.cpu_count(),
+    help="The number of simulations to run in parallel.",
+)
+args = parser.parse_args()
+
+env = dict(
+    os.environ,
+    BENCHMARK_SIMULATIONS=str(args.simulations),
+    BENCHMARK_PROCESSES=str(args.processes),
+)
+
+print(
+    f"{'mode':<14}{'total (s)':>12}{'per sim (s)':>14}"
+    f"{'max RSS (MiB)':>16}{'failed':>8}"
+)
+results = {}
+for mode, flags in (("spawn", []), ("fork-server", ["--fork-server"])):
+    with tempfile.TemporaryDirectory() as outdir:
+        config_file = os.path.join(outdir, "sweep.py")
+        with open(config_file, "w") as f:
+            f.write(config)
+
+        start = time.perf_counter()
+        subprocess.run(
+            [args.gem5, "-q", "--outdir", outdir, "-m", "gem5.utils.multisim"]
+            + flags
+            + [config_file],
+            env=env,
+            cwd=outdir,
+            check=True,
+            capture_output=True,
+        )
+        total = time.perf_counter() - start
+
+        with open(os.path.join(outdir, "multisim_summary.json")) as f:
+            summary = json.load(f)
+
+    per_sim = statistics.mean(sim["wall_time"] for sim in summary)
+    rss = [sim["max_rss"] for sim in summary if sim["max_rss"] is not None]
+    failed = sum(sim["exit_code"] != 0 for sim in summary)
+    results[mode] = per_sim
+    print(
+        f"{mode:<14}{total:>12.2f}{per_sim:>14.3f}"
+        f"{statistics.mean(rss) / 2**20 if rss else 0:>16.1f}{failed:>8}"
+    )
+
+print(
+    "Start-up time saved per simulation: "
+    f"{results['spawn'] - results['fork-server']:.3f}s"
+)
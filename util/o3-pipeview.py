@@ -38,10 +38,11 @@
 # Pipeline activity viewer for the O3 CPU model.
 
 import argparse
-import copy
 import os
 import sys
 
+import trace_index
+
 # Temporary storage for instructions. The queue is filled in out-of-order
 # until it reaches 'max_threshold' number of instructions. It is then
 # sorted out and instructions are printed out until their number drops to
@@ -63,6 +64,7 @@ insts = {
     # otherwise the print may not start/stop
     # at the time specified by tick_start/stop.
     "only_committed": 0,  # Set if only committed instructions are printed.
+    "header": None,  # Printed before the first instruction, if any.
 }
 
 
@@ -125,17 +127,19 @@ def process_trace(
             return
         fields = line.split(":")
 
-    # Print header
-    outfile.write(
+    # The header is only printed with the first instruction, so there is
+    # no output if there are no instructions in the range, however much of
+    # the trace is read to find that out.
+    header = (
         "// f = fetch, d = decode, n = rename, p = dispatch, "
         "i = issue, c = complete, r = retire"
     )
 
     if store_completions:
-        outfile.write(", s = store-complete")
-    outfile.write("\n\n")
+        header += ", s = store-complete"
+    header += "\n\n"
 
-    outfile.write(
+    header += (
         " "
         + "timeline".center(width)
         + "   "
@@ -148,8 +152,9 @@ def process_trace(
         + "seq_num".center(10)
     )
     if timestamps:
-        outfile.write("timestamps".center(25))
-    outfile.write("\n")
+        header += "timestamps".center(25)
+    header += "\n"
+    insts["header"] = header
 
     # Region of interest
     curr_inst = {}
@@ -213,8 +218,8 @@ def queue_inst(
     outfile, inst, cycle_time, width, color, timestamps, store_completions
 ):
     global insts
-    l_copy = copy.deepcopy(inst)
-    insts["queue"].append(l_copy)
+    # The values are all immutable, so a shallow copy is enough.
+    insts["queue"].append(dict(inst))
     if len(insts["queue"]) > insts["max_threshold"]:
         print_insts(
             outfile,
@@ -266,6 +271,9 @@ def print_insts(
         if insts["only_committed"] != 0 and print_item["retire"] == 0:
             continue
             # retire is set to zero if it hasn't been completed
+        if insts["header"]:
+            outfile.write(insts["header"])
+            insts["header"] = None
         print_inst(
             outfile,
             print_item,
@@ -498,6 +506,13 @@ def main():
         default=False,
         help="additionally display store completion ticks",
     )
+    parser.add_argument(
+        "--index",
+        action="store_true",
+        default=False,
+        help="index the trace (in TRACE_FILE.idx, the first time) and "
+        "only read the part of it in the tick or instruction range",
+    )
     parser.add_argument("tracefile")
 
     args = parser.parse_args()
@@ -509,9 +524,27 @@ def main():
     if not inst_range:
         parser.error("invalid range")
         sys.exit(1)
+    if not args.index:
+        trace = trace_index.openTrace(args.tracefile)
+    elif inst_range != [0, -1]:
+        trace = trace_index.openTrace(
+            args.tracefile,
+            trace_index.O3_PIPE_VIEW,
+            "sn",
+            inst_range[0],
+            inst_range[1] if inst_range[1] > 0 else None,
+        )
+    else:
+        trace = trace_index.openTrace(
+            args.tracefile,
+            trace_index.O3_PIPE_VIEW,
+            "tick",
+            tick_range[0],
+            tick_range[1] if tick_range[1] > 0 else None,
+        )
     # Process trace
     print("Processing trace... ", end=" ")
-    with open(args.tracefile) as trace:
+    with trace:
         with open(args.outfile, "w") as out:
             process_trace(
                 trace,
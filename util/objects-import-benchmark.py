@@ -0,0 +1,114 @@
+#! /usr/bin/env python3
+
+# Copyright (c) 2024 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Measures gem5's Python startup time with SimObject modules imported on demand
+(the default) and with every SimObject module imported at startup (by setting
+M5_EAGER_OBJECTS). Each mode runs gem5 on a small script which imports the
+SimObjects a typical stdlib configuration uses and exits.
+
+Usage:
+    util/objects-import-benchmark.py build/ALL/gem5.opt
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import tempfile
+import time
+
+# The script gem5 runs. It reports the time, since the Python interpreter
+# started, taken for gem5 to reach the script and then to import the
+# SimObjects it uses.
+script = """
+import time
+start = time.perf_counter()
+from m5.objects import (
+    AddrRange,
+    DDR4_2400_8x8,
+    MemCtrl,
+    Root,
+    SrcClockDomain,
+    System,
+    SystemXBar,
+    TimingSimpleCPU,
+    VoltageDomain,
+)
+import m5.SimObject
+print("BENCHMARK", time.process_time(), time.perf_counter() - start,
+      len(m5.SimObject.allClasses))
+"""
+
+parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+parser.add_argument("gem5", help="The gem5 binary to benchmark.")
+parser.add_argument(
+    "-n",
+    "--repeats",
+    type=int,
+    default=10,
+    help="The number of times gem5 is run in each mode.",
+)
+args = parser.parse_args()
+
+with tempfile.TemporaryDirectory() as outdir:
+    script_file = os.path.join(outdir, "benchmark.py")
+    with open(script_file, "w") as f:
+        f.write(script)
+
+    print(
+        f"{'mode':<8}{'wall (s)':>12}{'cpu (s)':>12}"
+        f"{'imports (s)':>14}{'classes':>10}"
+    )
+    for mode, eager in (("lazy", "false"), ("eager", "true")):
+        env = dict(os.environ, M5_EAGER_OBJECTS=eager)
+        wall, cpu, imports = [], [], []
+        for _ in range(args.repeats):
+            start = time.perf_counter()
+            output = subprocess.run(
+                [args.gem5, "-q", "--outdir", outdir, script_file],
+                env=env,
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            wall.append(time.perf_counter() - start)
+            line = next(
+                line
+                for line in output.splitlines()
+                if line.startswith("BENCHMARK")
+            )
+            _, cpu_time, import_time, classes = line.split()
+            cpu.append(float(cpu_time))
+            imports.append(float(import_time))
+
+        print(
+            f"{mode:<8}{statistics.median(wall):>12.3f}"
+            f"{statistics.median(cpu):>12.3f}"
+            f"{statistics.median(imports):>14.3f}{classes:>10}"
+        )
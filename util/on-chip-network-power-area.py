@@ -26,11 +26,17 @@
 
 
 import os
-import string
-import subprocess
 import sys
 from configparser import ConfigParser
 
+sys.path.append(
+    os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "..", "src", "python"
+    )
+)
+
+from m5.ext.pystats.statstxt import StatsTxtReader
+
 # Compile DSENT to generate the Python module and then import it.
 # This script assumes it is executed from the gem5 root.
 print("Attempting compilation")
@@ -196,16 +202,13 @@ def parseStats(
         exit(-1)
 
     # Now parse the stats
-    pattern = "sim_seconds"
-    lines = string.split(
-        subprocess.check_output(["grep", pattern, stats_file]), "\n", -1
-    )
-    assert len(lines) >= 1
+    stats = StatsTxtReader(stats_file, names=["simSeconds", "sim_seconds"])
 
-    ## Assume that the first line is the one required
-    [l1, l2, l3] = lines[0].partition(" ")
-    l4 = l3.strip().partition(" ")
-    simulation_length_in_seconds = float(l4[0])
+    ## Assume that the first dump is the one required
+    dump = next(iter(stats), {})
+    sim_seconds = dump.get("simSeconds", dump.get("sim_seconds"))
+    assert sim_seconds is not None
+    simulation_length_in_seconds = float(sim_seconds)
 
     # Initialize DSENT with a configuration file
     dsent.initialize(router_config_file)
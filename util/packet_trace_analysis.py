@@ -0,0 +1,736 @@
+#! /usr/bin/env python3
+# Copyright (c) 2024 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Analyses the memory traffic in a packet trace, as recorded by a
+CommMonitor or MemTraceProbe, and sizes synthetic traffic to match it.
+
+The trace is read a block at a time and each block is folded into
+summaries whose size doesn't depend on the number of packets: the
+bandwidth and read/write mix per time window, a heatmap of the accesses
+to each address region per (coarser) time epoch, a histogram of the
+strides between consecutive accesses and a histogram of the LRU stack
+(reuse) distances of the cache lines accessed. Reuse distances are
+estimated with SHARDS (Waldspurger et al., FAST '15): only the lines
+whose address hashes below a threshold are tracked, and the distances
+between them are found with a Fenwick tree over their last accesses, so
+the memory this needs is the sample rate times the footprint of the
+trace.
+
+The summaries size the gem5.components.processors generators (see
+TraceAnalysis.generator) and TrafficGen configurations (see
+TraceAnalysis.traffic_gen_config). Requires NumPy.
+
+Usage:
+    util/packet_trace_analysis.py [options] <trace>
+"""
+
+import argparse
+import json
+import sys
+from collections import Counter
+
+import numpy as np
+import protolib
+
+# The requests of the MemCmd::Command enum in src/mem/packet.hh which read
+# and write memory. Any other commands are counted as neither.
+READ_CMDS = (
+    1,  # ReadReq
+    11,  # SoftPFReq
+    12,  # SoftPFExReq
+    13,  # HardPFReq
+    22,  # ReadExReq
+    24,  # ReadCleanReq
+    25,  # ReadSharedReq
+    26,  # LoadLockedReq
+    30,  # LockedRMWReadReq
+)
+WRITE_CMDS = (
+    4,  # WriteReq
+    7,  # WritebackDirty
+    8,  # WritebackClean
+    9,  # WriteClean
+    16,  # WriteLineReq
+    27,  # StoreCondReq
+    32,  # LockedRMWWriteReq
+    34,  # SwapReq
+)
+
+# The columns of TraceAnalysis.windows.
+WINDOW_COLUMNS = ("read_bytes", "write_bytes", "reads", "writes", "others")
+
+
+class WindowSeries:
+    """
+    Sums of columns of values over fixed windows of ticks. The windows are
+    allocated as the ticks seen extend the series, and all of them are kept
+    until the end, so the memory used is proportional to the duration of
+    the trace over the window size: 8 bytes per column per window, e.g.
+    40 MB for a second of simulated time in the default windows of a
+    microsecond (10^6 ticks). Use larger windows for longer traces.
+    """
+
+    def __init__(self, window, columns):
+        self.window = window
+        # The index of the first window, and the sums of each window.
+        self.origin = None
+        self.length = 0
+        self._sums = np.zeros((0, columns))
+
+    @property
+    def sums(self):
+        return self._sums[: self.length]
+
+    def add(self, ticks, values):
+        """Adds the rows of values to the windows of the matching ticks."""
+        if not len(ticks):
+            return
+        index = (ticks // self.window).astype(np.int64)
+        first, last = int(index.min()), int(index.max())
+        if self.origin is None:
+            self.origin = first
+        if first < self.origin:
+            # Records which are slightly out of order are expected, e.g.
+            # from several requestors, but should be rare.
+            grow = self.origin - first
+            self._sums = np.concatenate(
+                (np.zeros((grow, self._sums.shape[1])), self._sums)
+            )
+            self.origin = first
+            self.length += grow
+        length = last - self.origin + 1
+        if length > len(self._sums):
+            capacity = max(length, 2 * len(self._sums))
+            sums = np.zeros((capacity, self._sums.shape[1]))
+            sums[: self.length] = self.sums
+            self._sums = sums
+        self.length = max(self.length, length)
+        index -= self.origin
+        for column in range(self._sums.shape[1]):
+            self._sums[: self.length, column] += np.bincount(
+                index, values[:, column], minlength=self.length
+            )
+
+
+class Heatmap:
+    """
+    The number of accesses to each 2^region_bits byte address region in
+    each epoch of ticks. Only the (epoch, region) pairs which are accessed
+    are stored, so the memory used is bounded by the resolution of the
+    heatmap rather than the length of the trace.
+    """
+
+    def __init__(self, epoch, region_bits):
+        self.epoch = epoch
+        self.region_bits = region_bits
+        self._pending = []
+        self._pending_length = 0
+        self._counts = self._empty()
+
+    @staticmethod
+    def _empty():
+        return (
+            np.zeros(0, np.int64),
+            np.zeros(0, np.uint64),
+            np.zeros(0, np.int64),
+        )
+
+    @staticmethod
+    def _merge(epochs, regions, counts):
+        order = np.lexsort((regions, epochs))
+        epochs, regions, counts = epochs[order], regions[order], counts[order]
+        new = np.ones(len(order), bool)
+        new[1:] = (epochs[1:] != epochs[:-1]) | (regions[1:] != regions[:-1])
+        starts = np.flatnonzero(new)
+        if not len(starts):
+            return Heatmap._empty()
+        return epochs[starts], regions[starts], np.add.reduceat(counts, starts)
+
+    def add(self, ticks, addrs):
+        epochs = (ticks // self.epoch).astype(np.int64)
+        regions = addrs >> np.uint64(self.region_bits)
+        counts = self._merge(epochs, regions, np.ones(len(ticks), np.int64))
+        self._pending.append(counts)
+        self._pending_length += len(counts[0])
+        if self._pending_length > max(len(self._counts[0]), 1 << 20):
+            self._flush()
+
+    def _flush(self):
+        if self._pending:
+            parts = [self._counts] + self._pending
+            self._counts = self._merge(
+                *(np.concatenate(column) for column in zip(*parts))
+            )
+            self._pending = []
+            self._pending_length = 0
+
+    @property
+    def counts(self):
+        """
+        The (epochs, regions, counts) arrays of the accesses to each region
+        in each epoch, sorted by epoch and region. The epochs and regions
+        are indices, i.e. the ticks and addresses shifted down.
+        """
+        self._flush()
+        return self._counts
+
+    def regions(self):
+        """Returns the total accesses to each region as a Counter."""
+        _, regions, counts = self.counts
+        totals = Counter()
+        for region, count in zip(regions.tolist(), counts.tolist()):
+            totals[region] += count
+        return totals
+
+
+class ReuseDistance:
+    """
+    A SHARDS estimate of the LRU stack distances of the accesses to a
+    stream of cache lines: the number of distinct lines accessed since
+    each line was last accessed.
+
+    A line is sampled if a hash of its address is below sample_rate. The
+    stack distance between two accesses to a sampled line is the number
+    of sampled lines whose last access is after the first of them, which
+    is counted with a Fenwick tree with a bit set at the last access of
+    each line, and then scaled up by the sample rate.
+    """
+
+    # The hash of the line is the top 24 bits of its product with this,
+    # the golden ratio in 64-bit fixed point.
+    HASH = np.uint64(0x9E3779B97F4A7C15)
+
+    def __init__(self, line_size, sample_rate):
+        self.line_bits = line_size.bit_length() - 1
+        self.sample_rate = sample_rate
+        self.threshold = int(sample_rate * (1 << 24))
+        # The time (index in the sampled stream) of the last access to
+        # each sampled line, and the tree over those times.
+        self._last = {}
+        self._time = 0
+        self._tree = [0] * 1025
+        # Counts of the sampled accesses by the bit length of their
+        # unscaled distance, and of those to lines not seen before.
+        self.histogram = Counter()
+        self.cold = 0
+        self.sampled = 0
+
+    def add(self, addrs):
+        lines = addrs >> np.uint64(self.line_bits)
+        hashes = (lines * self.HASH) >> np.uint64(40)
+        lines = lines[hashes < self.threshold]
+        self.sampled += len(lines)
+
+        last = self._last
+        tree = self._tree
+        histogram = self.histogram
+        for line in lines.tolist():
+            if self._time + 1 == len(tree):
+                self._compact()
+                last = self._last
+                tree = self._tree
+            size = len(tree)
+            previous = last.get(line)
+            if previous is None:
+                self.cold += 1
+            else:
+                # Count the set bits after the previous access, i.e. all of
+                # them (the number of lines) less those up to it.
+                i = previous + 1
+                before = 0
+                while i:
+                    before += tree[i]
+                    i &= i - 1
+                histogram[(len(last) - before).bit_length()] += 1
+                i = previous + 1
+                while i < size:
+                    tree[i] -= 1
+                    i += i & -i
+            i = self._time + 1
+            while i < size:
+                tree[i] += 1
+                i += i & -i
+            last[line] = self._time
+            self._time += 1
+
+    def _compact(self):
+        """
+        Renumbers the last accesses 0..n-1, in order, and rebuilds the tree
+        with room for as many accesses again.
+        """
+        lines = sorted(self._last, key=self._last.get)
+        self._last = {line: time for time, line in enumerate(lines)}
+        self._time = len(lines)
+        size = max(2 * len(lines), 1024) + 1
+        # The tree of a prefix of set bits, with the rest clear.
+        self._tree = [
+            min(i, len(lines)) - min(i - (i & -i), len(lines))
+            for i in range(size)
+        ]
+
+    def distances(self):
+        """
+        Returns the estimated number of accesses with each distance, as a
+        list of ((low, high), count), with the distance in lines from low
+        up to but excluding high, and the number of cold accesses.
+        """
+        scale = 1 / self.sample_rate
+        buckets = []
+        for bits in sorted(self.histogram):
+            low = (1 << bits) >> 1
+            buckets.append(
+                (
+                    (low * scale, (1 << bits) * scale),
+                    self.histogram[bits] * scale,
+                )
+            )
+        return buckets, self.cold * scale
+
+    def miss_ratio(self, lines):
+        """
+        Returns the estimated miss ratio of a fully associative LRU cache of
+        the given number of lines, i.e. the fraction of accesses which are
+        cold or have a distance of at least that. Distances are only known
+        to within a power of two, so the buckets spanning lines are
+        interpolated.
+        """
+        if not self.sampled:
+            return 0.0
+        misses = self.cold
+        for (low, high), count in self.distances()[0]:
+            count *= self.sample_rate
+            if low >= lines:
+                misses += count
+            elif high > lines:
+                misses += count * (high - lines) / (high - low)
+        return misses / self.sampled
+
+
+class TraceAnalysis:
+    """
+    The summaries of a packet trace. Call add with each block of records,
+    as a structured array of protolib.PACKET_FIELDS, or use analyse to
+    read a whole trace.
+    """
+
+    def __init__(
+        self,
+        tick_freq=10**12,
+        window=10**6,
+        epoch=10**9,
+        region_bits=20,
+        line_size=64,
+        max_stride=1 << 16,
+        sample_rate=0.001,
+    ):
+        self.tick_freq = tick_freq
+        self.line_size = line_size
+        self.max_stride = max_stride
+        self.windows = WindowSeries(window, len(WINDOW_COLUMNS))
+        self.heatmap = Heatmap(epoch, region_bits)
+        self.reuse = ReuseDistance(line_size, sample_rate)
+        # Strides within max_stride bytes, and the number which aren't.
+        self.strides = Counter()
+        self.far_strides = 0
+        self.sizes = Counter()
+        self.packets = 0
+        self.first_tick = None
+        self.last_tick = None
+        self.min_addr = None
+        self.max_addr = None
+        self._last_addr = None
+
+    def add(self, records):
+        if not len(records):
+            return
+        ticks = records["tick"]
+        cmds = records["cmd"]
+        addrs = records["addr"]
+        sizes = records["size"]
+        self.packets += len(records)
+
+        first, last = int(ticks.min()), int(ticks.max())
+        lowest, highest = int(addrs.min()), int((addrs + sizes).max())
+        if self.first_tick is None:
+            self.first_tick, self.last_tick = first, last
+            self.min_addr, self.max_addr = lowest, highest
+        else:
+            self.first_tick = min(self.first_tick, first)
+            self.last_tick = max(self.last_tick, last)
+            self.min_addr = min(self.min_addr, lowest)
+            self.max_addr = max(self.max_addr, highest)
+
+        reads = np.isin(cmds, READ_CMDS)
+        writes = np.isin(cmds, WRITE_CMDS)
+        values = np.empty((len(records), len(WINDOW_COLUMNS)))
+        values[:, 0] = np.where(reads, sizes, 0)
+        values[:, 1] = np.where(writes, sizes, 0)
+        values[:, 2] = reads
+        values[:, 3] = writes
+        values[:, 4] = ~(reads | writes)
+        self.windows.add(ticks, values)
+
+        for size, count in zip(*np.unique(sizes, return_counts=True)):
+            self.sizes[int(size)] += int(count)
+
+        self.heatmap.add(ticks, addrs)
+
+        signed = addrs.view(np.int64)
+        strides = np.diff(
+            signed,
+            prepend=signed[:1] if self._last_addr is None else self._last_addr,
+        )
+        if self._last_addr is None:
+            strides = strides[1:]
+        self._last_addr = signed[-1]
+        near = np.abs(strides) <= self.max_stride
+        self.far_strides += int(len(strides) - np.count_nonzero(near))
+        for stride, count in zip(
+            *np.unique(strides[near], return_counts=True)
+        ):
+            self.strides[int(stride)] += int(count)
+
+        self.reuse.add(addrs)
+
+    @property
+    def duration(self):
+        """The number of ticks from the first packet to the last."""
+        if self.first_tick is None:
+            return 0
+        return self.last_tick - self.first_tick
+
+    def totals(self):
+        """Returns a dict of the sum of each of WINDOW_COLUMNS."""
+        return dict(zip(WINDOW_COLUMNS, self.windows.sums.sum(0).tolist()))
+
+    def bandwidth(self):
+        """
+        Returns the bandwidth of each window, in bytes per second, as an
+        array of reads and writes.
+        """
+        seconds = self.windows.window / self.tick_freq
+        return self.windows.sums[:, :2] / seconds
+
+    def block_size(self):
+        """The most common packet size."""
+        if not self.sizes:
+            return self.line_size
+        return self.sizes.most_common(1)[0][0]
+
+    def pattern(self, threshold=0.5):
+        """
+        Classifies the access pattern as "linear", if at least threshold of
+        the strides are the block size, "strided" if they are some other
+        positive multiple of it, or "random". Returns the pattern and the
+        stride.
+        """
+        block_size = self.block_size()
+        total = sum(self.strides.values()) + self.far_strides
+        for stride, count in self.strides.most_common(2):
+            if stride > 0 and count >= threshold * total:
+                if stride == block_size:
+                    return "linear", stride
+                if stride % block_size == 0:
+                    return "strided", stride
+        return "random", block_size
+
+    def _read_percentage(self, reads, writes):
+        if reads + writes == 0:
+            return 100
+        return round(100 * reads / (reads + writes))
+
+    def generator(self):
+        """
+        Returns the name of the gem5.components.processors generator which
+        best matches the trace, LinearGenerator, StridedGenerator or
+        RandomGenerator, and a dict of the parameters to create it with.
+        """
+        totals = self.totals()
+        duration = max(self.duration, 1)
+        data = totals["read_bytes"] + totals["write_bytes"]
+        block_size = self.block_size()
+        pattern, stride = self.pattern()
+        params = dict(
+            duration=f"{duration * 10**12 // self.tick_freq}ps",
+            rate=f"{int(data * self.tick_freq / duration)}B/s",
+            block_size=block_size,
+            min_addr=self.min_addr or 0,
+            max_addr=self.max_addr or 0,
+            rd_perc=self._read_percentage(totals["reads"], totals["writes"]),
+        )
+        if pattern == "strided":
+            params.update(superblock_size=block_size, stride_size=stride)
+        name = f"{pattern.capitalize()}Generator"
+        return name, params
+
+    def traffic_gen_config(self, phases=1):
+        """
+        Returns a TrafficGen configuration which replays the traffic of the
+        trace in the given number of phases of equal duration, each with
+        the bandwidth and read/write mix of that part of the trace, and
+        then exits.
+        """
+        pattern, stride = self.pattern()
+        block_size = self.block_size()
+        sums = self.windows.sums
+        bounds = np.linspace(0, len(sums), phases + 1).astype(int)
+        lines = []
+        for phase in range(phases):
+            part = sums[bounds[phase] : bounds[phase + 1]]
+            duration = len(part) * self.windows.window
+            read_bytes, write_bytes, reads, writes, _ = part.sum(0)
+            if not duration:
+                continue
+            state = f"STATE {len(lines)} {duration}"
+            data = read_bytes + write_bytes
+            if not data:
+                lines.append(f"{state} IDLE")
+                continue
+            period = max(int(block_size * duration / data), 1)
+            mode = pattern.upper()
+            params = [
+                self._read_percentage(reads, writes),
+                self.min_addr,
+                self.max_addr,
+            ]
+            if pattern == "strided":
+                params += [0, block_size, block_size, stride]
+            else:
+                params.append(block_size)
+            params += [period, period, 0]
+            lines.append(f"{state} {mode} {' '.join(map(str, params))}")
+        states = len(lines)
+        lines.append(f"STATE {states} 0 EXIT")
+        lines.append("INIT 0")
+        lines += [f"TRANSITION {i} {i + 1} 1" for i in range(states)]
+        lines.append(f"TRANSITION {states} {states} 1")
+        return "\n".join(lines) + "\n"
+
+    def to_json(self):
+        """Returns all of the summaries as a dict which can be dumped."""
+        epochs, regions, counts = self.heatmap.counts
+        distances, cold = self.reuse.distances()
+        name, params = self.generator()
+        return {
+            "tick_freq": self.tick_freq,
+            "packets": self.packets,
+            "first_tick": self.first_tick,
+            "last_tick": self.last_tick,
+            "min_addr": self.min_addr,
+            "max_addr": self.max_addr,
+            "sizes": dict(self.sizes),
+            "window": self.windows.window,
+            "window_origin": self.windows.origin,
+            "windows": {
+                column: self.windows.sums[:, i].tolist()
+                for i, column in enumerate(WINDOW_COLUMNS)
+            },
+            "heatmap": {
+                "epoch": self.heatmap.epoch,
+                "region_bits": self.heatmap.region_bits,
+                "epochs": epochs.tolist(),
+                "regions": regions.tolist(),
+                "counts": counts.tolist(),
+            },
+            "strides": dict(self.strides),
+            "far_strides": self.far_strides,
+            "reuse": {
+                "line_size": self.line_size,
+                "sample_rate": self.reuse.sample_rate,
+                "distances": distances,
+                "cold": cold,
+            },
+            "generator": {"name": name, "params": params},
+        }
+
+    def report(self, out=sys.stdout, top=10):
+        """Prints a summary of the trace."""
+        totals = self.totals()
+        seconds = self.duration / self.tick_freq
+        print(f"Packets: {self.packets}", file=out)
+        print(
+            f"Ticks: {self.first_tick} to {self.last_tick} "
+            f"({seconds:.6g} s)",
+            file=out,
+        )
+        if self.min_addr is not None:
+            print(
+                f"Addresses: {self.min_addr:#x} to {self.max_addr:#x}",
+                file=out,
+            )
+        print(
+            f"Reads: {totals['reads']:.0f} ({totals['read_bytes']:.0f} B), "
+            f"writes: {totals['writes']:.0f} "
+            f"({totals['write_bytes']:.0f} B), "
+            f"others: {totals['others']:.0f}",
+            file=out,
+        )
+        bandwidth = self.bandwidth().sum(1)
+        if len(bandwidth):
+            data = totals["read_bytes"] + totals["write_bytes"]
+            print(
+                f"Bandwidth: {data / max(seconds, 1e-12):.4g} B/s mean, "
+                f"{bandwidth.max():.4g} B/s peak "
+                f"({len(bandwidth)} windows of {self.windows.window} ticks)",
+                file=out,
+            )
+
+        print("\nPacket sizes:", file=out)
+        for size, count in self.sizes.most_common(top):
+            print(f"{size:>12} {count:>14}", file=out)
+
+        print("\nStrides (bytes):", file=out)
+        for stride, count in self.strides.most_common(top):
+            print(f"{stride:>12} {count:>14}", file=out)
+        print(
+            f"{'> ' + str(self.max_stride):>12} {self.far_strides:>14}",
+            file=out,
+        )
+
+        print("\nBusiest regions:", file=out)
+        shift = self.heatmap.region_bits
+        for region, count in self.heatmap.regions().most_common(top):
+            print(f"{region << shift:>#18x} {count:>14}", file=out)
+
+        print(
+            f"\nReuse distances ({self.line_size} B lines, "
+            f"{self.reuse.sampled} sampled accesses):",
+            file=out,
+        )
+        distances, cold = self.reuse.distances()
+        for (low, high), count in distances:
+            print(f"{low:>12.0f} - {high:<12.0f} {count:>14.0f}", file=out)
+        print(f"{'cold':>27} {cold:>14.0f}", file=out)
+        print("\nLRU miss ratios:", file=out)
+        for bits in range(15, 31, 3):
+            size = 1 << bits
+            ratio = self.reuse.miss_ratio(size // self.line_size)
+            print(f"{size >> 10:>10} KiB {ratio:>10.4f}", file=out)
+
+        name, params = self.generator()
+        print(f"\nGenerator: {name}(", file=out)
+        for param, value in params.items():
+            print(f"    {param}={value!r},", file=out)
+        print(")", file=out)
+
+
+def analyse(in_file, block_size=protolib.BLOCK_SIZE, **kwargs):
+    """
+    Reads a packet trace a block at a time into a TraceAnalysis, created
+    with kwargs.
+    """
+    blocks = protolib.readTraceArrays(
+        in_file, protolib.PACKET_FIELDS, block_size=block_size
+    )
+    header = next(blocks)
+    if header is not None:
+        kwargs.setdefault(
+            "tick_freq", protolib.varintFields(header).get(3, 10**12)
+        )
+    analysis = TraceAnalysis(**kwargs)
+    for records, _ in blocks:
+        analysis.add(records)
+    return analysis
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("trace", help="The packet trace to analyse.")
+    parser.add_argument(
+        "--window",
+        type=int,
+        default=10**6,
+        help="The ticks in each bandwidth window. All of the windows are "
+        "kept in memory, 40 bytes each.",
+    )
+    parser.add_argument(
+        "--epoch",
+        type=int,
+        default=10**9,
+        help="The ticks in each epoch of the heatmap.",
+    )
+    parser.add_argument(
+        "--region-bits",
+        type=int,
+        default=20,
+        help="The log2 of the size of each address region of the heatmap.",
+    )
+    parser.add_argument(
+        "--line-size",
+        type=int,
+        default=64,
+        help="The cache line size for reuse distances.",
+    )
+    parser.add_argument(
+        "--max-stride",
+        type=int,
+        default=1 << 16,
+        help="The largest stride, in bytes, counted individually.",
+    )
+    parser.add_argument(
+        "--sample-rate",
+        type=float,
+        default=0.001,
+        help="The fraction of the cache lines whose reuse is tracked.",
+    )
+    parser.add_argument(
+        "--json", help="Write all of the summaries to this JSON file."
+    )
+    parser.add_argument(
+        "--traffic-gen",
+        metavar="CFG",
+        help="Write a TrafficGen configuration which matches the trace.",
+    )
+    parser.add_argument(
+        "--phases",
+        type=int,
+        default=1,
+        help="The number of phases of the TrafficGen configuration.",
+    )
+    args = parser.parse_args()
+
+    analysis = analyse(
+        args.trace,
+        window=args.window,
+        epoch=args.epoch,
+        region_bits=args.region_bits,
+        line_size=args.line_size,
+        max_stride=args.max_stride,
+        sample_rate=args.sample_rate,
+    )
+    analysis.report()
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(analysis.to_json(), f)
+    if args.traffic_gen:
+        with open(args.traffic_gen, "w") as f:
+            f.write(analysis.traffic_gen_config(args.phases))
+
+
+if __name__ == "__main__":
+    main()
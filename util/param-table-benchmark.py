@@ -0,0 +1,162 @@
+#! /usr/bin/env python3
+# Copyright (c) 2024 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Microbenchmark for the SimObject parameter tables (m5.util.multidict).
+
+Every SimObject class keeps its parameters, values, ports and children in
+multidicts chained along the class hierarchy. This benchmark times the table
+walks and lookups done by print_ini(), getCCParams() and unproxyParams() on
+instances of deep classes, using the flattened tables and using a walk of the
+multidict chain (how the tables were read before they were flattened).
+
+It must be run by gem5, e.g.:
+    build/ARM/gem5.opt util/param-table-benchmark.py
+    build/ARM/gem5.opt util/param-table-benchmark.py ArmO3CPU -n 200
+"""
+
+import argparse
+import importlib
+import os
+import sys
+import time
+
+if __name__ == "__main__":
+    print("ERROR: This file must be run from gem5.", file=sys.stderr)
+    sys.exit(1)
+
+import m5
+import m5.objects
+from m5.util import addToPath
+from m5.util.multidict import multidict
+
+addToPath(os.path.join(os.path.dirname(__file__), "..", "configs"))
+
+parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+parser.add_argument(
+    "classes",
+    nargs="*",
+    default=[
+        "common.cores.arm.HPI.HPI",
+        "common.cores.arm.O3_ARM_v7a.O3_ARM_v7a_3",
+    ],
+    help="SimObject classes to benchmark, either the name of a class in "
+    "m5.objects or a module path in configs/ followed by the class name.",
+)
+parser.add_argument(
+    "-n",
+    "--instances",
+    type=int,
+    default=100,
+    help="The number of instances of each class.",
+)
+parser.add_argument(
+    "-r",
+    "--repeats",
+    type=int,
+    default=5,
+    help="The number of times each measurement is repeated.",
+)
+args = parser.parse_args()
+
+
+def chain_items(table):
+    # The multidict.items() walk before the tables were flattened
+    yield from table.local.items()
+    if isinstance(table.parent, multidict):
+        for key, value in chain_items(table.parent):
+            if key not in table.local and key not in table.deleted:
+                yield key, value
+
+
+def chain_get(table, key):
+    # The multidict.get() lookup before the tables were flattened
+    while isinstance(table, multidict):
+        if key in table.local:
+            return table.local[key]
+        if key in table.deleted:
+            return None
+        table = table.parent
+    return table.get(key)
+
+
+def flat_items(table):
+    return table.items()
+
+
+def flat_get(table, key):
+    return table.get(key)
+
+
+def walk_tables(objs, items, get):
+    # Roughly the table accesses of print_ini() and getCCParams()
+    for obj in objs:
+        for name in sorted(key for key, _ in items(obj._params)):
+            get(obj._values, name)
+            get(obj._params, name)
+        for _ in items(obj._ports):
+            pass
+        for _ in items(obj._children):
+            pass
+
+
+def load_class(name):
+    if "." not in name:
+        return getattr(m5.objects, name)
+    module, cls = name.rsplit(".", 1)
+    return getattr(importlib.import_module(module), cls)
+
+
+def best_time(func):
+    times = []
+    for _ in range(args.repeats):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+print(
+    f"{'class':<24}{'depth':>6}{'params':>8}"
+    f"{'chain (s)':>12}{'flat (s)':>12}{'speedup':>9}"
+)
+for name in args.classes:
+    cls = load_class(name)
+    objs = [cls() for _ in range(args.instances)]
+
+    depth = 0
+    table = cls._params
+    while isinstance(table, multidict):
+        depth += 1
+        table = table.parent
+
+    chain = best_time(lambda: walk_tables(objs, chain_items, chain_get))
+    flat = best_time(lambda: walk_tables(objs, flat_items, flat_get))
+    print(
+        f"{cls.__name__:<24}{depth:>6}{len(list(cls._params.keys())):>8}"
+        f"{chain:>12.4f}{flat:>12.4f}{chain / flat:>8.1f}x"
+    )
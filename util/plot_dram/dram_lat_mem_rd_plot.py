@@ -43,9 +43,18 @@ except ImportError:
     print("Failed to import matplotlib and numpy")
     exit(-1)
 
+import os
 import re
 import sys
 
+sys.path.append(
+    os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "..", "..", "src", "python"
+    )
+)
+
+from m5.ext.pystats.statstxt import StatsTxtReader
+
 
 # This script is intended to post process and plot the output from
 # running configs/dram/lat_mem_rd.py, as such it parses the simout.txt and
@@ -55,10 +64,9 @@ def main():
         print("Usage: ", sys.argv[0], "<simout directory>")
         exit(-1)
 
-    try:
-        stats = open(sys.argv[1] + "/stats.txt")
-    except OSError:
-        print("Failed to open ", sys.argv[1] + "/stats.txt", " for reading")
+    stats_file = sys.argv[1] + "/stats.txt"
+    if not os.path.isfile(stats_file):
+        print("Failed to open ", stats_file, " for reading")
         exit(-1)
 
     try:
@@ -91,11 +99,10 @@ def main():
     # Now parse the stats
     raw_rd_lat = []
 
-    for line in stats:
-        match = re.match(r".*readLatencyHist::mean\s+(.+)\s+#.*", line)
-        if match:
-            raw_rd_lat.append(float(match.groups(0)[0]) / 1000)
-    stats.close()
+    stats = StatsTxtReader(stats_file, pattern=r".*readLatencyHist::mean$")
+    for dump in stats:
+        for value in dump.values():
+            raw_rd_lat.append(float(value) / 1000)
 
     # The stats also contain the warming, so filter the latency stats
     i = 0
@@ -44,9 +44,18 @@ except ImportError:
     print("Failed to import matplotlib and numpy")
     exit(-1)
 
+import os
 import re
 import sys
 
+sys.path.append(
+    os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "..", "..", "src", "python"
+    )
+)
+
+from m5.ext.pystats.statstxt import StatsTxtReader
+
 
 # Determine the parameters of the sweep from the simout output, and
 # then parse the stats and plot the 3D surface corresponding to the
@@ -72,10 +81,9 @@ def main():
     # efficiency
     mode = sys.argv[1][1]
 
-    try:
-        stats = open(sys.argv[2] + "/stats.txt")
-    except OSError:
-        print("Failed to open ", sys.argv[2] + "/stats.txt", " for reading")
+    stats_file = sys.argv[2] + "/stats.txt"
+    if not os.path.isfile(stats_file):
+        print("Failed to open ", stats_file, " for reading")
         exit(-1)
 
     try:
@@ -112,19 +120,17 @@ def main():
     bus_util = []
     avg_pwr = []
 
-    for line in stats:
-        match = re.match(r".*busUtil\s+(\d+\.\d+)\s+#.*", line)
-        if match:
-            bus_util.append(float(match.groups(0)[0]))
-
-        match = re.match(r".*peakBW\s+(\d+\.\d+)\s+#.*", line)
-        if match:
-            peak_bw.append(float(match.groups(0)[0]))
-
-        match = re.match(r".*averagePower\s+(\d+\.?\d*)\s+#.*", line)
-        if match:
-            avg_pwr.append(float(match.groups(0)[0]))
-    stats.close()
+    stats = StatsTxtReader(
+        stats_file, pattern=r".*(busUtil|peakBW|averagePower)$"
+    )
+    for dump in stats:
+        for name, value in dump.items():
+            if name.endswith("busUtil"):
+                bus_util.append(float(value))
+            elif name.endswith("peakBW"):
+                peak_bw.append(float(value))
+            else:
+                avg_pwr.append(float(value))
 
     # Sanity check
     if not (len(peak_bw) == len(bus_util) and len(bus_util) == len(avg_pwr)):
@@ -0,0 +1,153 @@
+#! /usr/bin/env python3
+# Copyright (c) 2024 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Measures how long util/protolib takes to read a packet trace, message by
+message as the decode scripts used to (decodeMessage), with readMessages,
+and into a NumPy array with packetArrays. The trace is synthetic, with
+the given number of packets, so the benchmark doesn't need gem5 or
+protobuf; the messages are parsed with packet_pb2 too when it is
+available.
+
+Usage:
+    util/protolib-benchmark.py -n 1000000
+"""
+
+import argparse
+import gzip
+import os
+import random
+import tempfile
+import time
+
+import protolib
+
+try:
+    import packet_pb2
+except ImportError:
+    packet_pb2 = None
+
+
+def varint(value):
+    out = bytearray()
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def message(fields):
+    body = b"".join(
+        varint(number << 3) + varint(value) for number, value in fields
+    )
+    return varint(len(body)) + body
+
+
+def write_trace(path, packets):
+    rng = random.Random(0)
+    with gzip.open(path, "wb") as f:
+        f.write(b"gem5")
+        # A PacketHeader with an obj_id of "bench", version 1 and a
+        # tick_freq of 10^12.
+        header = b"\x0a\x05bench\x10\x01\x18" + varint(10**12)
+        f.write(varint(len(header)) + header)
+        tick = 0
+        for pkt_id in range(packets):
+            tick += rng.randrange(1000)
+            f.write(
+                message(
+                    (
+                        (1, tick),
+                        (2, rng.choice((1, 4))),
+                        (3, rng.randrange(1 << 34) & ~63),
+                        (4, 64),
+                        (6, pkt_id),
+                        (7, 0x400000 + rng.randrange(1 << 20)),
+                    )
+                )
+            )
+
+
+def decode_messages(path):
+    packet = packet_pb2.Packet() if packet_pb2 else None
+    count = 0
+    with protolib.openFileRd(path) as f:
+        f.read(4)
+        while True:
+            size, _ = protolib._DecodeVarint32(f)
+            if size == 0:
+                break
+            buf = f.read(size)
+            if packet:
+                packet.ParseFromString(buf)
+            count += 1
+    return count - 1
+
+
+def read_messages(path):
+    packet = packet_pb2.Packet() if packet_pb2 else None
+    count = 0
+    with protolib.openFileRd(path) as f:
+        f.read(4)
+        for buf in protolib.readMessages(f):
+            if packet:
+                packet.ParseFromString(buf)
+            count += 1
+    return count - 1
+
+
+def packet_arrays(path):
+    _, records = protolib.packetArrays(path)
+    return len(records)
+
+
+parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+parser.add_argument(
+    "-n",
+    "--packets",
+    type=int,
+    default=1000000,
+    help="The number of packets in the trace.",
+)
+args = parser.parse_args()
+
+with tempfile.TemporaryDirectory() as tmpdir:
+    path = os.path.join(tmpdir, "trace.gz")
+    write_trace(path, args.packets)
+
+    print(f"{'reader':<18}{'time (s)':>12}{'packets/s':>14}")
+    for name, read in (
+        ("decodeMessage", decode_messages),
+        ("readMessages", read_messages),
+        ("packetArrays", packet_arrays),
+    ):
+        start = time.perf_counter()
+        count = read(path)
+        elapsed = time.perf_counter() - start
+        assert count == args.packets, (name, count)
+        print(f"{name:<18}{elapsed:>12.3f}{count / elapsed:>14.0f}")
@@ -70,6 +70,39 @@
 
 import gzip
 import struct
+from concurrent.futures import ProcessPoolExecutor
+
+# How many bytes of a trace to read, and decode, at a time.
+BLOCK_SIZE = 16 * 1024 * 1024
+
+# The fields of the trace messages, as (field number, name, NumPy dtype),
+# for the NumPy arrays returned by packetArrays and instDepArrays. All of
+# them are varints, which is what lets them be decoded without protobuf.
+PACKET_FIELDS = (
+    (1, "tick", "u8"),
+    (2, "cmd", "u4"),
+    (3, "addr", "u8"),
+    (4, "size", "u4"),
+    (5, "flags", "u4"),
+    (6, "pkt_id", "u8"),
+    (7, "pc", "u8"),
+)
+INST_DEP_FIELDS = (
+    (1, "seq_num", "u8"),
+    (2, "type", "u4"),
+    (3, "p_addr", "u8"),
+    (4, "size", "u4"),
+    (5, "flags", "u4"),
+    (7, "comp_delay", "u8"),
+    (9, "weight", "u4"),
+    (10, "pc", "u8"),
+    (11, "v_addr", "u8"),
+    (12, "asid", "u4"),
+)
+INST_DEP_REPEATED_FIELDS = (
+    (6, "rob_dep"),
+    (8, "reg_dep"),
+)
 
 
 def openFileRd(in_file):
@@ -144,6 +177,267 @@ def decodeMessage(in_file, message):
         return False
 
 
+def _frameMessages(buf, pos):
+    """
+    Finds the length-prefixed messages in buf, starting at pos. Returns a
+    list of the (start, end) of each complete message, and the position
+    of the first one which isn't complete.
+    """
+    frames = []
+    end = len(buf)
+    while pos < end:
+        size = buf[pos]
+        start = pos + 1
+        if size & 0x80:
+            size &= 0x7F
+            shift = 7
+            while True:
+                if start == end:
+                    return frames, pos
+                b = buf[start]
+                start += 1
+                size |= (b & 0x7F) << shift
+                if not (b & 0x80):
+                    break
+                shift += 7
+                if shift >= 64:
+                    raise OSError("Too many bytes when decoding varint.")
+        if start + size > end:
+            break
+        frames.append((start, start + size))
+        pos = start + size
+    return frames, pos
+
+
+def _readBlocks(in_file, block_size):
+    """
+    Reads the file a block at a time, yielding each block along with the
+    messages complete within it, as from _frameMessages. The bytes of an
+    incomplete message at the end of a block are carried over to the next.
+    """
+    buf = b""
+    while True:
+        block = in_file.read(block_size)
+        if not block:
+            return
+        buf += block
+        frames, pos = _frameMessages(buf, 0)
+        yield buf, frames
+        buf = buf[pos:]
+
+
+def readMessages(in_file, block_size=BLOCK_SIZE):
+    """
+    Yields the serialized messages remaining in the file, to be decoded
+    with ParseFromString. Unlike decodeMessage, which reads the length of
+    each message a byte at a time, this reads large blocks of the file
+    and finds the messages in those.
+    """
+    for buf, frames in _readBlocks(in_file, block_size):
+        for start, end in frames:
+            yield buf[start:end]
+
+
+def _decodeBlock(buf, frames, fields, repeated, base=0):
+    """
+    Decodes the messages at frames in buf, which must consist solely of
+    varint fields, into a NumPy structured array of the fields, and a dict
+    of the repeated fields, as described in readArrays. The length of the
+    first message starts at base.
+    """
+    import numpy as np
+
+    records = np.zeros(len(frames), dtype=[(n, t) for _, n, t in fields])
+    deps = {}
+    if not frames:
+        for _, name in repeated:
+            deps[name] = (np.zeros(1, np.int64), np.zeros(0, np.uint64))
+        return records, deps
+
+    end = frames[-1][1] - base
+    data = np.frombuffer(buf, np.uint8, count=end, offset=base)
+
+    # Decode every varint in the block at once, the message lengths along
+    # with the fields. A varint ends with the first byte without the top
+    # bit set.
+    last = data < 0x80
+    ends = np.flatnonzero(last)
+    starts = np.empty_like(ends)
+    starts[0] = 0
+    starts[1:] = ends[:-1] + 1
+    varint = np.cumsum(last) - last
+    shift = (np.arange(end) - starts[varint]) * 7
+    if shift.max(initial=0) >= 70:
+        raise OSError("Too many bytes when decoding varint.")
+    values = np.bitwise_or.reduceat(
+        (data & 0x7F).astype(np.uint64) << shift.astype(np.uint64), starts
+    )
+
+    # Each message is its length followed by (tag, value) pairs.
+    length_starts = np.array([start for start, _ in frames]) - base - 1
+    length_starts = varint[length_starts]
+    is_length = np.zeros(len(values), bool)
+    is_length[length_starts] = True
+    message = np.cumsum(is_length) - 1
+    index = np.arange(len(values)) - length_starts[message]
+    tag_index = np.flatnonzero(index % 2 == 1)
+    tags = values[tag_index]
+    if (tags & 7).any():
+        raise ValueError("Only messages of varint fields can be decoded.")
+    numbers = tags >> 3
+    values = values[tag_index + 1]
+    message = message[tag_index]
+
+    for number, name, _ in fields:
+        selected = numbers == number
+        records[name][message[selected]] = values[selected]
+    for number, name in repeated:
+        selected = numbers == number
+        counts = np.bincount(message[selected], minlength=len(frames))
+        offsets = np.zeros(len(frames) + 1, np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        deps[name] = (offsets, values[selected])
+    return records, deps
+
+
+def readArrays(in_file, fields, repeated=(), block_size=BLOCK_SIZE):
+    """
+    Yields the messages remaining in the file a block at a time, decoded
+    into NumPy arrays without going through protobuf. The messages may
+    only have varint fields (which all the trace records do).
+
+    Each block is a tuple of a structured array, with a column for each
+    of the (field number, name, dtype) in fields, and a dict mapping the
+    name of each of the (field number, name) in repeated to an (offsets,
+    values) tuple, with the values of message i in
+    values[offsets[i]:offsets[i + 1]]. Missing fields are 0.
+    """
+    for buf, frames in _readBlocks(in_file, block_size):
+        yield _decodeBlock(buf, frames, fields, repeated)
+
+
+def _concatenateArrays(blocks, repeated):
+    import numpy as np
+
+    records = np.concatenate([records for records, _ in blocks])
+    deps = {}
+    for _, name in repeated:
+        offsets = [np.zeros(1, np.int64)]
+        total = 0
+        for _, block_deps in blocks:
+            block_offsets, _ = block_deps[name]
+            offsets.append(block_offsets[1:] + total)
+            total += block_offsets[-1]
+        deps[name] = (
+            np.concatenate(offsets),
+            np.concatenate([d[name][1] for _, d in blocks]),
+        )
+    return records, deps
+
+
+def readTraceArrays(in_file, fields, repeated=(), block_size=BLOCK_SIZE):
+    """
+    Reads a trace a block at a time, as readArrays does. Yields the
+    serialized header of the trace (None if it is empty) and then the
+    records of each block. The header has string fields, so it is not
+    decoded here; see varintFields.
+    """
+    proto_in = openFileRd(in_file)
+    try:
+        if proto_in.read(4) != b"gem5":
+            raise ValueError(f"{in_file} is not a gem5 trace")
+        header = None
+        for buf, frames in _readBlocks(proto_in, block_size):
+            base = 0
+            # The header is the first message.
+            if header is None:
+                if not frames:
+                    continue
+                start, base = frames[0]
+                header = buf[start:base]
+                yield header
+                frames = frames[1:]
+            yield _decodeBlock(buf, frames, fields, repeated, base)
+        if header is None:
+            yield None
+    finally:
+        proto_in.close()
+
+
+def varintFields(buf):
+    """
+    Returns a dict of the varint fields of a serialized message by field
+    number, skipping its other fields, e.g. to get the tick frequency of a
+    trace from its header without protobuf.
+    """
+
+    def varint(pos):
+        result = shift = 0
+        while True:
+            b = buf[pos]
+            pos += 1
+            result |= (b & 0x7F) << shift
+            if not (b & 0x80):
+                return result, pos
+            shift += 7
+
+    fields = {}
+    pos = 0
+    while pos < len(buf):
+        tag, pos = varint(pos)
+        wire_type = tag & 7
+        if wire_type == 0:
+            fields[tag >> 3], pos = varint(pos)
+        elif wire_type == 1:
+            pos += 8
+        elif wire_type == 2:
+            size, pos = varint(pos)
+            pos += size
+        elif wire_type == 5:
+            pos += 4
+        else:
+            raise ValueError(f"Unsupported wire type {wire_type}.")
+    return fields
+
+
+def _readTrace(in_file, fields, repeated, block_size):
+    blocks = readTraceArrays(in_file, fields, repeated, block_size)
+    header = next(blocks)
+    empty = _decodeBlock(b"", [], fields, repeated)
+    return (header,) + _concatenateArrays([empty] + list(blocks), repeated)
+
+
+def packetArrays(in_file, block_size=BLOCK_SIZE):
+    """
+    Reads a packet trace into a NumPy structured array of PACKET_FIELDS.
+    Returns the serialized PacketHeader and the array.
+    """
+    header, records, _ = _readTrace(in_file, PACKET_FIELDS, (), block_size)
+    return header, records
+
+
+def instDepArrays(in_file, block_size=BLOCK_SIZE):
+    """
+    Reads an instruction dependency trace into a NumPy structured array of
+    INST_DEP_FIELDS. Returns the serialized InstDepRecordHeader, the array,
+    and a dict of the rob_dep and reg_dep dependencies as described in
+    readArrays.
+    """
+    return _readTrace(
+        in_file, INST_DEP_FIELDS, INST_DEP_REPEATED_FIELDS, block_size
+    )
+
+
+def readTraces(read, in_files, jobs=None):
+    """
+    Reads several traces, e.g. the per-CPU traces of a run, with read
+    (packetArrays or instDepArrays) in parallel processes. Returns the
+    results in the order of in_files.
+    """
+    with ProcessPoolExecutor(jobs) as pool:
+        return list(pool.map(read, in_files))
+
+
 def _EncodeVarint32(out_file, value):
     """
     The encoding of the Varint32 is copied from
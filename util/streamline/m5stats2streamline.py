@@ -60,6 +60,7 @@
 
 import argparse
 import gzip
+import math
 import os
 import re
 import shutil
@@ -69,6 +70,14 @@ import xml.etree.ElementTree as ET
 import zlib
 from configparser import ConfigParser
 
+sys.path.append(
+    os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "..", "..", "src", "python"
+    )
+)
+
+from m5.ext.pystats.statstxt import StatsTxtReader
+
 parser = argparse.ArgumentParser(
     formatter_class=argparse.RawDescriptionHelpFormatter,
     description="""
@@ -830,11 +839,6 @@ class StatsEntry:
         self.short_name = re.sub(r"system\.", "", name)
         self.short_name = re.sub(":", "_", name)
 
-        # Regex for this stat (string version used to construct union regex)
-        self.regex_string = "^" + name + r"\s+([\d\.]+)"
-        self.regex = re.compile(
-            "^" + name + r"\s+([\d\.e\-]+)\s+# (.*)$", re.M
-        )
         self.description = ""
 
         # Whether this stat is use per CPU or not
@@ -846,9 +850,6 @@ class StatsEntry:
         # List of values of stat per timestamp
         self.values = []
 
-        # Whether this stat has been found for the current timestamp
-        self.found = False
-
         # Whether this stat has been found at least once
         # (to suppress too many warnings)
         self.not_found_at_least_once = False
@@ -856,12 +857,9 @@ class StatsEntry:
         # Field used to hold ElementTree subelement for this stat
         self.ET_element = None
 
-        # Create per-CPU stat name and regex, etc.
+        # Create per-CPU stat name, etc.
         if self.per_cpu:
-            self.per_cpu_regex_string = []
-            self.per_cpu_regex = []
             self.per_cpu_name = []
-            self.per_cpu_found = []
             for i in range(num_cpus):
                 if num_cpus > 1:
                     per_cpu_name = re.sub("#", str(i), self.name)
@@ -870,17 +868,7 @@ class StatsEntry:
 
                 self.per_cpu_name.append(per_cpu_name)
                 print("\t", per_cpu_name)
-
-                self.per_cpu_regex_string.append(
-                    "^" + per_cpu_name + r"\s+[\d\.]+"
-                )
-                self.per_cpu_regex.append(
-                    re.compile(
-                        "^" + per_cpu_name + r"\s+([\d\.e\-]+)\s+# (.*)$", re.M
-                    )
-                )
                 self.values.append([])
-                self.per_cpu_found.append(False)
 
     def append_value(self, val, per_cpu_index=None):
         if self.per_cpu:
@@ -904,19 +892,6 @@ class Stats:
         )
         self.next_key += 1
 
-    # Union of all stats to accelerate parsing speed
-    def createStatsRegex(self):
-        regex_strings = []
-        print("\nnum entries in stats_list", len(self.stats_list))
-        for entry in self.stats_list:
-            if entry.per_cpu:
-                for i in range(num_cpus):
-                    regex_strings.append(entry.per_cpu_regex_string[i])
-            else:
-                regex_strings.append(entry.regex_string)
-
-        self.regex = re.compile("|".join(regex_strings))
-
 
 def registerStats(config_file):
     print("===============================")
@@ -965,7 +940,7 @@ def registerStats(config_file):
                 stats.register(item, group, i, False)
                 i += 1
 
-    stats.createStatsRegex()
+    print("\nnum entries in stats_list", len(stats.stats_list))
 
     return stats
 
@@ -977,137 +952,93 @@ def readGem5Stats(stats, gem5_stats_file):
     print("Parsing gem5 stats file...")
     print(gem5_stats_file)
     print("===============================\n")
-    ext = os.path.splitext(gem5_stats_file)[1]
-
-    window_start_regex = re.compile(
-        "^---------- Begin Simulation Statistics ----------"
-    )
-    window_end_regex = re.compile(
-        "^---------- End Simulation Statistics   ----------"
-    )
-    final_tick_regex = re.compile(r"^final_tick\s+(\d+)")
 
     global ticks_in_ns
-    sim_freq_regex = re.compile(r"^sim_freq\s+(\d+)")
     sim_freq = -1
 
-    try:
-        if ext == ".gz":
-            f = gzip.open(gem5_stats_file, "r")
-        else:
-            f = open(gem5_stats_file)
-    except:
+    if not os.path.isfile(gem5_stats_file):
         print("ERROR opening stats file", gem5_stats_file, "!")
         sys.exit(1)
 
-    stats_not_found_list = stats.stats_list[:]
-    window_num = 0
+    # Only the stats we convert (and the timing stats, under their current
+    # and old names) are read from the file.
+    names = {"simFreq", "sim_freq", "finalTick", "final_tick"}
+    for stat in stats.stats_list:
+        if stat.per_cpu:
+            names.update(stat.per_cpu_name)
+        else:
+            names.add(stat.name)
+    windows = StatsTxtReader(gem5_stats_file, names=names, descs=True).dumps()
+
+    def window_value(stat, window, name):
+        # Returns the value to store for a stat in a window, or None if it
+        # is missing (or not a number).
+        value = window.get(name)
+        if not isinstance(value, (int, float)) or not math.isfinite(value):
+            return None
+        if stat.description == "":
+            stat.description = window.descs.get(name, "")
+        if stat.name == "ipc":
+            return str(int(float(value) * 1000))
+        return str(int(value))
+
+    def not_found(stat, name):
+        if not stat.not_found_at_least_once:
+            print("WARNING: stat not found in window #", window_num, ":", name)
+            print("suppressing further warnings for this stat")
+            stat.not_found_at_least_once = True
+        return str(0)
 
+    window_num = 0
     while True:
-        error = False
         try:
-            line = f.readline()
-        except OSError:
+            window = next(windows, None)
+        except (OSError, EOFError):
             print("")
             print("WARNING: IO error in stats file")
             print("(gzip stream not closed properly?)...continuing for now")
-            error = True
-        if not line:
+            break
+        if window is None:
             break
 
         # Find out how many gem5 ticks in 1ns
         if sim_freq < 0:
-            m = sim_freq_regex.match(line)
-            if m:
-                sim_freq = int(m.group(1))  # ticks in 1 sec
+            freq = window.get("simFreq", window.get("sim_freq"))
+            if freq is not None:
+                sim_freq = int(freq)  # ticks in 1 sec
                 ticks_in_ns = int(sim_freq / 1e9)
                 print(
                     f"Simulation frequency found! 1 tick == {1.0 / sim_freq:e} sec\n"
                 )
 
         # Final tick in gem5 stats: current absolute timestamp
-        m = final_tick_regex.match(line)
-        if m:
-            tick = int(m.group(1))
+        tick = window.get("finalTick", window.get("final_tick"))
+        if tick is not None:
+            tick = int(tick)
             if tick > end_tick:
                 break
             stats.tick_list.append(tick)
 
-        if window_end_regex.match(line) or error:
-            if args.verbose:
-                print("new window")
-            for stat in stats.stats_list:
-                if stat.per_cpu:
-                    for i in range(num_cpus):
-                        if not stat.per_cpu_found[i]:
-                            if not stat.not_found_at_least_once:
-                                print(
-                                    "WARNING: stat not found in window #",
-                                    window_num,
-                                    ":",
-                                    stat.per_cpu_name[i],
-                                )
-                                print(
-                                    "suppressing further warnings for "
-                                    + "this stat"
-                                )
-                                stat.not_found_at_least_once = True
-                            stat.values[i].append(str(0))
-                        stat.per_cpu_found[i] = False
-                else:
-                    if not stat.found:
-                        if not stat.not_found_at_least_once:
-                            print(
-                                "WARNING: stat not found in window #",
-                                window_num,
-                                ":",
-                                stat.name,
-                            )
-                            print("suppressing further warnings for this stat")
-                            stat.not_found_at_least_once = True
-                        stat.values.append(str(0))
-                    stat.found = False
-            stats_not_found_list = stats.stats_list[:]
-            window_num += 1
-            if error:
-                break
-
-        # Do a single regex of the union of all stats first for speed
-        if stats.regex.match(line):
-            # Then loop through only the stats we haven't seen in this window
-            for stat in stats_not_found_list[:]:
-                if stat.per_cpu:
-                    for i in range(num_cpus):
-                        m = stat.per_cpu_regex[i].match(line)
-                        if m:
-                            if stat.name == "ipc":
-                                value = str(int(float(m.group(1)) * 1000))
-                            else:
-                                value = str(int(float(m.group(1))))
-                            if args.verbose:
-                                print(stat.per_cpu_name[i], value)
-                            stat.values[i].append(value)
-                            stat.per_cpu_found[i] = True
-                            all_found = True
-                            for j in range(num_cpus):
-                                if not stat.per_cpu_found[j]:
-                                    all_found = False
-                            if all_found:
-                                stats_not_found_list.remove(stat)
-                            if stat.description == "":
-                                stat.description = m.group(2)
-                else:
-                    m = stat.regex.match(line)
-                    if m:
-                        value = str(int(float(m.group(1))))
-                        if args.verbose:
-                            print(stat.name, value)
-                        stat.values.append(value)
-                        stat.found = True
-                        stats_not_found_list.remove(stat)
-                        if stat.description == "":
-                            stat.description = m.group(2)
-    f.close()
+        if args.verbose:
+            print("new window")
+        for stat in stats.stats_list:
+            if stat.per_cpu:
+                for i in range(num_cpus):
+                    name = stat.per_cpu_name[i]
+                    value = window_value(stat, window, name)
+                    if value is None:
+                        value = not_found(stat, name)
+                    elif args.verbose:
+                        print(name, value)
+                    stat.values[i].append(value)
+            else:
+                value = window_value(stat, window, stat.name)
+                if value is None:
+                    value = not_found(stat, stat.name)
+                elif args.verbose:
+                    print(stat.name, value)
+                stat.values.append(value)
+        window_num += 1
 
 
 # Create session.xml file in .apc folder
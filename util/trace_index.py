@@ -0,0 +1,254 @@
+# Copyright (c) 2024 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Sidecar indices for random access to large text traces.
+
+The O3PipeView and MinorTrace debug traces are ordered by time, so a
+window of them can be found without parsing everything before it. A
+TraceIndex splits a trace into chunks of about CHUNK_SIZE bytes, each
+starting at the beginning of a record, and stores the smallest and
+largest keys (ticks, and sequence numbers for O3PipeView) in each chunk
+in <trace>.idx. Finding a window is then a matter of reading the chunks
+whose keys overlap it.
+
+Traces compressed with gzip can only be read from the start, unless the
+indexed_gzip module is available, in which case its seek points are
+stored in <trace>.gzidx and the chunks are read directly. Without it,
+the trace before the window is still decompressed, but not parsed.
+"""
+
+import gzip
+import io
+import json
+import os
+import re
+
+try:
+    import indexed_gzip
+except ImportError:
+    indexed_gzip = None
+
+CHUNK_SIZE = 4 * 1024 * 1024
+VERSION = 1
+
+
+class TraceFormat:
+    """
+    How records are found in a type of trace. Each record starts with
+    boundary, after a newline, and key_re matches the keys of the records
+    which have them, with a group for each of the names in keys.
+    """
+
+    def __init__(self, name, boundary, key_re, keys):
+        self.name = name
+        self.boundary = b"\n" + boundary
+        self.key_re = re.compile(key_re, re.M)
+        self.keys = keys
+
+
+# An instruction of an O3PipeView trace starts with its fetch line, which
+# has the tick it was fetched at and its sequence number.
+O3_PIPE_VIEW = TraceFormat(
+    "O3PipeView",
+    b"O3PipeView:fetch:",
+    rb"^O3PipeView:fetch:(\d+):[^:\n]*:[^:\n]*:(\d+):",
+    ("tick", "sn"),
+)
+
+# Every line of a MinorTrace trace starts with its tick.
+MINOR_TRACE = TraceFormat("MinorTrace", b"", rb"^\s*(\d+):", ("tick",))
+
+
+def _openBinary(path, gzip_index=None):
+    """Opens a trace, which may be compressed, as a binary file."""
+    with open(path, "rb") as f:
+        compressed = f.read(2) == b"\x1f\x8b"
+    if not compressed:
+        return open(path, "rb")
+    if indexed_gzip is not None:
+        if gzip_index and os.path.exists(gzip_index):
+            return indexed_gzip.IndexedGzipFile(path, index_file=gzip_index)
+        return indexed_gzip.IndexedGzipFile(path)
+    return gzip.open(path, "rb")
+
+
+class _Window(io.RawIOBase):
+    """The bytes from start up to end (or the end of the file) of f."""
+
+    def __init__(self, f, start, end):
+        self._f = f
+        f.seek(start)
+        self._remaining = None if end is None else end - start
+
+    def readable(self):
+        return True
+
+    def readinto(self, buf):
+        size = len(buf)
+        if self._remaining is not None:
+            size = min(size, self._remaining)
+        data = self._f.read(size)
+        buf[: len(data)] = data
+        if self._remaining is not None:
+            self._remaining -= len(data)
+        return len(data)
+
+    def close(self):
+        self._f.close()
+        super().close()
+
+
+class TraceIndex:
+    """
+    The index of a trace, loaded from its sidecar file if that is up to
+    date, and otherwise built by reading the whole trace and saved.
+    """
+
+    def __init__(self, path, trace_format, chunk_size=CHUNK_SIZE):
+        self.path = path
+        self.format = trace_format
+        self.index_path = f"{path}.idx"
+        self.gzip_index_path = f"{path}.gzidx"
+        stat = os.stat(path)
+        self._stamp = [stat.st_size, stat.st_mtime_ns]
+        if not self._load():
+            self._build(chunk_size)
+            self._save()
+
+    def _load(self):
+        try:
+            with open(self.index_path) as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if (
+            index.get("version") != VERSION
+            or index.get("format") != self.format.name
+            or index.get("stamp") != self._stamp
+        ):
+            return False
+        self.length = index["length"]
+        self.chunks = index["chunks"]
+        return True
+
+    def _save(self):
+        index = {
+            "version": VERSION,
+            "format": self.format.name,
+            "stamp": self._stamp,
+            "length": self.length,
+            "chunks": self.chunks,
+        }
+        try:
+            with open(self.index_path, "w") as f:
+                json.dump(index, f)
+        except OSError as e:
+            print(f"Couldn't save the trace index: {e}")
+
+    def _chunk(self, offset, data):
+        """
+        Returns the entry for a chunk, its offset followed by the smallest
+        and largest of each key in it, or None if it has none.
+        """
+        entry = [offset]
+        matches = self.format.key_re.findall(data)
+        if not matches:
+            return entry + [None, None] * len(self.format.keys)
+        if len(self.format.keys) == 1:
+            matches = [(key,) for key in matches]
+        for column in zip(*matches):
+            values = [int(value) for value in column]
+            entry += [min(values), max(values)]
+        return entry
+
+    def _build(self, chunk_size):
+        print(f"Indexing {self.path}...")
+        self.chunks = []
+        offset = 0
+        buf = b""
+        with _openBinary(self.path) as f:
+            while True:
+                block = f.read(chunk_size)
+                if not block:
+                    break
+                buf += block
+                cut = buf.rfind(self.format.boundary) + 1
+                if cut <= 0:
+                    continue
+                self.chunks.append(self._chunk(offset, buf[:cut]))
+                offset += cut
+                buf = buf[cut:]
+            if buf:
+                self.chunks.append(self._chunk(offset, buf))
+            self.length = offset + len(buf)
+            if indexed_gzip is not None and isinstance(
+                f, indexed_gzip.IndexedGzipFile
+            ):
+                f.export_index(self.gzip_index_path)
+
+    def span(self, key, low=0, high=None):
+        """
+        Returns the start and end offsets of the chunks which have values
+        of key from low to high (inclusive, or unbounded if high is None).
+        """
+        column = 1 + 2 * self.format.keys.index(key)
+        first = last = None
+        for i, chunk in enumerate(self.chunks):
+            smallest, largest = chunk[column : column + 2]
+            if smallest is None or largest < low:
+                continue
+            if high is not None and smallest > high:
+                continue
+            if first is None:
+                first = i
+            last = i
+        if first is None:
+            return self.length, self.length
+        end = self.length
+        if last + 1 < len(self.chunks):
+            end = self.chunks[last + 1][0]
+        return self.chunks[first][0], end
+
+    def open(self, key, low=0, high=None):
+        """
+        Opens the chunks of the trace which have values of key from low to
+        high as a text file.
+        """
+        start, end = self.span(key, low, high)
+        f = _openBinary(self.path, self.gzip_index_path)
+        return io.TextIOWrapper(io.BufferedReader(_Window(f, start, end)))
+
+
+def openTrace(path, trace_format=None, key="tick", low=0, high=None):
+    """
+    Opens a trace, which may be compressed, as a text file. If a format is
+    given, the trace is indexed (if it hasn't been already) and only the
+    chunks of it which have values of key from low to high are read.
+    """
+    if trace_format is None:
+        return io.TextIOWrapper(_openBinary(path))
+    return TraceIndex(path, trace_format).open(key, low, high)